@@ -136,25 +136,22 @@ class ItemSpawner:
         print(f"📦 스폰할 아이템: {template.get('name_ko', template.get('name_en', template_id))}")
         print(f"📦 스폰 개수: {count}개")
 
-        spawned_items = []
+        # 아이템 생성 (고유 ID 부여)
+        items = [
+            self.create_item_from_template(template, str(uuid4()), room.id)
+            for _ in range(count)
+        ]
 
-        for i in range(count):
-            # 고유 ID 생성
-            item_id = str(uuid4())
-
-            # 아이템 생성
-            item = self.create_item_from_template(template, item_id, room.id)
-
-            # 데이터베이스에 저장
-            try:
-                created_item = await self.object_repo.create(item.to_dict())
-                spawned_items.append(created_item)
-
-                item_name = template.get('name_ko', template.get('name_en', template_id))
-                print(f"  ✅ {item_name} #{i+1} 생성됨: ID {item_id[:8]}...")
+        # 데이터베이스에 한 번에 저장
+        try:
+            spawned_items = await self.object_repo.create_many([item.to_dict() for item in items])
+        except Exception as e:
+            print(f"  ❌ 아이템 생성 실패: {e}")
+            return []
 
-            except Exception as e:
-                print(f"  ❌ 아이템 생성 실패 #{i+1}: {e}")
+        item_name = template.get('name_ko', template.get('name_en', template_id))
+        for i, created_item in enumerate(spawned_items):
+            print(f"  ✅ {item_name} #{i+1} 생성됨: ID {created_item.id[:8]}...")
 
         return spawned_items
 
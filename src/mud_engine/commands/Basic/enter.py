@@ -90,11 +90,7 @@ class EnterCommand(BaseCommand):
             if not game_engine:
                 return None
 
-            cursor = await game_engine.db_manager.execute(
-                "SELECT to_x, to_y FROM room_connections WHERE from_x = ? AND from_y = ?",
-                (from_x, from_y)
-            )
-            result = await cursor.fetchone()
+            result = await game_engine.world_manager.get_enter_connection(from_x, from_y)
 
             if result:
                 return {
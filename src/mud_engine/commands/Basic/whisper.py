@@ -47,10 +47,8 @@ class WhisperCommand(BaseCommand):
 
         # 대상 플레이어 찾기 (같은 방에 있는 플레이어만)
         target_session = None
-        for other_session in session.game_engine.session_manager.get_authenticated_sessions().values(): # pyright: ignore[reportOptionalMemberAccess]
-            if (other_session.player and
-                other_session.player.username.lower() == target_player_name.lower() and
-                getattr(other_session, 'current_room_id', None) == current_room_id and
+        for other_session in session.game_engine.session_manager.get_sessions_in_room(current_room_id): # pyright: ignore[reportOptionalMemberAccess]
+            if (other_session.player.username.lower() == target_player_name.lower() and
                 other_session.session_id != session.session_id):
                 target_session = other_session
                 break
@@ -15,6 +15,7 @@ from .spawn_item_command import SpawnItemCommand
 from .list_item_templates_command import ListItemTemplatesCommand
 from .terminate_command import TerminateCommand
 from .scheduler_command import SchedulerCommand
+from .tick_stats_command import TickStatsCommand
 
 __all__ = [
     'AdminCommand',
@@ -31,4 +32,5 @@ __all__ = [
     'ListItemTemplatesCommand',
     'TerminateCommand',
     'SchedulerCommand',
+    'TickStatsCommand',
 ]
@@ -37,8 +37,7 @@ class CreateExitCommand(AdminCommand):
         direction = args[1].lower()
         to_room = args[2]
 
-        valid_directions = ['north', 'south', 'east', 'west', 'up', 'down',
-                          'northeast', 'northwest', 'southeast', 'southwest']
+        valid_directions = ['north', 'south', 'east', 'west', 'enter']
 
         if direction not in valid_directions:
             return CommandResult(
@@ -47,11 +46,8 @@ class CreateExitCommand(AdminCommand):
             )
 
         try:
-            updates = {
-                "exits": {direction: to_room}
-            }
-
-            success = await session.game_engine.update_room_realtime(from_room, updates, session)
+            # 동서남북은 막힌 출구 해제, enter는 room_connections 추가 (출구 그래프 즉시 갱신)
+            success = await session.game_engine.world_manager.add_room_exit(from_room, direction, to_room)
 
             if success:
                 return CommandResult(
@@ -80,13 +76,12 @@ class CreateExitCommand(AdminCommand):
 **사용법:** `createexit <출발방ID> <방향> <도착방ID>`
 
 **사용 가능한 방향:**
-- `north`, `south`, `east`, `west`
-- `up`, `down`
-- `northeast`, `northwest`, `southeast`, `southwest`
+- `north`, `south`, `east`, `west` - 좌표상 인접한 방 사이의 막힌 출구를 엽니다
+- `enter` - 좌표와 무관하게 입장 연결을 만듭니다
 
 **예시:**
 - `createexit garden north library` - 정원에서 북쪽으로 도서관 연결
-- `createexit room_001 up room_002` - 1층에서 위쪽으로 2층 연결
+- `createexit room_001 enter room_002` - 건물 입구에서 내부로 연결
 
 **별칭:** `ce`, `mkexit`
 **권한:** 관리자 전용
@@ -49,20 +49,7 @@ class GotoCommand(AdminCommand):
             )
 
         try:
-            cursor = await session.game_engine.db_manager.execute(
-                "SELECT id FROM rooms WHERE x = ? AND y = ?",
-                (x, y)
-            )
-            room_row = await cursor.fetchone()
-
-            if not room_row:
-                return CommandResult(
-                    result_type=CommandResultType.ERROR,
-                    message=I18N.get_message("admin.goto.room_not_found", locale, x=x, y=y)
-                )
-
-            target_room_id = room_row[0]
-            target_room = await session.game_engine.world_manager.get_room(target_room_id)
+            target_room = await session.game_engine.world_manager.get_room_at_coordinates(x, y)
 
             if not target_room:
                 return CommandResult(
@@ -70,6 +57,8 @@ class GotoCommand(AdminCommand):
                     message=I18N.get_message("admin.goto.room_not_found", locale, x=x, y=y)
                 )
 
+            target_room_id = target_room.id
+
             if hasattr(session, 'current_room_id') and session.current_room_id:
                 await session.game_engine.broadcast_to_room(
                     session.current_room_id,
@@ -35,24 +35,17 @@ class RoomInfoCommand(AdminCommand):
             )
 
         try:
-            cursor = await session.game_engine.db_manager.execute(
+            room_data = await session.game_engine.db_manager.fetch_one(
                 "SELECT * FROM rooms WHERE id = ?",
                 (session.current_room_id,)
             )
-            room_row = await cursor.fetchone()
 
-            if not room_row:
+            if not room_data:
                 return CommandResult(
                     result_type=CommandResultType.ERROR,
                     message=I18N.get_message("admin.roominfo.not_in_db", locale, room_id=session.current_room_id)
                 )
 
-            # 컬럼 이름 가져오기
-            column_names = [description[0] for description in cursor.description]
-
-            # 방 정보를 딕셔너리로 변환
-            room_data = dict(zip(column_names, room_row))
-
             # 정보 포맷팅
             info_lines = ["🔍 방 상세 정보", ""]
 
@@ -76,11 +69,9 @@ class RoomInfoCommand(AdminCommand):
             # 현재 방의 좌표 가져오기 (몬스터 정보와 enter 연결 정보에서 공통 사용)
             room_coords = None
             try:
-                room_cursor = await session.game_engine.db_manager.execute(
-                    "SELECT x, y FROM rooms WHERE id = ?",
-                    (session.current_room_id,)
-                )
-                room_coords = await room_cursor.fetchone()
+                room = await session.game_engine.world_manager.get_room(session.current_room_id)
+                if room and room.x is not None and room.y is not None:
+                    room_coords = (room.x, room.y)
             except Exception as coords_error:
                 logger.error(f"방 좌표 조회 중 오류: {coords_error}")
 
@@ -107,26 +98,18 @@ class RoomInfoCommand(AdminCommand):
         try:
             if room_coords:
                 room_x, room_y = room_coords
-                monster_cursor = await session.game_engine.db_manager.execute(
+                monster_rows = await session.game_engine.db_manager.fetch_all(
                     "SELECT * FROM monsters WHERE x = ? AND y = ? AND is_alive = 1",
                     (room_x, room_y)
                 )
             else:
                 # 좌표를 찾을 수 없으면 빈 결과 반환
-                monster_cursor = await session.game_engine.db_manager.execute(
-                    "SELECT * FROM monsters WHERE 1 = 0"
-                )
-            monster_rows = await monster_cursor.fetchall()
+                monster_rows = []
 
             if monster_rows:
                 info_lines.extend(["", "🐾 방 내 몬스터 정보", ""])
 
-                # 몬스터 컬럼 이름 가져오기
-                monster_column_names = [description[0] for description in monster_cursor.description]
-
-                for i, monster_row in enumerate(monster_rows, 1):
-                    monster_data = dict(zip(monster_column_names, monster_row))
-
+                for i, monster_data in enumerate(monster_rows, 1):
                     # 몬스터 ID 단축 표시
                     short_id = monster_data['id'].split('-')[-1] if '-' in monster_data['id'] else monster_data['id']
                     info_lines.append(f"몬스터 #{i} ({short_id}):")
@@ -169,18 +152,16 @@ class RoomInfoCommand(AdminCommand):
             if room_coords:
                 room_x, room_y = room_coords
                 # 현재 방에서 나가는 enter 연결 조회
-                enter_cursor = await session.game_engine.db_manager.execute(
+                enter_connections = await session.game_engine.db_manager.fetch_rows(
                     "SELECT to_x, to_y FROM room_connections WHERE from_x = ? AND from_y = ?",
                     (room_x, room_y)
                 )
-                enter_connections = await enter_cursor.fetchall()
 
                 # 현재 방으로 들어오는 enter 연결 조회
-                enter_in_cursor = await session.game_engine.db_manager.execute(
+                enter_in_connections = await session.game_engine.db_manager.fetch_rows(
                     "SELECT from_x, from_y FROM room_connections WHERE to_x = ? AND to_y = ?",
                     (room_x, room_y)
                 )
-                enter_in_connections = await enter_in_cursor.fetchall()
 
                 if enter_connections or enter_in_connections:
                     info_lines.extend(["", "🚪 Enter 연결 정보", ""])
@@ -94,11 +94,11 @@ class SchedulerCommand(AdminCommand):
         lines = ["📋 등록된 스케줄 이벤트 목록:\n"]
         for event in events:
             status = "✅ 활성" if event["enabled"] else "❌ 비활성"
-            intervals = ", ".join([f"{i}초" for i in event["intervals"]])
             lines.append(f"  • {event['name']}")
             lines.append(f"    상태: {status}")
-            lines.append(f"    간격: {intervals}")
-            lines.append(f"    실행: {event['run_count']}회 (오류: {event['error_count']}회)")
+            lines.append(f"    간격: {_format_schedule(event)}")
+            lines.append(f"    실행: {event['run_count']}회 (오류: {event['error_count']}회, "
+                         f"시간 초과: {event['timeout_count']}회, 건너뜀: {event['skipped_count']}회)")
             if event["last_run"]:
                 lines.append(f"    마지막 실행: {event['last_run']}")
             lines.append("")
@@ -128,16 +128,25 @@ class SchedulerCommand(AdminCommand):
             )
 
         status = "✅ 활성" if info["enabled"] else "❌ 비활성"
-        intervals = ", ".join([f"{i}초" for i in info["intervals"]])
+        timeout = f"{info['timeout']:g}초" if info["timeout"] else "없음"
+        next_run = f"{info['next_run_in']:.1f}초 후" if info["next_run_in"] is not None else "-"
+        latency = info["latency"]
 
         message = f"""
 📊 이벤트 상세 정보: {info['name']}
 
-상태: {status}
-실행 간격: {intervals}
+상태: {status}{' (실행 중)' if info['running'] else ''}
+실행 간격: {_format_schedule(info)}
+놓친 실행 정책: {info['missed_policy']}
+제한 시간: {timeout}
+다음 실행: {next_run}
 총 실행 횟수: {info['run_count']}회
-오류 발생: {info['error_count']}회
+오류 발생: {info['error_count']}회 (시간 초과: {info['timeout_count']}회)
+건너뛴 실행: {info['skipped_count']}회
 마지막 실행: {info['last_run'] if info['last_run'] else '없음'}
+마지막 실행 시간: {info['last_duration'] * 1000:.1f}ms
+시작 지연: 최근 {info['last_latency'] * 1000:.1f}ms / 평균 {latency['avg'] * 1000:.1f}ms / \
+p95 {latency['p95'] * 1000:.1f}ms / 최대 {latency['max'] * 1000:.1f}ms
 """
         await session.send_message({
             "type": "system_message",
@@ -193,3 +202,11 @@ class SchedulerCommand(AdminCommand):
                 result_type=CommandResultType.ERROR,
                 message="이벤트 없음"
             )
+
+
+def _format_schedule(event: dict) -> str:
+    """주기/실행 시점 표시 (예: "60초마다 (15초)", "15초마다")"""
+    offsets = event["offsets"]
+    if offsets == [0]:
+        return f"{event['interval']:g}초마다"
+    return f"{event['interval']:g}초마다 ({', '.join(f'{o:g}초' for o in offsets)})"
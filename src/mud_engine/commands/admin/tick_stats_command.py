@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Tick 프로파일 조회 명령어"""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict
+
+from .base import AdminCommand
+from ..base import CommandResult, CommandResultType
+
+if TYPE_CHECKING:
+    from ...core.game_engine import GameEngine
+    from ...core.types import SessionType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DUMP_PATHS = {
+    "json": "data/tick_metrics.json",
+    "prom": "data/tick_metrics.prom",
+}
+
+
+class TickStatsCommand(AdminCommand):
+    """Tick 시스템 프로파일 조회 명령어 (관리자 전용)"""
+
+    def __init__(self):
+        super().__init__(
+            name="tickstats",
+            description="Tick 시스템별 실행 시간/쿼리/메시지 및 tick 지연 조회 (show/dump/reset)",
+            aliases=["tickprof"]
+        )
+
+    async def execute_admin(self, session: 'SessionType', args: list):
+        """
+        Tick 프로파일 명령어 실행
+
+        사용법:
+            tickstats [show] - 시스템별 프로파일 요약
+            tickstats dump [json|prom] [경로] - 프로파일을 파일로 내보내기
+            tickstats reset - 누적된 프로파일 초기화
+        """
+        subcommand = args[0].lower() if args else "show"
+        game_engine = session.game_engine
+
+        if subcommand == "show":
+            return await self._show_stats(session, game_engine)
+        elif subcommand == "dump":
+            return await self._dump_stats(session, game_engine, args[1:])
+        elif subcommand == "reset":
+            return await self._reset_stats(session, game_engine)
+        else:
+            return await self._show_usage(session)
+
+    async def _show_usage(self, session: 'SessionType') -> CommandResult:
+        """사용법 표시"""
+        usage = """
+📈 Tick 프로파일 명령어
+
+사용법:
+  tickstats                        - 시스템별 프로파일 요약
+  tickstats dump [json|prom] [경로] - 프로파일을 파일로 내보내기
+  tickstats reset                  - 누적된 프로파일 초기화
+
+예시:
+  tickstats
+  tickstats dump prom
+  tickstats dump json data/tick_metrics.json
+"""
+        await session.send_message({
+            "type": "system_message",
+            "message": usage
+        })
+        return CommandResult(
+            result_type=CommandResultType.SUCCESS,
+            message="사용법 표시"
+        )
+
+    async def _show_stats(self, session: 'SessionType', game_engine: 'GameEngine') -> CommandResult:
+        """시스템별 프로파일 요약 표시"""
+        tick_manager = game_engine.global_tick_manager
+        profile = tick_manager.profiler.to_dict()
+        stats = tick_manager.get_stats()
+        drift = profile["tick_drift_seconds"]
+
+        lines = [
+            "📈 Tick 프로파일:\n",
+            f"  tick: {stats['tick_count']}회 (건너뜀 {stats['skipped_ticks']}회, 간격 초과 {stats['tick_overruns']}회)",
+            f"  tick 지연: 평균 {_ms(drift['avg'])} / p95 {_ms(drift['p95'])} / 최대 {_ms(drift['max'])}",
+            ""
+        ]
+
+        overruns = {system["name"]: system["overrun_count"] for system in stats["systems"]}
+        for name, metrics in sorted(profile["systems"].items()):
+            duration = metrics["duration_seconds"]
+            lines.append(f"  • {name}")
+            lines.append(f"    실행: {duration['count']}회 (예산 초과: {overruns.get(name, 0)}회)")
+            lines.append(f"    시간: 평균 {_ms(duration['avg'])} / p95 {_ms(duration['p95'])} / 최대 {_ms(duration['max'])}")
+            lines.append(f"    DB 쿼리: {_counts(metrics.get('db_queries'))}")
+            lines.append(f"    메시지: {_counts(metrics.get('messages_sent'))}")
+            lines.append("")
+
+        await session.send_message({
+            "type": "system_message",
+            "message": "\n".join(lines)
+        })
+        return CommandResult(
+            result_type=CommandResultType.SUCCESS,
+            message=f"{len(profile['systems'])}개 시스템 프로파일 조회"
+        )
+
+    async def _dump_stats(self, session: 'SessionType', game_engine: 'GameEngine', args: list) -> CommandResult:
+        """프로파일을 JSON 또는 Prometheus 텍스트 파일로 내보내기"""
+        fmt = args[0].lower() if args else "json"
+        if fmt not in DEFAULT_DUMP_PATHS:
+            return await self._show_usage(session)
+        path = args[1] if len(args) >= 2 else DEFAULT_DUMP_PATHS[fmt]
+
+        try:
+            output = game_engine.global_tick_manager.profiler.dump(path, fmt)
+        except OSError as e:
+            logger.error(f"Tick 프로파일 파일 기록 실패 ({path}): {e}")
+            await session.send_message({
+                "type": "error",
+                "message": f"❌ 파일을 기록할 수 없습니다: {path}"
+            })
+            return CommandResult(
+                result_type=CommandResultType.ERROR,
+                message="파일 기록 실패"
+            )
+
+        await session.send_message({
+            "type": "success",
+            "message": f"✅ Tick 프로파일을 기록했습니다: {output}"
+        })
+        return CommandResult(
+            result_type=CommandResultType.SUCCESS,
+            message="프로파일 내보내기"
+        )
+
+    async def _reset_stats(self, session: 'SessionType', game_engine: 'GameEngine') -> CommandResult:
+        """누적된 프로파일 초기화"""
+        game_engine.global_tick_manager.profiler.reset()
+        await session.send_message({
+            "type": "success",
+            "message": "✅ Tick 프로파일을 초기화했습니다."
+        })
+        return CommandResult(
+            result_type=CommandResultType.SUCCESS,
+            message="프로파일 초기화"
+        )
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}ms"
+
+
+def _counts(histogram: Dict[str, Any]) -> str:
+    if not histogram:
+        return "-"
+    return f"평균 {histogram['avg']:.1f} / p95 {histogram['p95']:g} / 최대 {histogram['max']:g}"
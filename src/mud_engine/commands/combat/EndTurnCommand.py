@@ -31,8 +31,10 @@ class EndTurnCommand(BaseCommand):
             return self.create_error_result("전투를 찾을 수 없거나 이미 종료되었습니다.")
 
         logger.info(f"EndTurnCommand excute invoked")
-        await self.combat_handler.process_player_action(combat_id, session.player.id,
-            CombatAction.ENDTURN, target_id=None)
+        # 같은 전투의 몹 턴 tick과 섞이지 않도록 전투 락을 잡고 처리
+        async with combat.lock:
+            await self.combat_handler.process_player_action(combat_id, session.player.id,
+                CombatAction.ENDTURN, target_id=None)
 
         return self.create_success_result(
             message="",
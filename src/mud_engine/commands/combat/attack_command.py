@@ -104,26 +104,28 @@ class AttackCommand(BaseCommand):
         combat.set_entity_map(getattr(session, "room_entity_map", {}))
 
         if session.in_combat == True:
-            # 전투 중에 attack 명령 인 경우 - 공격 액션 실행
-            target_combatant = self.get_target_combatant_by_monster_id(target_monster.id, combat)
-            result = await self._execute_combat_attack(session, target_combatant, combat)
-            # _execute_attack 내부에서 이미 broadcast됨 → 중복 전송 제거
-            combat.advance_turn()
-
-            if combat.is_combat_over():
-                await self._end_combat(session, combat, {})
-                _lcmd = LookCommand()
-                await _lcmd._look_around(session)
+            # 같은 전투의 몹 턴 tick과 섞이지 않도록 전투 락을 잡고 처리
+            async with combat.lock:
+                # 전투 중에 attack 명령 인 경우 - 공격 액션 실행
+                target_combatant = self.get_target_combatant_by_monster_id(target_monster.id, combat)
+                result = await self._execute_combat_attack(session, target_combatant, combat)
+                # _execute_attack 내부에서 이미 broadcast됨 → 중복 전송 제거
+                combat.advance_turn()
+
+                if combat.is_combat_over():
+                    await self._end_combat(session, combat, {})
+                    _lcmd = LookCommand()
+                    await _lcmd._look_around(session)
+                    return result
+
+                # 상태 출력
+                msg = combat.get_combat_status_message(session.locale)
+                await self.combat_handler.send_broadcast_combat_message(combat, msg)
+                msg = combat.get_whos_turn(session.locale)
+                await self.combat_handler.send_broadcast_combat_message(combat, msg)
+                await self.combat_handler.send_battle_command_menu(combat)
                 return result
 
-            # 상태 출력
-            msg = combat.get_combat_status_message(session.locale)
-            await self.combat_handler.send_broadcast_combat_message(combat, msg)
-            msg = combat.get_whos_turn(session.locale)
-            await self.combat_handler.send_broadcast_combat_message(combat, msg)
-            await self.combat_handler.send_battle_command_menu(combat)
-            return result
-
         """else: 새로운 전투 시작"""
         # 세션 상태 업데이트
         session.in_combat = True
@@ -37,6 +37,12 @@ class FleeCommand(BaseCommand):
         if not combat or not combat.is_active:
             return self.create_error_result("전투를 찾을 수 없거나 이미 종료되었습니다.")
 
+        # 같은 전투의 몹 턴 tick과 섞이지 않도록 전투 락을 잡고 처리
+        async with combat.lock:
+            return await self._flee(session, combat, combat_id)
+
+    async def _flee(self, session: SessionType, combat, combat_id: str) -> CommandResult:
+        """도망 처리 (전투 락을 잡은 상태에서 호출)"""
         # 현재 턴 확인
         current_combatant = combat.get_current_combatant()
         if not current_combatant or current_combatant.id != session.player.id:
@@ -42,7 +42,12 @@ class ItemCommand(BaseCommand):
             inv_cmd = InventoryCommand()
             return await inv_cmd.execute(session, [])
 
-        # 인자 있음: 아이템 사용
+        # 인자 있음: 아이템 사용 (같은 전투의 몹 턴 tick과 섞이지 않도록 전투 락을 잡고 처리)
+        async with combat.lock:
+            return await self._use_item(session, combat, args)
+
+    async def _use_item(self, session: SessionType, combat, args: List[str]) -> CommandResult:
+        """아이템 사용 후 턴 진행 (전투 락을 잡은 상태에서 호출)"""
         use_cmd = UseCommand()
         result = await use_cmd.execute(session, args)
 
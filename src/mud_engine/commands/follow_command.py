@@ -62,10 +62,8 @@ class FollowCommand(BaseCommand):
 
         # 대상 플레이어 찾기
         target_session = None
-        for other_session in session.game_engine.session_manager.iter_authenticated_sessions():
-            if (other_session.player and
-                other_session.player.username.lower() == target_player_name.lower() and
-                getattr(other_session, 'current_room_id', None) == current_room_id and
+        for other_session in session.game_engine.session_manager.get_sessions_in_room(current_room_id):
+            if (other_session.player.username.lower() == target_player_name.lower() and
                 other_session.session_id != session.session_id):
                 target_session = other_session
                 break
@@ -48,10 +48,8 @@ class GiveCommand(BaseCommand):
             )
 
         # 같은 방에 있는 플레이어들 중에서 대상 찾기
-        for other_session in session.game_engine.session_manager.get_authenticated_sessions().values():
-            if (other_session.player and
-                other_session.player.username.lower() == target_player_name.lower() and
-                getattr(other_session, 'current_room_id', None) == current_room_id and
+        for other_session in session.game_engine.session_manager.get_sessions_in_room(current_room_id):
+            if (other_session.player.username.lower() == target_player_name.lower() and
                 other_session.session_id != session.session_id):
                 target_session = other_session
                 break
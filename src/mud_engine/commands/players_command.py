@@ -35,16 +35,13 @@ class PlayersCommand(BaseCommand):
 
         # 같은 방에 있는 플레이어들 찾기
         players_in_room = []
-        for other_session in session.game_engine.session_manager.iter_authenticated_sessions():
-            if (other_session.player and
-                getattr(other_session, 'current_room_id', None) == current_room_id):
-
-                player_info = {
-                    "name": other_session.player.username,
-                    "is_self": other_session.session_id == session.session_id,
-                    "following": getattr(other_session, 'following_player', None)
-                }
-                players_in_room.append(player_info)
+        for other_session in session.game_engine.session_manager.get_sessions_in_room(current_room_id):
+            player_info = {
+                "name": other_session.player.username,
+                "is_self": other_session.session_id == session.session_id,
+                "following": getattr(other_session, 'following_player', None)
+            }
+            players_in_room.append(player_info)
 
         from ..core.localization import get_localization_manager
         localization = get_localization_manager()
@@ -90,7 +90,7 @@ class ReadCommand(BaseCommand):
                 )
 
             # [Lua 콜백 우선 시도] 아이템 Lua 스크립트가 있으면 콜백 실행
-            lua_result = self._try_lua_callback(
+            lua_result = await self._try_lua_callback(
                 session, game_engine, target_item, "read"
             )
             if lua_result is not None:
@@ -285,7 +285,7 @@ class ReadCommand(BaseCommand):
                 return str(val)
         return ""
 
-    def _try_lua_callback(
+    async def _try_lua_callback(
         self, session: Any, game_engine: Any,
         target_item: Any, verb: str,
     ) -> Dict[str, Any] | None:
@@ -330,4 +330,4 @@ class ReadCommand(BaseCommand):
             },
         }
 
-        return handler.execute_verb_callback(template_id, verb, context)
+        return await handler.execute_verb_callback(template_id, verb, context)
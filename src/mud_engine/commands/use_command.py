@@ -68,7 +68,7 @@ class UseCommand(BaseCommand):
                 return self.create_error_result(I18N.get_message("obj.use.not_in_inv", get_user_locale(session), name=' '.join(args)))
 
             # [Lua 콜백 우선 시도] 아이템 Lua 스크립트가 있으면 콜백 실행
-            lua_result = self._try_lua_callback(session, game_engine, target_item, "use")
+            lua_result = await self._try_lua_callback(session, game_engine, target_item, "use")
             if lua_result is not None:
                 message = lua_result.get("message", "")
                 if lua_result.get("consume", False):
@@ -374,7 +374,7 @@ class UseCommand(BaseCommand):
         except Exception:
             return False
 
-    def _try_lua_callback(
+    async def _try_lua_callback(
         self, session: SessionType, game_engine: Any,
         target_item: Any, verb: str,
     ) -> Dict[str, Any] | None:
@@ -419,4 +419,4 @@ class UseCommand(BaseCommand):
             },
         }
 
-        return handler.execute_verb_callback(template_id, verb, context)
+        return await handler.execute_verb_callback(template_id, verb, context)
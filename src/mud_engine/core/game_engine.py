@@ -6,12 +6,12 @@ from typing import Dict, Optional, Any, TYPE_CHECKING
 from datetime import datetime
 
 from .event_bus import EventBus, Event, EventType, get_event_bus
-from .managers import CommandManager, EventHandler, PlayerMovementManager, AdminManager, GlobalTickManager
+from .managers import CommandManager, EventHandler, PlayerMovementManager, AdminManager, GlobalTickManager, AggroManager
 from .managers.time_manager import TimeManager
 from .managers.scheduler_manager import SchedulerManager
 from .types import SessionType
 from ..game.managers import PlayerManager, WorldManager
-from ..game.repositories import RoomRepository, GameObjectRepository
+from ..game.repositories import RoomRepository
 from ..database.connection import DatabaseManager
 from ..game.managers.dialogue_manager import DialogueManager
 from ..game.item_lua_callback_handler import ItemLuaCallbackHandler
@@ -52,7 +52,7 @@ class GameEngine:
 
         # WorldManager 초기화
         room_repo = RoomRepository(db_manager)
-        object_repo = GameObjectRepository(db_manager)
+        object_repo = self.model_manager.game_objects
         from ..game.repositories import MonsterRepository
         monster_repo = MonsterRepository(db_manager)
         self.world_manager = WorldManager(room_repo, object_repo, monster_repo)
@@ -85,6 +85,7 @@ class GameEngine:
             self.time_manager = TimeManager(self)
             self.scheduler_manager = SchedulerManager(self)
             self.global_tick_manager = GlobalTickManager(self)
+            self.aggro_manager = AggroManager(self)
 
             # 튜토리얼 안내 시스템 초기화  # TODO: 퀘스트 만들면 지울 내용
             from ..game.tutorial_announcer import get_tutorial_announcer
@@ -122,6 +123,27 @@ class GameEngine:
         self._running = True
         self._start_time = datetime.now()
 
+        # 엔티티 캐시 주기적 기록 시작 (write-behind)
+        self.db_manager.start_write_behind()
+
+        # 방 공간 인덱스 적재 (좌표 기반 조회를 메모리에서 처리)
+        try:
+            await self.world_manager.initialize_room_index()
+        except Exception as e:
+            logger.error(f"방 공간 인덱스 적재 실패: {e}")
+
+        # 몬스터 레지스트리 적재 (스폰 제한/로밍/좌표별 조회를 메모리에서 처리)
+        try:
+            await self.world_manager.initialize_monster_registry()
+        except Exception as e:
+            logger.error(f"몬스터 레지스트리 적재 실패: {e}")
+
+        # 선공 확인 시작 (방 입장/선공형 몬스터 도착 이벤트 기반)
+        try:
+            self.aggro_manager.start()
+        except Exception as e:
+            logger.error(f"선공 매니저 시작 실패: {e}")
+
         # 몬스터 템플릿 및 스폰 시스템 시작
         try:
             # 템플릿 로드
@@ -137,8 +159,13 @@ class GameEngine:
             # logger.info("글로벌 스폰 제한 설정 완료")
 
             logger.info("몬스터 스폰 시스템 시작")
+            await self.world_manager.initialize_spawn_points()
             await self.world_manager.setup_default_spawn_points()
             await self.world_manager.start_spawn_scheduler()
+            # 스폰 보충/로밍은 글로벌 Tick에서 30초마다 실행
+            self.global_tick_manager.register_system(
+                "monster_spawn", self.world_manager.run_spawn_cycle, 30, order=50, budget=1.0
+            )
             logger.info("몬스터 스폰 시스템 완료")
 
         except Exception as e:
@@ -154,19 +181,17 @@ class GameEngine:
         # 글로벌 스케줄러 시작
         try:
             # 전투 tick 이벤트 등록 (15초마다 실행)
-            from .managers.scheduler_manager import ScheduleInterval
             self.scheduler_manager.register_event(
                 "combat_tick",
                 self._process_combat_tick,
-                [ScheduleInterval.SECOND_00, ScheduleInterval.SECOND_15,
-                 ScheduleInterval.SECOND_30, ScheduleInterval.SECOND_45]
+                interval=15
             )
             await self.scheduler_manager.start()
             logger.info("글로벌 스케줄러 시작 완료")
         except Exception as e:
             logger.error(f"글로벌 스케줄러 시작 실패: {e}")
 
-        # 글로벌 3초 Tick 시작
+        # 글로벌 Tick 시작 (등록된 시스템 실행)
         try:
             await self.global_tick_manager.start()
             logger.info("글로벌 Tick 매니저 시작 완료")
@@ -212,6 +237,13 @@ class GameEngine:
         except Exception as e:
             logger.error(f"글로벌 Tick 매니저 중지 실패: {e}")
 
+        # 선공 확인 중지
+        try:
+            await self.aggro_manager.stop()
+            logger.info("선공 매니저 중지 완료")
+        except Exception as e:
+            logger.error(f"선공 매니저 중지 실패: {e}")
+
         # 시간 시스템 중지
         try:
             await self.time_manager.stop()
@@ -229,6 +261,12 @@ class GameEngine:
         # 모든 활성 세션에 종료 알림
         await self._notify_all_players_shutdown()
 
+        # 엔티티 캐시에 남은 변경 기록
+        try:
+            await self.db_manager.stop_write_behind()
+        except Exception as e:
+            logger.error(f"엔티티 캐시 기록 실패: {e}")
+
         logger.info("GameEngine 중지 완료")
 
     def is_running(self) -> bool:
@@ -367,6 +405,9 @@ class GameEngine:
             }
         ))
 
+        # 세션 목록과 방 점유 인덱스에서 제거
+        self.session_manager.remove_session(session.session_id)
+
     # === 메시지 브로드캐스트 ===
 
     async def broadcast_to_room(self, room_id: str, message: Dict[str, Any],
@@ -394,12 +435,10 @@ class GameEngine:
             }
         ))
 
-        # 실제 브로드캐스트 수행 - 해당 방에 있는 플레이어들만 대상
+        # 실제 브로드캐스트 수행 - 해당 방에 있는 플레이어들만 대상 (방 점유 인덱스 사용)
         count = 0
-        for session in self.session_manager.iter_authenticated_sessions():
-            if (session.player and
-                session.session_id != exclude_session and
-                getattr(session, 'current_room_id', None) == room_id):
+        for session in self.session_manager.get_sessions_in_room(room_id):
+            if session.session_id != exclude_session:
                 if await session.send_message(message):
                     count += 1
 
@@ -418,16 +457,16 @@ class GameEngine:
         Returns:
             None
         """
-        message = {
+        payload = {
             "type": "moving message",
             "message": message
         }
-        for session in self.session_manager.iter_authenticated_sessions():
-            if (session.player and session.session_id != exclude_session) and (getattr(session, 'current_room_id', None) == room_id):
+        for session in self.session_manager.get_sessions_in_room(room_id):
+            if session.session_id != exclude_session:
                 logger.info(f"현재 방[{room_id}]에 플레이어 발견 ")
                 s: PlayerStats = session.player.stats
                 logger.info(f"int[{s.intelligence}] dex[{s.dexterity}]")
-                await session.send_message(message)
+                await session.send_message(payload)
         return
 
     async def broadcast_to_all(self, message: Dict[str, Any],
@@ -6,11 +6,13 @@ from .event_handler import EventHandler
 from .player_movement_manager import PlayerMovementManager
 from .admin_manager import AdminManager
 from .global_tick_manager import GlobalTickManager
+from .aggro_manager import AggroManager
 
 __all__ = [
     'CommandManager',
     'EventHandler',
     'PlayerMovementManager',
     'AdminManager',
-    'GlobalTickManager'
+    'GlobalTickManager',
+    'AggroManager'
 ]
\ No newline at end of file
@@ -329,10 +329,7 @@ class AdminManager:
                 "total_rooms": len(rooms),
                 "rooms_with_players": len([
                     room for room in rooms
-                    if any(
-                        getattr(session, 'current_room_id', None) == room.id
-                        for session in self.game_engine.session_manager.get_authenticated_sessions()
-                    )
+                    if self.game_engine.session_manager.get_sessions_in_room(room.id)
                 ])
             }
         except Exception as e:
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""선공형 몬스터 선공 매니저
+
+주기적으로 모든 세션의 방을 조회하는 대신, 선공 여부가 바뀔 수 있는 이벤트에서만 확인한다.
+- 플레이어가 방에 들어올 때 (이동, 로그인, 전투 후 복귀: SessionManager 방 입장 리스너)
+- 선공형 몬스터가 셀에 새로 나타날 때 (스폰, 리스폰, 로밍 이동: MonsterRegistry 도착 리스너)
+셀별 선공형 몬스터는 MonsterRegistry 인덱스에서 조회하므로 가만히 있는 플레이어는 비용이 들지 않는다.
+리스너는 동기 코드에서 호출되므로 확인 대상만 모아 두고, 한 번의 태스크에서 몰아서 처리한다.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from ...commands.combat_commands import AttackCommand
+from ...game.combat import CombatantType
+
+if TYPE_CHECKING:
+    from ..game_engine import GameEngine
+    from ..types import SessionType
+    from ...game.monster import Monster
+
+logger = logging.getLogger(__name__)
+
+
+class AggroManager:
+    """선공형 몬스터 선공 확인 (이벤트 기반)"""
+
+    def __init__(self, game_engine: 'GameEngine'):
+        self.game_engine = game_engine
+        self.session_manager = game_engine.session_manager
+        self.combat_handler = game_engine.combat_handler
+        self._pending_sessions: Dict[str, 'SessionType'] = {}  # 선공 확인 예약된 세션
+        self._pending_cells: Dict[Tuple[int, int], None] = {}  # 선공형 몬스터가 나타난 셀
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """방 입장/몬스터 도착 리스너 등록"""
+        self.session_manager.set_room_enter_listener(self._on_room_entered)
+        self.game_engine.world_manager.set_monster_arrival_listener(self._on_monster_arrived)
+        logger.info("AggroManager 시작 (이벤트 기반 선공 확인)")
+
+    async def stop(self) -> None:
+        """리스너 해제 및 진행 중인 확인 작업 취소"""
+        self.session_manager.set_room_enter_listener(None)
+        self.game_engine.world_manager.set_monster_arrival_listener(None)
+        self._pending_sessions.clear()
+        self._pending_cells.clear()
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        logger.info("AggroManager 중지")
+
+    # === 이벤트 ===
+
+    def _on_room_entered(self, session: 'SessionType', room_id: str) -> None:
+        """세션이 방에 들어감 (전투 인스턴스 입장은 제외)"""
+        if room_id.startswith("combat_"):
+            return
+        self._pending_sessions[session.session_id] = session
+        self._schedule_flush()
+
+    def _on_monster_arrived(self, monster: 'Monster') -> None:
+        """살아있는 선공형 몬스터가 셀에 나타남"""
+        self._pending_cells[(monster.x, monster.y)] = None
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # 이벤트 루프 밖(초기화/테스트)에서의 변경은 무시
+        self._flush_task = loop.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        """예약된 셀/세션의 선공 확인 (처리 중 새로 예약된 것까지 비울 때까지 반복)"""
+        while self._pending_cells or self._pending_sessions:
+            cells, self._pending_cells = self._pending_cells, {}
+            for x, y in cells:
+                room = await self.game_engine.world_manager.get_room_at_coordinates(x, y)
+                if not room:
+                    continue
+                for s in self.session_manager.get_sessions_in_room(room.id):
+                    self._pending_sessions[s.session_id] = s
+
+            sessions, self._pending_sessions = self._pending_sessions, {}
+            for s in sessions.values():
+                try:
+                    await self._check_session(s)
+                except Exception as e:
+                    logger.error(f"선공 확인 실패 (session_id: {s.session_id}): {e}", exc_info=True)
+
+    # === 선공 처리 ===
+
+    async def _check_session(self, s: 'SessionType') -> None:
+        """전투 중이 아닌 세션의 방에 선공형 몬스터가 있으면 전투 시작"""
+        if not s.is_authenticated or not s.player or s.in_combat:
+            return
+        if s.session_id not in self.session_manager.sessions:
+            return  # 확인 전에 연결이 끊긴 세션
+        room = await self.game_engine.world_manager.get_room(s.current_room_id)
+        if not room or room.x is None or room.y is None:
+            return
+
+        aggressive_monsters = await self.game_engine.world_manager.get_aggressive_monsters_at_coordinates(room.x, room.y)
+        if not aggressive_monsters:
+            logger.debug(f"방 {s.current_room_id[-12:]}에 선공형 몬스터 없음")
+            return
+        logger.info(f"선공몹({len(aggressive_monsters)}개) action {aggressive_monsters[0].get_localized_name('en')}")
+        # TODO: 선공형몹이 플레이어를 발견했습니다 메시지
+        # 인스턴스 확인 및 생성
+        combat = await self.combat_handler.start_combat(s.player, aggressive_monsters[0], s.current_room_id, aggresive=True)
+
+        # 인스턴스에 엔티티 기록
+        combat.set_entity_map(getattr(s, "room_entity_map", {}))
+
+        # 세션 상태 업데이트
+        s.in_combat = True
+        s.original_room_id = s.current_room_id
+        s.combat_id = combat.id
+        s.current_room_id = f"combat_{combat.id}"  # 전투 인스턴스로 이동
+        logger.debug(s)
+
+        # 만약 몹 턴이면 공격
+        async with combat.lock:
+            combatant = combat.get_current_combatant()  # 현재 누구 턴
+            if combatant.combatant_type == CombatantType.MONSTER:
+                logger.info(f"몹 턴 combatant is [{combatant.combatant_type}]")
+                await self.combat_handler.process_monster_turn(combat.id)
+                # 전투 종료 확인
+                if combat.is_combat_over():
+                    acmd = AttackCommand(self.combat_handler)
+                    await acmd._end_combat(s, combat, {})
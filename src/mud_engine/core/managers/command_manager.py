@@ -92,6 +92,7 @@ class CommandManager:
             SpawnItemCommand, ListItemTemplatesCommand, TerminateCommand
         )
         from ...commands.admin.scheduler_command import SchedulerCommand
+        from ...commands.admin.tick_stats_command import TickStatsCommand
         self.command_processor.register_command(CreateRoomCommand())
         self.command_processor.register_command(EditRoomCommand())
         self.command_processor.register_command(CreateExitCommand())
@@ -104,6 +105,7 @@ class CommandManager:
         self.command_processor.register_command(ListItemTemplatesCommand())
         self.command_processor.register_command(TerminateCommand())
         self.command_processor.register_command(SchedulerCommand())
+        self.command_processor.register_command(TickStatsCommand())
 
         # 플레이어 상호작용 명령어들 등록
         from ...commands.interaction_commands import (
@@ -332,10 +332,8 @@ class EventHandler:
             }
 
             # 방에 있는 모든 플레이어에게 전송
-            for session in self.game_engine.session_manager.sessions.values():
-                if (hasattr(session, 'current_room_id') and
-                    session.current_room_id == room_id):
-                    await session.send_message(room_message)
+            for session in self.game_engine.session_manager.get_sessions_in_room(room_id, authenticated_only=False):
+                await session.send_message(room_message)
 
         except Exception as e:
             logger.error(f"방 채팅 메시지 이벤트 처리 실패: {e}")
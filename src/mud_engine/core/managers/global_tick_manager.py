@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
+"""글로벌 Tick 매니저
+
+TickScheduler 위에 게임 기본 시스템(스태미나 회복, 몹 턴)을 등록한다.
+선공 확인은 tick이 아니라 방 입장/몬스터 도착 이벤트로 처리한다 (AggroManager).
+다른 매니저들도 register_system()으로 각자의 주기 작업을 등록해 하나의 tick 루프에서 실행된다.
+시스템별 실행 시간/DB 쿼리 수/전송 메시지 수와 tick 지연은 TickProfiler에 기록되며,
+TICK_METRICS_FILE 환경변수를 지정하면 주기적으로 파일(.json 또는 .prom)로 내보낸다.
+서로 다른 전투의 몹 턴은 동시에(최대 MAX_CONCURRENT_MONSTER_TURNS개) 처리하고,
+같은 전투는 CombatInstance.lock으로 플레이어 전투 명령과 직렬화한다.
+"""
 
 import asyncio
 import logging
+import os
 
 from typing import TYPE_CHECKING
 from ...commands.combat_commands import AttackCommand
+from ...utils.tick_profiler import TickProfiler
+from ...utils.tick_scheduler import TickScheduler
+from ...server.telnet_session import TelnetSession
 
 if TYPE_CHECKING:
     from ..game_engine import GameEngine
@@ -13,137 +27,95 @@ from ...game.combat import CombatantType
 
 logger = logging.getLogger(__name__)
 
-class GlobalTickManager:
-    """글로벌 Tick 매니저 - 3초간격 몹 턴"""
-    # TODO: 주기, 콜백을 등록 할 수 있도록 할 것
+
+class GlobalTickManager(TickScheduler):
+    """글로벌 Tick 매니저 - 주기별 시스템 등록/실행"""
+
+    # 기본 시스템 실행 순서
+    ORDER_STAMINA = 10
+    ORDER_MONSTER_TURNS = 20
+    ORDER_METRICS_DUMP = 1000
+
+    METRICS_DUMP_INTERVAL = 60  # 프로파일 파일 내보내기 주기 (초)
+    MAX_CONCURRENT_MONSTER_TURNS = 8  # 동시에 처리할 전투(몹 턴) 최대 수
 
     def __init__(self, game_engine: 'GameEngine'):
+        super().__init__()
         self.game_engine = game_engine
         self.session_manager = self.game_engine.session_manager
         self.combat_handler = self.game_engine.combat_handler
-        self._running: bool = False
+        self._monster_turn_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_MONSTER_TURNS)
+
+        # 기존 3초 몹 턴 작업을 개별 시스템으로 등록
+        self.register_system("stamina_regen", self._regen_stamina, 3, order=self.ORDER_STAMINA)
+        self.register_system("monster_turns", self._process_monster_turns, 3, order=self.ORDER_MONSTER_TURNS,
+                             budget=0.5)
+
+        # 시스템별 프로파일 (쿼리/메시지 수는 전역 누적 카운터의 실행 전후 차이)
+        self.set_profiler(TickProfiler({
+            "db_queries": lambda: self.game_engine.db_manager.query_count,
+            "messages_sent": lambda: TelnetSession.messages_sent,
+        }))
+        self.metrics_file = os.getenv("TICK_METRICS_FILE", "")
+        if self.metrics_file:
+            self.register_system("metrics_dump", self._dump_metrics, self.METRICS_DUMP_INTERVAL,
+                                 order=self.ORDER_METRICS_DUMP)
         logger.info("GlobalTickManager 초기화 완료")
 
-    async def start(self):
-        """스케줄러 시작"""
-        if self._running:
-            logger.warning("GlobalTickManager 이미 실행 중입니다")
-            return
-
-        self._running = True
-        self._tasks = []
-        self._loop = asyncio.create_task(self._scheduler_loop())
-        logger.info("글로벌 Tick 매니저 시작 완료")
-
-    async def _scheduler_loop(self):
-        while self._running:
-            logger.debug(f"GlobalTickManager _running[{self._running}]")
-
-            new_task = asyncio.create_task(self._worker())
-            self._tasks.append(new_task)
-
-            await asyncio.sleep(3)
+    # === 기본 시스템 ===
 
-            # 완료된 태스크 정리
-            self._tasks = [t for t in self._tasks if t and not t.done()]
-
-            if not self._running:
-                break
-
-    async def stop(self):
-        self._running = False
-        if self._loop and not self._loop.done():
-            self._loop.cancel()
-            try:
-                await self._loop
-            except asyncio.CancelledError:
-                pass
-
-        for t in self._tasks:
-            if t and not t.done(): t.cancle()
-
-        if self._tasks:
-            await asyncio.gather(*self._tasks, return_exceptions=True)
-        logger.info("글로벌 Tick 매니저 중지 완료")
-
-    async def _worker(self):
-        # 스태미나 회복 (모든 세션, 3초마다 +0.5)
+    async def _regen_stamina(self) -> None:
+        """스태미나 회복 (모든 세션, 3초마다 +0.5)"""
         for s in self.session_manager.get_all_sessions():
             if hasattr(s, 'stamina') and hasattr(s, 'max_stamina'):
                 if s.stamina < s.max_stamina:
                     s.stamina = min(s.stamina + 0.5, s.max_stamina)
 
+    async def _process_monster_turns(self) -> None:
+        """현재 턴이 몬스터인 전투만 골라 전투별로 동시에 몹 턴 처리"""
+        combats = self.combat_handler.combat_manager.get_combats_awaiting_monster_turn()
+        if not combats:
+            return
+        async with asyncio.TaskGroup() as tg:
+            for combat in combats:
+                tg.create_task(self._run_monster_turn(combat))
+
+    async def _run_monster_turn(self, combat) -> None:
+        """전투 하나의 몹 턴 처리 (오류는 해당 전투에서만 기록하고 다른 전투에 전파하지 않음)"""
+        async with self._monster_turn_semaphore, combat.lock:
+            # 락을 기다리는 동안 플레이어 명령으로 턴이 넘어갔거나 전투가 끝났을 수 있음
+            if not combat.is_monster_turn():
+                return
+            # 접속해 전투 중인 플레이어가 없는 전투는 진행하지 않음 (재접속/타임아웃 대기)
+            s = self._get_combat_session(combat)
+            if not s:
+                return
+            logger.info(f"몹턴 session_id[{s.session_id[-12:]}] combat_id[{combat.id[-12:]}]")
+            try:
+                await self._process_monster_turn(combat.id)
+                # 전투 종료 확인
+                if combat.is_combat_over():
+                    acmd = AttackCommand(self.combat_handler)
+                    await acmd._end_combat(s, combat, {})
+            except Exception as e:
+                logger.error(f"몹 턴 처리 오류 (combat_id: {combat.id}): {e}", exc_info=True)
+
+    def _get_combat_session(self, combat):
+        """전투에 참가 중인 플레이어 중 해당 전투 상태인 세션 하나"""
+        for combatant in combat.combatants:
+            if combatant.combatant_type != CombatantType.PLAYER:
+                continue
+            s = self.session_manager.get_player_session(combatant.id)
+            if s and s.in_combat and s.combat_id == combat.id:
+                return s
+        return None
+
+    async def _dump_metrics(self) -> None:
+        """프로파일을 TICK_METRICS_FILE로 내보내기"""
         try:
-            for s in self.session_manager.get_all_sessions():
-                logger.debug(f"session_id[{s.session_id}]")
-                if not s.in_combat: continue
-                logger.info(f"몹턴 session_id[{s.session_id[-12:]}] in_combat True session.combat_id[{s.combat_id[-12:]}]")
-                # 배틀 객체 가져오기
-                _combats = self.combat_handler.active_combats
-                for cid in _combats:  # 이 루프는 세션 갯수만큼 반복 됨.. 으음..
-                    if cid == s.combat_id:
-                        _combat_instancese = _combats[cid]
-                        combatant = _combat_instancese.get_current_combatant()  # 현재 누구 턴
-                        if combatant.combatant_type == CombatantType.MONSTER:
-                            logger.info(f"몹 턴 combatant is [{combatant.combatant_type}]")
-                            await self._process_monster_turn(cid)
-                            # 전투 종료 확인
-                            if _combat_instancese.is_combat_over():
-                                acmd = AttackCommand(_combats)
-                                await acmd._end_combat(s, _combat_instancese, {})
-                        break  # 해당 세션에 대한 combat_id 를 찾으려는 것이므로 찾았으면 break
-        except asyncio.CancelledError:
-            logger.info("Worker 태스크 취소됨 - 전투중 몹턴")
-            # 정리 작업 수행
-            raise  # 반드시 re-raise
-        # ===== ===== ===== ===== ===== =====
-        try:
-            locale = 'en' # 서버내부처리를 위해서는 디폴트 값 이용
-            for s in self.session_manager.get_all_sessions():
-                logger.debug(f"session_id[{s.session_id}]")
-                if s.in_combat: continue
-                room_info = await self.game_engine.get_room_info(s.current_room_id, locale)
-                if not room_info or not room_info.get('monsters'):
-                    return
-                aggressive_monsters = []
-                for monster in room_info['monsters']:
-                    logger.debug(f"몬스터 체크: {monster.get_localized_name(locale)}, 타입: {monster.monster_type}, 선공형: {monster.is_aggressive()}, 살아있음: {monster.is_alive}")
-                    # 선공형이고 살아있는 몬스터만
-                    if monster.is_aggressive() and monster.is_alive:
-                        aggressive_monsters.append(monster)
-                        logger.info(f"선공형 몬스터 발견: {monster.get_localized_name(locale)}")
-                if not aggressive_monsters:
-                    logger.debug(f"방 {s.current_room_id[-12:]}에 선공형 몬스터 없음")
-                    return
-                logger.info(f"선공몹({len(aggressive_monsters)}개) action {aggressive_monsters[0].get_localized_name('en')}")
-                # TODO: 선공형몹이 플레이어를 발견했습니다 메시지
-                # 인스턴스 확인 및 생성
-                combat = await self.combat_handler.start_combat(s.player, aggressive_monsters[0], s.current_room_id, aggresive=True)
-
-                # 인스턴스에 엔티티 기록
-                combat.set_entity_map(getattr(s, "room_entity_map", {}))
-
-                # 세션 상태 업데이트
-                s.in_combat = True
-                s.original_room_id =s.current_room_id
-                s.combat_id = combat.id
-                s.current_room_id = f"combat_{combat.id}"  # 전투 인스턴스로 이동
-                logger.debug(s)
-
-                # 만약 몹 턴이면 공격
-                combatant = combat.get_current_combatant()  # 현재 누구 턴
-                if combatant.combatant_type == CombatantType.MONSTER:
-                    logger.info(f"몹 턴 combatant is [{combatant.combatant_type}]")
-                    await self._process_monster_turn(combat.id)
-                    # 전투 종료 확인
-                    if combat.is_combat_over():
-                        acmd = AttackCommand(_combats)
-                        await acmd._end_combat(s, _combat_instancese, {})
-
-        except asyncio.CancelledError:
-            logger.info("Worker 태스크 취소됨 - 몹 선공")
-            # 정리 작업 수행
-            raise  # 반드시 re-raise
+            self.profiler.dump(self.metrics_file)
+        except OSError as e:
+            logger.error(f"Tick 프로파일 파일 기록 실패 ({self.metrics_file}): {e}")
 
     async def _process_monster_turn(self, combat_id):
         await self.combat_handler.process_monster_turn(combat_id)
@@ -326,17 +326,14 @@ class PlayerMovementManager:
         try:
             # 방에 있는 모든 플레이어들 찾기
             players_in_room = []
-            for session in self.game_engine.session_manager.get_authenticated_sessions():
-                if (session.player and
-                    getattr(session, 'current_room_id', None) == room_id):
-
-                    player_info = {
-                        "id": session.player.id,
-                        "name": session.player.username,
-                        "session_id": session.session_id,
-                        "following": getattr(session, 'following_player', None)
-                    }
-                    players_in_room.append(player_info)
+            for session in self.game_engine.session_manager.get_sessions_in_room(room_id):
+                player_info = {
+                    "id": session.player.id,
+                    "name": session.player.username,
+                    "session_id": session.session_id,
+                    "following": getattr(session, 'following_player', None)
+                }
+                players_in_room.append(player_info)
 
             # 방에 있는 모든 플레이어들에게 업데이트된 목록 전송
             update_message = {
@@ -464,8 +461,7 @@ class PlayerMovementManager:
                 await session.send_error("현재 방의 좌표 정보가 없습니다.")
                 return False
 
-            # 목적지 좌표 계산
-            from ...utils.coordinate_utils import get_direction_from_string, calculate_new_coordinates
+            from ...utils.coordinate_utils import get_direction_from_string
 
             direction_enum = get_direction_from_string(direction)
             if not direction_enum:
@@ -476,20 +472,9 @@ class PlayerMovementManager:
                 await session.send_error(message)
                 return False
 
-            new_x, new_y = calculate_new_coordinates(current_room.x, current_room.y, direction_enum)
-
-            # 막힌 출구 확인
-            if hasattr(current_room, 'blocked_exits') and direction.lower() in (current_room.blocked_exits or []):
-                from ..localization import get_localization_manager
-                localization = get_localization_manager()
-                locale = session.player.preferred_locale if session.player else "en"
-                message = localization.get_message("movement.no_exit", locale, direction=direction)
-                await session.send_error(message)
-                return False
-
-            # 목적지 방 확인
-            target_room = await self.game_engine.world_manager.get_room_at_coordinates(new_x, new_y)
-            if not target_room:
+            # 미리 계산된 출구 그래프에서 목적지 확인 (막힌 출구 반영)
+            target_room_id = await self.game_engine.world_manager.get_room_exit(current_room_id, direction_enum.value)
+            if not target_room_id:
                 from ..localization import get_localization_manager
                 localization = get_localization_manager()
                 locale = session.player.preferred_locale if session.player else "en"
@@ -508,7 +493,7 @@ class PlayerMovementManager:
             session.stamina = max(0.0, session.stamina - 1.0)
 
             # 기존 이동 메서드 사용
-            return await self.move_player_to_room(session, target_room.id, skip_followers)
+            return await self.move_player_to_room(session, target_room_id, skip_followers)
 
         except Exception as e:
             logger.error(f"방향 기반 이동 실패 ({session.player.username}, {direction}): {e}")
@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
-"""글로벌 스케줄러 시스템"""
+"""글로벌 스케줄러 시스템
+
+이벤트마다 임의의 주기(interval)와 주기 내 실행 시점(offsets)을 가지며,
+예정 시각은 이벤트 루프의 단조 시계(loop.time()) 기준으로 계산한다.
+벽시계 정렬(예: 매분 15초)은 시작할 때 한 번만 벽시계 → loop.time() 기준점을 잡아 맞추므로,
+실행 중 시스템 시계가 바뀌어도 간격이 흔들리지 않는다.
+각 실행은 이벤트별 독립 태스크로 타임아웃과 함께 실행되어 느린 이벤트가 다른 이벤트를 늦추지 않으며,
+밀린 실행은 이벤트별 정책(MissedRunPolicy)에 따라 건너뛰거나 몰아서 실행한다.
+이벤트별 시작 지연(예정 시각 대비)은 히스토그램으로, 실행 시간은 글로벌 Tick 프로파일러에 기록한다.
+"""
 
 import asyncio
 import logging
+import math
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional, Callable, Awaitable, Dict, List
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Callable, Awaitable, Dict, List, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+from ...utils.tick_profiler import Histogram, TickProfiler
+
 if TYPE_CHECKING:
     from ..game_engine import GameEngine
 
@@ -15,27 +28,48 @@ logger = logging.getLogger(__name__)
 
 
 class ScheduleInterval(Enum):
-    """스케줄 간격 열거형"""
+    """매분 실행 시점 (기존 등록 방식 호환용: 60초 주기의 해당 초에 실행)"""
     SECOND_00 = 0
     SECOND_15 = 15
     SECOND_30 = 30
     SECOND_45 = 45
 
 
+class MissedRunPolicy(Enum):
+    """예정 시각을 놓친 실행 처리 정책"""
+    SKIP = "skip"  # 밀린 실행은 한 번으로 합치고 나머지는 건너뜀
+    CATCH_UP = "catch_up"  # 밀린 횟수만큼 연달아 실행 (MAX_CATCH_UP_RUNS까지)
+
+
 @dataclass
 class ScheduledEvent:
     """스케줄된 이벤트"""
     name: str
     callback: Callable[[], Awaitable[None]]
-    intervals: List[ScheduleInterval]
+    interval: float  # 주기 (초)
+    offsets: Tuple[float, ...]  # 주기 내 실행 시점 (초, 벽시계 기준 정렬)
+    missed_policy: MissedRunPolicy = MissedRunPolicy.SKIP
+    timeout: Optional[float] = None  # 1회 실행 제한 시간 (초, None이면 제한 없음)
     enabled: bool = True
+    next_run: Optional[float] = None  # 다음 예정 시각 (loop.time 기준)
+    pending: List[float] = field(default_factory=list)  # 실행 대기 중인 예정 시각
+    task: Optional[asyncio.Task] = None
     last_run: Optional[datetime] = None
     run_count: int = 0
     error_count: int = 0
+    timeout_count: int = 0
+    skipped_count: int = 0  # 정책/중복 실행 방지로 건너뛴 실행 수
+    last_latency: float = 0.0
+    last_duration: float = 0.0
+    latency: Histogram = field(default_factory=lambda: Histogram(TickProfiler.DURATION_BUCKETS))
 
 
 class SchedulerManager:
-    """글로벌 스케줄러 매니저 - 0, 15, 30, 45초에 이벤트 실행"""
+    """글로벌 스케줄러 매니저 - 이벤트별 주기/시점에 맞춰 독립 태스크로 실행"""
+
+    DEFAULT_TIMEOUT = 30.0  # 이벤트 1회 실행 기본 제한 시간 (초)
+    MAX_CATCH_UP_RUNS = 5  # CATCH_UP 정책에서 한 번에 몰아서 실행할 최대 횟수
+    STATUS_LOG_INTERVAL = 60.0  # 상태 로그 주기 (초)
 
     def __init__(self, game_engine: 'GameEngine'):
         """
@@ -45,17 +79,25 @@ class SchedulerManager:
             game_engine: 게임 엔진 인스턴스
         """
         self.game_engine = game_engine
-        self._task: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None  # 디스패치 루프
         self._running: bool = False
         self._events: Dict[str, ScheduledEvent] = {}
-        
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._epoch: float = 0.0  # 벽시계 0초에 해당하는 loop.time() 값 (시작 시 한 번 계산)
+        self._next_status_log: float = 0.0
+
         logger.info("SchedulerManager 초기화 완료")
 
     def register_event(
         self,
         name: str,
         callback: Callable[[], Awaitable[None]],
-        intervals: List[ScheduleInterval]
+        intervals: Optional[List[ScheduleInterval]] = None,
+        *,
+        interval: Optional[float] = None,
+        offset: float = 0.0,
+        missed_policy: MissedRunPolicy = MissedRunPolicy.SKIP,
+        timeout: Optional[float] = DEFAULT_TIMEOUT
     ) -> None:
         """
         스케줄 이벤트 등록
@@ -63,29 +105,50 @@ class SchedulerManager:
         Args:
             name: 이벤트 이름 (고유 식별자)
             callback: 실행할 비동기 함수
-            intervals: 실행할 초 간격 리스트
+            intervals: 매분 실행할 초 목록 (기존 방식, interval과 함께 쓰지 않음)
+            interval: 실행 주기 (초)
+            offset: 주기 내 실행 시점 (초, 벽시계 기준. 예: interval=60, offset=15 → 매분 15초)
+            missed_policy: 예정 시각을 놓친 실행 처리 정책
+            timeout: 1회 실행 제한 시간 (초, None이면 제한 없음)
 
         Example:
+            scheduler.register_event("monster_spawn", self._spawn_monsters, interval=30)
             scheduler.register_event(
-                "monster_spawn",
-                self._spawn_monsters,
-                [ScheduleInterval.SECOND_00, ScheduleInterval.SECOND_30]
+                "map_export", self._export_map,
+                [ScheduleInterval.SECOND_15]
             )
         """
-        if name in self._events:
+        if intervals:
+            period, offsets = 60.0, tuple(sorted(float(i.value) for i in intervals))
+        elif interval is not None and interval > 0:
+            period, offsets = float(interval), (float(offset) % float(interval),)
+        else:
+            raise ValueError(f"이벤트 '{name}'의 실행 주기가 지정되지 않았습니다")
+
+        previous = self._events.get(name)
+        if previous:
             logger.warning(f"이벤트 '{name}'이 이미 등록되어 있습니다. 덮어씁니다.")
-        
+
         event = ScheduledEvent(
             name=name,
             callback=callback,
-            intervals=intervals
+            interval=period,
+            offsets=offsets,
+            missed_policy=missed_policy,
+            timeout=timeout
         )
+        if previous and previous.task and not previous.task.done():
+            event.task = previous.task  # 실행 중인 이전 콜백과 겹치지 않도록 유지
         self._events[name] = event
-        logger.info(f"스케줄 이벤트 등록: {name} (간격: {[i.value for i in intervals]}초)")
+        if self._running:
+            self._schedule(event, self._loop_time())
+            self._wakeup.set()
+        logger.info(f"스케줄 이벤트 등록: {name} (주기: {period:g}초, 시점: {[f'{o:g}' for o in offsets]}초, "
+                    f"정책: {missed_policy.value})")
 
     def unregister_event(self, name: str) -> bool:
         """
-        스케줄 이벤트 등록 해제
+        스케줄 이벤트 등록 해제 (실행 중인 콜백은 끝까지 실행)
 
         Args:
             name: 이벤트 이름
@@ -97,7 +160,7 @@ class SchedulerManager:
             del self._events[name]
             logger.info(f"스케줄 이벤트 등록 해제: {name}")
             return True
-        
+
         logger.warning(f"등록되지 않은 이벤트: {name}")
         return False
 
@@ -112,10 +175,15 @@ class SchedulerManager:
             bool: 성공 여부
         """
         if name in self._events:
-            self._events[name].enabled = True
+            event = self._events[name]
+            event.enabled = True
+            if self._running:
+                # 비활성 동안의 실행은 밀린 실행으로 보지 않고 다음 예정 시각부터 재개
+                self._schedule(event, self._loop_time())
+                self._wakeup.set()
             logger.info(f"스케줄 이벤트 활성화: {name}")
             return True
-        
+
         logger.warning(f"등록되지 않은 이벤트: {name}")
         return False
 
@@ -133,7 +201,7 @@ class SchedulerManager:
             self._events[name].enabled = False
             logger.info(f"스케줄 이벤트 비활성화: {name}")
             return True
-        
+
         logger.warning(f"등록되지 않은 이벤트: {name}")
         return False
 
@@ -149,15 +217,28 @@ class SchedulerManager:
         """
         if name not in self._events:
             return None
-        
+
         event = self._events[name]
+        next_in = None
+        if self._running and event.enabled and event.next_run is not None:
+            next_in = max(0.0, event.next_run - self._loop_time())
         return {
             "name": event.name,
             "enabled": event.enabled,
-            "intervals": [i.value for i in event.intervals],
+            "interval": event.interval,
+            "offsets": list(event.offsets),
+            "missed_policy": event.missed_policy.value,
+            "timeout": event.timeout,
+            "running": bool(event.task and not event.task.done()),
+            "next_run_in": next_in,
             "last_run": event.last_run.isoformat() if event.last_run else None,
             "run_count": event.run_count,
-            "error_count": event.error_count
+            "error_count": event.error_count,
+            "timeout_count": event.timeout_count,
+            "skipped_count": event.skipped_count,
+            "last_duration": event.last_duration,
+            "last_latency": event.last_latency,
+            "latency": event.latency.to_dict()
         }
 
     def list_events(self) -> List[Dict]:
@@ -175,144 +256,169 @@ class SchedulerManager:
             logger.warning("SchedulerManager가 이미 실행 중입니다")
             return
 
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # 벽시계 정렬 기준점은 시작 시 한 번만 계산 (이후 시계 변경의 영향을 받지 않음)
+        self._epoch = now - time.time()
+        self._next_status_log = now + self.STATUS_LOG_INTERVAL
         self._running = True
-        self._task = asyncio.create_task(self._scheduler_loop())
-        
+        for event in self._events.values():
+            self._schedule(event, now)
+        self._task = asyncio.create_task(self._dispatch_loop())
+
         event_count = len(self._events)
         enabled_count = sum(1 for e in self._events.values() if e.enabled)
         logger.info(f"글로벌 스케줄러 시작 완료 (등록된 이벤트: {event_count}개, 활성: {enabled_count}개)")
 
     async def stop(self) -> None:
-        """스케줄러 중지"""
+        """스케줄러 중지 (디스패치 루프와 실행 중인 이벤트 태스크 취소)"""
         if not self._running:
             return
 
         self._running = False
-        if self._task and not self._task.done():
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        tasks = [self._task] if self._task else []
+        tasks += [e.task for e in self._events.values() if e.task]
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for event in self._events.values():
+            event.task = None
+            event.pending.clear()
 
         logger.info("글로벌 스케줄러 중지 완료")
 
-    async def _scheduler_loop(self) -> None:
-        """스케줄러 메인 루프"""
-        try:
-            loop_count = 0
-            while self._running:
-                now = datetime.now()
-                current_second = now.second
-
-                # 다음 실행 시점 계산
-                next_trigger = self._calculate_next_trigger(current_second)
-                wait_seconds = self._calculate_wait_seconds(current_second, next_trigger)
-
-                logger.debug(f"현재 시간: {now.strftime('%H:%M:%S')}, "
-                           f"다음 트리거: {next_trigger}초, "
-                           f"대기 시간: {wait_seconds:.2f}초")
-
-                # 대기
-                await asyncio.sleep(wait_seconds)
-
-                if not self._running:
-                    break
-
-                # 이벤트 실행
-                await self._execute_scheduled_events(next_trigger)
-                
-                # 1분마다 상태 로그 (0초 트리거 시)
-                loop_count += 1
-                if next_trigger == 0 and loop_count % 1 == 0:
-                    event_count = len(self._events)
-                    enabled_count = sum(1 for e in self._events.values() if e.enabled)
-                    total_runs = sum(e.run_count for e in self._events.values())
-                    total_errors = sum(e.error_count for e in self._events.values())
-                    logger.info(f"스케줄러 상태: 이벤트 {event_count}개 (활성 {enabled_count}개), "
-                              f"총 실행 {total_runs}회, 오류 {total_errors}회")
+    # === 예정 시각 계산 ===
 
-        except asyncio.CancelledError:
-            logger.info("스케줄러 루프 취소됨")
-        except Exception as e:
-            logger.error(f"스케줄러 루프 오류: {e}", exc_info=True)
+    def _loop_time(self) -> float:
+        return asyncio.get_running_loop().time()
 
-    def _calculate_next_trigger(self, current_second: int) -> int:
-        """
-        다음 트리거 시점 계산
+    def _next_due(self, event: ScheduledEvent, after: float) -> float:
+        """after 이후(초과)의 가장 이른 예정 시각 (loop.time 기준)"""
+        cycle = math.floor((after - self._epoch) / event.interval)
+        for k in (cycle, cycle + 1):
+            for offset in event.offsets:
+                due = self._epoch + k * event.interval + offset
+                if due > after:
+                    return due
+        return self._epoch + (cycle + 2) * event.interval + event.offsets[0]
 
-        Args:
-            current_second: 현재 초 (0-59)
+    def _schedule(self, event: ScheduledEvent, now: float) -> None:
+        event.next_run = self._next_due(event, now)
 
-        Returns:
-            int: 다음 트리거 초 (0, 15, 30, 45)
-        """
-        trigger_seconds = [0, 15, 30, 45]
-        
-        for trigger in trigger_seconds:
-            if trigger > current_second:
-                return trigger
-        
-        # 다음 분의 0초
-        return 0
-
-    def _calculate_wait_seconds(self, current_second: int, next_trigger: int) -> float:
-        """
-        다음 트리거까지 대기 시간 계산
-
-        Args:
-            current_second: 현재 초
-            next_trigger: 다음 트리거 초
-
-        Returns:
-            float: 대기 시간 (초)
-        """
-        now = datetime.now()
-        current_microsecond = now.microsecond
+    # === 실행 ===
 
-        if next_trigger > current_second:
-            # 같은 분 내
-            seconds_diff = next_trigger - current_second
-            wait_seconds = seconds_diff - (current_microsecond / 1_000_000)
+    async def _dispatch_loop(self) -> None:
+        """가장 이른 예정 시각까지 대기했다가 도래한 이벤트를 각자의 태스크로 실행"""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._running:
+                now = loop.time()
+                for event in list(self._events.values()):
+                    if event.enabled and event.next_run is not None and event.next_run <= now:
+                        self._dispatch(event, now)
+
+                if now >= self._next_status_log:
+                    self._next_status_log = now + self.STATUS_LOG_INTERVAL
+                    self._log_status()
+
+                due_times = [e.next_run for e in self._events.values() if e.enabled and e.next_run is not None]
+                wait = min(due_times + [self._next_status_log]) - loop.time()
+                self._wakeup.clear()
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+        except asyncio.CancelledError:
+            logger.info("스케줄러 디스패치 루프 취소됨")
+            raise
+
+    def _dispatch(self, event: ScheduledEvent, now: float) -> None:
+        """도래한(밀린 것 포함) 예정 시각을 정책에 따라 실행 대기열에 넣고 태스크 시작"""
+        dues = self._collect_due_times(event, now)
+        running = event.task is not None and not event.task.done()
+
+        if event.missed_policy == MissedRunPolicy.CATCH_UP:
+            room = self.MAX_CATCH_UP_RUNS - len(event.pending)
+            accepted = dues[-room:] if room > 0 else []
+        elif running or event.pending:
+            accepted = []  # 이전 실행이 아직 진행 중이면 겹쳐 실행하지 않음
         else:
-            # 다음 분
-            seconds_diff = (60 - current_second) + next_trigger
-            wait_seconds = seconds_diff - (current_microsecond / 1_000_000)
-
-        return max(0.1, wait_seconds)  # 최소 0.1초
-
-    async def _execute_scheduled_events(self, trigger_second: int) -> None:
-        """
-        스케줄된 이벤트 실행
-
-        Args:
-            trigger_second: 트리거 초 (0, 15, 30, 45)
-        """
-        trigger_interval = ScheduleInterval(trigger_second)
-        executed_count = 0
-        
-        logger.debug(f"스케줄 이벤트 실행 시작: {trigger_second}초")
-
-        for event in self._events.values():
-            if not event.enabled:
-                continue
-            
-            if trigger_interval not in event.intervals:
-                continue
-
+            accepted = dues[-1:]  # 밀린 실행은 가장 최근 예정 시각 한 번으로 합침
+
+        skipped = len(dues) - len(accepted)
+        if skipped:
+            event.skipped_count += skipped
+            reason = "이전 실행 진행 중" if running else "예정 시각 지연"
+            logger.warning(f"스케줄 이벤트 {skipped}회 건너뜀: {event.name} ({reason})")
+        event.pending.extend(accepted)
+
+        if event.pending and not running:
+            event.task = asyncio.create_task(self._run_event(event), name=f"scheduler:{event.name}")
+            event.task.add_done_callback(self._on_event_task_done)
+
+    def _collect_due_times(self, event: ScheduledEvent, now: float) -> List[float]:
+        """now까지 도래한 예정 시각들을 모으고 다음 예정 시각을 갱신"""
+        dues = [event.next_run]
+        next_run = self._next_due(event, event.next_run)
+        limit = self.MAX_CATCH_UP_RUNS
+        while next_run <= now:
+            if len(dues) < limit:
+                dues.append(next_run)
+            else:
+                # 대기열에 넣지 못할 만큼 밀린 실행은 개수만 세고 마지막 예정 시각만 유지
+                event.skipped_count += 1
+                dues[-1] = next_run
+            next_run = self._next_due(event, next_run)
+        event.next_run = next_run
+        return dues
+
+    async def _run_event(self, event: ScheduledEvent) -> None:
+        """이벤트의 실행 대기열을 순서대로 실행 (1회 실행마다 타임아웃 적용)"""
+        loop = asyncio.get_running_loop()
+        profiler = self.game_engine.global_tick_manager.profiler
+        while event.pending:
+            due = event.pending.pop(0)
+            snapshot = profiler.begin() if profiler else None
+            started = loop.time()
+            event.last_latency = max(0.0, started - due)
+            event.latency.observe(event.last_latency)
             try:
                 logger.debug(f"이벤트 실행: {event.name}")
-                await event.callback()
-                
+                await asyncio.wait_for(event.callback(), event.timeout)
                 event.last_run = datetime.now()
                 event.run_count += 1
-                executed_count += 1
-                
                 logger.debug(f"이벤트 실행 완료: {event.name} (총 {event.run_count}회)")
-            
+            except asyncio.TimeoutError:
+                event.timeout_count += 1
+                event.error_count += 1
+                logger.error(f"이벤트 실행 시간 초과 ({event.name}): {event.timeout:g}초")
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 event.error_count += 1
                 logger.error(f"이벤트 실행 오류 ({event.name}): {e}", exc_info=True)
+            finally:
+                event.last_duration = loop.time() - started
+                if profiler:
+                    profiler.record_system(f"scheduler:{event.name}", event.last_duration, snapshot)
+
+    def _on_event_task_done(self, task: asyncio.Task) -> None:
+        """이벤트 태스크 종료 감시 (예상치 못한 예외 기록)"""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error(f"스케줄 이벤트 태스크 비정상 종료 ({task.get_name()}): {error}", exc_info=error)
+
+    def _log_status(self) -> None:
+        """1분마다 상태 로그"""
+        event_count = len(self._events)
+        enabled_count = sum(1 for e in self._events.values() if e.enabled)
+        total_runs = sum(e.run_count for e in self._events.values())
+        total_errors = sum(e.error_count for e in self._events.values())
+        total_skipped = sum(e.skipped_count for e in self._events.values())
+        logger.info(f"스케줄러 상태: 이벤트 {event_count}개 (활성 {enabled_count}개), "
+                    f"총 실행 {total_runs}회, 오류 {total_errors}회, 건너뜀 {total_skipped}회")
 
-        if executed_count > 0:
-            logger.info(f"스케줄 이벤트 실행 완료: {executed_count}개 이벤트 ({trigger_second}초)")
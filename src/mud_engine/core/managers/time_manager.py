@@ -5,7 +5,7 @@ import asyncio
 import logging
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 from pathlib import Path
 
 if TYPE_CHECKING:
@@ -23,6 +23,9 @@ class TimeOfDay(Enum):
 class TimeManager:
     """게임 내 시간 관리 및 낮/밤 주기 시스템"""
 
+    TIME_CHANGE_INTERVAL = 300  # 시간대 변경 주기 (초)
+    MAP_EXPORT_TIMEOUT = 10.0  # 맵 생성 1회 제한 시간 (초)
+
     def __init__(self, game_engine: 'GameEngine'):
         """
         TimeManager 초기화
@@ -31,7 +34,6 @@ class TimeManager:
             game_engine: 게임 엔진 인스턴스
         """
         self.game_engine = game_engine
-        self._task: Optional[asyncio.Task] = None
         self._running: bool = False
         self._map_export_counter: int = 0  # 맵 생성 카운터 (15초 * 40 = 10분)
         
@@ -78,14 +80,20 @@ class TimeManager:
             return
 
         self._running = True
-        self._task = asyncio.create_task(self._time_cycle_loop())
-        
-        # 스케줄러에 맵 생성 이벤트 등록
-        from ..managers.scheduler_manager import ScheduleInterval
+        # 시간대 변경과 맵 생성을 스케줄러 이벤트로 등록 (단조 시계 기준, 벽시계 정렬은 시작 시 한 번)
+        from ..managers.scheduler_manager import MissedRunPolicy
+        self.game_engine.scheduler_manager.register_event(
+            "time_cycle",
+            self._change_time_of_day,
+            interval=self.TIME_CHANGE_INTERVAL,  # 매 5분 정각 (0, 5, 10, ... 분)
+            missed_policy=MissedRunPolicy.SKIP
+        )
         self.game_engine.scheduler_manager.register_event(
             "map_export",
             self._export_unified_map_scheduled,
-            [ScheduleInterval.SECOND_15]  # 매분 15초에 실행
+            interval=60,
+            offset=15,  # 매분 15초에 실행
+            timeout=self.MAP_EXPORT_TIMEOUT
         )
         
         logger.info("시간 시스템 시작 완료")
@@ -100,118 +108,34 @@ class TimeManager:
 
         self._running = False
         
-        # 시간 주기 태스크 중지
-        if self._task and not self._task.done():
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-
-        # 스케줄러에서 맵 생성 이벤트 제거
+        # 스케줄러에서 시간대 변경/맵 생성 이벤트 제거
+        self.game_engine.scheduler_manager.unregister_event("time_cycle")
         self.game_engine.scheduler_manager.unregister_event("map_export")
 
         logger.info("시간 시스템 중지 완료")
 
-    async def _time_cycle_loop(self) -> None:
-        """시간 주기 루프"""
-        try:
-            while self._running:
-                # 현재 시간의 분 확인
-                now = datetime.now()
-                current_minute = now.minute
-
-                # 다음 변경 시간 계산
-                next_change_minute = self._calculate_next_change_minute(current_minute)
-                wait_seconds = self._calculate_wait_seconds(current_minute, next_change_minute)
-
-                logger.info(f"현재 시간: {now.strftime('%H:%M')}, "
-                          f"다음 변경: {next_change_minute}분, "
-                          f"대기 시간: {wait_seconds}초")
-
-                # 대기
-                await asyncio.sleep(wait_seconds)
-
-                if not self._running:
-                    break
-
-                # 시간대 변경
-                await self._change_time_of_day()
-
-        except asyncio.CancelledError:
-            logger.info("시간 주기 루프 취소됨")
-        except Exception as e:
-            logger.error(f"시간 주기 루프 오류: {e}", exc_info=True)
-
-    def _calculate_next_change_minute(self, current_minute: int) -> int:
-        """
-        다음 시간 변경 시점 계산
-
-        Args:
-            current_minute: 현재 분
-
-        Returns:
-            int: 다음 변경 시점의 분 (0-59)
+    @classmethod
+    def _time_of_day_at(cls, now: datetime) -> TimeOfDay:
         """
-        # 낮으로 변경: 5, 15, 25, 35, 45, 55
-        # 밤으로 변경: 0, 10, 20, 30, 40, 50
-        change_minutes = [0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55]
-
-        for minute in change_minutes:
-            if minute > current_minute:
-                return minute
+        가장 가까운 5분 경계로 반올림한 시각의 시간대
 
-        # 다음 시간의 0분
-        return 0
-
-    def _calculate_wait_seconds(self, current_minute: int, next_change_minute: int) -> float:
+        스케줄러 실행이 경계보다 조금 늦거나(지연) 이르더라도(시계 오차) 같은 경계로 판정된다.
+        낮: 5, 15, 25, 35, 45, 55분 / 밤: 0, 10, 20, 30, 40, 50분
         """
-        다음 변경까지 대기 시간 계산
-
-        Args:
-            current_minute: 현재 분
-            next_change_minute: 다음 변경 분
-
-        Returns:
-            float: 대기 시간 (초)
-        """
-        now = datetime.now()
-        current_second = now.second
-
-        if next_change_minute > current_minute:
-            # 같은 시간 내
-            minutes_diff = next_change_minute - current_minute
-            wait_seconds = (minutes_diff * 60) - current_second
-        else:
-            # 다음 시간
-            minutes_diff = (60 - current_minute) + next_change_minute
-            wait_seconds = (minutes_diff * 60) - current_second
-
-        return max(1, wait_seconds)  # 최소 1초
+        minutes = now.minute + now.second / 60
+        slot = round(minutes / 5) % 12
+        return TimeOfDay.DAY if slot % 2 == 1 else TimeOfDay.NIGHT
 
     async def _change_time_of_day(self) -> None:
-        """시간대 변경 및 알림"""
-        now = datetime.now()
-        current_minute = now.minute
-        
-        logger.info(f"_change_time_of_day 호출됨: 현재 분={current_minute}")
+        """시간대 변경 및 알림 (스케줄러에서 5분마다 호출)"""
+        if not self._running:
+            return
 
-        # 낮/밤 결정
-        # 낮: 5, 15, 25, 35, 45, 55
-        # 밤: 0, 10, 20, 30, 40, 50
-        day_minutes = [5, 15, 25, 35, 45, 55]
-        night_minutes = [0, 10, 20, 30, 40, 50]
+        now = datetime.now()
+        logger.info(f"_change_time_of_day 호출됨: 현재 시각={now.strftime('%H:%M:%S')}")
 
         old_time = self.current_time
-
-        if current_minute in day_minutes:
-            self.current_time = TimeOfDay.DAY
-        elif current_minute in night_minutes:
-            self.current_time = TimeOfDay.NIGHT
-        else:
-            # 예상치 못한 시간 (오차 허용)
-            logger.warning(f"예상치 못한 시간 변경 시점: {current_minute}분")
-            return
+        self.current_time = self._time_of_day_at(now)
 
         # 시간이 실제로 변경된 경우에만 알림
         logger.info(f"시간 비교: old={old_time.value}, new={self.current_time.value}")
@@ -280,7 +204,8 @@ class TimeManager:
             output_path = Path("data/world_map_unified.html")
             
             # MapExporter 인스턴스 생성
-            map_exporter = MapExporter(self.game_engine.db_manager)
+            map_exporter = MapExporter(self.game_engine.db_manager,
+                                       self.game_engine.world_manager.exit_graph)
             
             # 맵 생성 실행
             success = await map_exporter.export_to_file(str(output_path))
@@ -5,6 +5,7 @@ SQLite 기반 데이터 저장 및 관리 기능을 제공합니다.
 """
 
 from .connection import DatabaseManager, get_database_manager, close_database_manager
+from .entity_cache import EntityCache
 from .repository import BaseRepository, BaseModel
 from .schema import create_database_schema, verify_schema
 
@@ -12,6 +13,7 @@ __all__ = [
     'DatabaseManager',
     'get_database_manager',
     'close_database_manager',
+    'EntityCache',
     'BaseRepository',
     'BaseModel',
     'create_database_schema',
@@ -5,12 +5,15 @@
 import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Optional, Tuple
 
 import aiosqlite
 from dotenv import load_dotenv
 
+from .entity_cache import EntityCache
 from .schema import create_database_schema, verify_schema
 
 logger = logging.getLogger(__name__)
@@ -42,6 +45,40 @@ class DatabaseManager:
         self._connection: Optional[aiosqlite.Connection] = None
         self._lock = asyncio.Lock()
 
+        # 읽기 전용 연결 풀 (WAL 모드라 쓰기 연결과 동시에 SELECT 가능, 0이면 쓰기 연결 하나로 모두 처리)
+        self.reader_pool_size = int(os.getenv("DB_READER_POOL_SIZE", "2"))
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+
+        # 엔티티 캐시 (테이블명 -> 캐시) 및 write-behind 기록 주기 (초, 0 이하이면 즉시 기록)
+        self._entity_caches: Dict[str, EntityCache] = {}
+        # 테이블명 → 키별 변경 리스너 (같은 테이블의 리포지토리 인스턴스들이 공유)
+        self._change_listeners: Dict[str, Dict[str, List[Any]]] = {}
+        self.write_behind_interval = float(os.getenv("DB_WRITE_BEHIND_INTERVAL", "1.0"))
+        # 테이블별 엔티티 캐시에 적재할 최대 행 수 (0이면 제한 없음)
+        self.entity_cache_max_rows = int(os.getenv("DB_ENTITY_CACHE_MAX_ROWS", "50000"))
+        self._write_behind_task: Optional[asyncio.Task] = None
+
+        # 테이블 컬럼 메타데이터 캐시 및 SQL 구문 캐시 (migrate_database 시 무효화)
+        self._table_columns: Dict[str, List[str]] = {}
+        self._statement_cache: Dict[Tuple[Hashable, ...], str] = {}
+
+        # 실행한 쿼리 누적 수 (Tick 프로파일러가 시스템별 쿼리 수 계산에 사용)
+        self.query_count: int = 0
+
+        # 트랜잭션 (unit of work) 상태
+        # - 쓰기 연결이 하나뿐이므로 트랜잭션은 한 번에 하나만 열리고, 다른 작업의 쿼리는 끝날 때까지 대기
+        # - 트랜잭션 안에서 생성된 하위 태스크도 컨텍스트를 물려받아 같은 트랜잭션에 합류
+        # - 컨텍스트에는 트랜잭션마다 만든 토큰을 담고, 열려 있는 트랜잭션의 토큰과 같을 때만 합류로 봄
+        #   (블록이 끝난 뒤에도 살아 있는 하위 태스크가 트랜잭션 안이라고 착각하지 않도록)
+        self._transaction_lock = asyncio.Lock()
+        self._transaction_token: ContextVar[Optional[object]] = ContextVar(
+            f"db_transaction_{id(self)}", default=None
+        )
+        self._active_transaction: Optional[object] = None
+        self._savepoint_seq = 0
+        self._rollback_hooks: List[Callable[[], None]] = []
+
         logger.info(f"DatabaseManager 초기화: {self.db_path}")
 
     async def initialize(self) -> None:
@@ -71,6 +108,9 @@ class DatabaseManager:
                 if not await verify_schema(self._connection):
                     raise RuntimeError("데이터베이스 스키마 검증 실패")
 
+                # 읽기 전용 연결 풀 (스키마 생성/마이그레이션 이후에 연결)
+                await self._open_readers()
+
                 logger.info("데이터베이스 초기화 완료")
 
             except Exception as e:
@@ -84,7 +124,8 @@ class DatabaseManager:
             self._connection = await aiosqlite.connect(
                 self.db_path,
                 timeout=30.0,
-                isolation_level=None  # autocommit 모드
+                isolation_level=None,  # autocommit 모드
+                cached_statements=256  # 리포지토리가 재사용하는 SQL 구문용 prepared statement 캐시
             )
 
             # SQLite 설정 최적화
@@ -96,6 +137,81 @@ class DatabaseManager:
 
             logger.info("데이터베이스 연결 생성 완료")
 
+    async def _open_readers(self) -> None:
+        """읽기 전용 연결 풀 생성 (실패 시 쓰기 연결만 사용)"""
+        if self.reader_pool_size <= 0 or self._readers or self.db_path == ":memory:":
+            return
+
+        try:
+            idle_readers: asyncio.Queue = asyncio.Queue()
+            for _ in range(self.reader_pool_size):
+                reader = await aiosqlite.connect(
+                    self.db_path,
+                    timeout=30.0,
+                    isolation_level=None,
+                    cached_statements=256
+                )
+                self._readers.append(reader)
+                await reader.execute("PRAGMA query_only = ON")
+                await reader.execute("PRAGMA cache_size = -16000")  # 16MB 캐시
+                await reader.execute("PRAGMA temp_store = MEMORY")
+                idle_readers.put_nowait(reader)
+
+            self._idle_readers = idle_readers
+            logger.info(f"읽기 전용 연결 풀 생성 완료: {len(self._readers)}개")
+
+        except Exception as e:
+            logger.warning(f"읽기 전용 연결 풀 생성 실패, 쓰기 연결로 조회: {e}")
+            await self._close_readers()
+
+    async def _close_readers(self) -> None:
+        """읽기 전용 연결 풀 종료"""
+        self._idle_readers = None
+        readers, self._readers = self._readers, []
+        for reader in readers:
+            try:
+                await reader.close()
+            except Exception as e:
+                logger.error(f"읽기 연결 종료 중 오류: {e}")
+
+    @asynccontextmanager
+    async def _read_connection(self) -> AsyncIterator[Optional[aiosqlite.Connection]]:
+        """
+        읽기 연결 대여
+
+        풀이 없거나 transaction() 블록 안이면 None을 반환하며, 이때는 쓰기 연결로 조회해야 합니다
+        (블록 안에서 아직 커밋되지 않은 변경을 읽어야 하므로).
+        """
+        idle_readers = self._idle_readers
+        if idle_readers is None or self.in_transaction():
+            yield None
+            return
+
+        reader = await idle_readers.get()
+        try:
+            yield reader
+        finally:
+            idle_readers.put_nowait(reader)
+
+    @staticmethod
+    def _is_read_query(query: str) -> bool:
+        """읽기 연결로 보낼 수 있는 조회 쿼리인지 여부"""
+        return query.lstrip()[:6].upper() == "SELECT"
+
+    async def _fetch(self, query: str, parameters: tuple, limit_one: bool = False) -> Tuple[Any, list]:
+        """조회 실행 (SELECT는 읽기 연결 풀로, 그 외는 쓰기 연결로) 후 (description, rows) 반환"""
+        if self._is_read_query(query):
+            async with self._read_connection() as reader:
+                if reader is not None:
+                    self.query_count += 1
+                    async with reader.execute(query, parameters) as cursor:
+                        rows = await cursor.fetchmany(1) if limit_one else await cursor.fetchall()
+                        return cursor.description, list(rows)
+
+        cursor = await self.execute(query, parameters)
+        rows = await cursor.fetchmany(1) if limit_one else await cursor.fetchall()
+        return cursor.description, list(rows)
+
     async def get_connection(self) -> aiosqlite.Connection:
         """
         데이터베이스 연결 반환
@@ -119,7 +235,9 @@ class DatabaseManager:
         Returns:
             aiosqlite.Cursor: 쿼리 결과 커서
         """
+        await self._wait_for_other_transaction()
         connection = await self.get_connection()
+        self.query_count += 1
         return await connection.execute(query, parameters)
 
     async def execute_many(self, query: str, parameters_list: list) -> aiosqlite.Cursor:
@@ -133,7 +251,9 @@ class DatabaseManager:
         Returns:
             aiosqlite.Cursor: 쿼리 결과 커서
         """
+        await self._wait_for_other_transaction()
         connection = await self.get_connection()
+        self.query_count += 1
         return await connection.executemany(query, parameters_list)
 
     async def fetch_one(self, query: str, parameters: tuple = ()) -> Optional[dict]:
@@ -147,15 +267,14 @@ class DatabaseManager:
         Returns:
             Optional[dict]: 조회 결과 (딕셔너리 형태)
         """
-        cursor = await self.execute(query, parameters)
-        row = await cursor.fetchone()
+        description, rows = await self._fetch(query, parameters, limit_one=True)
 
-        if row is None:
+        if not rows:
             return None
 
         # 컬럼명과 함께 딕셔너리로 변환
-        columns = [description[0] for description in cursor.description]
-        return dict(zip(columns, row))
+        columns = [column[0] for column in description]
+        return dict(zip(columns, rows[0]))
 
     async def fetch_all(self, query: str, parameters: tuple = ()) -> list[dict]:
         """
@@ -168,29 +287,238 @@ class DatabaseManager:
         Returns:
             list[dict]: 조회 결과 리스트 (딕셔너리 형태)
         """
-        cursor = await self.execute(query, parameters)
-        rows = await cursor.fetchall()
+        description, rows = await self._fetch(query, parameters)
 
         if not rows:
             return []
 
         # 컬럼명과 함께 딕셔너리로 변환
-        columns = [description[0] for description in cursor.description]
+        columns = [column[0] for column in description]
         return [dict(zip(columns, row)) for row in rows]
 
+    async def fetch_rows(self, query: str, parameters: tuple = ()) -> list[tuple]:
+        """
+        여러 레코드를 튜플 형태로 조회 (집계/리포트용 대량 조회)
+
+        Args:
+            query: SQL 쿼리
+            parameters: 쿼리 매개변수
+
+        Returns:
+            list[tuple]: 조회 결과 리스트
+        """
+        _, rows = await self._fetch(query, parameters)
+        return [tuple(row) for row in rows]
+
     async def commit(self) -> None:
-        """트랜잭션 커밋"""
+        """트랜잭션 커밋 (transaction() 블록 안에서는 블록 종료 시 한 번에 커밋)
+
+        블록 밖에서는 다른 작업이 연 트랜잭션이 끝날 때까지 기다린 뒤 호출하므로
+        다른 작업의 BEGIN을 대신 커밋하지 않습니다.
+        """
+        if self.in_transaction():
+            return
+        await self._wait_for_other_transaction()
         if self._connection:
             await self._connection.commit()
 
     async def rollback(self) -> None:
-        """트랜잭션 롤백"""
+        """트랜잭션 롤백 (transaction() 블록 안에서는 블록이 예외로 끝날 때 롤백)
+
+        블록 밖에서는 다른 작업이 연 트랜잭션이 끝날 때까지 기다린 뒤 호출하므로
+        다른 작업의 진행 중인 변경을 버리지 않습니다.
+        """
+        if self.in_transaction():
+            return
+        await self._wait_for_other_transaction()
         if self._connection:
             await self._connection.rollback()
 
+    # === 트랜잭션 (unit of work) ===
+
+    def in_transaction(self) -> bool:
+        """현재 작업이 열려 있는 transaction() 블록 안에 있는지 여부"""
+        token = self._transaction_token.get()
+        return token is not None and token is self._active_transaction
+
+    def add_rollback_hook(self, hook: Callable[[], None]) -> None:
+        """
+        현재 트랜잭션(또는 savepoint)이 롤백될 때 실행할 함수 등록
+
+        엔티티 캐시처럼 DB 밖에 있는 상태를 되돌리는 데 사용합니다.
+        트랜잭션 밖에서는 아무것도 하지 않습니다.
+        """
+        if self.in_transaction():
+            self._rollback_hooks.append(hook)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator['DatabaseManager']:
+        """
+        여러 쓰기 작업을 하나의 트랜잭션으로 묶는 unit of work
+
+        블록 안의 execute/commit/rollback(리포지토리 포함)은 자동으로 이 트랜잭션에 합류하며,
+        블록이 정상 종료되면 한 번 커밋하고 예외가 발생하면 전체를 롤백합니다.
+        중첩 호출은 SAVEPOINT로 처리되어 안쪽 블록만 롤백할 수 있습니다.
+
+        사용 예:
+            async with db_manager.transaction():
+                await repo.update(...)
+                await repo.create(...)
+        """
+        if self.in_transaction():
+            async with self._savepoint():
+                yield self
+            return
+
+        async with self._transaction_lock:
+            marker = object()
+            self._active_transaction = marker
+            token = self._transaction_token.set(marker)
+            try:
+                connection = await self.get_connection()
+                await connection.execute("BEGIN")
+                try:
+                    yield self
+                except BaseException:
+                    await connection.rollback()
+                    self._run_rollback_hooks(0)
+                    raise
+                else:
+                    await connection.commit()
+            finally:
+                self._rollback_hooks.clear()
+                self._active_transaction = None
+                self._transaction_token.reset(token)
+
+    @asynccontextmanager
+    async def _savepoint(self) -> AsyncIterator[None]:
+        """중첩 트랜잭션용 SAVEPOINT"""
+        self._savepoint_seq += 1
+        name = f"sp_{self._savepoint_seq}"
+        hook_mark = len(self._rollback_hooks)
+        connection = await self.get_connection()
+        await connection.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except BaseException:
+            await connection.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            await connection.execute(f"RELEASE SAVEPOINT {name}")
+            self._run_rollback_hooks(hook_mark)
+            raise
+        else:
+            await connection.execute(f"RELEASE SAVEPOINT {name}")
+
+    def _run_rollback_hooks(self, mark: int) -> None:
+        """mark 이후 등록된 롤백 훅을 역순으로 실행"""
+        hooks = self._rollback_hooks[mark:]
+        del self._rollback_hooks[mark:]
+        for hook in reversed(hooks):
+            try:
+                hook()
+            except Exception as e:
+                logger.error(f"롤백 훅 실행 실패: {e}")
+
+    async def _wait_for_other_transaction(self) -> None:
+        """다른 작업이 연 트랜잭션이 끝날 때까지 대기 (같은 연결을 공유하므로)"""
+        while self._transaction_lock.locked() and not self.in_transaction():
+            async with self._transaction_lock:
+                pass
+
+    # === 엔티티 캐시 / write-behind ===
+
+    @property
+    def write_behind_enabled(self) -> bool:
+        """write-behind 사용 여부"""
+        return self.write_behind_interval > 0
+
+    def get_entity_cache(self, table_name: str) -> EntityCache:
+        """
+        테이블의 엔티티 캐시 반환 (같은 테이블의 리포지토리 인스턴스들이 공유)
+
+        Args:
+            table_name: 테이블명
+
+        Returns:
+            EntityCache: 엔티티 캐시
+        """
+        cache = self._entity_caches.get(table_name)
+        if cache is None:
+            cache = EntityCache(table_name, self.entity_cache_max_rows)
+            self._entity_caches[table_name] = cache
+        return cache
+
+    def get_change_listeners(self, table_name: str) -> Dict[str, List[Any]]:
+        """
+        테이블의 변경 리스너 목록 반환 (같은 테이블의 리포지토리 인스턴스들이 공유)
+
+        Args:
+            table_name: 테이블명
+
+        Returns:
+            Dict[str, List[Any]]: 리포지토리가 정한 키 → 리스너 목록
+        """
+        return self._change_listeners.setdefault(table_name, {})
+
+    async def flush_entity_caches(self) -> int:
+        """
+        모든 엔티티 캐시의 대기 중인 변경을 기록
+
+        Returns:
+            int: 기록된 엔티티 수
+        """
+        if self._connection is None:
+            return 0
+
+        written = 0
+        for cache in list(self._entity_caches.values()):
+            if cache.has_pending:
+                written += await cache.flush(self)
+        return written
+
+    def start_write_behind(self) -> None:
+        """주기적 캐시 기록 태스크 시작"""
+        if not self.write_behind_enabled:
+            logger.info("write-behind 비활성화 (변경 즉시 기록)")
+            return
+        if self._write_behind_task and not self._write_behind_task.done():
+            return
+        self._write_behind_task = asyncio.create_task(self._write_behind_loop())
+        logger.info(f"write-behind 시작 (주기: {self.write_behind_interval}초)")
+
+    async def stop_write_behind(self) -> None:
+        """주기적 캐시 기록 태스크 중지 후 남은 변경 기록"""
+        if self._write_behind_task and not self._write_behind_task.done():
+            self._write_behind_task.cancel()
+            try:
+                await self._write_behind_task
+            except asyncio.CancelledError:
+                pass
+        self._write_behind_task = None
+
+        written = await self.flush_entity_caches()
+        logger.info(f"write-behind 중지 (종료 시 기록: {written}건)")
+
+    async def _write_behind_loop(self) -> None:
+        """write-behind 기록 루프"""
+        while True:
+            await asyncio.sleep(self.write_behind_interval)
+            try:
+                await self.flush_entity_caches()
+            except Exception as e:
+                logger.error(f"엔티티 캐시 기록 중 오류: {e}", exc_info=True)
+
     async def close(self) -> None:
         """데이터베이스 연결 종료"""
+        # 연결을 닫기 전에 기록 대기 중인 캐시 변경을 모두 기록
+        try:
+            await self.stop_write_behind()
+        except Exception as e:
+            logger.error(f"엔티티 캐시 기록 실패: {e}")
+
         async with self._lock:
+            # 체크포인트 전에 읽기 연결을 먼저 닫음
+            await self._close_readers()
+
             if self._connection:
                 try:
                     # WAL 체크포인트 실행 (WAL 파일을 메인 DB로 병합)
@@ -234,6 +562,60 @@ class DatabaseManager:
         """
         return await self.fetch_all(f"PRAGMA table_info({table_name})")
 
+    async def get_table_columns(self, table_name: str) -> List[str]:
+        """
+        테이블 컬럼명 목록 조회 (캐시됨)
+
+        Args:
+            table_name: 테이블명
+
+        Returns:
+            list[str]: 컬럼명 목록
+        """
+        columns = self._table_columns.get(table_name)
+        if columns is None:
+            table_info = await self.get_table_info(table_name)
+            columns = [col['name'] for col in table_info]
+            if columns:  # 아직 생성되지 않은 테이블은 캐시하지 않음
+                self._table_columns[table_name] = columns
+        return columns
+
+    def get_statement(self, key: Tuple[Hashable, ...], builder: Callable[[], str]) -> str:
+        """
+        SQL 구문 캐시 조회 (없으면 builder로 생성 후 저장)
+
+        같은 (테이블, 컬럼 조합)에 대해 항상 동일한 SQL 문자열을 재사용하므로
+        sqlite3의 prepared statement 캐시가 적중합니다.
+
+        Args:
+            key: 캐시 키 (예: ("update", 테이블명, 컬럼 튜플))
+            builder: SQL 문자열 생성 함수
+
+        Returns:
+            str: SQL 문자열
+        """
+        statement = self._statement_cache.get(key)
+        if statement is None:
+            statement = builder()
+            self._statement_cache[key] = statement
+        return statement
+
+    def invalidate_schema_cache(self, table_name: Optional[str] = None) -> None:
+        """
+        스키마/구문 캐시 무효화
+
+        Args:
+            table_name: 무효화할 테이블명 (None이면 전체)
+        """
+        if table_name is None:
+            self._table_columns.clear()
+            self._statement_cache.clear()
+            return
+
+        self._table_columns.pop(table_name, None)
+        for key in [key for key in self._statement_cache if len(key) > 1 and key[1] == table_name]:
+            del self._statement_cache[key]
+
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
         await self.initialize()
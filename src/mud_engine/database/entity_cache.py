@@ -0,0 +1,226 @@
+"""
+엔티티 캐시 (identity map + write-behind)
+
+테이블별로 DB 행(row) 딕셔너리를 ID 기준으로 메모리에 유지한다.
+리포지토리의 update는 캐시된 행에 변경 내용을 병합하고 dirty로 표시만 하며,
+DatabaseManager가 주기적으로(또는 종료 시) dirty 행을 트랜잭션 단위로 일괄 기록한다.
+같은 엔티티에 대한 연속 변경은 하나의 UPDATE로 합쳐진다.
+적재된 행 수가 max_rows를 넘으면 가장 오래 쓰지 않은 깨끗한(dirty가 아닌) 행부터 내보낸다.
+"""
+
+import logging
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .connection import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+
+class EntityCache:
+    """테이블 단위 엔티티 캐시"""
+
+    def __init__(self, table_name: str, max_rows: int = 0):
+        """
+        EntityCache 초기화
+
+        Args:
+            table_name: 캐시 대상 테이블명
+            max_rows: 적재할 최대 행 수 (0이면 제한 없음)
+        """
+        self.table_name = table_name
+        self.max_rows = max_rows
+        self._rows: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()  # 오래 쓰지 않은 행이 앞쪽
+        self._dirty: Dict[str, Dict[str, Any]] = {}  # ID -> 아직 기록되지 않은 컬럼 변경분
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def has_pending(self) -> bool:
+        """기록 대기 중인 변경 존재 여부"""
+        return bool(self._dirty)
+
+    @property
+    def pending_count(self) -> int:
+        """기록 대기 중인 엔티티 수"""
+        return len(self._dirty)
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """캐시된 행의 복사본 반환 (없으면 None)"""
+        row = self._rows.get(record_id)
+        if row is None:
+            return None
+        self._rows.move_to_end(record_id)
+        return dict(row)
+
+    def contains(self, record_id: str) -> bool:
+        """캐시 적재 여부"""
+        return record_id in self._rows
+
+    def put(self, record_id: str, row: Dict[str, Any]) -> None:
+        """DB에서 읽은 행을 캐시에 적재합니다.
+
+        기록 대기 중인 변경이 있는 행은 캐시 쪽이 최신이므로 덮어쓰지 않습니다.
+        """
+        if record_id in self._dirty:
+            return
+        self._rows[record_id] = dict(row)
+        self._rows.move_to_end(record_id)
+        self._evict()
+
+    def overlay(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """DB에서 읽은 행에 기록 대기 중인 변경을 덧씌운 행 반환 (변경이 없으면 그대로)"""
+        pending = self._dirty.get(row.get('id'))
+        return {**row, **pending} if pending else row
+
+    def pending_ids(self, columns: Iterable[str]) -> List[str]:
+        """columns 중 하나라도 기록 대기 중인 변경이 있는 행의 ID 목록"""
+        watched = set(columns)
+        if not watched:
+            return []
+        return [record_id for record_id, changes in self._dirty.items() if not watched.isdisjoint(changes)]
+
+    def _evict(self) -> None:
+        """max_rows를 넘은 만큼 오래된 깨끗한 행부터 제거 (기록 대기 중인 행은 유지)"""
+        excess = len(self._rows) - self.max_rows
+        if self.max_rows <= 0 or excess <= 0:
+            return
+        victims: List[str] = []
+        for record_id in self._rows:
+            if record_id not in self._dirty:
+                victims.append(record_id)
+                if len(victims) >= excess:
+                    break
+        for record_id in victims:
+            del self._rows[record_id]
+
+    def apply_update(self, record_id: str, changes: Dict[str, Any], mark_dirty: bool = True) -> None:
+        """캐시된 행에 변경 내용을 병합하고, 필요하면 dirty로 표시합니다.
+
+        mark_dirty=False는 이미 DB에 기록된 변경이라는 뜻이므로,
+        같은 컬럼의 오래된 대기 변경이 나중에 덮어쓰지 않도록 제거합니다.
+        """
+        row = self._rows.get(record_id)
+        if row is not None:
+            row.update(changes)
+        if mark_dirty:
+            self._dirty.setdefault(record_id, {}).update(changes)
+            return
+
+        pending = self._dirty.get(record_id)
+        if pending is not None:
+            for column in changes:
+                pending.pop(column, None)
+            if not pending:
+                del self._dirty[record_id]
+
+    def discard(self, record_id: str) -> None:
+        """행과 대기 중인 변경을 캐시에서 제거합니다."""
+        self._rows.pop(record_id, None)
+        self._dirty.pop(record_id, None)
+
+    def clear(self) -> None:
+        """캐시 전체 비우기 (대기 중인 변경도 버림)"""
+        self._rows.clear()
+        self._dirty.clear()
+
+    def _take_pending(self) -> Dict[str, Dict[str, Any]]:
+        pending, self._dirty = self._dirty, {}
+        return pending
+
+    def _restore_pending(self, pending: Dict[str, Dict[str, Any]]) -> None:
+        """기록이 롤백된 변경을 되돌려 놓습니다 (그 사이 발생한 변경이 우선)."""
+        for record_id, changes in pending.items():
+            merged = dict(changes)
+            merged.update(self._dirty.get(record_id, {}))
+            self._dirty[record_id] = merged
+
+    def snapshot(self, record_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """행과 대기 중인 변경의 스냅샷 (트랜잭션 롤백 시 restore에 사용)"""
+        row = self._rows.get(record_id)
+        dirty = self._dirty.get(record_id)
+        return (dict(row) if row is not None else None,
+                dict(dirty) if dirty is not None else None)
+
+    def restore(self, record_id: str,
+                snapshot: Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]) -> None:
+        """snapshot으로 저장한 상태로 되돌립니다."""
+        row, dirty = snapshot
+        if row is None:
+            self._rows.pop(record_id, None)
+        else:
+            self._rows[record_id] = row
+        if dirty is None:
+            self._dirty.pop(record_id, None)
+        else:
+            self._dirty[record_id] = dirty
+
+    async def flush(self, db_manager: 'DatabaseManager') -> int:
+        """
+        대기 중인 변경을 하나의 트랜잭션으로 기록
+
+        이미 transaction() 블록 안이면 그 트랜잭션에 합류하며,
+        바깥 트랜잭션이 롤백되면 기록했던 변경은 다시 대기 상태로 돌아갑니다.
+
+        Args:
+            db_manager: 데이터베이스 매니저
+
+        Returns:
+            int: 기록된 엔티티 수
+        """
+        if not self._dirty:
+            return 0
+
+        try:
+            async with db_manager.transaction():
+                # 트랜잭션 획득 후에 가져와야 동시에 실행된 flush끼리 순서가 뒤바뀌지 않음
+                pending = self._take_pending()
+                db_manager.add_rollback_hook(lambda: self._restore_pending(pending))
+
+                # 같은 컬럼 조합끼리 묶어 executemany로 기록
+                batches: Dict[Tuple[str, ...], List[tuple]] = {}
+                for record_id, changes in pending.items():
+                    columns = tuple(sorted(changes.keys()))
+                    values = tuple(changes[column] for column in columns) + (record_id,)
+                    batches.setdefault(columns, []).append(values)
+
+                for columns, rows in batches.items():
+                    await db_manager.execute_many(self._update_statement(db_manager, columns), rows)
+
+            if pending:
+                logger.debug(f"{self.table_name} 캐시 일괄 기록: {len(pending)}건")
+            return len(pending)
+
+        except Exception as e:
+            logger.error(f"{self.table_name} 캐시 일괄 기록 실패, 개별 기록으로 재시도: {e}")
+
+        return await self._flush_individually(db_manager)
+
+    async def _flush_individually(self, db_manager: 'DatabaseManager') -> int:
+        """일괄 기록 실패 시 행 단위로 기록하고, 실패한 행은 캐시에서 제거합니다."""
+        written = 0
+        for record_id in list(self._dirty.keys()):
+            try:
+                async with db_manager.transaction():
+                    changes = self._dirty.pop(record_id, None)
+                    if not changes:
+                        continue
+                    db_manager.add_rollback_hook(partial(self._restore_pending, {record_id: changes}))
+                    columns = tuple(sorted(changes.keys()))
+                    values = tuple(changes[column] for column in columns) + (record_id,)
+                    await db_manager.execute(self._update_statement(db_manager, columns), values)
+                written += 1
+            except Exception as e:
+                # 같은 변경은 다시 시도해도 실패하므로 버리고, 다음 조회 시 DB에서 다시 읽도록 함
+                logger.error(f"{self.table_name} 레코드 기록 실패, 변경 폐기 (ID: {record_id}): {e}")
+                self.discard(record_id)
+        return written
+
+    def _update_statement(self, db_manager: 'DatabaseManager', columns: Tuple[str, ...]) -> str:
+        return db_manager.get_statement(
+            ('update', self.table_name, columns),
+            lambda: f"UPDATE {self.table_name} SET {', '.join(f'{column} = ?' for column in columns)} WHERE id = ?"
+        )
@@ -6,10 +6,11 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Union, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Generic, Union, cast
 from uuid import uuid4
 
 from .connection import DatabaseManager, get_database_manager
+from .entity_cache import EntityCache
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,9 @@ class BaseModel:
 class BaseRepository(Generic[T], ABC):
     """기본 리포지토리 클래스"""
 
+    # True이면 DatabaseManager의 엔티티 캐시를 사용 (ID 조회는 메모리에서, update는 write-behind)
+    cache_entities: bool = False
+
     def __init__(self, db_manager: Optional[DatabaseManager] = None):
         """
         BaseRepository 초기화
@@ -72,6 +76,105 @@ class BaseRepository(Generic[T], ABC):
             self._db_manager = await get_database_manager()
         return self._db_manager
 
+    def _get_entity_cache(self, db_manager: DatabaseManager) -> Optional[EntityCache]:
+        """엔티티 캐시 반환 (캐시를 사용하지 않으면 None)"""
+        if not self.cache_entities:
+            return None
+        return db_manager.get_entity_cache(self._table_name)
+
+    def _track_cache_change(self, db_manager: DatabaseManager, cache: Optional[EntityCache], record_id: str) -> None:
+        """트랜잭션 안에서 캐시를 변경하기 전에 호출 (롤백 시 캐시도 되돌림)"""
+        if cache is None or not db_manager.in_transaction():
+            return
+        snapshot = cache.snapshot(record_id)
+        db_manager.add_rollback_hook(lambda: cache.restore(record_id, snapshot))
+
+    def _cache_rows(self, cache: Optional[EntityCache], rows: List[Dict[str, Any]]) -> None:
+        """조회한 행들을 캐시에 적재"""
+        if cache is None:
+            return
+        for row in rows:
+            if row.get('id') is not None:
+                cache.put(row['id'], row)
+
+    async def _overlay_pending(self, db_manager: DatabaseManager, rows: List[Dict[str, Any]],
+                               columns: Iterable[str],
+                               matches: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+        """SQL로 조회한 행에 기록 대기 중인 변경을 덧씌움 (flush 없이 캐시와 같은 결과)
+
+        조건 컬럼(columns)에 대기 중인 변경이 있는 행은 matches로 다시 확인하여,
+        조건에서 벗어난 행은 빼고 DB 결과에 없던 행은 추가합니다.
+        """
+        cache = self._get_entity_cache(db_manager)
+        if cache is None or not cache.has_pending:
+            return rows
+
+        changed = set(cache.pending_ids(columns))
+        result: List[Dict[str, Any]] = []
+        for row in rows:
+            merged = cache.overlay(row)
+            if row.get('id') not in changed or matches(merged):
+                result.append(merged)
+
+        seen = {row.get('id') for row in rows}
+        extra = [record_id for record_id in changed if record_id not in seen]
+        if extra:
+            for row in (await self._get_rows_by_ids(extra)).values():
+                merged = cache.overlay(row)
+                if matches(merged):
+                    result.append(merged)
+        return result
+
+    async def _count_pending_adjustment(self, db_manager: DatabaseManager,
+                                        conditions: Dict[str, Any]) -> int:
+        """COUNT(*) 결과에 더할 보정값 (조건 컬럼이 바뀌어 기록 대기 중인 행만 다시 판정)"""
+        cache = self._get_entity_cache(db_manager)
+        if cache is None or not conditions or not cache.has_pending:
+            return 0
+        changed = cache.pending_ids(conditions.keys())
+        if not changed:
+            return 0
+
+        adjustment = 0
+        where = ' AND '.join(f'{key} = ?' for key in conditions)
+        for start in range(0, len(changed), self._IN_CHUNK_SIZE):
+            chunk = changed[start:start + self._IN_CHUNK_SIZE]
+            query = (f"SELECT COUNT(*) as count FROM {self._table_name} "
+                     f"WHERE {where} AND id IN ({', '.join('?' for _ in chunk)})")
+            result = await db_manager.fetch_one(query, tuple(conditions.values()) + tuple(chunk))
+            adjustment -= result['count'] if result else 0
+
+        for row in (await self._get_rows_by_ids(changed)).values():
+            if self._row_matches(cache.overlay(row), conditions):
+                adjustment += 1
+        return adjustment
+
+    @staticmethod
+    def _row_matches(row: Dict[str, Any], conditions: Dict[str, Any]) -> bool:
+        """SQL의 key = ? 조건과 같게 비교 (NULL은 어떤 값과도 같지 않음)"""
+        return all(
+            row.get(key) is not None and value is not None and row.get(key) == value
+            for key, value in conditions.items()
+        )
+
+    async def flush(self) -> int:
+        """
+        이 테이블의 기록 대기 중인 변경을 DB에 기록
+
+        조회 메서드는 대기 중인 변경을 결과에 덧씌우므로 호출할 필요가 없으며,
+        캐시를 거치지 않고 SQL로 직접 조회하기 전에 호출하면 캐시와 DB의 내용이 일치합니다.
+
+        Returns:
+            int: 기록된 엔티티 수
+        """
+        if not self.cache_entities:
+            return 0
+        db_manager = await self.get_db_manager()
+        cache = db_manager.get_entity_cache(self._table_name)
+        if not cache.has_pending:
+            return 0
+        return await cache.flush(db_manager)
+
     def _generate_id(self) -> str:
         """새로운 ID 생성"""
         return str(uuid4())
@@ -115,10 +218,39 @@ class BaseRepository(Generic[T], ABC):
         return prepared_data
 
     async def _get_table_columns(self) -> List[str]:
-        """테이블 컬럼 목록 반환"""
+        """테이블 컬럼 목록 반환 (DatabaseManager 스키마 캐시 사용)"""
         db_manager = await self.get_db_manager()
-        table_info = await db_manager.get_table_info(self._table_name)
-        return [col['name'] for col in table_info]
+        return await db_manager.get_table_columns(self._table_name)
+
+    # === SQL 구문 (테이블/컬럼 조합별로 캐시되어 동일한 문자열 재사용) ===
+
+    def _insert_statement(self, db_manager: DatabaseManager, columns: Tuple[str, ...]) -> str:
+        return db_manager.get_statement(
+            ('insert', self._table_name, columns),
+            lambda: f"INSERT INTO {self._table_name} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+
+    def _update_statement(self, db_manager: DatabaseManager, columns: Tuple[str, ...]) -> str:
+        return db_manager.get_statement(
+            ('update', self._table_name, columns),
+            lambda: f"UPDATE {self._table_name} SET {', '.join(f'{key} = ?' for key in columns)} WHERE id = ?"
+        )
+
+    def _select_where_statement(self, db_manager: DatabaseManager, columns: Tuple[str, ...]) -> str:
+        return db_manager.get_statement(
+            ('select_where', self._table_name, columns),
+            lambda: f"SELECT * FROM {self._table_name} WHERE {' AND '.join(f'{key} = ?' for key in columns)}"
+        )
+
+    def _count_statement(self, db_manager: DatabaseManager, columns: Tuple[str, ...]) -> str:
+        def build() -> str:
+            query = f"SELECT COUNT(*) as count FROM {self._table_name}"
+            if columns:
+                query += f" WHERE {' AND '.join(f'{key} = ?' for key in columns)}"
+            return query
+
+        return db_manager.get_statement(('count', self._table_name, columns), build)
 
     async def create(self, data: Dict[str, Any]) -> T:
         """
@@ -135,18 +267,15 @@ class BaseRepository(Generic[T], ABC):
             prepared_data = self._prepare_data_for_insert(data)
 
             # 컬럼과 값 분리
-            columns = list(prepared_data.keys())
-            placeholders = ', '.join(['?' for _ in columns])
+            columns = tuple(prepared_data.keys())
             values = list(prepared_data.values())
 
             # INSERT 쿼리 실행
-            query = f"""
-                INSERT INTO {self._table_name} ({', '.join(columns)})
-                VALUES ({placeholders})
-            """
+            query = self._insert_statement(db_manager, columns)
 
             await db_manager.execute(query, tuple(values))
             await db_manager.commit()
+            self._track_cache_change(db_manager, self._get_entity_cache(db_manager), prepared_data['id'])
 
             # 생성된 레코드 반환
             created_record = await self.get_by_id(prepared_data['id'])
@@ -171,6 +300,12 @@ class BaseRepository(Generic[T], ABC):
         """
         try:
             db_manager = await self.get_db_manager()
+            cache = self._get_entity_cache(db_manager)
+            if cache is not None:
+                cached_row = cache.get(record_id)
+                if cached_row is not None:
+                    return cast(T, self._model_class.from_dict(cached_row))
+
             query = f"SELECT * FROM {self._table_name} WHERE id = ?"
 
             result = await db_manager.fetch_one(query, (record_id,))
@@ -178,6 +313,10 @@ class BaseRepository(Generic[T], ABC):
             if result is None:
                 return None
 
+            if cache is not None:
+                cache.put(record_id, result)
+                result = cache.overlay(result)
+
             return cast(T, self._model_class.from_dict(result))
 
         except Exception as e:
@@ -203,6 +342,8 @@ class BaseRepository(Generic[T], ABC):
                 query += f" LIMIT {limit} OFFSET {offset}"
 
             results = await db_manager.fetch_all(query)
+            self._cache_rows(self._get_entity_cache(db_manager), results)
+            results = await self._overlay_pending(db_manager, results, (), lambda row: True)
 
             return [cast(T, self._model_class.from_dict(result)) for result in results]
 
@@ -237,19 +378,27 @@ class BaseRepository(Generic[T], ABC):
             if 'updated_at' not in table_columns and 'updated_at' in prepared_data:
                 del prepared_data['updated_at']
 
-            # SET 절 생성
-            set_clauses = [f"{key} = ?" for key in prepared_data.keys()]
-            values = list(prepared_data.values()) + [record_id]
+            cache = self._get_entity_cache(db_manager)
+            if cache is not None and db_manager.write_behind_enabled and not db_manager.in_transaction():
+                # 나중에 기록할 때 실패하지 않도록 컬럼을 미리 검증
+                unknown_columns = [key for key in prepared_data if key not in table_columns]
+                if unknown_columns:
+                    raise ValueError(f"{self._table_name}에 없는 컬럼: {', '.join(unknown_columns)}")
+
+                # 캐시에 병합하고 기록은 write-behind로 미룸
+                cache.apply_update(record_id, prepared_data)
+                logger.debug(f"{self._table_name} 레코드 업데이트 (기록 대기): {record_id}")
+                return cast(T, self._model_class.from_dict(cache.get(record_id)))
 
             # UPDATE 쿼리 실행
-            query = f"""
-                UPDATE {self._table_name}
-                SET {', '.join(set_clauses)}
-                WHERE id = ?
-            """
+            values = list(prepared_data.values()) + [record_id]
+            query = self._update_statement(db_manager, tuple(prepared_data.keys()))
 
             await db_manager.execute(query, tuple(values))
             await db_manager.commit()
+            if cache is not None:
+                self._track_cache_change(db_manager, cache, record_id)
+                cache.apply_update(record_id, prepared_data, mark_dirty=False)
 
             # 업데이트된 레코드 반환
             updated_record = await self.get_by_id(record_id)
@@ -281,6 +430,12 @@ class BaseRepository(Generic[T], ABC):
                 logger.warning(f"{self._table_name} 레코드를 찾을 수 없음 (ID: {record_id})")
                 return False
 
+            # 기록 대기 중인 변경은 삭제될 행이므로 버림
+            cache = self._get_entity_cache(db_manager)
+            if cache is not None:
+                self._track_cache_change(db_manager, cache, record_id)
+                cache.discard(record_id)
+
             # DELETE 쿼리 실행
             query = f"DELETE FROM {self._table_name} WHERE id = ?"
             cursor = await db_manager.execute(query, (record_id,))
@@ -299,6 +454,158 @@ class BaseRepository(Generic[T], ABC):
             await db_manager.rollback()
             raise
 
+    # === 일괄 처리 (한 트랜잭션, 컬럼 조합별 executemany 한 번) ===
+
+    # SQLite 매개변수 개수 제한을 넘지 않도록 IN 조회를 나누는 크기
+    _IN_CHUNK_SIZE = 500
+
+    async def _get_rows_by_ids(self, record_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """ID 목록의 행을 조회 (캐시에 있는 행은 캐시에서, 나머지는 IN 조회 한 번으로)"""
+        db_manager = await self.get_db_manager()
+        cache = self._get_entity_cache(db_manager)
+
+        rows: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for record_id in dict.fromkeys(record_ids):
+            cached_row = cache.get(record_id) if cache is not None else None
+            if cached_row is not None:
+                rows[record_id] = cached_row
+            else:
+                missing.append(record_id)
+
+        for start in range(0, len(missing), self._IN_CHUNK_SIZE):
+            chunk = missing[start:start + self._IN_CHUNK_SIZE]
+            query = f"SELECT * FROM {self._table_name} WHERE id IN ({', '.join('?' for _ in chunk)})"
+            results = await db_manager.fetch_all(query, tuple(chunk))
+            self._cache_rows(cache, results)
+            for result in results:
+                rows[result['id']] = result
+
+        return rows
+
+    async def create_many(self, items: List[Union[Dict[str, Any], BaseModel]]) -> List[T]:
+        """
+        여러 레코드를 한 트랜잭션으로 생성
+
+        생성 후 다시 조회하지 않고 삽입한 데이터로 모델을 만들어 반환합니다.
+
+        Args:
+            items: 생성할 데이터 목록
+
+        Returns:
+            List[T]: 생성된 모델 인스턴스 리스트 (입력 순서 유지)
+        """
+        if not items:
+            return []
+
+        db_manager = await self.get_db_manager()
+        try:
+            prepared_rows = [self._prepare_data_for_insert(item) for item in items]
+
+            batches: Dict[Tuple[str, ...], List[tuple]] = {}
+            for prepared_data in prepared_rows:
+                columns = tuple(prepared_data.keys())
+                batches.setdefault(columns, []).append(tuple(prepared_data.values()))
+
+            async with db_manager.transaction():
+                for columns, values in batches.items():
+                    await db_manager.execute_many(self._insert_statement(db_manager, columns), values)
+
+            logger.info(f"{self._table_name}에 새 레코드 {len(prepared_rows)}개 일괄 생성")
+            return [cast(T, self._model_class.from_dict(prepared_data)) for prepared_data in prepared_rows]
+
+        except Exception as e:
+            logger.error(f"{self._table_name} 레코드 일괄 생성 실패: {e}")
+            raise
+
+    async def update_many(self, updates: Dict[str, Dict[str, Any]]) -> List[T]:
+        """
+        여러 레코드를 한 트랜잭션으로 업데이트
+
+        기존 행은 캐시 또는 IN 조회 한 번으로 읽고, 갱신 후에는 다시 조회하지 않습니다.
+        존재하지 않는 ID는 건너뜁니다.
+
+        Args:
+            updates: 레코드 ID -> 업데이트할 데이터
+
+        Returns:
+            List[T]: 업데이트된 모델 인스턴스 리스트
+        """
+        if not updates:
+            return []
+
+        db_manager = await self.get_db_manager()
+        try:
+            existing_rows = await self._get_rows_by_ids(list(updates.keys()))
+            missing = [record_id for record_id in updates if record_id not in existing_rows]
+            if missing:
+                logger.warning(f"{self._table_name} 레코드를 찾을 수 없음 ({len(missing)}건): {missing[:5]}")
+
+            table_columns = await self._get_table_columns()
+            prepared_updates: Dict[str, Dict[str, Any]] = {}
+            batches: Dict[Tuple[str, ...], List[tuple]] = {}
+            for record_id in existing_rows:
+                prepared_data = self._prepare_data_for_update(updates[record_id])
+                if 'updated_at' not in table_columns:
+                    prepared_data.pop('updated_at', None)
+                prepared_updates[record_id] = prepared_data
+                columns = tuple(prepared_data.keys())
+                batches.setdefault(columns, []).append(tuple(prepared_data.values()) + (record_id,))
+
+            cache = self._get_entity_cache(db_manager)
+            async with db_manager.transaction():
+                for columns, values in batches.items():
+                    await db_manager.execute_many(self._update_statement(db_manager, columns), values)
+                if cache is not None:
+                    for record_id, prepared_data in prepared_updates.items():
+                        self._track_cache_change(db_manager, cache, record_id)
+                        cache.apply_update(record_id, prepared_data, mark_dirty=False)
+
+            logger.debug(f"{self._table_name} 레코드 {len(prepared_updates)}개 일괄 업데이트")
+            return [
+                cast(T, self._model_class.from_dict({**existing_rows[record_id], **prepared_data}))
+                for record_id, prepared_data in prepared_updates.items()
+            ]
+
+        except Exception as e:
+            logger.error(f"{self._table_name} 레코드 일괄 업데이트 실패: {e}")
+            raise
+
+    async def delete_many(self, record_ids: List[str]) -> int:
+        """
+        여러 레코드를 한 트랜잭션으로 삭제
+
+        Args:
+            record_ids: 삭제할 레코드 ID 목록
+
+        Returns:
+            int: 삭제된 레코드 수
+        """
+        if not record_ids:
+            return 0
+
+        db_manager = await self.get_db_manager()
+        try:
+            unique_ids = list(dict.fromkeys(record_ids))
+            cache = self._get_entity_cache(db_manager)
+
+            async with db_manager.transaction():
+                if cache is not None:
+                    for record_id in unique_ids:
+                        self._track_cache_change(db_manager, cache, record_id)
+                        cache.discard(record_id)
+
+                query = f"DELETE FROM {self._table_name} WHERE id = ?"
+                cursor = await db_manager.execute_many(query, [(record_id,) for record_id in unique_ids])
+                deleted_count = cursor.rowcount
+
+            logger.info(f"{self._table_name} 레코드 {deleted_count}개 일괄 삭제")
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"{self._table_name} 레코드 일괄 삭제 실패: {e}")
+            raise
+
     async def find_by(self, **conditions) -> List[T]:
         """
         조건으로 레코드 검색
@@ -310,21 +617,20 @@ class BaseRepository(Generic[T], ABC):
             List[T]: 검색된 모델 인스턴스 리스트
         """
         try:
-            db_manager = await self.get_db_manager()
-
             if not conditions:
                 return await self.get_all()
 
+            db_manager = await self.get_db_manager()
+
             # WHERE 절 생성
-            where_clauses = [f"{key} = ?" for key in conditions.keys()]
             values = list(conditions.values())
-
-            query = f"""
-                SELECT * FROM {self._table_name}
-                WHERE {' AND '.join(where_clauses)}
-            """
+            query = self._select_where_statement(db_manager, tuple(conditions.keys()))
 
             results = await db_manager.fetch_all(query, tuple(values))
+            self._cache_rows(self._get_entity_cache(db_manager), results)
+            results = await self._overlay_pending(
+                db_manager, results, conditions.keys(), lambda row: self._row_matches(row, conditions)
+            )
 
             return [cast(T, self._model_class.from_dict(result)) for result in results]
 
@@ -345,19 +651,11 @@ class BaseRepository(Generic[T], ABC):
         try:
             db_manager = await self.get_db_manager()
 
-            if conditions:
-                where_clauses = [f"{key} = ?" for key in conditions.keys()]
-                values = list(conditions.values())
-                query = f"""
-                    SELECT COUNT(*) as count FROM {self._table_name}
-                    WHERE {' AND '.join(where_clauses)}
-                """
-                result = await db_manager.fetch_one(query, tuple(values))
-            else:
-                query = f"SELECT COUNT(*) as count FROM {self._table_name}"
-                result = await db_manager.fetch_one(query)
+            query = self._count_statement(db_manager, tuple(conditions.keys()))
+            result = await db_manager.fetch_one(query, tuple(conditions.values()))
+            count = result['count'] if result else 0
 
-            return result['count'] if result else 0
+            return count + await self._count_pending_adjustment(db_manager, conditions)
 
         except Exception as e:
             logger.error(f"{self._table_name} 레코드 개수 조회 실패: {e}")
@@ -375,6 +673,10 @@ class BaseRepository(Generic[T], ABC):
         """
         try:
             db_manager = await self.get_db_manager()
+            cache = self._get_entity_cache(db_manager)
+            if cache is not None and cache.contains(record_id):
+                return True
+
             query = f"SELECT 1 FROM {self._table_name} WHERE id = ? LIMIT 1"
             result = await db_manager.fetch_one(query, (record_id,))
             return result is not None
@@ -98,13 +98,63 @@ DATABASE_SCHEMA: List[str] = [
     );
     """,
 
+    """
+    -- 방 간 특별 연결 테이블 (enter 명령어용)
+    CREATE TABLE IF NOT EXISTS room_connections (
+        id TEXT PRIMARY KEY,
+        from_x INTEGER NOT NULL, -- 출발 방 X 좌표
+        from_y INTEGER NOT NULL, -- 출발 방 Y 좌표
+        to_x INTEGER NOT NULL, -- 도착 방 X 좌표
+        to_y INTEGER NOT NULL, -- 도착 방 Y 좌표
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """,
+
+    """
+    -- 몬스터 스폰 포인트 테이블 (방 + 몬스터 템플릿별 스폰 설정)
+    CREATE TABLE IF NOT EXISTS spawn_points (
+        room_id TEXT NOT NULL,
+        x INTEGER NOT NULL, -- 방 X 좌표 (셀 인덱스용)
+        y INTEGER NOT NULL, -- 방 Y 좌표 (셀 인덱스용)
+        monster_template_id TEXT NOT NULL,
+        max_count INTEGER DEFAULT 1, -- 셀당 최대 생존 수
+        spawn_chance REAL DEFAULT 1.0, -- 스폰 주기마다의 스폰 확률
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (room_id, monster_template_id)
+    );
+    """,
+
+    """
+    -- 실버 잔액 원장 (소유자별 현재 잔액, silver_coin 스택 합계와 일치)
+    CREATE TABLE IF NOT EXISTS currency_balances (
+        owner_id TEXT PRIMARY KEY, -- 플레이어/몬스터 ID
+        amount INTEGER NOT NULL DEFAULT 0 CHECK (amount >= 0),
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """,
+
+    """
+    -- 실버 증감 저널 (추가 전용)
+    CREATE TABLE IF NOT EXISTS currency_transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        owner_id TEXT NOT NULL,
+        delta INTEGER NOT NULL, -- 증감액 (차감은 음수)
+        balance INTEGER NOT NULL, -- 변경 후 잔액
+        reason TEXT DEFAULT '', -- 사유 (buy:<item_id>, sell:<item_id>, spawn, sync 등)
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """,
+
     """
     -- 인덱스 생성
     CREATE INDEX IF NOT EXISTS idx_players_username ON players(username);
+    CREATE INDEX IF NOT EXISTS idx_room_connections_from ON room_connections(from_x, from_y);
     CREATE INDEX IF NOT EXISTS idx_game_objects_location ON game_objects(location_type, location_id);
     CREATE INDEX IF NOT EXISTS idx_monsters_coordinates ON monsters(x, y);
     CREATE INDEX IF NOT EXISTS idx_monsters_type ON monsters(monster_type);
     CREATE INDEX IF NOT EXISTS idx_monsters_alive ON monsters(is_alive);
+    CREATE INDEX IF NOT EXISTS idx_spawn_points_template ON spawn_points(monster_template_id);
+    CREATE INDEX IF NOT EXISTS idx_currency_transactions_owner ON currency_transactions(owner_id, id);
     """,
 
     """
@@ -400,6 +450,26 @@ async def migrate_database(db_manager) -> None:
         await db_manager.commit()
         logger.info("item_prices 초기 데이터 삽입 완료 (%d건)", len(initial_prices))
 
+        # 실버 잔액 원장이 비어 있으면 인벤토리 silver_coin 스택 합계로 한 번 채움
+        cursor = await db_manager.execute("SELECT 1 FROM currency_balances LIMIT 1")
+        if not await cursor.fetchone():
+            logger.info("currency_balances 초기 잔액 적재 중...")
+            await db_manager.execute("""
+                INSERT INTO currency_balances (owner_id, amount)
+                SELECT location_id, SUM(CAST(json_extract(properties, '$.quantity') AS INTEGER))
+                FROM game_objects
+                WHERE location_type IN ('INVENTORY', 'inventory')
+                  AND CASE WHEN json_valid(properties)
+                      THEN json_extract(properties, '$.template_id') END = 'silver_coin'
+                GROUP BY location_id
+            """)
+            await db_manager.execute("""
+                INSERT INTO currency_transactions (owner_id, delta, balance, reason)
+                SELECT owner_id, amount, amount, 'migrate' FROM currency_balances
+            """)
+            await db_manager.commit()
+            logger.info("currency_balances 초기 잔액 적재 완료")
+
         logger.info("데이터베이스 마이그레이션 완료")
 
     except Exception as e:
@@ -407,6 +477,10 @@ async def migrate_database(db_manager) -> None:
         await db_manager.rollback()
         raise
 
+    finally:
+        # 컬럼이 추가/변경되었을 수 있으므로 스키마/구문 캐시 무효화
+        db_manager.invalidate_schema_cache()
+
 
 async def verify_schema(db_connection) -> bool:
     """
@@ -2,10 +2,11 @@
 전투 시스템 - 인스턴스 기반 턴제 전투
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import uuid4
 
 from ..core.localization import get_localization_manager
@@ -63,6 +64,10 @@ class CombatInstance:
     max_timeout_ticks: int = 8  # 8 * 15초 = 2분  # TODO: 이건 또 뭐야
     I18N = get_localization_manager()
     _entity_map: Dict[str, Any] = field(default_factory=dict)
+    # 현재 턴/활성 상태 변경 리스너 (CombatManager의 몹 턴 대기 집합 갱신용)
+    _turn_listener: Optional[Callable[["CombatInstance"], None]] = field(default=None, repr=False, compare=False)
+    # 전투 상태 변경 직렬화용 락 (플레이어 전투 명령과 몹 턴 tick이 같은 전투에서 섞이지 않도록)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
 
     def __post_init__(self):
         """초기화 후 턴 순서 결정"""
@@ -76,6 +81,22 @@ class CombatInstance:
         self.turn_order = [c.id for c in sorted_combatants]
         logger.info(f"전투 {self.id} 턴 순서 결정: {self.turn_order}")
 
+    def set_turn_listener(self, listener: Optional[Callable[["CombatInstance"], None]]) -> None:
+        """현재 턴이 바뀔 수 있는 변경(참가자 추가/제거, 턴 진행, 종료)마다 호출될 리스너 설정"""
+        self._turn_listener = listener
+
+    def notify_turn_changed(self) -> None:
+        """턴 리스너에 현재 턴 변경 알림 (turn_order를 직접 바꾼 경우에도 호출)"""
+        if self._turn_listener:
+            self._turn_listener(self)
+
+    def is_monster_turn(self) -> bool:
+        """진행 중인 전투에서 현재 턴이 몬스터인지 여부"""
+        if not self.is_active:
+            return False
+        current = self.get_current_combatant()
+        return current is not None and current.combatant_type == CombatantType.MONSTER
+
     def add_combatant(self, combatant: Combatant) -> None:
         """전투 참가자 추가"""
         if any(c.id == combatant.id for c in self.combatants):
@@ -88,6 +109,7 @@ class CombatInstance:
         logger.info(f"전투 {self.id}에 {combatant.name} 추가")
         for c in self.combatants:
             logger.info(f"- {c.get_display_name()}")
+        self.notify_turn_changed()
 
     def remove_combatant(self, combatant_id: str) -> bool:
         """전투 참가자 제거"""
@@ -99,6 +121,7 @@ class CombatInstance:
             if combatant_id in self.turn_order:
                 self.turn_order.remove(combatant_id)
             logger.info(f"전투 {self.id}에서 {combatant_id} 제거")
+            self.notify_turn_changed()
             return True
 
         return False
@@ -160,6 +183,8 @@ class CombatInstance:
         if current and not current.is_alive():
             logger.info("current_combatant dead")
             self.advance_turn(True)  # 이런 경우 self.turn_number 는 증가하면 안됨
+        else:
+            self.notify_turn_changed()
         # NOTE: 누구턴 메시지는 실행 한 곳에서
 
     # def add_combat_log(self, turn: CombatTurn) -> None:
@@ -222,6 +247,7 @@ class CombatInstance:
         self.is_active = False
         self.ended_at = datetime.now()
         logger.info(f"전투 {self.id} 종료")
+        self.notify_turn_changed()
 
     def get_winners(self) -> List[Combatant]:
         """승리자 목록 반환"""
@@ -112,16 +112,7 @@ class CombatHandler:
         Returns:
             bool: 전투 중이면 True
         """
-        for combat in self.combat_manager.combat_instances.values():
-            if not combat.is_active:
-                continue
-
-            # 전투 참가자 중에 해당 몬스터가 있는지 확인
-            for combatant in combat.combatants:
-                if combatant.id == monster_id and combatant.is_alive():
-                    return True
-
-        return False
+        return self.combat_manager.is_monster_in_combat(monster_id)
 
     async def process_player_action(
         self,
@@ -350,15 +341,14 @@ class CombatHandler:
             if not self.world_manager:
                 return
             inventory = await self.world_manager.get_inventory_objects(entity_id)
+            # 아이템 이동 전체를 한 번에 커밋 (중간 실패 시 인벤토리에 그대로 남음)
+            await self.world_manager._object_manager.move_game_objects(
+                [obj.id for obj in inventory], "container", corpse_id, is_equipped=False,
+            )
             for obj in inventory:
                 obj.location_type = "container"
                 obj.location_id = corpse_id
                 obj.is_equipped = False
-                await self.world_manager._object_manager.update_game_object(obj.id, {
-                    "location_type": "container",
-                    "location_id": corpse_id,
-                    "is_equipped": False,
-                })
             if inventory:
                 logger.info(f"사망자 {entity_id[-12:]}의 아이템 {len(inventory)}개를 corpse {corpse_id[-12:]}로 이동")
         except Exception as e:
@@ -404,9 +394,9 @@ class CombatHandler:
                     # 몬스터 DB 사망 처리
                     monster = await self.world_manager.get_monster(dead_combatant.id)
                     if monster and monster.is_alive:
-                        monster.die()
-                        await self.world_manager.update_monster(monster)
-                        logger.info(f"몬스터 {dead_combatant.id} DB 사망 처리 완료")
+                        # 레지스트리 객체를 직접 바꾸지 않고, 저장 실패 시 되돌리는 경로로 처리
+                        if await self.world_manager.kill_monster(monster.id):
+                            logger.info(f"몬스터 {dead_combatant.id} DB 사망 처리 완료")
             else:
                 # 플레이어 사망
                 desc_en = I18N.get_message("combat.corpse_desc", "en", name=name_en)
@@ -689,9 +679,7 @@ class CombatHandler:
                             #     logger.info(f"몬스터 {combatant.name}이(가) {len(dropped)}개 아이템 드롭")
 
                             # 몬스터 사망 처리
-                            if monster.is_alive:
-                                monster.die()
-                                await self.world_manager.update_monster(monster)
+                            if monster.is_alive and await self.world_manager.kill_monster(monster.id):
                                 logger.info(f"몬스터 {combatant.name} ({combatant.id}) 사망 처리 완료")
                     except Exception as e:
                         logger.error(f"몬스터 사망 처리 실패 ({combatant.id}): {e}")
@@ -719,16 +707,13 @@ class CombatHandler:
         Returns:
             CombatInstance: 전투 인스턴스 (없으면 None)
         """
-        logger.info("mark")
-        for combat in self.combat_manager.combat_instances.values():
-            if not combat.is_active:
-                continue
-
-            # 전투 참가자 중에 해당 플레이어가 있는지 확인
-            for combatant in combat.combatants:
-                if combatant.id == player_id and combatant.is_alive():
-                    return combat
+        combat = self.combat_manager.get_combat_by_player(player_id)
+        if not combat or not combat.is_active:
+            return None
 
+        combatant = combat.get_combatant(player_id)
+        if combatant and combatant.is_alive():
+            return combat
         return None
 
     @property
@@ -751,27 +736,18 @@ class CombatHandler:
             CombatInstance: 생성된 전투 인스턴스
         """
         # 몹을 통해 이미 존재 하는 combat을 찾음
-        _found = False
         logger.info("invoked start_combat")
         logger.info(monster)
 
-        for combat in self.combat_manager.combat_instances.values():
-            for combatant in combat.combatants:
-                if monster.id == combatant.id and combatant.is_alive():
-                    _found = True
-                    break
-            if _found:
-                break
-
-        if _found:
-            # 플레이어가 인스턴스에 없는 경우 플레이어 추가
-            for combatant in combat.combatants:
-                if combatant.id == player.id:  # 꼭 찾는걸 이렇게 해야 하나
+        if self.combat_manager.is_monster_in_combat(monster.id):
+            combat = self.combat_manager.get_combat_by_monster(monster.id)
+            # 플레이어가 인스턴스에 없는 경우 플레이어 추가 (턴 순서가 바뀌므로 진행 중인 몹 턴이 끝난 뒤)
+            async with combat.lock:
+                if combat.get_combatant(player.id):
                     logger.info("found")
-                    break
-            else:
-                logger.info("플레이어 만 추가")
-                self.combat_manager.add_player_to_combat(combat.id, player, player.id)
+                else:
+                    logger.info("플레이어 만 추가")
+                    self.combat_manager.add_player_to_combat(combat.id, player, player.id)
             # 턴도 다시 결정 할 필요 없음
             return combat
 
@@ -21,17 +21,35 @@ class CombatManager:
         self.combat_instances: Dict[str, CombatInstance] = {}  # combat_id -> CombatInstance
         self.room_combats: Dict[str, str] = {}  # room_id -> combat_id
         self.player_combats: Dict[str, str] = {}  # player_id -> combat_id
+        self.monster_combats: Dict[str, str] = {}  # monster_id -> combat_id
+        # combat_id -> 참가했던 플레이어/몬스터 ID (전투 종료 시 위 매핑 정리용)
+        self._participants: Dict[str, Dict[str, None]] = {}
+        # 현재 턴이 몬스터인 진행 중 전투 (순서를 유지하는 집합, combat_id -> None)
+        self._awaiting_monster_turn: Dict[str, None] = {}
         self.session_manager = session_manager
         logger.info("CombatManager 초기화 완료")
 
     def create_combat(self, room_id: str) -> CombatInstance:
         """새로운 전투 인스턴스 생성"""
         combat = CombatInstance(room_id=room_id)
+        combat.set_turn_listener(self._on_turn_changed)
         self.combat_instances[combat.id] = combat
         self.room_combats[room_id] = combat.id
+        self._participants[combat.id] = {}
         logger.info(f"방 {room_id}에 전투 인스턴스 {combat.id} 생성")
         return combat
 
+    def _on_turn_changed(self, combat: CombatInstance) -> None:
+        """전투의 현재 턴 변경 시 몹 턴 대기 집합 갱신"""
+        if combat.is_monster_turn() and combat.id in self.combat_instances:
+            self._awaiting_monster_turn[combat.id] = None
+        else:
+            self._awaiting_monster_turn.pop(combat.id, None)
+
+    def get_combats_awaiting_monster_turn(self) -> List[CombatInstance]:
+        """현재 턴이 몬스터인 진행 중 전투 목록"""
+        return [self.combat_instances[combat_id] for combat_id in self._awaiting_monster_turn]
+
     def _build_turn_order_message(self, combat: CombatInstance, locale: str) -> str:
         """참가자의 locale에 맞는 턴 순서 메시지 생성"""
         I18N = get_localization_manager()
@@ -65,6 +83,7 @@ class CombatManager:
         if superadmin_id:
             combat.turn_order.insert(0, combat.turn_order.pop(combat.turn_order.index(superadmin_id)))
             logger.info(f"after {combat.turn_order}")
+            combat.notify_turn_changed()
 
         # 참가자별 locale로 개별 전송
         await self._broadcast_per_player_locale(
@@ -75,6 +94,7 @@ class CombatManager:
         """선공 몬스터 전투 시작 시 턴 순서 브로드캐스트 (참가자별 locale)"""
         combat.turn_order.insert(0, combat.turn_order.pop(combat.turn_order.index(monster.id)))
         logger.info(f"after {combat.turn_order}")
+        combat.notify_turn_changed()
 
         # 참가자별 locale로 개별 전송
         await self._broadcast_per_player_locale(
@@ -102,6 +122,21 @@ class CombatManager:
             return self.get_combat(combat_id)
         return None
 
+    def get_combat_by_monster(self, monster_id: str) -> Optional[CombatInstance]:
+        """몬스터 ID로 전투 인스턴스 조회"""
+        combat_id = self.monster_combats.get(monster_id)
+        if combat_id:
+            return self.get_combat(combat_id)
+        return None
+
+    def is_monster_in_combat(self, monster_id: str) -> bool:
+        """몬스터가 진행 중인 전투에 살아서 참가 중인지 확인"""
+        combat = self.get_combat_by_monster(monster_id)
+        if not combat or not combat.is_active:
+            return False
+        combatant = combat.get_combatant(monster_id)
+        return combatant is not None and combatant.is_alive()
+
     def is_player_in_combat(self, player_id: str) -> bool:
         """플레이어가 전투 중인지 확인"""
         combat = self.get_combat_by_player(player_id)
@@ -142,6 +177,7 @@ class CombatManager:
         combatant.data = {"player": player}
         combat.add_combatant(combatant)
         self.player_combats[player_id] = combat_id
+        self._participants.setdefault(combat_id, {})[player_id] = None
         return True
 
     def add_monster_to_combat(self, combat_id: str, monster: Monster) -> bool:
@@ -178,6 +214,8 @@ class CombatManager:
             f"몬스터 {monster.id}를 전투 {combat_id}에 추가 (AC: {monster.stats.armor_class}, 공격보너스: {monster.stats.attack_bonus})"
         )
         combat.add_combatant(combatant)
+        self.monster_combats[monster.id] = combat_id
+        self._participants.setdefault(combat_id, {})[monster.id] = None
         return True
 
     def remove_player_from_combat(self, player_id: str) -> bool:
@@ -189,6 +227,7 @@ class CombatManager:
         success = combat.remove_combatant(player_id)
         if success:
             del self.player_combats[player_id]
+            self._participants.get(combat.id, {}).pop(player_id, None)
             logger.info(f"플레이어 {player_id}를 전투에서 제거")
 
         return success
@@ -201,10 +240,12 @@ class CombatManager:
 
         combat.end_combat()
 
-        # 플레이어 전투 매핑 제거
-        for player_id in list(self.player_combats.keys()):
-            if self.player_combats[player_id] == combat_id:
-                del self.player_combats[player_id]
+        # 플레이어/몬스터 전투 매핑 제거 (다른 전투로 옮겨간 매핑은 유지)
+        for participant_id in self._participants.pop(combat_id, {}):
+            if self.player_combats.get(participant_id) == combat_id:
+                del self.player_combats[participant_id]
+            if self.monster_combats.get(participant_id) == combat_id:
+                del self.monster_combats[participant_id]
 
         # 방 전투 매핑 제거
         if combat.room_id in self.room_combats:
@@ -219,6 +260,8 @@ class CombatManager:
 
         for combat_id in finished_combats:
             del self.combat_instances[combat_id]
+            self._participants.pop(combat_id, None)
+            self._awaiting_monster_turn.pop(combat_id, None)
 
         if finished_combats:
             logger.info(f"{len(finished_combats)}개의 종료된 전투 인스턴스 정리")
@@ -95,7 +95,7 @@ class DialogueInstance:
         ):
             try:
                 ctx = await self._build_context()
-                result = self.lua_loader.execute_get_dialogue(
+                result = await self.lua_loader.execute_get_dialogue(
                     talker.id, ctx
                 )
                 if result is not None:
@@ -154,7 +154,7 @@ class DialogueInstance:
             ):
                 try:
                     ctx = await self._build_context()
-                    self.lua_loader.execute_on_bye(self.interlocutor.id, ctx)
+                    await self.lua_loader.execute_on_bye(self.interlocutor.id, ctx)
                 except Exception as e:
                     logger.error(f"Lua on_bye 콜백 실행 실패: {e}")
             self.is_active = False
@@ -174,7 +174,7 @@ class DialogueInstance:
         ):
             try:
                 ctx = await self._build_context()
-                result = self.lua_loader.execute_on_choice(
+                result = await self.lua_loader.execute_on_choice(
                     talker.id, choice, ctx
                 )
                 if result is None:
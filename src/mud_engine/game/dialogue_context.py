@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from typing import Any, List, Optional, TYPE_CHECKING
 
+from .lua_script_loader import LazyField
+
 if TYPE_CHECKING:
     from .models.player import Player
     from .models.gameobject import GameObject
@@ -23,8 +25,11 @@ _SILVER_TEMPLATE_ID = "silver_coin"
 class DialogueContext:
     """Lua 스크립트에 전달할 읽기 전용 컨텍스트 빌더
 
-    Python 객체 참조를 전달하지 않고 순수 dict로 변환하여
+    Python 객체 참조를 전달하지 않고 dict 스냅샷을 만들어
     Lua 측에서 Python 내부 상태를 변경할 수 없게 한다.
+    중첩 값은 여기서 복사하지 않고, LuaScriptLoader가 Lua 테이블로 한 번 변환할 때
+    기본 타입만 남긴다. 교환 정보(실버, 인벤토리)는 LazyField로 두어
+    스크립트가 처음 읽을 때만 조회한다.
     """
 
     @staticmethod
@@ -79,72 +84,31 @@ class DialogueContext:
     ) -> dict[str, Any]:
         """교환 정보를 포함한 컨텍스트 빌드 (비동기).
 
-        CurrencyManager와 GameObjectRepository를 사용하여
-        실버 잔액, 인벤토리 목록을 조회한 뒤 build()에 전달한다.
+        실버 잔액/인벤토리는 미리 조회하지 않고 LazyField로 넣어,
+        스크립트가 player.silver, npc.inventory 등을 처음 읽을 때만 조회한다.
+        같은 소유자의 인벤토리는 한 단계 안에서 한 번만 조회한다.
+        지연 필드는 읽기 전까지 pairs()로 순회되지 않는다.
         """
-        exchange_data = await DialogueContext._fetch_exchange_data(
-            player_id=player.id,
-            npc_id=npc.id,
-            player=player,
-            currency_manager=currency_manager,
-            object_repo=object_repo,
-        )
-        return DialogueContext.build(
+        ctx = DialogueContext.build(
             player=player,
             session=session,
             npc=npc,
             dialogue=dialogue,
-            exchange_data=exchange_data,
         )
-
-    @staticmethod
-    async def _fetch_exchange_data(
-        player_id: str,
-        npc_id: str,
-        player: Player,
-        currency_manager: CurrencyManager,
-        object_repo: GameObjectRepository,
-    ) -> dict[str, Any]:
-        """교환에 필요한 데이터를 비동기로 조회.
-
-        Returns:
-            {
-                "player_silver": int,
-                "player_inventory": list[GameObject],  # silver_coin 제외
-                "player_weight_limit": float,
-                "npc_silver": int,
-                "npc_inventory": list[GameObject],  # silver_coin 제외
-            }
-        """
-        # 실버 잔액 조회
-        player_silver = await currency_manager.get_balance(player_id)
-        npc_silver = await currency_manager.get_balance(npc_id)
-
-        # 인벤토리 조회 (silver_coin 제외)
-        player_all = await object_repo.get_objects_in_inventory(player_id)
-        npc_all = await object_repo.get_objects_in_inventory(npc_id)
-
-        player_inventory = [
-            obj for obj in player_all
-            if obj.properties.get("template_id") != _SILVER_TEMPLATE_ID
-        ]
-        npc_inventory = [
-            obj for obj in npc_all
-            if obj.properties.get("template_id") != _SILVER_TEMPLATE_ID
-        ]
-
-        # 무게 제한 (carry_weight는 silver_coin 포함 전체 무게)
-        carry_weight = sum(obj.weight for obj in player_all)
-        weight_limit = player.get_max_carry_weight()
-
-        return {
-            "player_silver": player_silver,
-            "player_inventory": player_inventory,
-            "player_carry_weight": carry_weight,
-            "player_weight_limit": weight_limit,
-            "npc_silver": npc_silver,
-            "npc_inventory": npc_inventory,
-        }
+        snapshot = _ExchangeSnapshot(currency_manager, object_repo)
+        player_id, npc_id = str(player.id), str(npc.id)
+
+        ctx["player"].update({
+            "silver": LazyField(lambda: snapshot.silver(player_id)),
+            "inventory": LazyField(lambda: snapshot.inventory(player_id)),
+            "carry_weight": LazyField(lambda: snapshot.carry_weight(player_id)),
+            "weight_limit": float(player.get_max_carry_weight()),
+        })
+        ctx["npc"].update({
+            "silver": LazyField(lambda: snapshot.silver(npc_id)),
+            "inventory": LazyField(lambda: snapshot.inventory(npc_id)),
+        })
+        return ctx
 
     @staticmethod
     def _build_player_context(
@@ -220,10 +184,10 @@ class DialogueContext:
         if isinstance(npc.name, dict):
             name_copy = {str(k): str(v) for k, v in npc.name.items()}
 
-        # properties 깊은 복사 (순수 dict)
+        # properties 스냅샷 (중첩 값은 Lua 변환 시 기본 타입으로 정리)
         props_copy: dict[str, Any] = {}
         if isinstance(npc.properties, dict):
-            props_copy = _deep_copy_dict(npc.properties)
+            props_copy = dict(npc.properties)
 
         result: dict[str, Any] = {
             "id": str(npc.id),
@@ -273,10 +237,10 @@ def _build_item_dict(obj: GameObject) -> dict[str, Any]:
     if isinstance(obj.name, dict):
         name_copy = {str(k): str(v) for k, v in obj.name.items()}
 
-    # properties 깊은 복사
+    # properties 스냅샷 (중첩 값은 Lua 변환 시 기본 타입으로 정리)
     props_copy: dict[str, Any] = {}
     if isinstance(obj.properties, dict):
-        props_copy = _deep_copy_dict(obj.properties)
+        props_copy = dict(obj.properties)
 
     return {
         "id": str(obj.id),
@@ -289,36 +253,35 @@ def _build_item_dict(obj: GameObject) -> dict[str, Any]:
     }
 
 
-def _deep_copy_dict(source: dict[str, Any]) -> dict[str, Any]:
-    """dict를 재귀적으로 순수 dict/list/기본 타입으로 복사"""
-    result: dict[str, Any] = {}
-    for k, v in source.items():
-        if isinstance(v, dict):
-            result[str(k)] = _deep_copy_dict(v)
-        elif isinstance(v, list):
-            result[str(k)] = _deep_copy_list(v)
-        elif isinstance(v, (str, int, float, bool)):
-            result[str(k)] = v
-        elif v is None:
-            result[str(k)] = None
-        else:
-            # 알 수 없는 타입은 문자열로 변환
-            result[str(k)] = str(v)
-    return result
-
-
-def _deep_copy_list(source: list[Any]) -> list[Any]:
-    """list를 재귀적으로 순수 list/dict/기본 타입으로 복사"""
-    result: list[Any] = []
-    for item in source:
-        if isinstance(item, dict):
-            result.append(_deep_copy_dict(item))
-        elif isinstance(item, list):
-            result.append(_deep_copy_list(item))
-        elif isinstance(item, (str, int, float, bool)):
-            result.append(item)
-        elif item is None:
-            result.append(None)
-        else:
-            result.append(str(item))
-    return result
+
+class _ExchangeSnapshot:
+    """한 대화 단계 동안 교환 정보를 필요할 때 조회하고 소유자별로 재사용"""
+
+    def __init__(
+        self,
+        currency_manager: CurrencyManager,
+        object_repo: GameObjectRepository,
+    ) -> None:
+        self._currency_manager = currency_manager
+        self._object_repo = object_repo
+        self._inventories: dict[str, List[GameObject]] = {}
+
+    async def silver(self, owner_id: str) -> int:
+        """실버 잔액"""
+        return int(await self._currency_manager.get_balance(owner_id))
+
+    async def inventory(self, owner_id: str) -> list[dict[str, Any]]:
+        """교환용 인벤토리 목록 (silver_coin 제외)"""
+        return [
+            _build_item_dict(obj) for obj in await self._load_inventory(owner_id)
+            if obj.properties.get("template_id") != _SILVER_TEMPLATE_ID
+        ]
+
+    async def carry_weight(self, owner_id: str) -> float:
+        """소지 무게 (silver_coin 포함 전체 무게)"""
+        return float(sum(obj.weight for obj in await self._load_inventory(owner_id)))
+
+    async def _load_inventory(self, owner_id: str) -> List[GameObject]:
+        if owner_id not in self._inventories:
+            self._inventories[owner_id] = await self._object_repo.get_objects_in_inventory(owner_id)
+        return self._inventories[owner_id]
@@ -2,30 +2,133 @@
 """게임 객체 리포지토리"""
 
 import logging
-from typing import List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
 
 from ..database.repository import BaseRepository
 from .models import GameObject
 
 logger = logging.getLogger(__name__)
 
+# 템플릿 변경 리스너: 해당 템플릿 객체가 인벤토리에서 바뀐 소유자 ID 집합을 받음
+TemplateListener = Callable[[Set[str]], Awaitable[None]]
+
 
 class GameObjectRepository(BaseRepository[GameObject]):
     """게임 객체 리포지토리"""
 
+    cache_entities = True
+
+    def __init__(self, db_manager=None):
+        super().__init__(db_manager)
+        # DB 매니저가 정해지기 전에 등록된 리스너 (정해지면 공유 목록으로 옮김)
+        self._unbound_listeners: Dict[str, List[TemplateListener]] = {}
+
     def get_table_name(self) -> str:
         return "game_objects"
 
     def get_model_class(self):
         return GameObject
 
+    # === 템플릿별 변경 알림 (실버 잔액 원장 등 파생 데이터 동기화용) ===
+
+    @property
+    def _template_listeners(self) -> Dict[str, List[TemplateListener]]:
+        """템플릿 ID → 리스너 목록.
+
+        같은 DB 매니저를 쓰는 모든 GameObjectRepository 인스턴스가 공유하므로,
+        어느 인스턴스로 객체를 바꾸어도 리스너가 호출된다.
+        """
+        if self._db_manager is None:
+            return self._unbound_listeners
+        listeners = self._db_manager.get_change_listeners(self._table_name)
+        if self._unbound_listeners:
+            for template_id, pending in self._unbound_listeners.items():
+                listeners.setdefault(template_id, []).extend(pending)
+            self._unbound_listeners.clear()
+        return listeners
+
+    def add_template_listener(self, template_id: str, listener: TemplateListener) -> None:
+        """template_id 객체가 인벤토리에 생성/이동/수정/삭제되면 영향받은 소유자 ID 집합으로 listener 호출"""
+        self._template_listeners.setdefault(template_id, []).append(listener)
+
+    async def create(self, data: Dict[str, Any]) -> GameObject:
+        created = await super().create(data)
+        await self._notify_template_listeners([created])
+        return created
+
+    async def create_many(self, items: List[Any]) -> List[GameObject]:
+        created = await super().create_many(items)
+        await self._notify_template_listeners(created)
+        return created
+
+    async def update(self, record_id: str, data: Dict[str, Any]) -> Optional[GameObject]:
+        before = await self.get_by_id(record_id) if self._template_listeners else None
+        updated = await super().update(record_id, data)
+        await self._notify_template_listeners([before, updated])
+        return updated
+
+    async def update_many(self, updates: Dict[str, Dict[str, Any]]) -> List[GameObject]:
+        before = await self._get_watched_objects(list(updates))
+        updated = await super().update_many(updates)
+        await self._notify_template_listeners(before + updated)
+        return updated
+
+    async def delete(self, record_id: str) -> bool:
+        before = await self.get_by_id(record_id) if self._template_listeners else None
+        deleted = await super().delete(record_id)
+        await self._notify_template_listeners([before])
+        return deleted
+
+    async def delete_many(self, record_ids: List[str]) -> int:
+        before = await self._get_watched_objects(record_ids)
+        deleted_count = await super().delete_many(record_ids)
+        await self._notify_template_listeners(before)
+        return deleted_count
+
+    async def _get_watched_objects(self, record_ids: List[str]) -> List[GameObject]:
+        """리스너가 있을 때만 변경 전 객체를 조회 (캐시 또는 IN 조회 한 번)"""
+        if not self._template_listeners or not record_ids:
+            return []
+        rows = await self._get_rows_by_ids(record_ids)
+        return [GameObject.from_dict(row) for row in rows.values()]
+
+    async def _notify_template_listeners(self, objects: Iterable[Optional[GameObject]]) -> None:
+        """변경 전후 객체 중 인벤토리에 있던/있는 감시 템플릿 객체의 소유자를 리스너에 전달"""
+        if not self._template_listeners:
+            return
+        owners: Dict[str, Set[str]] = {}
+        for obj in objects:
+            if obj is None or not obj.location_id or str(obj.location_type).lower() != 'inventory':
+                continue
+            template_id = obj.properties.get('template_id') if isinstance(obj.properties, dict) else None
+            if template_id in self._template_listeners:
+                owners.setdefault(template_id, set()).add(obj.location_id)
+        for template_id, owner_ids in owners.items():
+            for listener in self._template_listeners[template_id]:
+                try:
+                    await listener(owner_ids)
+                except Exception as e:
+                    logger.error(f"템플릿 변경 리스너 실행 실패 ({template_id}): {e}")
+
+    async def _find_by_location(self, location_type: str, location_id: str) -> List[GameObject]:
+        """location_type(대소문자 모두)과 location_id가 일치하는 객체를 IN 조회 한 번으로 검색"""
+        location_types = (location_type.upper(), location_type.lower())
+        db_manager = await self.get_db_manager()
+        rows = await db_manager.fetch_all(
+            "SELECT * FROM game_objects WHERE location_type IN (?, ?) AND location_id = ?",
+            (*location_types, location_id),
+        )
+        self._cache_rows(self._get_entity_cache(db_manager), rows)
+        rows = await self._overlay_pending(
+            db_manager, rows, ('location_type', 'location_id'),
+            lambda row: row.get('location_type') in location_types and row.get('location_id') == location_id,
+        )
+        return [GameObject.from_dict(row) for row in rows]
+
     async def get_objects_in_room(self, room_id: str) -> List[GameObject]:
         """특정 방에 있는 객체들 조회"""
         try:
-            # 대소문자 모두 검색
-            room_objects = await self.find_by(location_type='ROOM', location_id=room_id)
-            room_objects_lower = await self.find_by(location_type='room', location_id=room_id)
-            return room_objects + room_objects_lower
+            return await self._find_by_location('room', room_id)
         except Exception as e:
             logger.error(f"방 내 객체 조회 실패 ({room_id}): {e}")
             raise
@@ -33,14 +136,38 @@ class GameObjectRepository(BaseRepository[GameObject]):
     async def get_objects_in_inventory(self, character_id: str) -> List[GameObject]:
         """특정 캐릭터의 인벤토리 객체들 조회"""
         try:
-            # 대소문자 모두 검색
-            inventory_objects = await self.find_by(location_type='INVENTORY', location_id=character_id)
-            inventory_objects_lower = await self.find_by(location_type='inventory', location_id=character_id)
-            return inventory_objects + inventory_objects_lower
+            return await self._find_by_location('inventory', character_id)
         except Exception as e:
             logger.error(f"인벤토리 객체 조회 실패 ({character_id}): {e}")
             raise
 
+    async def get_inventory_objects_by_template(self, character_id: str, template_id: str) -> List[GameObject]:
+        """특정 캐릭터 인벤토리에서 템플릿이 일치하는 객체만 조회 (위치 인덱스 사용, 다른 행은 디코딩하지 않음)"""
+        try:
+            db_manager = await self.get_db_manager()
+            rows = await db_manager.fetch_all(
+                "SELECT * FROM game_objects "
+                "WHERE location_type IN ('INVENTORY', 'inventory') AND location_id = ? "
+                "AND CASE WHEN json_valid(properties) THEN json_extract(properties, '$.template_id') END = ? "
+                "ORDER BY created_at",
+                (character_id, template_id),
+            )
+            self._cache_rows(self._get_entity_cache(db_manager), rows)
+
+            def matches(row: Dict[str, Any]) -> bool:
+                if row.get('location_type') not in ('INVENTORY', 'inventory') or row.get('location_id') != character_id:
+                    return False
+                return GameObject.from_dict(row).properties.get('template_id') == template_id
+
+            rows = await self._overlay_pending(
+                db_manager, rows, ('location_type', 'location_id', 'properties'), matches
+            )
+            rows.sort(key=lambda row: str(row.get('created_at') or ''))
+            return [GameObject.from_dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"인벤토리 템플릿 객체 조회 실패 ({character_id}, {template_id}): {e}")
+            raise
+
     async def get_objects_by_type(self, object_type: str) -> List[GameObject]:
         """타입별 객체 조회 (object_type 필드 제거됨 - 모든 객체 반환)"""
         try:
@@ -61,6 +188,18 @@ class GameObjectRepository(BaseRepository[GameObject]):
             logger.error(f"객체 방 이동 실패 ({object_id} -> {room_id}): {e}")
             raise
 
+    async def move_objects(self, object_ids: List[str], location_type: str, location_id: str,
+                           is_equipped: Optional[bool] = None) -> List[GameObject]:
+        """여러 객체를 한 번에 같은 위치로 이동 (한 트랜잭션)"""
+        try:
+            changes: Dict[str, Any] = {'location_type': location_type, 'location_id': location_id}
+            if is_equipped is not None:
+                changes['is_equipped'] = is_equipped
+            return await self.update_many({object_id: changes for object_id in object_ids})
+        except Exception as e:
+            logger.error(f"객체 일괄 이동 실패 ({len(object_ids)}개 -> {location_type}:{location_id}): {e}")
+            raise
+
     async def move_object_to_inventory(self, object_id: str, character_id: str) -> Optional[GameObject]:
         """객체를 인벤토리로 이동"""
         try:
@@ -92,10 +231,7 @@ class GameObjectRepository(BaseRepository[GameObject]):
     async def get_objects_in_container(self, container_id: str) -> List[GameObject]:
         """컨테이너 내부의 객체들 조회"""
         try:
-            # 대소문자 모두 검색
-            container_objects = await self.find_by(location_type='CONTAINER', location_id=container_id)
-            container_objects_lower = await self.find_by(location_type='container', location_id=container_id)
-            return container_objects + container_objects_lower
+            return await self._find_by_location('container', container_id)
         except Exception as e:
             logger.error(f"컨테이너 내 객체 조회 실패 ({container_id}): {e}")
             raise
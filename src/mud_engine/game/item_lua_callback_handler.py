@@ -3,7 +3,8 @@
 
 아이템 동사 명령어(use, read 등) 실행 시 configs/items/{template_id}.lua
 스크립트의 콜백 함수(on_use, on_read 등)를 호출하여 아이템별 커스텀 동작을 구현한다.
-기존 LuaScriptLoader를 재사용하여 샌드박스 환경과 핫 리로드를 활용한다.
+기존 LuaScriptLoader를 재사용하여 스크립트별 샌드박스 환경, 적재 캐시(mtime 기반 핫 리로드),
+워커 스레드 실행과 명령어 수/시간 제한을 활용한다.
 """
 
 from __future__ import annotations
@@ -16,6 +17,9 @@ from .lua_script_loader import LuaScriptLoader
 
 logger = logging.getLogger(__name__)
 
+# 아이템 Lua 스크립트 디렉토리
+ITEM_SCRIPT_DIR = os.path.join("configs", "items")
+
 
 class ItemLuaCallbackHandler:
     """아이템 Lua 콜백 스크립트를 로드하고 실행하는 핸들러
@@ -35,7 +39,7 @@ class ItemLuaCallbackHandler:
     def load_item_script(self, template_id: str) -> str | None:
         """configs/items/{template_id}.lua 파일을 읽어 문자열로 반환
 
-        매 호출 시 디스크에서 읽어 핫 리로드를 지원한다.
+        디버깅/도구용 원문 조회이며, 콜백 실행은 LuaScriptLoader의 컴파일 캐시를 사용한다.
         파일 미존재 시 None 반환.
 
         Args:
@@ -44,7 +48,7 @@ class ItemLuaCallbackHandler:
         Returns:
             Lua 스크립트 소스 문자열 또는 None
         """
-        file_path = os.path.join("configs", "items", f"{template_id}.lua")
+        file_path = self._script_path(template_id)
         if not os.path.exists(file_path):
             logger.debug(
                 "아이템 Lua 스크립트 파일 없음: %s", file_path
@@ -60,6 +64,10 @@ class ItemLuaCallbackHandler:
             )
             return None
 
+    @staticmethod
+    def _script_path(template_id: str) -> str:
+        return os.path.join(ITEM_SCRIPT_DIR, f"{template_id}.lua")
+
     def _convert_callback_result(
         self,
         lua_result: Any,
@@ -111,7 +119,7 @@ class ItemLuaCallbackHandler:
             "consume": consume,
         }
 
-    def execute_verb_callback(
+    async def execute_verb_callback(
         self,
         template_id: str | None,
         verb: str,
@@ -119,8 +127,8 @@ class ItemLuaCallbackHandler:
     ) -> dict[str, Any] | None:
         """범용 동사 콜백 실행 메서드
 
-        template_id에 대응하는 Lua 스크립트를 로드하고,
-        on_{verb}(ctx) 함수를 동적으로 호출한다.
+        template_id에 대응하는 Lua 스크립트 환경에서
+        on_{verb}(ctx) 함수를 워커 스레드로 호출한다.
         모든 오류 시 None을 반환하여 기존 폴백 로직이 실행되도록 한다.
 
         Args:
@@ -143,44 +151,18 @@ class ItemLuaCallbackHandler:
             return None
 
         try:
-            # 스크립트 소스 로드
-            script_source = self.load_item_script(template_id)
-            if script_source is None:
-                return None
-
-            # 스크립트 실행 (글로벌에 함수 등록)
-            self._lua_loader._lua.execute(script_source)
+            # locale 추출
+            locale = context.get("session", {}).get("locale", "en")
 
-            # on_{verb} 함수 존재 확인
+            # 스크립트 환경의 on_{verb} 호출 (스크립트/함수 없음, nil 반환, 오류 시 None)
             callback_name = f"on_{verb}"
-            callback_fn = getattr(
-                self._lua_loader._lua.globals(), callback_name, None
+            converted = await self._lua_loader.call_function(
+                self._script_path(template_id), callback_name, context,
+                convert=lambda lua_result: self._convert_callback_result(lua_result, locale),
             )
-            if callback_fn is None:
-                logger.debug(
-                    "아이템 Lua 스크립트에 %s 함수 없음 [%s]",
-                    callback_name, template_id,
-                )
+            if converted is None:
                 return None
 
-            # Lua 컨텍스트 생성
-            lua_ctx = self._lua_loader._build_lua_context(context)
-
-            # 콜백 함수 호출
-            lua_result = callback_fn(lua_ctx)
-            if lua_result is None:
-                logger.debug(
-                    "아이템 Lua 콜백 nil 반환 [%s.%s]",
-                    template_id, callback_name,
-                )
-                return None
-
-            # locale 추출
-            locale = context.get("session", {}).get("locale", "en")
-
-            # 결과 변환
-            converted = self._convert_callback_result(lua_result, locale)
-
             logger.debug(
                 "아이템 Lua 콜백 실행 완료 [%s.%s]",
                 template_id, callback_name,
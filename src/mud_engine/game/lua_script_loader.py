@@ -2,8 +2,16 @@
 Lua 스크립트 로더 - NPC 대화 스크립트를 로드하고 실행
 
 lupa 라이브러리를 통해 Lua 스크립트를 샌드박스 환경에서 실행한다.
-스크립트 파일은 매 호출 시 디스크에서 읽어 핫 리로드를 지원한다.
-Exchange API를 Lua 글로벌에 등록하여 대화 스크립트에서 교환 기능을 사용할 수 있다.
+스크립트마다 독립된 환경 테이블에 한 번 적재하므로 get_dialogue/on_choice/on_use 등
+같은 이름의 함수가 스크립트끼리 덮어쓰이지 않는다. 환경은 읽기 전용 공용 API
+(표준 라이브러리 일부, log, exchange)만 참조하고 io/os/load/debug/python 등에는 접근할 수 없다.
+적재한 환경은 파일 경로별로 캐시하고, 호출 시 stat 한 번으로 mtime/크기 변경을 확인해
+바뀐 경우에만 다시 읽고 컴파일한다 (핫 리로드 유지).
+스크립트는 워커 스레드의 LuaRuntime 풀에서 명령어 수/시간 제한과 함께 실행되어,
+느리거나 끝나지 않는 스크립트가 asyncio 이벤트 루프를 멈추지 않는다.
+Exchange API를 공용 API에 등록하여 대화 스크립트에서 교환 기능을 사용할 수 있다.
+Exchange API 호출은 워커 스레드에서 메인 이벤트 루프로 코루틴을 넘겨(run_coroutine_threadsafe)
+aiosqlite 연결이 묶인 루프에서 실행하고 결과만 기다린다.
 """
 
 from __future__ import annotations
@@ -11,9 +19,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import queue
+import threading
 from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, TYPE_CHECKING, TypeVar
 
 from .managers.price_resolver import PriceResolver
 
@@ -26,58 +37,246 @@ logger = logging.getLogger(__name__)
 LuaRuntime_T = Any
 LuaTable_T = Any
 
-# 비동기→동기 브릿지용 스레드 풀 (Exchange API 호출 전용)
-_exchange_thread_pool = ThreadPoolExecutor(max_workers=1)
+T = TypeVar("T")
 
 # silver_coin 템플릿 ID (인벤토리 목록에서 제외용)
 _SILVER_TEMPLATE_ID = "silver_coin"
 
+# NPC 대화 스크립트 디렉토리
+DIALOGUE_SCRIPT_DIR = os.path.join("configs", "dialogues")
+
+# 런타임별 샌드박스 준비 코드
+# - shared: 모든 스크립트 환경이 읽기 전용으로 참조하는 공용 API
+# - load_env: 스크립트를 자신의 환경 테이블에 적재 (전역 정의는 환경 테이블에만 기록)
+# - call_limited: 명령어 수 제한을 걸고 함수 호출 (초과 시 Lua 오류)
+#   초과하면 훅을 매 명령어마다 다시 걸어 두므로 스크립트가 pcall로 잡아도 곧바로 다시 실패한다.
+#   훅 해제는 Python 쪽(_LuaWorker.call_limited)에서 C 함수 debug.sethook을 직접 호출해 처리한다.
+# - make_lazy: 없는 키를 처음 읽을 때 resolve(key)로 채우는 테이블로 설정
+_SANDBOX_LUA = """
+local setmetatable, error, load, type, rawset = setmetatable, error, load, type, rawset
+local sethook, pcall, pack, unpack = debug.sethook, pcall, table.pack, table.unpack
+
+local function readonly(t)
+    return setmetatable({}, {
+        __index = t,
+        __newindex = function() error("read-only table", 2) end,
+        __metatable = false,
+    })
+end
+
+local shared = {
+    assert = assert, error = error, ipairs = ipairs, next = next, pairs = pairs,
+    pcall = pcall, select = select, tonumber = tonumber, tostring = tostring,
+    type = type, unpack = unpack, setmetatable = setmetatable,
+    string = readonly(string), table = readonly(table), math = readonly(math),
+    utf8 = readonly(utf8), os = readonly({time = os.time, clock = os.clock, date = os.date}),
+}
+
+local function load_env(source, name)
+    local env = setmetatable({}, {__index = shared, __metatable = false})
+    local chunk, err = load(source, "=" .. name, "t", env)
+    if not chunk then error(err, 0) end
+    chunk()
+    return env
+end
+
+local function set_api(name, api)
+    if type(api) == "table" then api = readonly(api) end
+    shared[name] = api
+end
+
+local function exceeded()
+    sethook(exceeded, "", 1)
+    error("instruction budget exceeded", 2)
+end
+
+local function call_limited(limit, fn, ...)
+    sethook(exceeded, "", limit)
+    local result = pack(pcall(fn, ...))
+    sethook()
+    if not result[1] then error(result[2], 0) end
+    return unpack(result, 2, result.n)
+end
+
+local function make_lazy(t, resolve)
+    return setmetatable(t, {__index = function(tbl, key)
+        local value = resolve(key)
+        if value ~= nil then rawset(tbl, key, value) end
+        return value
+    end})
+end
+
+return load_env, set_api, call_limited, make_lazy
+"""
 
-def _attribute_filter(obj: object, attr_name: str, is_setting: bool) -> str:
-    """Lua에서 Python 객체 속성 접근을 필터링하는 샌드박스 함수.
 
-    '_' 접두사 속성 접근을 차단하여 Python 내부 객체 보호.
+class LazyField:
+    """Lua 테이블로 변환할 때 바로 채우지 않고, 스크립트가 처음 읽을 때 조회하는 값
+
+    load()는 메인 이벤트 루프에서 실행할 코루틴을 반환한다 (DB 조회 등).
+    조회 결과는 해당 Lua 테이블에 저장되어 같은 호출 안에서는 다시 조회하지 않는다.
     """
-    if isinstance(attr_name, str) and not attr_name.startswith("_"):
-        return attr_name
-    raise AttributeError(f"access denied: {attr_name}")
 
+    __slots__ = ("_factory",)
+
+    def __init__(self, factory: Callable[[], Awaitable[Any]]) -> None:
+        self._factory = factory
 
-def _run_async(coro: Any) -> Any:
-    """비동기 코루틴을 동기적으로 실행하는 브릿지 함수.
+    def load(self) -> Awaitable[Any]:
+        return self._factory()
 
-    Lua 스크립트는 동기 컨텍스트에서 실행되므로,
-    별도 스레드에서 새 이벤트 루프를 생성하여 비동기 함수를 호출한다.
+
+class _CallCancel:
+    """스크립트 호출 1회의 취소 상태
+
+    호출이 시간 초과로 버려진 뒤에도 워커 스레드는 계속 실행될 수 있으므로,
+    그 뒤의 Exchange API 호출은 시작하지 않고 진행 중인 호출은 취소한다 (트랜잭션 롤백).
     """
-    def _run_in_thread() -> Any:
-        loop = asyncio.new_event_loop()
+
+    __slots__ = ("cancelled", "_pending", "_lock")
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self._pending: set[Future[Any]] = set()
+        self._lock = threading.Lock()
+
+    def add(self, future: Future[Any]) -> None:
+        with self._lock:
+            if not self.cancelled:
+                self._pending.add(future)
+                return
+        future.cancel()
+
+    def discard(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def cancel(self) -> None:
+        """메인 루프 스레드에서 호출"""
+        with self._lock:
+            self.cancelled = True
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+
+
+@dataclass
+class _ScriptSource:
+    """디스크에서 읽은 스크립트 원문 (워커 간 공유, 파일 상태별 한 번만 읽음)"""
+    signature: tuple[int, int]  # 읽은 시점 파일의 (mtime_ns, size)
+    source: str
+
+
+class _LuaWorker:
+    """LuaRuntime 하나와 그 런타임에 적재된 스크립트 환경
+
+    한 번에 한 스레드만 사용한다 (LuaScriptLoader의 유휴 워커 큐로 보장).
+    """
+
+    def __init__(self, lua: LuaRuntime_T, await_on_loop: Callable[[Any], Any]) -> None:
+        self.lua = lua
+        self.new_table = lua.compile("return {}")
+        self.load_env, self.set_api, self._call_limited, self.make_lazy = lua.execute(_SANDBOX_LUA)
+        self._clear_hook = lua.globals().debug.sethook
+        self._await_on_loop = await_on_loop  # LazyField 조회용 메인 루프 브릿지
+        # 파일 경로 → (적재 시점 파일 상태, 스크립트 환경. 적재 실패 시 None)
+        self.envs: dict[str, tuple[tuple[int, int], Any]] = {}
+
+    def call_limited(self, limit: int, fn: Any, *args: Any) -> Any:
+        """명령어 수 제한을 걸고 Lua 함수 호출 (초과 시 LuaError).
+
+        예산을 넘기면 남은 Lua 코드가 모두 실패하도록 훅이 남아 있으므로, 끝나면 항상 해제한다.
+        C 함수를 직접 호출하므로 해제하는 동안에는 훅이 발동하지 않는다.
+        """
         try:
-            return loop.run_until_complete(coro)
+            return self._call_limited(limit, fn, *args)
         finally:
-            loop.close()
+            self._clear_hook()
+
+    def to_lua(self, data: Any) -> Any:
+        """Python 값을 Lua 값으로 재귀 변환 (중간 복사 없이 한 번에).
+
+        dict/list/tuple은 새 Lua 테이블로, 기본 타입은 그대로, 그 외 객체는 문자열로 변환하므로
+        스크립트가 Python 객체를 참조하거나 변경할 수 없다.
+        dict의 LazyField 값은 스크립트가 그 키를 처음 읽을 때 조회한다.
+        """
+        if data is None or isinstance(data, (str, int, float, bool)):
+            return data
+        if isinstance(data, dict):
+            lua_table = self.new_table()
+            lazy: dict[str, LazyField] = {}
+            for key, value in data.items():
+                if isinstance(value, LazyField):
+                    lazy[str(key)] = value
+                else:
+                    lua_table[key if isinstance(key, (str, int)) else str(key)] = self.to_lua(value)
+            if lazy:
+                self.make_lazy(lua_table, lambda key: self._resolve_lazy(lazy, key))
+            return lua_table
+        if isinstance(data, (list, tuple)):
+            lua_table = self.new_table()
+            for i, value in enumerate(data, start=1):
+                lua_table[i] = self.to_lua(value)
+            return lua_table
+        return str(data)
+
+    def _resolve_lazy(self, lazy: dict[str, LazyField], key: Any) -> Any:
+        field = lazy.get(key) if isinstance(key, str) else None
+        if field is None:
+            return None
+        return self.to_lua(self._await_on_loop(field.load()))
+
 
-    future = _exchange_thread_pool.submit(_run_in_thread)
-    return future.result(timeout=10)
+def _current_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _attribute_filter(obj: object, attr_name: str, is_setting: bool) -> str:
+    """Lua에서 Python 객체 속성 접근을 필터링하는 샌드박스 함수.
+
+    '_' 접두사 속성 접근을 차단하여 Python 내부 객체 보호.
+    """
+    if isinstance(attr_name, str) and not attr_name.startswith("_"):
+        return attr_name
+    raise AttributeError(f"access denied: {attr_name}")
 
 
 class LuaScriptLoader:
     """Lua 스크립트 로더 - NPC 대화 스크립트를 로드하고 실행"""
 
-    def __init__(self) -> None:
-        self._lua: LuaRuntime_T | None = None
+    POOL_SIZE = 2  # LuaRuntime 워커 수 (동시에 실행 가능한 스크립트 호출 수)
+    MAX_INSTRUCTIONS = 10_000_000  # 호출 1회 Lua 명령어 수 제한
+    CALL_TIMEOUT = 10.0  # 호출 1회 대기 시간 제한 (초)
+    EXCHANGE_TIMEOUT = 5.0  # Exchange API 호출 1회 대기 시간 제한 (초, CALL_TIMEOUT보다 짧게)
+
+    def __init__(self, pool_size: int | None = None) -> None:
+        self._workers: list[_LuaWorker] = []
+        self._idle: queue.SimpleQueue[_LuaWorker] = queue.SimpleQueue()
+        self._executor: ThreadPoolExecutor | None = None
+        self._sources: dict[str, _ScriptSource] = {}  # 파일 경로 → 원문
         self._available: bool = False
         self._exchange_manager: ExchangeManager | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None  # 스크립트를 호출한 메인 이벤트 루프
+        self._job_state = threading.local()  # 워커 스레드별 현재 호출의 _CallCancel
+        size = pool_size or self.POOL_SIZE
         try:
             from lupa import LuaRuntime  # type: ignore[import-untyped]
 
-            self._lua = LuaRuntime(
-                register_eval=False,
-                attribute_filter=_attribute_filter,
-            )
+            for _ in range(size):
+                worker = _LuaWorker(LuaRuntime(
+                    register_eval=False,
+                    attribute_filter=_attribute_filter,
+                ), self._await_on_loop)
+                # 공용 API에 log 함수 등록 (Python logger로 출력)
+                worker.set_api("log", lambda msg: logger.info(f"[Lua] {msg}"))
+                self._workers.append(worker)
+                self._idle.put(worker)
+            self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="lua")
             self._available = True
-            # Lua 글로벌에 log 함수 등록 (Python logger로 출력)
-            self._lua.globals()["log"] = lambda msg: logger.info(f"[Lua] {msg}")
-            logger.info("LuaScriptLoader 초기화 완료 (lupa 사용 가능)")
+            logger.info(f"LuaScriptLoader 초기화 완료 (lupa 사용 가능, 워커 {size}개)")
         except ImportError:
             logger.error(
                 "lupa 라이브러리를 찾을 수 없습니다. "
@@ -87,11 +286,12 @@ class LuaScriptLoader:
             logger.error(f"LuaRuntime 초기화 실패: {e}")
 
     def register_exchange_api(self, exchange_manager: ExchangeManager) -> None:
-        """ExchangeManager 참조를 저장하고 Lua 글로벌에 exchange 테이블 등록"""
+        """ExchangeManager 참조를 저장하고 모든 워커의 공용 API에 exchange 테이블 등록"""
         self._exchange_manager = exchange_manager
-        if self._available and self._lua is not None:
-            self._register_exchange_globals()
-            logger.info("Exchange API가 Lua 글로벌에 등록됨")
+        if self._available:
+            for worker in self._workers:
+                self._register_exchange_globals(worker)
+            logger.info("Exchange API가 Lua 공용 API에 등록됨")
 
     def is_available(self) -> bool:
         """lupa 라이브러리 사용 가능 여부 반환"""
@@ -102,7 +302,7 @@ class LuaScriptLoader:
 
         파일 미존재 시 None 반환.
         """
-        file_path = os.path.join("configs", "dialogues", f"{npc_id}.lua")
+        file_path = os.path.join(DIALOGUE_SCRIPT_DIR, f"{npc_id}.lua")
         if not os.path.exists(file_path):
             logger.info(f"Lua 스크립트 파일 없음: {file_path}")
             return None
@@ -113,125 +313,203 @@ class LuaScriptLoader:
             logger.error(f"Lua 스크립트 파일 읽기 실패 [{npc_id}]: {e}")
             return None
 
-    def execute_get_dialogue(
-        self, npc_id: str, context: dict[str, Any]
-    ) -> tuple[list[dict[str, str]], OrderedDict[int, dict[str, str]]] | None:
-        """Lua 스크립트의 get_dialogue(ctx) 함수를 실행.
-
-        반환: (dialogue_texts, choice_entity) 또는 None (실패 시)
-        - dialogue_texts: [{"en": "...", "ko": "..."}, ...]
-        - choice_entity: OrderedDict {1: {"en": "...", "ko": "..."}, ...}
+    def invalidate_script_cache(self, file_path: str | None = None) -> None:
+        """적재된 스크립트 캐시 무효화 (file_path 미지정 시 전체)"""
+        if file_path is None:
+            self._sources.clear()
+        else:
+            self._sources.pop(file_path, None)
+        for worker in self._workers:
+            if file_path is None:
+                worker.envs.clear()
+            else:
+                worker.envs.pop(file_path, None)
+
+    # ── 스크립트 호출 ──────────────────────────────────
+
+    async def call_function(
+        self,
+        file_path: str,
+        function_name: str,
+        *args: Any,
+        convert: Callable[[Any], T] | None = None,
+    ) -> T | None:
+        """스크립트의 function_name(*args)를 워커 스레드에서 실행.
+
+        dict/list 인자는 Lua 테이블로 변환하고, 반환값은 워커 안에서 convert로 변환한다.
+        스크립트/함수가 없거나, nil을 반환하거나, 오류/명령어 수 초과/시간 초과 시 None 반환.
         """
-        if not self._available or self._lua is None:
-            return None
-
-        script_source = self.load_script(npc_id)
-        if script_source is None:
+        if not self._available or self._executor is None:
             return None
 
-        try:
-            self._lua.execute(script_source)
-            get_dialogue_fn = self._lua.globals().get_dialogue
-            if get_dialogue_fn is None:
-                logger.warning(
-                    f"Lua 스크립트에 get_dialogue 함수 없음 [{npc_id}]"
-                )
+        def job(worker: _LuaWorker) -> Any:
+            env = self._get_env(worker, file_path)
+            if env is None:
                 return None
-
-            lua_ctx = self._build_lua_context(context)
-            lua_result = get_dialogue_fn(lua_ctx)
+            fn = env[function_name]
+            if fn is None:
+                logger.debug(f"Lua 스크립트에 {function_name} 함수 없음 [{file_path}]")
+                return None
+            lua_args = [worker.to_lua(arg) for arg in args]
+            lua_result = worker.call_limited(self.MAX_INSTRUCTIONS, fn, *lua_args)
             if lua_result is None:
                 return None
+            return convert(lua_result) if convert else lua_result
 
-            return self._convert_lua_result(lua_result)
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        cancel = _CallCancel()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(self._executor, self._run_job, job, cancel),
+                self.CALL_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            cancel.cancel()
+            logger.error(
+                f"Lua 스크립트 실행 시간 초과 [{file_path}:{function_name}]: {self.CALL_TIMEOUT}초"
+            )
         except Exception as e:
-            logger.error(f"Lua 스크립트 실행 오류 [{npc_id}]: {e}")
-            return None
+            logger.error(f"Lua 스크립트 실행 오류 [{file_path}:{function_name}]: {e}")
+        return None
 
-    def execute_on_choice(
-        self, npc_id: str, choice: int, context: dict[str, Any]
-    ) -> tuple[list[dict[str, str]], OrderedDict[int, dict[str, str]]] | None:
-        """Lua 스크립트의 on_choice(choice_number, ctx) 함수를 실행.
+    def _run_job(self, job: Callable[[_LuaWorker], T], cancel: _CallCancel) -> T:
+        """유휴 워커 하나를 빌려 job 실행 (워커 스레드에서 호출)"""
+        worker = self._idle.get()
+        self._job_state.cancel = cancel
+        try:
+            return job(worker)
+        finally:
+            self._job_state.cancel = None
+            self._idle.put(worker)
 
-        반환: (dialogue_texts, choice_entity) 또는 None (실패 시)
+    def _await_on_loop(self, coro: Any) -> Any:
+        """워커 스레드에서 메인 이벤트 루프에 코루틴을 실행시키고 결과를 기다리는 브릿지.
+
+        DB 접근(aiosqlite)은 메인 루프에서 실행되며, 워커만 결과를 기다린다.
+        호출이 시간 초과로 취소되었으면 코루틴을 시작하지 않는다.
         """
-        if not self._available or self._lua is None:
-            return None
+        loop = self._loop
+        cancel: _CallCancel | None = getattr(self._job_state, "cancel", None)
+        if loop is None or loop.is_closed():
+            coro.close()
+            raise RuntimeError("Exchange API를 실행할 이벤트 루프가 없습니다")
+        if _current_loop() is loop:
+            # 루프 스레드에서 결과를 기다리면 교착 상태가 되므로 거부
+            coro.close()
+            raise RuntimeError("이벤트 루프 스레드에서는 Exchange API를 호출할 수 없습니다")
+        if cancel is not None and cancel.cancelled:
+            coro.close()
+            raise RuntimeError("시간 초과로 취소된 스크립트 호출입니다")
+
+        async def guarded() -> Any:
+            # 취소 표시와 같은 루프 스레드에서 확인하므로, 취소된 뒤에는 시작하지 않는다
+            if cancel is not None and cancel.cancelled:
+                coro.close()
+                raise asyncio.CancelledError()
+            return await coro
+
+        future = asyncio.run_coroutine_threadsafe(guarded(), loop)
+        if cancel is not None:
+            cancel.add(future)
+        try:
+            return future.result(timeout=self.EXCHANGE_TIMEOUT)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+        finally:
+            if cancel is not None:
+                cancel.discard(future)
 
-        script_source = self.load_script(npc_id)
-        if script_source is None:
-            return None
+    def _get_env(self, worker: _LuaWorker, file_path: str) -> Any | None:
+        """워커에 적재된 스크립트 환경 반환 (파일이 바뀌었으면 다시 적재).
 
+        파일 미존재/읽기 실패/적재 실패 시 None. 적재 실패도 같은 파일 상태에 대해 캐시한다.
+        """
         try:
-            self._lua.execute(script_source)
-            on_choice_fn = self._lua.globals().on_choice
-            if on_choice_fn is None:
-                logger.warning(
-                    f"Lua 스크립트에 on_choice 함수 없음 [{npc_id}]"
-                )
-                return None
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            worker.envs.pop(file_path, None)
+            self._sources.pop(file_path, None)
+            logger.debug(f"Lua 스크립트 파일 없음: {file_path}")
+            return None
+        except OSError as e:
+            logger.error(f"Lua 스크립트 파일 확인 실패 [{file_path}]: {e}")
+            return None
 
-            lua_ctx = self._build_lua_context(context)
-            lua_result = on_choice_fn(choice, lua_ctx)
-            if lua_result is None:
-                return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = worker.envs.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-            return self._convert_lua_result(lua_result)
+        source = self._read_source(file_path, signature)
+        if source is None:
+            return None
+        try:
+            env = worker.call_limited(
+                self.MAX_INSTRUCTIONS, worker.load_env, source, os.path.basename(file_path)
+            )
         except Exception as e:
-            logger.error(f"Lua 스크립트 실행 오류 [{npc_id}]: {e}")
+            logger.error(f"Lua 스크립트 적재 오류 [{file_path}]: {e}")
+            env = None
+        worker.envs[file_path] = (signature, env)
+        if cached is not None:
+            logger.info(f"Lua 스크립트 변경 감지, 다시 적재 [{file_path}]")
+        return env
+
+    def _read_source(self, file_path: str, signature: tuple[int, int]) -> str | None:
+        """파일 상태가 같으면 다른 워커가 읽어 둔 원문을 재사용"""
+        cached = self._sources.get(file_path)
+        if cached is not None and cached.signature == signature:
+            return cached.source
+        try:
+            with open(file_path, "r", encoding="utf-8") as fp:
+                source = fp.read()
+        except OSError as e:
+            logger.error(f"Lua 스크립트 파일 읽기 실패 [{file_path}]: {e}")
             return None
+        self._sources[file_path] = _ScriptSource(signature, source)
+        return source
 
-    def execute_on_bye(self, npc_id: str, context: dict[str, Any]) -> None:
-        """Lua 스크립트의 on_bye(ctx) 콜백을 실행 (선택적).
-
-        Lua 스크립트에 on_bye 함수가 정의되어 있으면 호출한다.
-        미정의 시 무시. 반환값 없음.
-        """
-        if not self._available or self._lua is None:
-            return
+    # ── NPC 대화 ──────────────────────────────────
 
-        script_source = self.load_script(npc_id)
-        if script_source is None:
-            return
+    async def execute_get_dialogue(
+        self, npc_id: str, context: dict[str, Any]
+    ) -> tuple[list[dict[str, str]], OrderedDict[int, dict[str, str]]] | None:
+        """Lua 스크립트의 get_dialogue(ctx) 함수를 실행.
 
-        try:
-            self._lua.execute(script_source)
-            on_bye_fn = self._lua.globals().on_bye
-            if on_bye_fn is None:
-                return  # on_bye 미정의 → 무시
-
-            lua_ctx = self._build_lua_context(context)
-            on_bye_fn(lua_ctx)
-            logger.info(f"Lua on_bye 콜백 실행 완료 [{npc_id}]")
-        except Exception as e:
-            logger.error(f"Lua on_bye 콜백 실행 오류 [{npc_id}]: {e}")
+        반환: (dialogue_texts, choice_entity) 또는 None (실패 시)
+        - dialogue_texts: [{"en": "...", "ko": "..."}, ...]
+        - choice_entity: OrderedDict {1: {"en": "...", "ko": "..."}, ...}
+        """
+        return await self.call_function(
+            self._dialogue_path(npc_id), "get_dialogue", context,
+            convert=self._convert_lua_result,
+        )
 
-    def _build_lua_context(self, context: dict[str, Any]) -> LuaTable_T:
-        """Python dict를 Lua 테이블로 변환하여 샌드박스 컨텍스트 생성.
+    async def execute_on_choice(
+        self, npc_id: str, choice: int, context: dict[str, Any]
+    ) -> tuple[list[dict[str, str]], OrderedDict[int, dict[str, str]]] | None:
+        """Lua 스크립트의 on_choice(choice_number, ctx) 함수를 실행.
 
-        중첩 dict도 재귀적으로 Lua 테이블로 변환한다.
+        반환: (dialogue_texts, choice_entity) 또는 None (실패 시)
         """
-        if self._lua is None:
-            raise RuntimeError("LuaRuntime이 초기화되지 않았습니다")
+        return await self.call_function(
+            self._dialogue_path(npc_id), "on_choice", choice, context,
+            convert=self._convert_lua_result,
+        )
 
-        # register_eval=False이므로 execute로 테이블 생성 함수를 정의
-        self._lua.execute("function newtable() return {} end")
-        new_table = self._lua.globals().newtable  # type: ignore[union-attr]
+    async def execute_on_bye(self, npc_id: str, context: dict[str, Any]) -> None:
+        """Lua 스크립트의 on_bye(ctx) 콜백을 실행 (선택적).
 
-        def _to_lua_table(data: Any) -> Any:
-            if isinstance(data, dict):
-                lua_table = new_table()
-                for key, value in data.items():
-                    lua_table[key] = _to_lua_table(value)
-                return lua_table
-            if isinstance(data, (list, tuple)):
-                lua_table = new_table()
-                for i, value in enumerate(data, start=1):
-                    lua_table[i] = _to_lua_table(value)
-                return lua_table
-            return data
+        Lua 스크립트에 on_bye 함수가 정의되어 있으면 호출한다.
+        미정의 시 무시. 반환값 없음.
+        """
+        await self.call_function(self._dialogue_path(npc_id), "on_bye", context)
 
-        return _to_lua_table(context)
+    @staticmethod
+    def _dialogue_path(npc_id: str) -> str:
+        return os.path.join(DIALOGUE_SCRIPT_DIR, f"{npc_id}.lua")
 
     def _convert_lua_result(
         self, lua_result: LuaTable_T
@@ -277,22 +555,19 @@ class LuaScriptLoader:
 
     # ── Exchange API 등록 ──────────────────────────────────
 
-    def _register_exchange_globals(self) -> None:
-        """Lua 글로벌에 exchange 테이블 등록.
+    def _register_exchange_globals(self, worker: _LuaWorker) -> None:
+        """워커의 공용 API에 exchange 테이블 등록 (스크립트에서는 읽기 전용).
 
         Lua에서 다음과 같이 호출 가능:
           exchange.get_npc_inventory(npc_id)
           exchange.buy_from_npc(player_id, npc_id, item_id, price)
         """
-        if self._lua is None or self._exchange_manager is None:
+        if self._exchange_manager is None:
             return
 
-        lua = self._lua
         em = self._exchange_manager
-
-        # Lua 테이블 생성 함수 준비
-        lua.execute("function newtable() return {} end")
-        new_table_fn = lua.globals().newtable
+        new_table_fn = worker.new_table
+        _run_async = self._await_on_loop
 
         def _to_lua(data: Any) -> Any:
             """Python 객체를 Lua 테이블로 변환"""
@@ -319,11 +594,12 @@ class LuaScriptLoader:
         def _inventory_to_lua(
             items: list[Any],
             price_field: str | None = None,
+            prices: dict[str, int] | None = None,
         ) -> Any:
             """인벤토리 아이템 목록을 Lua 테이블로 변환.
 
             silver_coin은 제외한다.
-            price_field가 지정되면 해당 필드에 PriceResolver 산출 가격을 추가한다.
+            price_field가 지정되면 해당 필드에 미리 조회한 템플릿별 가격(prices)을 추가한다.
             """
             result = new_table_fn()
             idx = 1
@@ -349,18 +625,10 @@ class LuaScriptLoader:
                     dict(item.properties) if isinstance(item.properties, dict)
                     else {}
                 )
-                # 가격 필드 추가 (PriceResolver가 template_id로 DB 조회)
-                if price_field == "buy_price":
-                    entry["buy_price"] = _run_async(
-                        price_resolver.get_buy_price(
-                            item.properties.get("template_id", "")
-                        )
-                    )
-                elif price_field == "sell_price":
-                    entry["sell_price"] = _run_async(
-                        price_resolver.get_sell_price(
-                            item.properties.get("template_id", "")
-                        )
+                # 가격 필드 추가 (템플릿별로 한 번씩 미리 조회한 가격)
+                if price_field and prices is not None:
+                    entry[price_field] = prices.get(
+                        item.properties.get("template_id", ""), 0
                     )
                 result[idx] = entry
                 idx += 1
@@ -369,6 +637,34 @@ class LuaScriptLoader:
         # PriceResolver 인스턴스 생성 (DB 기반 가격 산출 위임)
         price_resolver = PriceResolver(em._object_repo._db_manager)
 
+        # ── 메인 루프에서 실행할 코루틴 (Lua 호출 1회 = 루프 왕복 1회) ──
+
+        async def _load_inventory(
+            owner_id: str, price_field: str,
+        ) -> tuple[list[Any], dict[str, int]]:
+            """인벤토리와 템플릿별 가격을 함께 조회"""
+            items = await em._object_repo.get_objects_in_inventory(owner_id)
+            resolve = (
+                price_resolver.get_buy_price if price_field == "buy_price"
+                else price_resolver.get_sell_price
+            )
+            prices: dict[str, int] = {}
+            for item in items:
+                template_id = item.properties.get("template_id", "")
+                if template_id != _SILVER_TEMPLATE_ID and template_id not in prices:
+                    prices[template_id] = await resolve(template_id)
+            return items, prices
+
+        async def _item_price(item_id: str, price_field: str) -> int:
+            """아이템 조회 후 템플릿 기준 가격 산출"""
+            item = await em._object_repo.get_by_id(item_id)
+            if item is None:
+                return 0
+            template_id = item.properties.get("template_id", "")
+            if price_field == "buy_price":
+                return await price_resolver.get_buy_price(template_id)
+            return await price_resolver.get_sell_price(template_id)
+
         # ── 가격 조회 함수 래퍼 ──
 
         def get_buy_price(item_id: Any) -> Any:
@@ -376,11 +672,7 @@ class LuaScriptLoader:
             if not isinstance(item_id, str):
                 return 0
             try:
-                item = _run_async(em._object_repo.get_by_id(item_id))
-                if item is None:
-                    return 0
-                template_id = item.properties.get("template_id", "")
-                return _run_async(price_resolver.get_buy_price(template_id))
+                return _run_async(_item_price(item_id, "buy_price"))
             except Exception as e:
                 logger.error(f"get_buy_price 오류: {e}")
                 return 0
@@ -390,11 +682,7 @@ class LuaScriptLoader:
             if not isinstance(item_id, str):
                 return 0
             try:
-                item = _run_async(em._object_repo.get_by_id(item_id))
-                if item is None:
-                    return 0
-                template_id = item.properties.get("template_id", "")
-                return _run_async(price_resolver.get_sell_price(template_id))
+                return _run_async(_item_price(item_id, "sell_price"))
             except Exception as e:
                 logger.error(f"get_sell_price 오류: {e}")
                 return 0
@@ -424,10 +712,8 @@ class LuaScriptLoader:
             if not isinstance(npc_id, str):
                 return _make_error("npc_id must be a string")
             try:
-                items = _run_async(
-                    em._object_repo.get_objects_in_inventory(npc_id)
-                )
-                return _inventory_to_lua(items, price_field="buy_price")
+                items, prices = _run_async(_load_inventory(npc_id, "buy_price"))
+                return _inventory_to_lua(items, "buy_price", prices)
             except Exception as e:
                 logger.error(f"get_npc_inventory 오류: {e}")
                 return _make_error(f"Internal error: {e}")
@@ -437,10 +723,8 @@ class LuaScriptLoader:
             if not isinstance(player_id, str):
                 return _make_error("player_id must be a string")
             try:
-                items = _run_async(
-                    em._object_repo.get_objects_in_inventory(player_id)
-                )
-                return _inventory_to_lua(items, price_field="sell_price")
+                items, prices = _run_async(_load_inventory(player_id, "sell_price"))
+                return _inventory_to_lua(items, "sell_price", prices)
             except Exception as e:
                 logger.error(f"get_player_inventory 오류: {e}")
                 return _make_error(f"Internal error: {e}")
@@ -517,7 +801,7 @@ class LuaScriptLoader:
                 logger.error(f"sell_to_npc 오류: {e}")
                 return _make_error(f"Internal error: {e}")
 
-        # Lua 글로벌에 exchange 테이블 등록
+        # 공용 API에 exchange 테이블 등록
         exchange_table = new_table_fn()
         exchange_table["get_buy_price"] = get_buy_price
         exchange_table["get_sell_price"] = get_sell_price
@@ -528,5 +812,5 @@ class LuaScriptLoader:
         exchange_table["get_player_silver"] = get_player_silver
         exchange_table["buy_from_npc"] = buy_from_npc
         exchange_table["sell_to_npc"] = sell_to_npc
-        lua.globals()["exchange"] = exchange_table
-        logger.info("Exchange API Lua 글로벌 등록 완료")
+        worker.set_api("exchange", exchange_table)
+        logger.info("Exchange API Lua 공용 API 등록 완료")
@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 """실버 코인 화폐 관리 모듈
 
-CurrencyManager는 silver_coin 스택의 생성, 조회, 증감, 삭제를 전담한다.
-game_objects 테이블의 기존 스택 시스템(max_stack=9999)을 활용하며,
-properties.template_id='silver_coin'으로 식별한다.
+CurrencyManager는 실버 잔액 원장과 silver_coin 스택의 생성, 조회, 증감, 삭제를 전담한다.
+잔액은 currency_balances 테이블(owner_id -> amount)에서 기본 키로 바로 읽고,
+모든 증감은 currency_transactions 저널에 한 줄씩 추가된다.
+인벤토리의 silver_coin 스택(max_stack=9999, properties.template_id='silver_coin')은
+화면에 보이는 실버로 유지하며, 다른 경로(줍기/버리기/주기 등)로 스택이 움직이면
+GameObjectRepository의 템플릿 리스너로 해당 소유자의 원장을 스택 합계에 맞춘다.
 """
 import logging
-from typing import List
+from contextvars import ContextVar
+from typing import List, Optional, Set
 from uuid import uuid4
 
 from ..game_object_repository import GameObjectRepository
@@ -21,27 +25,31 @@ COIN_WEIGHT = 0.003
 
 
 class CurrencyManager:
-    """실버 코인 스택 관리"""
+    """실버 잔액 원장 및 실버 코인 스택 관리"""
 
     def __init__(self, object_repo: GameObjectRepository) -> None:
         self._object_repo = object_repo
+        # 이 매니저가 스택을 고치는 중에는 리스너의 재동기화를 건너뜀
+        self._applying: ContextVar[bool] = ContextVar(f"currency_applying_{id(self)}", default=False)
+        object_repo.add_template_listener(TEMPLATE_ID, self._on_silver_changed)
         logger.info("CurrencyManager 초기화 완료")
 
     async def get_balance(self, owner_id: str) -> int:
         """소유자의 실버 잔액 조회.
 
-        game_objects에서 template_id='silver_coin', location_type='inventory',
-        location_id=owner_id인 아이템의 properties.quantity 합산.
-        없으면 0 반환.
+        currency_balances에서 owner_id 기본 키로 한 행만 읽는다. 없으면 0 반환.
         """
-        stacks = await self._find_silver_stacks(owner_id)
-        total = sum(s.properties.get("quantity", 0) for s in stacks)
-        return total
+        db_manager = await self._object_repo.get_db_manager()
+        row = await db_manager.fetch_one(
+            "SELECT amount FROM currency_balances WHERE owner_id = ?", (owner_id,)
+        )
+        return int(row["amount"]) if row else 0
 
-    async def earn(self, owner_id: str, amount: int) -> bool:
+    async def earn(self, owner_id: str, amount: int, reason: str = "") -> bool:
         """소유자에게 실버 지급.
 
-        기존 스택이 있으면 quantity 증가, 없으면 새 silver_coin 아이템 생성.
+        원장 잔액을 한 행 갱신으로 늘리고 저널에 기록한 뒤,
+        기존 스택의 quantity를 늘리거나 새 silver_coin 아이템을 생성한다.
         max_stack(9999) 초과 시 추가 스택 생성.
         amount가 0 이하이면 False 반환.
         """
@@ -49,6 +57,117 @@ class CurrencyManager:
             logger.warning(f"earn 금액이 0 이하: {amount}")
             return False
 
+        try:
+            # 원장/저널/스택 변경을 한 트랜잭션으로 커밋 (중간 실패 시 전체 롤백)
+            db_manager = await self._object_repo.get_db_manager()
+            async with db_manager.transaction():
+                await self._apply_delta(owner_id, amount, reason)
+                await self._add_to_stacks(owner_id, amount)
+
+            logger.info(f"실버 지급 완료: owner={owner_id[-12:]}, amount={amount}")
+            return True
+
+        except Exception as e:
+            logger.error(f"실버 지급 실패 (owner={owner_id}, amount={amount}): {e}")
+            return False
+
+    async def spend(self, owner_id: str, amount: int, reason: str = "") -> bool:
+        """소유자의 실버 차감.
+
+        잔액 확인과 차감은 원장 한 행의 조건부 갱신(amount >= 차감액)으로 원자적으로 처리한다.
+        잔액 부족 시 False 반환.
+        quantity가 0이 되면 해당 game_object 삭제.
+        amount가 0 이하이면 False 반환.
+        """
+        if amount <= 0:
+            logger.warning(f"spend 금액이 0 이하: {amount}")
+            return False
+
+        try:
+            db_manager = await self._object_repo.get_db_manager()
+            async with db_manager.transaction():
+                balance = await self._apply_delta(owner_id, -amount, reason)
+                if balance is None:
+                    logger.debug(
+                        f"실버 잔액 부족: owner={owner_id[-12:]}, 요청={amount}"
+                    )
+                    return False
+
+                await self._remove_from_stacks(owner_id, amount)
+
+            logger.info(f"실버 차감 완료: owner={owner_id[-12:]}, amount={amount}")
+            return True
+
+        except Exception as e:
+            logger.error(f"실버 차감 실패 (owner={owner_id}, amount={amount}): {e}")
+            return False
+
+    async def sync_balance(self, owner_id: str, reason: str = "sync") -> int:
+        """소유자의 원장 잔액을 인벤토리 silver_coin 스택 합계에 맞춘다.
+
+        차이가 있을 때만 원장을 고치고 저널에 차액을 기록한다.
+        스택과 잔액은 트랜잭션 안에서 쓰기 연결로 읽으므로, 그 사이에 다른 earn/spend가
+        끼어들어 잘못된 차액을 기록하지 않는다.
+
+        Returns:
+            동기화 후 잔액
+        """
+        db_manager = await self._object_repo.get_db_manager()
+        async with db_manager.transaction():
+            stacks = await self._find_silver_stacks(owner_id)
+            total = sum(s.properties.get("quantity", 0) for s in stacks)
+            delta = total - await self.get_balance(owner_id)
+            if delta != 0:
+                await self._apply_delta(owner_id, delta, reason)
+        if delta != 0:
+            logger.info(f"실버 원장 동기화: owner={owner_id[-12:]}, 차액={delta:+d}, 잔액={total}")
+        return total
+
+    async def _on_silver_changed(self, owner_ids: Set[str]) -> None:
+        """다른 경로로 silver_coin 스택이 생성/이동/삭제되었을 때 원장 재동기화"""
+        if self._applying.get():
+            return
+        for owner_id in owner_ids:
+            await self.sync_balance(owner_id)
+
+    async def _apply_delta(self, owner_id: str, delta: int, reason: str) -> Optional[int]:
+        """원장 한 행을 원자적으로 증감하고 저널에 기록.
+
+        차감 시 잔액이 부족하면 아무것도 바꾸지 않고 None 반환.
+        transaction() 블록 안에서 호출해야 한다.
+
+        Returns:
+            변경 후 잔액 (잔액 부족 시 None)
+        """
+        db_manager = await self._object_repo.get_db_manager()
+        if delta >= 0:
+            cursor = await db_manager.execute(
+                "INSERT INTO currency_balances (owner_id, amount) VALUES (?, ?) "
+                "ON CONFLICT(owner_id) DO UPDATE SET amount = amount + excluded.amount, "
+                "updated_at = CURRENT_TIMESTAMP RETURNING amount",
+                (owner_id, delta),
+            )
+        else:
+            cursor = await db_manager.execute(
+                "UPDATE currency_balances SET amount = amount + ?, updated_at = CURRENT_TIMESTAMP "
+                "WHERE owner_id = ? AND amount >= ? RETURNING amount",
+                (delta, owner_id, -delta),
+            )
+        row = await cursor.fetchone()
+        await cursor.close()
+        if row is None:
+            return None
+
+        balance = int(row[0])
+        await db_manager.execute(
+            "INSERT INTO currency_transactions (owner_id, delta, balance, reason) VALUES (?, ?, ?, ?)",
+            (owner_id, delta, balance, reason),
+        )
+        return balance
+
+    async def _add_to_stacks(self, owner_id: str, amount: int) -> None:
+        """표시용 silver_coin 스택에 amount만큼 추가 (기존 스택 여유분 먼저, 남으면 새 스택)"""
+        token = self._applying.set(True)
         try:
             stacks = await self._find_silver_stacks(owner_id)
             remaining = amount
@@ -63,7 +182,7 @@ class CurrencyManager:
                     continue
                 add = min(remaining, space)
                 stack.properties["quantity"] = current_qty + add
-                await self._object_repo.update(stack.id, stack.to_dict())
+                await self._object_repo.update(stack.id, {"properties": stack.properties})
                 remaining -= add
                 logger.debug(
                     f"실버 스택 {stack.id[-12:]} 수량 증가: "
@@ -75,39 +194,16 @@ class CurrencyManager:
                 qty = min(remaining, MAX_STACK)
                 await self._create_silver_stack(owner_id, qty)
                 remaining -= qty
+        finally:
+            self._applying.reset(token)
 
-            logger.info(f"실버 지급 완료: owner={owner_id[-12:]}, amount={amount}")
-            return True
-
-        except Exception as e:
-            logger.error(f"실버 지급 실패 (owner={owner_id}, amount={amount}): {e}")
-            return False
-
-    async def spend(self, owner_id: str, amount: int) -> bool:
-        """소유자의 실버 차감.
-
-        잔액 부족 시 False 반환.
-        quantity가 0이 되면 해당 game_object 삭제.
-        amount가 0 이하이면 False 반환.
-        """
-        if amount <= 0:
-            logger.warning(f"spend 금액이 0 이하: {amount}")
-            return False
-
+    async def _remove_from_stacks(self, owner_id: str, amount: int) -> None:
+        """표시용 silver_coin 스택에서 amount만큼 차감 (뒤에서부터 소진, 0이 된 스택은 삭제)"""
+        token = self._applying.set(True)
         try:
             stacks = await self._find_silver_stacks(owner_id)
-            total = sum(s.properties.get("quantity", 0) for s in stacks)
-
-            if total < amount:
-                logger.debug(
-                    f"실버 잔액 부족: owner={owner_id[-12:]}, "
-                    f"잔액={total}, 요청={amount}"
-                )
-                return False
-
             remaining = amount
 
-            # 스택에서 차감 (뒤에서부터 소진)
             for stack in reversed(stacks):
                 if remaining <= 0:
                     break
@@ -122,34 +218,27 @@ class CurrencyManager:
                     logger.debug(f"실버 스택 삭제: {stack.id[-12:]}")
                 else:
                     stack.properties["quantity"] = new_qty
-                    await self._object_repo.update(stack.id, stack.to_dict())
+                    await self._object_repo.update(stack.id, {"properties": stack.properties})
                     logger.debug(
                         f"실버 스택 {stack.id[-12:]} 수량 감소: "
                         f"{current_qty} -> {new_qty}"
                     )
 
-            logger.info(f"실버 차감 완료: owner={owner_id[-12:]}, amount={amount}")
-            return True
-
-        except Exception as e:
-            logger.error(f"실버 차감 실패 (owner={owner_id}, amount={amount}): {e}")
-            return False
+            if remaining > 0:
+                logger.warning(
+                    f"실버 스택이 원장보다 적음: owner={owner_id[-12:]}, 부족분={remaining}"
+                )
+        finally:
+            self._applying.reset(token)
 
     async def _find_silver_stacks(self, owner_id: str) -> List[GameObject]:
         """소유자의 silver_coin game_objects 목록 조회.
 
         location_type='inventory', location_id=owner_id이고
-        properties.template_id='silver_coin'인 아이템을 반환한다.
+        properties.template_id='silver_coin'인 행만 조회한다 (다른 인벤토리 아이템은 읽지 않음).
+        조회 실패는 그대로 전파하여, 호출한 트랜잭션이 스택 없이 원장만 바꾸지 않고 롤백되게 한다.
         """
-        try:
-            inventory = await self._object_repo.get_objects_in_inventory(owner_id)
-            return [
-                obj for obj in inventory
-                if obj.properties.get("template_id") == TEMPLATE_ID
-            ]
-        except Exception as e:
-            logger.error(f"실버 스택 조회 실패 (owner={owner_id}): {e}")
-            return []
+        return await self._object_repo.get_inventory_objects_by_template(owner_id, TEMPLATE_ID)
 
     async def _create_silver_stack(
         self, owner_id: str, quantity: int
@@ -3,7 +3,7 @@
 
 ExchangeManager는 플레이어와 NPC 간의 양방향 아이템 교환을 원자적으로 처리한다.
 CurrencyManager와 GameObjectRepository를 조합하여 실버 차감/증가 및 아이템 이동을 수행하며,
-중간 실패 시 보상 트랜잭션 패턴으로 롤백한다.
+거래 전체를 하나의 DB 트랜잭션으로 묶어 중간 실패 시 전체를 롤백한다.
 """
 import logging
 
@@ -25,6 +25,14 @@ class ExchangeResult(TypedDict):
     error_code: str  # 프로그래밍용 에러 코드
 
 
+class _TradeAborted(Exception):
+    """거래 트랜잭션 중단 (트랜잭션을 롤백하고 result를 반환)"""
+
+    def __init__(self, result: ExchangeResult) -> None:
+        super().__init__(result["error"])
+        self.result = result
+
+
 def _ok() -> ExchangeResult:
     """성공 결과 생성"""
     return ExchangeResult(success=True, error="", error_code="")
@@ -39,7 +47,7 @@ class ExchangeManager:
     """양방향 아이템 교환 처리
 
     buy_from_npc / sell_to_npc 메서드를 통해 원자적 거래를 수행한다.
-    실버 차감 후 아이템 이동 실패 시 보상 트랜잭션으로 롤백한다.
+    실버 차감/증가와 아이템 이동은 한 트랜잭션으로 커밋되며, 실패 시 전체 롤백된다.
     """
 
     def __init__(
@@ -60,7 +68,7 @@ class ExchangeManager:
 
         순서: 잔액 확인 → 아이템 존재 확인 → 무게 확인 →
               플레이어 실버 차감 → NPC 실버 증가 → 장착 해제 → 아이템 이동
-        실패 시 보상 트랜잭션으로 롤백.
+        실버/아이템 변경은 한 트랜잭션으로 커밋되며, 실패 시 전체 롤백.
         """
         try:
             # 1. 아이템 존재 확인
@@ -97,40 +105,31 @@ class ExchangeManager:
                 )
                 return _fail("무게 제한을 초과합니다.", "weight_exceeded")
 
-            # 4. 플레이어 실버 차감
-            spend_ok = await self._currency.spend(player_id, price)
-            if not spend_ok:
-                logger.error(f"구매 실패 - 실버 차감 실패: player={player_id[-12:]}")
-                return _fail("실버 차감에 실패했습니다.", "insufficient_silver")
-
-            # 5. NPC 실버 증가
-            earn_ok = await self._currency.earn(npc_id, price)
-            if not earn_ok:
-                # 롤백: 플레이어 실버 복원
-                logger.warning(
-                    f"구매 롤백 - NPC 실버 증가 실패, 플레이어 실버 복원: "
-                    f"npc={npc_id[-12:]}"
+            db_manager = await self._object_repo.get_db_manager()
+            async with db_manager.transaction():
+                # 4. 플레이어 실버 차감
+                spend_ok = await self._currency.spend(player_id, price, reason=f"buy:{game_object_id}")
+                if not spend_ok:
+                    logger.error(f"구매 실패 - 실버 차감 실패: player={player_id[-12:]}")
+                    raise _TradeAborted(_fail("실버 차감에 실패했습니다.", "insufficient_silver"))
+
+                # 5. NPC 실버 증가
+                earn_ok = await self._currency.earn(npc_id, price, reason=f"buy:{game_object_id}")
+                if not earn_ok:
+                    logger.warning(f"구매 롤백 - NPC 실버 증가 실패: npc={npc_id[-12:]}")
+                    raise _TradeAborted(_fail("거래 처리 중 오류가 발생했습니다.", "item_not_found"))
+
+                # 6. 장착 해제 (NPC가 장착 중이면)
+                if item.is_equipped:
+                    await self._unequip_item(item)
+
+                # 7. 아이템을 NPC → 플레이어로 이동
+                moved = await self._object_repo.move_object_to_inventory(
+                    game_object_id, player_id,
                 )
-                await self._currency.earn(player_id, price)
-                return _fail("거래 처리 중 오류가 발생했습니다.", "item_not_found")
-
-            # 6. 장착 해제 (NPC가 장착 중이면)
-            if item.is_equipped:
-                await self._unequip_item(item)
-
-            # 7. 아이템을 NPC → 플레이어로 이동
-            moved = await self._object_repo.move_object_to_inventory(
-                game_object_id, player_id,
-            )
-            if not moved:
-                # 롤백: 양쪽 실버 복원
-                logger.warning(
-                    f"구매 롤백 - 아이템 이동 실패, 실버 복원: "
-                    f"item={game_object_id}"
-                )
-                await self._currency.earn(player_id, price)
-                await self._currency.spend(npc_id, price)
-                return _fail("아이템 이동에 실패했습니다.", "item_not_found")
+                if not moved:
+                    logger.warning(f"구매 롤백 - 아이템 이동 실패: item={game_object_id}")
+                    raise _TradeAborted(_fail("아이템 이동에 실패했습니다.", "item_not_found"))
 
             logger.info(
                 f"구매 완료: player={player_id[-12:]}, npc={npc_id[-12:]}, "
@@ -138,6 +137,9 @@ class ExchangeManager:
             )
             return _ok()
 
+        except _TradeAborted as aborted:
+            return aborted.result
+
         except Exception as e:
             logger.error(
                 f"구매 중 예외 발생: player={player_id}, npc={npc_id}, "
@@ -153,7 +155,7 @@ class ExchangeManager:
 
         순서: NPC 잔액 확인 → 아이템 소유 확인 → 장착 해제 →
               NPC 실버 차감 → 플레이어 실버 증가 → 아이템 이동
-        실패 시 보상 트랜잭션으로 롤백.
+        장착 해제/실버/아이템 변경은 한 트랜잭션으로 커밋되며, 실패 시 전체 롤백.
         """
         try:
             # 1. 아이템 존재 확인
@@ -183,42 +185,33 @@ class ExchangeManager:
                     "NPC의 소지금이 부족합니다.", "npc_insufficient_silver",
                 )
 
-            # 4. 장착 해제 (플레이어가 장착 중이면)
-            if item.is_equipped:
-                await self._unequip_item(item)
-
-            # 5. NPC 실버 차감
-            spend_ok = await self._currency.spend(npc_id, price)
-            if not spend_ok:
-                logger.error(f"판매 실패 - NPC 실버 차감 실패: npc={npc_id[-12:]}")
-                return _fail(
-                    "NPC의 소지금이 부족합니다.", "npc_insufficient_silver",
-                )
-
-            # 6. 플레이어 실버 증가
-            earn_ok = await self._currency.earn(player_id, price)
-            if not earn_ok:
-                # 롤백: NPC 실버 복원
-                logger.warning(
-                    f"판매 롤백 - 플레이어 실버 증가 실패, NPC 실버 복원: "
-                    f"player={player_id[-12:]}"
+            db_manager = await self._object_repo.get_db_manager()
+            async with db_manager.transaction():
+                # 4. 장착 해제 (플레이어가 장착 중이면)
+                if item.is_equipped:
+                    await self._unequip_item(item)
+
+                # 5. NPC 실버 차감
+                spend_ok = await self._currency.spend(npc_id, price, reason=f"sell:{game_object_id}")
+                if not spend_ok:
+                    logger.error(f"판매 실패 - NPC 실버 차감 실패: npc={npc_id[-12:]}")
+                    raise _TradeAborted(_fail(
+                        "NPC의 소지금이 부족합니다.", "npc_insufficient_silver",
+                    ))
+
+                # 6. 플레이어 실버 증가
+                earn_ok = await self._currency.earn(player_id, price, reason=f"sell:{game_object_id}")
+                if not earn_ok:
+                    logger.warning(f"판매 롤백 - 플레이어 실버 증가 실패: player={player_id[-12:]}")
+                    raise _TradeAborted(_fail("거래 처리 중 오류가 발생했습니다.", "item_not_found"))
+
+                # 7. 아이템을 플레이어 → NPC로 이동
+                moved = await self._object_repo.move_object_to_inventory(
+                    game_object_id, npc_id,
                 )
-                await self._currency.earn(npc_id, price)
-                return _fail("거래 처리 중 오류가 발생했습니다.", "item_not_found")
-
-            # 7. 아이템을 플레이어 → NPC로 이동
-            moved = await self._object_repo.move_object_to_inventory(
-                game_object_id, npc_id,
-            )
-            if not moved:
-                # 롤백: 양쪽 실버 복원
-                logger.warning(
-                    f"판매 롤백 - 아이템 이동 실패, 실버 복원: "
-                    f"item={game_object_id}"
-                )
-                await self._currency.earn(npc_id, price)
-                await self._currency.spend(player_id, price)
-                return _fail("아이템 이동에 실패했습니다.", "item_not_found")
+                if not moved:
+                    logger.warning(f"판매 롤백 - 아이템 이동 실패: item={game_object_id}")
+                    raise _TradeAborted(_fail("아이템 이동에 실패했습니다.", "item_not_found"))
 
             logger.info(
                 f"판매 완료: player={player_id[-12:]}, npc={npc_id[-12:]}, "
@@ -226,6 +219,9 @@ class ExchangeManager:
             )
             return _ok()
 
+        except _TradeAborted as aborted:
+            return aborted.result
+
         except Exception as e:
             logger.error(
                 f"판매 중 예외 발생: player={player_id}, npc={npc_id}, "
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""좌표 기반 출구 그래프 모듈
+
+방 좌표, blocked_exits, room_connections(enter 연결)로부터 각 방의 출구를
+서버 시작 시 한 번 계산해 두고, 방/막힌 출구/enter 연결이 바뀌면
+영향을 받는 셀만 다시 계산한다.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..models import Room
+from ...utils.coordinate_utils import DIRECTION_OFFSETS, compute_coordinate_exits
+from .room_index import Coordinate, RoomSpatialIndex
+
+logger = logging.getLogger(__name__)
+
+
+class ExitGraph:
+    """방 ID → 출구(방향 → 목적지 방 ID) 그래프"""
+
+    def __init__(self, spatial_index: RoomSpatialIndex) -> None:
+        self._index = spatial_index
+        self._exits: Dict[str, Dict[str, str]] = {}
+        self._adjacent: Dict[str, Dict[str, str]] = {}  # 막힘 여부와 무관한 인접 방
+        self._enter_connections: Dict[Coordinate, Coordinate] = {}
+        self._enter_sources: Dict[Coordinate, Set[Coordinate]] = {}  # 목적지 → 출발지 역인덱스
+        self._built: bool = False
+
+    @property
+    def is_built(self) -> bool:
+        """그래프 구성 여부"""
+        return self._built
+
+    def build(self, enter_connections: Dict[Coordinate, Coordinate]) -> None:
+        """공간 인덱스와 enter 연결로 전체 그래프를 구성합니다."""
+        self._exits.clear()
+        self._adjacent.clear()
+        self._enter_connections = dict(enter_connections)
+        self._enter_sources.clear()
+        for source, target in self._enter_connections.items():
+            self._enter_sources.setdefault(target, set()).add(source)
+
+        for room in self._index.all_rooms():
+            self._rebuild_room(room)
+
+        self._built = True
+        logger.info(f"출구 그래프 구성 완료: {len(self._exits)}개 방, enter 연결 {len(self._enter_connections)}개")
+
+    # === 조회 ===
+
+    def get_exits(self, room_id: str) -> Dict[str, str]:
+        """방의 출구 목록 (복사본)"""
+        return dict(self._exits.get(room_id, {}))
+
+    def get_exit(self, room_id: str, direction: str) -> Optional[str]:
+        """방의 특정 방향 출구 목적지 방 ID"""
+        return self._exits.get(room_id, {}).get(direction)
+
+    def get_adjacent_room_ids(self, room_id: str) -> List[str]:
+        """막힘 여부와 무관하게 동서남북으로 인접한 방 ID 목록"""
+        return list(self._adjacent.get(room_id, {}).values())
+
+    def get_enter_target(self, x: int, y: int) -> Optional[Coordinate]:
+        """좌표의 enter 연결 목적지"""
+        return self._enter_connections.get((x, y))
+
+    # === 증분 갱신 ===
+
+    def on_room_changed(self, old_room: Optional[Room], new_room: Optional[Room]) -> None:
+        """방 생성/수정/삭제 후 영향을 받는 셀만 다시 계산합니다.
+
+        Args:
+            old_room: 변경 전 방 (생성 시 None)
+            new_room: 변경 후 방 (삭제 시 None)
+        """
+        if not self._built:
+            return
+
+        cells: Set[Coordinate] = set()
+        for room in (old_room, new_room):
+            if room is not None and room.x is not None and room.y is not None:
+                cells |= self._affected_cells((room.x, room.y))
+
+        if old_room is not None and new_room is None:
+            self._exits.pop(old_room.id, None)
+            self._adjacent.pop(old_room.id, None)
+        elif new_room is not None:
+            self._rebuild_room(new_room)
+
+        self.rebuild_cells(cells)
+
+    def set_enter_connection(self, source: Coordinate, target: Coordinate) -> None:
+        """enter 연결을 추가/변경하고 출발 셀을 다시 계산합니다."""
+        previous = self._enter_connections.get(source)
+        if previous is not None:
+            self._enter_sources.get(previous, set()).discard(source)
+        self._enter_connections[source] = target
+        self._enter_sources.setdefault(target, set()).add(source)
+        self.rebuild_cells([source])
+
+    def remove_enter_connection(self, source: Coordinate) -> None:
+        """enter 연결을 제거하고 출발 셀을 다시 계산합니다."""
+        target = self._enter_connections.pop(source, None)
+        if target is not None:
+            self._enter_sources.get(target, set()).discard(source)
+        self.rebuild_cells([source])
+
+    def rebuild_cells(self, cells: Iterable[Coordinate]) -> None:
+        """지정한 좌표에 있는 방들의 출구를 다시 계산합니다."""
+        if not self._built:
+            return
+        for x, y in cells:
+            room = self._index.get_at(x, y)
+            if room is not None:
+                self._rebuild_room(room)
+
+    def _affected_cells(self, cell: Coordinate) -> Set[Coordinate]:
+        """셀 변경 시 출구가 바뀔 수 있는 셀 목록 (자기 자신, 인접 4셀, enter 출발지)"""
+        x, y = cell
+        cells = {cell}
+        for dx, dy in DIRECTION_OFFSETS.values():
+            cells.add((x + dx, y + dy))
+        cells |= self._enter_sources.get(cell, set())
+        return cells
+
+    def _room_id_at(self, x: int, y: int) -> Optional[str]:
+        room = self._index.get_at(x, y)
+        return room.id if room is not None else None
+
+    def _rebuild_room(self, room: Room) -> None:
+        """한 방의 출구와 인접 방을 계산합니다."""
+        if room.x is None or room.y is None:
+            self._exits[room.id] = {}
+            self._adjacent[room.id] = {}
+            return
+
+        self._adjacent[room.id] = compute_coordinate_exits(room.x, room.y, self._room_id_at)
+        self._exits[room.id] = compute_coordinate_exits(
+            room.x, room.y, self._room_id_at,
+            blocked_exits=room.blocked_exits,
+            enter_target=self._enter_connections.get((room.x, room.y)),
+        )
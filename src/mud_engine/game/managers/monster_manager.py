@@ -2,10 +2,13 @@
 """몬스터 관리자 모듈"""
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from uuid import uuid4
-from .room_manager import RoomManager
+from .monster_registry import MonsterRegistry
+from .monster_roaming import RoamingBatch, RoamMove
+from .spawn_point_index import SpawnPoint, SpawnPointIndex
 from ..repositories import MonsterRepository
 from ..monster import Monster, MonsterType, MonsterBehavior, MonsterStats
 from ...config import TemplateLoader
@@ -16,11 +19,20 @@ logger = logging.getLogger(__name__)
 class MonsterManager:
     """몬스터 및 스폰 시스템 관리 전담 클래스"""
 
+    # 리스폰 기록 실패 시 재시도 간격 (초)
+    RESPAWN_RETRY_DELAY = 30
+
     def __init__(self, monster_repo: MonsterRepository) -> None:
         """MonsterManager를 초기화합니다."""
         self._monster_repo: MonsterRepository = monster_repo
-        self._spawn_scheduler_task: Optional[asyncio.Task] = None
-        self._spawn_points: Dict[str, List[Dict[str, Any]]] = {}
+        self._registry: MonsterRegistry = MonsterRegistry()
+        self._registry_lock: asyncio.Lock = asyncio.Lock()
+        self._registry.set_respawn_listener(self._on_respawn_scheduled)
+        self._respawn_task: Optional[asyncio.Task] = None
+        self._respawn_wakeup: asyncio.Event = asyncio.Event()
+        self._next_respawn_wakeup: Optional[float] = None  # 리스폰 루프가 대기 중인 시각
+        self._spawn_index: SpawnPointIndex = SpawnPointIndex()
+        self._registry.set_count_listener(self._spawn_index.refresh)
         self._global_spawn_limits: Dict[str, int] = {}
         self._game_engine: Optional[Any] = None  # GameEngine 참조 (순환 참조 방지를 위해 Optional)
         self._room_manager: Optional[Any] = None  # RoomManager 참조
@@ -48,88 +60,174 @@ class MonsterManager:
         await self._template_loader.load_all_templates()
         logger.info("몬스터 템플릿 로드 완료")
 
+    # === 몬스터 레지스트리 ===
+
+    @property
+    def registry(self) -> MonsterRegistry:
+        """몬스터 레지스트리"""
+        return self._registry
+
+    async def load_registry(self) -> int:
+        """monsters 테이블 전체를 읽어 몬스터 레지스트리를 적재합니다.
+
+        적재 이후에는 몬스터 조회가 레지스트리에서 처리되며, 몬스터 변경은 반드시
+        create_monster/update_monster/kill_monster/delete_monster 등을 거쳐야 반영됩니다.
+
+        Returns:
+            int: 적재된 몬스터 수
+        """
+        async with self._registry_lock:
+            try:
+                monsters = await self._monster_repo.get_all()
+                self._registry.load(monsters)
+                self._spawn_index.refresh_all()
+                return len(monsters)
+            except Exception as e:
+                logger.error(f"몬스터 레지스트리 적재 실패: {e}")
+                raise
+
+    async def _get_registry(self) -> MonsterRegistry:
+        """적재된 레지스트리를 반환합니다 (미적재 시 먼저 적재)."""
+        if not self._registry.is_loaded:
+            async with self._registry_lock:
+                if not self._registry.is_loaded:
+                    self._registry.load(await self._monster_repo.get_all())
+                    self._spawn_index.refresh_all()
+        return self._registry
+
+    # === 스폰 포인트 인덱스 ===
+
+    @property
+    def spawn_index(self) -> SpawnPointIndex:
+        """스폰 포인트 인덱스"""
+        return self._spawn_index
+
+    async def load_spawn_points(self) -> int:
+        """spawn_points 테이블을 읽어 스폰 포인트 인덱스를 적재합니다.
+
+        생존 수는 몬스터 레지스트리의 셀/템플릿 카운터를 사용하므로 레지스트리도 함께 적재됩니다.
+
+        Returns:
+            int: 적재된 스폰 포인트 수
+        """
+        try:
+            registry = await self._get_registry()
+            rows = await self._monster_repo.get_spawn_points()
+            self._spawn_index.load((SpawnPoint.from_dict(row) for row in rows), registry.count_alive_at)
+            return len(self._spawn_index)
+        except Exception as e:
+            logger.error(f"스폰 포인트 적재 실패: {e}")
+            raise
+
+    async def _get_spawn_index(self) -> SpawnPointIndex:
+        """적재된 스폰 포인트 인덱스를 반환합니다 (미적재 시 먼저 적재)."""
+        if not self._spawn_index.is_loaded:
+            await self.load_spawn_points()
+        return self._spawn_index
+
     # === 스폰 스케줄러 ===
 
     async def start_spawn_scheduler(self) -> None:
-        """몬스터 스폰 스케줄러를 시작합니다."""
-        if self._spawn_scheduler_task and not self._spawn_scheduler_task.done():
+        """리스폰 루프를 시작합니다 (스폰/로밍 주기 처리는 글로벌 Tick에서 run_spawn_cycle 호출)."""
+        if self._respawn_task and not self._respawn_task.done():
             logger.warning("스폰 스케줄러가 이미 실행 중입니다")
             return
         logger.info("몬스터 스폰 스케줄러 시작")
-        self._spawn_scheduler_task = asyncio.create_task(self._spawn_scheduler_loop())
+        self._respawn_task = asyncio.create_task(self._respawn_loop())
 
     async def stop_spawn_scheduler(self) -> None:
-        """몬스터 스폰 스케줄러를 중지합니다."""
-        if self._spawn_scheduler_task:
-            self._spawn_scheduler_task.cancel()
+        """리스폰 루프를 중지합니다."""
+        if self._respawn_task:
+            self._respawn_task.cancel()
             try:
-                await self._spawn_scheduler_task
+                await self._respawn_task
             except asyncio.CancelledError:
                 pass
             logger.info("몬스터 스폰 스케줄러 중지")
 
-    async def _spawn_scheduler_loop(self) -> None:
-        """스폰 스케줄러 메인 루프"""
+    async def run_spawn_cycle(self) -> None:
+        """스폰 포인트 보충과 몬스터 로밍을 한 번 처리합니다 (글로벌 Tick 시스템)."""
+        await self._process_initial_spawns()
+        await self._process_monster_roaming()
+
+    # === 리스폰 ===
+
+    def _on_respawn_scheduled(self, due: float) -> None:
+        """리스폰이 예약되면 대기 중인 시각보다 이른 경우 리스폰 루프를 깨웁니다."""
+        if self._next_respawn_wakeup is None or due < self._next_respawn_wakeup:
+            self._respawn_wakeup.set()
+
+    async def _respawn_loop(self) -> None:
+        """가장 이른 리스폰 예정 시각까지 대기했다가 리스폰을 처리하는 루프"""
         try:
             while True:
+                self._respawn_wakeup.clear()
                 await self._process_respawns()
-                await self._process_initial_spawns()
-                await self._process_monster_roaming()
-                await asyncio.sleep(30)  ## TODO: 아하! 여기가 맘에 안듬 ㅡㅡ; 위에 것들을 글로벌틱에서 관리 하도록 할 것
+
+                registry = await self._get_registry()
+                next_due = registry.next_respawn_time()
+                self._next_respawn_wakeup = next_due
+                timeout = None if next_due is None else max(0.0, next_due - time.time())
+                try:
+                    await asyncio.wait_for(self._respawn_wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
         except asyncio.CancelledError:
-            logger.info("스폰 스케줄러 루프 종료")
+            logger.info("리스폰 루프 종료")
             raise
-        except Exception as e:
-            logger.error(f"스폰 스케줄러 오류: {e}")
-            await asyncio.sleep(5)
 
     async def _process_respawns(self) -> None:
-        """리스폰 대기 중인 몬스터들을 처리합니다."""
+        """리스폰 예정 시각이 지난 몬스터들을 처리합니다."""
         try:
-            dead_monsters = await self._monster_repo.find_by(is_alive=False)
-            for monster in dead_monsters:
-                if monster.is_ready_to_respawn():
-                    await self._respawn_monster(monster)
+            registry = await self._get_registry()
+            for monster in registry.pop_due_respawns(time.time()):
+                if not await self._respawn_monster(monster):
+                    # 실패한 리스폰은 잠시 후 다시 시도
+                    registry.schedule_respawn(monster.id, time.time() + self.RESPAWN_RETRY_DELAY)
         except Exception as e:
             logger.error(f"리스폰 처리 실패: {e}")
 
     async def _process_initial_spawns(self) -> None:
-        """초기 스폰이 필요한 방들을 처리합니다."""
+        """정원 미달인 스폰 포인트만 보충합니다."""
         try:
-            for room_id, spawn_configs in self._spawn_points.items():
-                for spawn_config in spawn_configs:
-                    await self._check_and_spawn_monster(room_id, spawn_config)
+            spawn_index = await self._get_spawn_index()
+            limited_templates = set()  # 이번 주기에 글로벌 제한에 도달한 템플릿
+            for point in spawn_index.under_populated():
+                if point.monster_template_id in limited_templates:
+                    continue
+                if not await self._check_and_spawn_monster(point):
+                    limited_templates.add(point.monster_template_id)
         except Exception as e:
             logger.error(f"초기 스폰 처리 실패: {e}")
 
-    async def _check_and_spawn_monster(self, room_id: str, spawn_config: Dict[str, Any]) -> None:
-        """특정 방에 몬스터 스폰이 필요한지 확인하고 스폰합니다."""
+    async def _check_and_spawn_monster(self, point: SpawnPoint) -> bool:
+        """스폰 포인트에 몬스터 스폰이 필요한지 확인하고 스폰합니다.
+
+        Returns:
+            bool: 템플릿의 글로벌 스폰 제한에 도달했으면 False
+        """
         try:
-            monster_template_id = spawn_config.get('monster_template_id')
-            max_count = spawn_config.get('max_count', 1)
-            spawn_chance = spawn_config.get('spawn_chance', 1.0)
+            monster_template_id = point.monster_template_id
+            registry = await self._get_registry()
 
             # 글로벌 제한 확인
             global_limit = self._global_spawn_limits.get(monster_template_id)
             if global_limit is not None:
-                all_monsters = await self.get_all_monsters()
-                global_count = sum(1 for m in all_monsters
-                                 if m.get_property('template_id') == monster_template_id and m.is_alive)
+                global_count = registry.count_alive(monster_template_id)
                 if global_count >= global_limit:
                     logger.debug(f"글로벌 스폰 제한 도달: {monster_template_id} ({global_count}/{global_limit})")
-                    return
-
-            # 방별 제한 확인 (좌표 기반)
-            current_monsters = await self.get_monsters_in_room(room_id)
-            template_monsters = [m for m in current_monsters if m.get_property('template_id') == monster_template_id and m.is_alive]
+                    return False
 
-            if len(template_monsters) < max_count:
+            # 셀별 제한 확인 (좌표 기반)
+            room_count = registry.count_alive_at(point.x, point.y, monster_template_id)
+            if room_count < point.max_count:
                 import random
-                if random.random() <= spawn_chance:
-                    await self._spawn_monster_from_template(room_id, monster_template_id)
-                    logger.info(f"몬스터 자동 스폰: {room_id}, 현재 {len(template_monsters)+1}/{max_count}")
+                if random.random() <= point.spawn_chance:
+                    await self._spawn_monster_from_template(point.room_id, monster_template_id)
+                    logger.info(f"몬스터 자동 스폰: {point.room_id}, 현재 {room_count+1}/{point.max_count}")
         except Exception as e:
-            logger.error(f"몬스터 스폰 체크 실패 ({room_id}): {e}")
+            logger.error(f"몬스터 스폰 체크 실패 ({point.room_id}): {e}")
+        return True
 
     async def _spawn_monster_from_template(self, room_id: str, template_id: str) -> Optional[Monster]:
         """템플릿을 기반으로 몬스터를 스폰합니다."""
@@ -162,91 +260,93 @@ class MonsterManager:
                 roaming_config = spawn_config['roaming']
                 new_monster.properties['roaming_config'] = roaming_config
 
-            created_monster = await self._monster_repo.create(new_monster.to_dict())
-            if created_monster:
-                logger.info(f"몬스터 스폰됨: {created_monster.get_localized_name()} (방: {room_id})")
-
-                # equipment 아이템 생성 (game_objects에 저장)
+            # exchange_config를 properties에 저장 (DialogueContext에서 참조)
+            template = self._template_loader.get_monster_template(template_id) or {}
+            exchange_config = template.get('exchange_config')
+            if isinstance(exchange_config, dict):
+                new_monster.properties['exchange_config'] = exchange_config
+
+            # 몬스터, 장비, 초기 실버를 한 트랜잭션으로 커밋 (일부만 생성된 채로 남지 않도록)
+            db_manager = await self._monster_repo.get_db_manager()
+            async with db_manager.transaction():
+                created_monster = await self._monster_repo.create(new_monster.to_dict())
+                if not created_monster:
+                    return None
                 await self._create_monster_equipment(created_monster.id, template_id)
 
-                return created_monster
+            # 커밋된 뒤에만 레지스트리에 등록
+            (await self._get_registry()).put(created_monster)
+            logger.info(f"몬스터 스폰됨: {created_monster.get_localized_name()} (방: {room_id})")
+            return created_monster
         except Exception as e:
             logger.error(f"몬스터 스폰 실패 ({template_id} -> {room_id}): {e}")
         return None
 
     async def _create_monster_equipment(self, monster_id: str, template_id: str) -> None:
-        """몬스터 스폰 시 equipment 배열의 아이템 + exchange_config 기반 silver_coin 생성"""
-        try:
-            template = self._template_loader.get_monster_template(template_id)
-            if not template:
-                return
+        """몬스터 스폰 시 equipment 배열의 아이템 + exchange_config 기반 silver_coin 생성.
 
-            equipment_list = template.get('equipment', [])
-
-            if equipment_list:
-                if not self._game_engine:
-                    logger.warning("game_engine 없음 - 몬스터 장비 생성 불가")
-                else:
-                    for equip in equipment_list:
-                        item_template_id = equip.get('template_id')
-                        slot = equip.get('slot')
-                        if not item_template_id:
-                            continue
-
-                        item = self._template_loader.create_item_from_template(
-                            item_template_id, str(uuid4()),
-                            location_type="inventory",
-                            location_id=monster_id
-                        )
-                        if item:
-                            item.is_equipped = True
-                            if slot:
-                                item.equipment_slot = slot
-                            await self._game_engine.world_manager._object_manager.create_game_object(item.to_dict())
-                            logger.debug(f"몬스터 {monster_id[-12:]}에 장비 생성: {item_template_id}")
-
-            # exchange_config 처리: 초기 실버 생성 + monster properties에 저장
-            try:
-                exchange_config = template.get('exchange_config')
-                if exchange_config:
-                    # monster properties에 exchange_config 저장 (DialogueContext에서 참조)
-                    if self._game_engine:
-                        monster = await self._game_engine.world_manager.get_monster(monster_id)
-                        if monster and isinstance(monster.properties, dict):
-                            monster.properties['exchange_config'] = exchange_config
-                            await self._game_engine.world_manager.update_monster(monster)
-                            logger.debug(f"몬스터 {monster_id[-12:]}에 exchange_config 저장")
-
-                    initial_silver = exchange_config.get('initial_silver', 0)
-                    if initial_silver > 0:
-                        if self._currency_manager:
-                            await self._currency_manager.earn(monster_id, initial_silver)
-                            logger.info(
-                                f"몬스터 {monster_id[-12:]}에 초기 실버 {initial_silver} 생성"
-                            )
-                        else:
-                            logger.warning(
-                                f"currency_manager 없음 - 몬스터 {monster_id[-12:]} 초기 실버 생성 불가"
-                            )
-            except Exception as e:
-                # exchange_config 파싱 실패 시 로깅 후 무시 (NPC는 교환 기능 없이 스폰)
-                logger.warning(
-                    f"exchange_config 처리 실패 ({monster_id[-12:]}, {template_id}): {e}"
-                )
+        실패하면 예외를 그대로 전파하므로, 호출한 트랜잭션이 몬스터 생성까지 함께 롤백한다.
+        """
+        template = self._template_loader.get_monster_template(template_id)
+        if not template:
+            return
 
-        except Exception as e:
-            logger.error(f"몬스터 장비 생성 실패 ({monster_id}, {template_id}): {e}")
+        equipment_list = template.get('equipment', [])
+
+        if equipment_list:
+            if not self._game_engine:
+                logger.warning("game_engine 없음 - 몬스터 장비 생성 불가")
+            else:
+                items = []
+                for equip in equipment_list:
+                    item_template_id = equip.get('template_id')
+                    slot = equip.get('slot')
+                    if not item_template_id:
+                        continue
+
+                    item = self._template_loader.create_item_from_template(
+                        item_template_id, str(uuid4()),
+                        location_type="inventory",
+                        location_id=monster_id
+                    )
+                    if item:
+                        item.is_equipped = True
+                        if slot:
+                            item.equipment_slot = slot
+                        items.append(item.to_dict())
+
+                # 장비 전체를 한 번에 커밋 (일부만 생성된 채로 남지 않도록)
+                if items:
+                    await self._game_engine.world_manager._object_manager.create_game_objects(items)
+                    logger.debug(f"몬스터 {monster_id[-12:]}에 장비 {len(items)}개 생성")
+
+        # exchange_config 처리: 초기 실버 생성
+        exchange_config = template.get('exchange_config')
+        if not isinstance(exchange_config, dict):
+            return
+        initial_silver = exchange_config.get('initial_silver', 0)
+        if initial_silver > 0:
+            if not self._currency_manager:
+                logger.warning(f"currency_manager 없음 - 몬스터 {monster_id[-12:]} 초기 실버 생성 불가")
+            elif await self._currency_manager.earn(monster_id, initial_silver, reason="spawn"):
+                logger.info(f"몬스터 {monster_id[-12:]}에 초기 실버 {initial_silver} 생성")
+            else:
+                raise RuntimeError(f"몬스터 {monster_id[-12:]} 초기 실버 생성 실패")
 
     async def _respawn_monster(self, monster: Monster) -> bool:
         """몬스터를 리스폰합니다."""
         try:
-            success = await self._monster_repo.respawn_monster(monster.id)
+            # 레지스트리의 객체를 갱신해 기록 (좌표는 그대로 유지, 기록 실패 시 되돌림)
+            success = await self._apply_and_update(monster, Monster.respawn)
             if success:
                 logger.info(f"몬스터 리스폰됨: {monster.get_localized_name()} (좌표: {monster.x}, {monster.y})")
                 # 리스폰 시 장비 재생성
                 template_id = monster.properties.get('template_id')
                 if template_id:
-                    await self._create_monster_equipment(monster.id, template_id)
+                    try:
+                        await self._create_monster_equipment(monster.id, template_id)
+                    except Exception as e:
+                        logger.error(f"몬스터 장비 생성 실패 ({monster.id}, {template_id}): {e}")
             return success
         except Exception as e:
             logger.error(f"몬스터 리스폰 실패 ({monster.id}): {e}")
@@ -255,84 +355,74 @@ class MonsterManager:
     # === 스폰 포인트 관리 ===
 
     async def add_spawn_point(self, room_id: str, monster_template_id: str, max_count: int = 1, spawn_chance: float = 1.0, room_manager=None) -> None:
-        """방에 몬스터 스폰 포인트를 추가합니다."""
+        """방에 몬스터 스폰 포인트를 추가합니다 (같은 방/템플릿의 기존 설정은 대체)."""
         try:
-            if room_manager:
-                room = await room_manager.get_room(room_id)
-                if not room:
-                    logger.error(f"스폰 포인트 추가 실패: 방이 존재하지 않음 ({room_id})")
-                    return
+            room_manager = room_manager or self._room_manager
+            room = await room_manager.get_room(room_id) if room_manager else None
+            if not room:
+                logger.error(f"스폰 포인트 추가 실패: 방이 존재하지 않음 ({room_id})")
+                return
+            if room.x is None or room.y is None:
+                logger.error(f"스폰 포인트 추가 실패: 방에 좌표가 없음 ({room_id})")
+                return
 
             template = await self._monster_repo.get_by_id(monster_template_id)
             if not template:
                 logger.error(f"스폰 포인트 추가 실패: 몬스터 템플릿이 존재하지 않음 ({monster_template_id})")
                 return
 
-            if room_id not in self._spawn_points:
-                self._spawn_points[room_id] = []
-
-            spawn_config = {
-                'monster_template_id': monster_template_id,
-                'max_count': max_count,
-                'spawn_chance': spawn_chance
-            }
-            self._spawn_points[room_id].append(spawn_config)
-
-            # 방 정보를 가져와서 좌표로 로그 표시
-            try:
-                if room_manager:
-                    room = await room_manager.get_room(room_id)
-                    if room and hasattr(room, 'x') and hasattr(room, 'y'):
-                        logger.info(f"스폰 포인트 추가됨: ({room.x}, {room.y}) -> {monster_template_id} (최대 {max_count}마리)")
-                    else:
-                        logger.info(f"스폰 포인트 추가됨: {room_id} -> {monster_template_id} (최대 {max_count}마리)")
-                else:
-                    logger.info(f"스폰 포인트 추가됨: {room_id} -> {monster_template_id} (최대 {max_count}마리)")
-            except Exception:
-                logger.info(f"스폰 포인트 추가됨: {room_id} -> {monster_template_id} (최대 {max_count}마리)")
+            spawn_index = await self._get_spawn_index()
+            point = SpawnPoint(room_id=room_id, x=room.x, y=room.y, monster_template_id=monster_template_id,
+                               max_count=max_count, spawn_chance=spawn_chance)
+            await self._monster_repo.save_spawn_point(point.to_dict())
+            spawn_index.put(point)
+            logger.info(f"스폰 포인트 추가됨: ({room.x}, {room.y}) -> {monster_template_id} (최대 {max_count}마리)")
         except Exception as e:
             logger.error(f"스폰 포인트 추가 실패: {e}")
 
     async def remove_spawn_point(self, room_id: str, monster_template_id: str) -> bool:
         """방에서 몬스터 스폰 포인트를 제거합니다."""
         try:
-            if room_id not in self._spawn_points:
+            spawn_index = await self._get_spawn_index()
+            if spawn_index.get(room_id, monster_template_id) is None:
                 return False
 
-            original_count = len(self._spawn_points[room_id])
-            self._spawn_points[room_id] = [
-                config for config in self._spawn_points[room_id]
-                if config.get('monster_template_id') != monster_template_id
-            ]
-
-            removed = len(self._spawn_points[room_id]) < original_count
-            if removed:
-                logger.info(f"스폰 포인트 제거됨: {room_id} -> {monster_template_id}")
-
-            if not self._spawn_points[room_id]:
-                del self._spawn_points[room_id]
-            return removed
+            await self._monster_repo.delete_spawn_points(room_id, monster_template_id)
+            spawn_index.remove(room_id, monster_template_id)
+            logger.info(f"스폰 포인트 제거됨: {room_id} -> {monster_template_id}")
+            return True
         except Exception as e:
             logger.error(f"스폰 포인트 제거 실패: {e}")
             return False
 
     async def get_spawn_points(self) -> Dict[str, List[Dict[str, Any]]]:
         """모든 스폰 포인트 정보를 반환합니다."""
-        return self._spawn_points.copy()
+        spawn_index = await self._get_spawn_index()
+        return {room_id: [point.to_config() for point in spawn_index.get_by_room(room_id)]
+                for room_id in spawn_index.room_ids()}
 
     async def get_room_spawn_points(self, room_id: str) -> List[Dict[str, Any]]:
         """특정 방의 스폰 포인트 정보를 반환합니다."""
-        return self._spawn_points.get(room_id, []).copy()
+        spawn_index = await self._get_spawn_index()
+        return [point.to_config() for point in spawn_index.get_by_room(room_id)]
+
+    async def get_template_spawn_points(self, monster_template_id: str) -> List[SpawnPoint]:
+        """특정 몬스터 템플릿의 스폰 포인트 목록을 반환합니다."""
+        spawn_index = await self._get_spawn_index()
+        return spawn_index.get_by_template(monster_template_id)
 
     async def clear_spawn_points(self, room_id: Optional[str] = None) -> None:
         """스폰 포인트를 정리합니다."""
         try:
+            spawn_index = await self._get_spawn_index()
+            await self._monster_repo.delete_spawn_points(room_id)
             if room_id:
-                if room_id in self._spawn_points:
-                    del self._spawn_points[room_id]
-                    logger.info(f"방 {room_id}의 스폰 포인트 정리됨")
+                for point in spawn_index.get_by_room(room_id):
+                    spawn_index.remove(*point.key)
+                logger.info(f"방 {room_id}의 스폰 포인트 정리됨")
             else:
-                self._spawn_points.clear()
+                for point in spawn_index.all_points():
+                    spawn_index.remove(*point.key)
                 logger.info("모든 스폰 포인트 정리됨")
         except Exception as e:
             logger.error(f"스폰 포인트 정리 실패: {e}")
@@ -360,9 +450,8 @@ class MonsterManager:
                 logger.warning(f"글로벌 제한이 설정되지 않음: {template_id}")
                 return 0
 
-            all_monsters = await self.get_all_monsters()
-            template_monsters = [m for m in all_monsters
-                               if m.get_property('template_id') == template_id and m.is_alive]
+            registry = await self._get_registry()
+            template_monsters = registry.get_by_template(template_id)
 
             excess_count = len(template_monsters) - global_limit
             if excess_count <= 0:
@@ -404,12 +493,25 @@ class MonsterManager:
     async def get_monsters_at_coordinates(self, x: int, y: int) -> List[Monster]:
         """특정 좌표에 있는 모든 살아있는 몬스터를 조회합니다."""
         try:
-            all_monsters = await self._monster_repo.get_monsters_at_coordinates(x, y)
-            return [monster for monster in all_monsters if monster.is_alive]
+            registry = await self._get_registry()
+            return registry.get_at(x, y)
         except Exception as e:
             logger.error(f"좌표 ({x}, {y}) 몬스터 조회 실패: {e}")
             return []
 
+    async def get_aggressive_monsters_at_coordinates(self, x: int, y: int) -> List[Monster]:
+        """특정 좌표에 있는 살아있는 선공형 몬스터를 조회합니다."""
+        try:
+            registry = await self._get_registry()
+            return registry.get_aggressive_at(x, y)
+        except Exception as e:
+            logger.error(f"좌표 ({x}, {y}) 선공형 몬스터 조회 실패: {e}")
+            return []
+
+    def set_arrival_listener(self, listener: Optional[Callable[[Monster], None]]) -> None:
+        """선공형 몬스터가 셀에 새로 나타날 때(스폰/리스폰/로밍) 호출될 리스너를 설정합니다."""
+        self._registry.set_arrival_listener(listener)
+
     async def get_monsters_in_room(self, room_id: str) -> List[Monster]:
         """특정 방에 있는 모든 살아있는 몬스터를 조회합니다 (좌표 기반)."""
         try:
@@ -425,7 +527,10 @@ class MonsterManager:
     async def kill_monster(self, monster_id: str) -> bool:
         """몬스터를 사망 처리합니다."""
         try:
-            return await self._monster_repo.kill_monster(monster_id)
+            monster = await self.get_monster(monster_id)
+            if not monster:
+                return False
+            return await self._apply_and_update(monster, Monster.die)
         except Exception as e:
             logger.error(f"몬스터 사망 처리 실패 ({monster_id}): {e}")
             return False
@@ -433,7 +538,8 @@ class MonsterManager:
     async def get_monster(self, monster_id: str) -> Optional[Monster]:
         """몬스터 ID로 몬스터 정보를 조회합니다."""
         try:
-            return await self._monster_repo.get_by_id(monster_id)
+            registry = await self._get_registry()
+            return registry.get(monster_id)
         except Exception as e:
             logger.error(f"몬스터 조회 실패 ({monster_id}): {e}")
             raise
@@ -441,7 +547,8 @@ class MonsterManager:
     async def get_all_monsters(self) -> List[Monster]:
         """모든 몬스터를 조회합니다."""
         try:
-            return await self._monster_repo.get_all()
+            registry = await self._get_registry()
+            return registry.all_monsters()
         except Exception as e:
             logger.error(f"전체 몬스터 조회 실패: {e}")
             raise
@@ -465,6 +572,7 @@ class MonsterManager:
                 properties=monster_data.get('properties', {})
             )
             created_monster = await self._monster_repo.create(monster.to_dict())
+            (await self._get_registry()).put(created_monster)
             logger.info(f"새 몬스터 생성됨: {created_monster.id}")
             return created_monster
         except Exception as e:
@@ -474,8 +582,11 @@ class MonsterManager:
     async def update_monster(self, monster: Monster) -> bool:
         """몬스터 정보를 업데이트합니다."""
         try:
+            registry = await self._get_registry()
             updated_monster = await self._monster_repo.update(monster.id, monster.to_dict())
             if updated_monster:
+                # 호출자가 수정한 객체를 그대로 보관하고 좌표/생존 인덱스 갱신
+                registry.put(monster)
                 logger.debug(f"몬스터 업데이트됨: {monster.id}")
                 return True
             return False
@@ -483,11 +594,30 @@ class MonsterManager:
             logger.error(f"몬스터 업데이트 실패 ({monster.id}): {e}")
             raise
 
+    async def _apply_and_update(self, monster: Monster, change: Callable[[Monster], None]) -> bool:
+        """레지스트리의 몬스터에 변경을 적용해 기록합니다.
+
+        기록이 실패하거나(None 반환/예외) registry.put()까지 가지 못하면 좌표/생존 필드를
+        변경 전 값으로 되돌려, 살아 있는 객체와 레지스트리 좌표/생존 인덱스가 어긋나지 않게 합니다.
+        """
+        before = (monster.x, monster.y, monster.is_alive, monster.last_death_time, monster.stats.current_hp)
+        success = False
+        try:
+            change(monster)
+            success = await self.update_monster(monster)
+            return success
+        finally:
+            if not success:
+                (monster.x, monster.y, monster.is_alive,
+                 monster.last_death_time, monster.stats.current_hp) = before
+
     async def delete_monster(self, monster_id: str) -> bool:
         """몬스터를 삭제합니다."""
         try:
+            registry = await self._get_registry()
             success = await self._monster_repo.delete(monster_id)
             if success:
+                registry.remove(monster_id)
                 logger.info(f"몬스터 삭제됨: {monster_id}")
             return success
         except Exception as e:
@@ -511,14 +641,17 @@ class MonsterManager:
             # 이전 좌표 저장
             old_x, old_y = monster.x, monster.y
 
-            # 몬스터 위치를 방의 좌표로 업데이트
+            # 몬스터 위치를 방의 좌표로 업데이트 (기록 실패 시 이전 좌표로 되돌림)
+            new_x, new_y = old_x, old_y
             if room_manager:
                 room = await room_manager.get_room(room_id)
                 if room and room.x is not None and room.y is not None:
-                    monster.x = room.x
-                    monster.y = room.y
+                    new_x, new_y = room.x, room.y
 
-            success = await self.update_monster(monster)
+            def move(target: Monster) -> None:
+                target.x, target.y = new_x, new_y
+
+            success = await self._apply_and_update(monster, move)
 
             if success:
                 # 좌표 정보로 로그 출력
@@ -553,11 +686,9 @@ class MonsterManager:
     async def find_monsters_by_name(self, name_pattern: str, locale: str = 'en') -> List[Monster]:
         """이름 패턴으로 몬스터를 검색합니다."""
         try:
-            all_monsters = await self.get_all_monsters()
+            registry = await self._get_registry()
             matching_monsters = []
-            for monster in all_monsters:
-                if not monster.is_alive:
-                    continue
+            for monster in registry.alive_monsters():
                 monster_name = monster.get_localized_name(locale).lower()
                 if name_pattern.lower() in monster_name:
                     matching_monsters.append(monster)
@@ -569,118 +700,70 @@ class MonsterManager:
     # === 몬스터 로밍 ===
 
     async def _process_monster_roaming(self) -> None:
-        """로밍 가능한 몬스터들의 이동을 처리합니다."""
+        """로밍 가능한 몬스터들의 이동을 한 번에 계산하고 일괄 반영합니다."""
         try:
-            all_monsters = await self.get_all_monsters()
-            alive_monsters = [m for m in all_monsters if m.is_alive]
-
-            for monster in alive_monsters:
-                # TODO: 여기서 몹의 lua 에 있는 로밍 함수를 실행
-
-                # 템플릿은 로밍하지 않음
-                if monster.get_property('is_template', False):
-                    continue
-
-                if not monster.can_roam():
-                    continue
-
-                roaming_config = monster.get_property('roaming_config')
-                if not roaming_config:
-                    continue
-
-                # 로밍 확률 체크 (기본 50%)
-                roam_chance = roaming_config.get('roam_chance', 0.5)
-                import random
-                random_value = random.random()
-
-                # UUID의 마지막 부분만 사용
-                short_id = monster.id.split('-')[-1] if '-' in monster.id else monster.id
-
-                if random_value > roam_chance:
-                    # 현재 위치 좌표 가져오기
-                    current_coord = f"({monster.x}, {monster.y})" if monster.x is not None and monster.y is not None else "알 수 없음"
-
-                    # 몬스터 영어 이름 가져오기 (15자 제한)
-                    monster_name = monster.get_localized_name('en')[:15] if monster.get_localized_name('en') else short_id
-
-                    logger.info(f"{monster_name} {short_id} {current_coord} 이동하지 않음 (확률: {random_value:.2f} > {roam_chance})")
-                    continue
+            registry = await self._get_registry()
+            batch = RoamingBatch.from_monsters(registry.alive_monsters())
+            if not batch:
+                return
 
-                logger.debug(f"몬스터 {short_id} 이동 시도 (확률: {random_value:.2f} <= {roam_chance})")
-                await self._roam_monster(monster, roaming_config, self._room_manager, self._game_engine, random_value)
+            walkable = await self._get_walkable_cells()
+            moves = batch.plan(walkable)
+            logger.debug(f"몬스터 로밍: 대상 {len(batch)}마리 중 {len(moves)}마리 이동")
+            if moves:
+                await self._apply_roaming_moves(moves, walkable)
         except Exception as e:
             logger.error(f"몬스터 로밍 처리 실패: {e}")
 
-    async def _roam_monster(self, monster: Monster, roaming_config: Dict[str, Any], room_manager: RoomManager=None, game_engine=None, random_value: float = 0.0) -> None:
-        """몬스터를 로밍 범위 내에서 이동시킵니다."""
-        try:
-            if monster.x is None or monster.y is None:
-                return
-            priv_x = monster.x
-            priv_y = monster.y
-            priv_room = await room_manager.get_room_at_coordinates(priv_x, priv_y)
-
-            if room_manager:
-
-                roaming_area = roaming_config.get('roaming_area')
-                if not roaming_area:
-                    roaming_area = {}
-
-                min_x = roaming_area.get('min_x')
-                max_x = roaming_area.get('max_x')
-                min_y = roaming_area.get('min_y')
-                max_y = roaming_area.get('max_y')
-
-                # 좌표 기반으로 가능한 방향 계산
-                from ...utils.coordinate_utils import Direction, calculate_new_coordinates
-
-                available_moves = []
-                current_x, current_y = monster.x, monster.y
-
-                # 모든 방향에 대해 인접 좌표 확인
-                for direction in Direction:
-                    target_x, target_y = calculate_new_coordinates(current_x, current_y, direction)
-
-                    # 로밍 영역 제한 확인
-                    if min_x is not None and target_x < min_x:
-                        continue
-                    if max_x is not None and target_x > max_x:
-                        continue
-                    if min_y is not None and target_y < min_y:
-                        continue
-                    if max_y is not None and target_y > max_y:
-                        continue
-
-                    # 해당 좌표에 방이 존재하는지 확인
-                    target_room = await room_manager.get_room_at_coordinates(target_x, target_y)  # target_room은 아래의 배열에 넣는데에만 쓰임
-                    if target_room:
-                        available_moves.append((direction, target_x, target_y))
-
-                if not available_moves:
-                    return
-
-                import random
-                _, target_x, target_y = random.choice(available_moves)
-
-                # 몬스터 좌표 직접 업데이트
-                monster.x = target_x
-                monster.y = target_y
-                success = await self.update_monster(monster)
-
-                if success:
-                    short_id = monster.id.split('-')[-1] if '-' in monster.id else monster.id
-
-                    # 몬스터 영어 이름 가져오기 (15자 제한)
-                    monster_name = monster.get_localized_name('en')[:15] if monster.get_localized_name('en') else short_id
-
-                    logger.info(f"{monster_name} {short_id} ({current_x}, {current_y}) -> ({target_x}, {target_y}) 로밍 (확률: {random_value:.2f})")
-
-                    target_room = await room_manager.get_room_at_coordinates(target_x, target_y)  # 그래서 여기서 다시 room을 가져 옴
-                    await self._game_engine.broadcast_to_room_by_detection_ability(priv_room.id, f"{monster_name} leaves the room.")
-                    await self._game_engine.broadcast_to_room_by_detection_ability(target_room.id, f"{monster_name} enters this room.")
-
-        except Exception as e:
-            logger.error(f"몬스터 로밍 실패 ({monster.id}): {e}")
+    async def _get_walkable_cells(self) -> Dict[Tuple[int, int], Any]:
+        """몬스터가 이동할 수 있는 좌표 → 방 매핑 (방 공간 인덱스, 미적재 시 전체 방 조회)"""
+        if not self._room_manager:
+            return {}
+        if self._room_manager.spatial_index.is_loaded:
+            return self._room_manager.spatial_index.coordinates()
+        cells: Dict[Tuple[int, int], Any] = {}
+        for room in await self._room_manager.get_all_rooms():
+            if room.x is not None and room.y is not None:
+                cells.setdefault((room.x, room.y), room)
+        return cells
+
+    async def _apply_roaming_moves(self, moves: List[RoamMove], walkable: Dict[Tuple[int, int], Any]) -> None:
+        """로밍 결과를 한 트랜잭션으로 저장하고, 방마다 퇴장/입장 메시지를 한 번씩 보냅니다."""
+        updated = await self._monster_repo.update_many({
+            move.monster.id: {'x': move.new[0], 'y': move.new[1]} for move in moves
+        })
+        updated_ids = {monster.id for monster in updated}
+
+        registry = await self._get_registry()
+        leaves: Dict[str, List[str]] = {}
+        enters: Dict[str, List[str]] = {}
+        for move in moves:
+            monster = move.monster
+            if monster.id not in updated_ids:
+                continue
+            monster.x, monster.y = move.new
+            registry.put(monster)
+
+            # UUID의 마지막 부분만 사용
+            short_id = monster.id.split('-')[-1] if '-' in monster.id else monster.id
+            # 몬스터 영어 이름 가져오기 (15자 제한)
+            monster_name = monster.get_localized_name('en')[:15] if monster.get_localized_name('en') else short_id
+            logger.debug(f"{monster_name} {short_id} {move.old} -> {move.new} 로밍 (확률: {move.roll:.2f})")
+
+            old_room = walkable.get(move.old)
+            new_room = walkable.get(move.new)
+            if old_room:
+                leaves.setdefault(old_room.id, []).append(f"{monster_name} leaves the room.")
+            if new_room:
+                enters.setdefault(new_room.id, []).append(f"{monster_name} enters this room.")
+        logger.info(f"몬스터 {len(updated_ids)}마리 로밍")
+
+        if not self._game_engine:
+            return
+        for room_id, lines in leaves.items():
+            await self._game_engine.broadcast_to_room_by_detection_ability(room_id, "\n".join(lines))
+        for room_id, lines in enters.items():
+            await self._game_engine.broadcast_to_room_by_detection_ability(room_id, "\n".join(lines))
 
     # === 선공 시스템 ===
 
@@ -718,8 +801,13 @@ class MonsterManager:
             return False
 
     async def setup_default_spawn_points(self, room_manager=None) -> None:
-        """기본 스폰 포인트들을 설정합니다."""
+        """기본 스폰 포인트들을 설정합니다 (spawn_points 테이블이 비어 있을 때만, 즉 최초 1회)."""
         try:
+            spawn_index = await self._get_spawn_index()
+            if len(spawn_index):
+                logger.info(f"저장된 스폰 포인트 {len(spawn_index)}개 사용 (기본 스폰 포인트 설정 생략)")
+                return
+
             small_rat_template = await self._monster_repo.get_by_id('template_small_rat')
             if not small_rat_template:
                 logger.info("작은 쥐 템플릿이 없습니다. 스폰 포인트 설정을 건너뜁니다.")
@@ -760,10 +848,7 @@ class MonsterManager:
 
             # 이전 방의 플레이어들에게 퇴장 알림
             if old_room_id and old_room_id != new_room_id:
-                sessions_in_old_room = []
-                for session in game_engine.session_manager.get_all_sessions():
-                    if hasattr(session, 'current_room_id') and session.current_room_id == old_room_id:
-                        sessions_in_old_room.append(session)
+                sessions_in_old_room = game_engine.session_manager.get_sessions_in_room(old_room_id)
 
                 for session in sessions_in_old_room:
                     if session.player:
@@ -779,10 +864,7 @@ class MonsterManager:
                         })
 
             # 새 방의 플레이어들에게 입장 알림
-            sessions_in_new_room = []
-            for session in game_engine.session_manager.get_all_sessions():
-                if hasattr(session, 'current_room_id') and session.current_room_id == new_room_id:
-                    sessions_in_new_room.append(session)
+            sessions_in_new_room = game_engine.session_manager.get_sessions_in_room(new_room_id)
 
             for session in sessions_in_new_room:
                 if session.player:
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""몬스터 레지스트리 모듈
+
+서버 시작 시 monsters 테이블을 한 번 읽어 Monster 객체를 메모리에 유지한다.
+좌표(x, y), 템플릿 ID, 생존 여부별 인덱스와 셀/템플릿 단위 생존 수 카운터를 함께 관리하므로
+스폰 제한 확인, 로밍, 좌표별 몬스터 조회가 테이블 전체 조회 없이 처리된다.
+사망한 몬스터는 리스폰 예정 시각(last_death_time + respawn_time) 기준 힙에 등록되어
+리스폰 처리 시 대기 중인 몬스터를 훑지 않고 예정 시각이 지난 항목만 꺼낸다.
+살아있는 선공형 몬스터는 셀별로 따로 인덱싱되며, 선공형 몬스터가 셀에 새로 나타나면
+(스폰/리스폰/로밍 이동) 도착 리스너를 호출해 선공 확인을 이벤트로 처리할 수 있게 한다.
+셀/템플릿 생존 수가 바뀌면 생존 수 리스너를 호출해 스폰 포인트 인덱스가 정원 미달 여부를 갱신한다.
+DB 기록은 MonsterManager가 리포지토리(엔티티 캐시 write-behind)를 통해 수행하고,
+변경 후 put()으로 인덱스를 갱신한다.
+"""
+
+import heapq
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..monster import Monster
+from .room_index import Coordinate
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 키: (좌표, 템플릿 ID, 생존 여부, 선공형 여부)
+_IndexKey = Tuple[Optional[Coordinate], Optional[str], bool, bool]
+# 순서를 유지하는 ID 집합 (조회 결과가 생성 순서를 따르도록 dict 사용)
+_IdSet = Dict[str, None]
+
+
+def _template_id(monster: Monster) -> Optional[str]:
+    properties = monster.properties if isinstance(monster.properties, dict) else {}
+    return properties.get('template_id')
+
+
+def _index_key(monster: Monster) -> _IndexKey:
+    coord = (monster.x, monster.y) if monster.x is not None and monster.y is not None else None
+    return coord, _template_id(monster), bool(monster.is_alive), monster.is_aggressive()
+
+
+def _is_aggressive_arrival(previous_key: Optional[_IndexKey], key: _IndexKey) -> bool:
+    """살아있는 선공형 몬스터가 셀에 새로 나타났는지 (생성/리스폰/이동/선공형 전환)"""
+    coord, _, alive, aggressive = key
+    if coord is None or not alive or not aggressive:
+        return False
+    return previous_key is None or previous_key[0] != coord or not previous_key[2] or not previous_key[3]
+
+
+def _respawn_due_time(monster: Monster) -> Optional[float]:
+    """리스폰 예정 시각 (UNIX timestamp, 사망 시각이 없으면 None)"""
+    if not monster.last_death_time:
+        return None
+    return monster.last_death_time.timestamp() + monster.respawn_time
+
+
+class MonsterRegistry:
+    """몬스터 인메모리 레지스트리 (좌표/템플릿/생존 상태 인덱스)"""
+
+    def __init__(self) -> None:
+        self._by_id: Dict[str, Monster] = {}
+        self._keys: Dict[str, _IndexKey] = {}  # 몬스터 ID -> 마지막으로 인덱싱된 키
+        self._by_coord: Dict[Coordinate, _IdSet] = {}
+        self._by_template: Dict[str, _IdSet] = {}
+        self._alive: _IdSet = {}
+        self._dead: _IdSet = {}
+        self._alive_by_template: Dict[str, int] = {}
+        self._alive_by_cell_template: Dict[Tuple[Coordinate, str], int] = {}
+        self._aggressive_by_coord: Dict[Coordinate, _IdSet] = {}  # 살아있는 선공형 몬스터
+        self._arrival_listener: Optional[Callable[[Monster], None]] = None
+        self._count_listener: Optional[Callable[[Coordinate, str], None]] = None
+        # 리스폰 예정 힙: (예정 시각, 몬스터 ID). 취소/변경된 항목은 _respawn_due와 비교해 꺼낼 때 버림
+        self._respawn_heap: List[Tuple[float, str]] = []
+        self._respawn_due: Dict[str, float] = {}
+        self._respawn_listener: Optional[Callable[[float], None]] = None
+        self._loaded: bool = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """레지스트리 적재 여부"""
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def set_respawn_listener(self, listener: Optional[Callable[[float], None]]) -> None:
+        """리스폰이 예약될 때마다 예정 시각과 함께 호출될 리스너 설정"""
+        self._respawn_listener = listener
+
+    def set_arrival_listener(self, listener: Optional[Callable[[Monster], None]]) -> None:
+        """살아있는 선공형 몬스터가 셀에 새로 나타날 때마다 호출될 리스너 설정 (load() 중에는 호출 안 함)"""
+        self._arrival_listener = listener
+
+    def set_count_listener(self, listener: Optional[Callable[[Coordinate, str], None]]) -> None:
+        """셀/템플릿별 생존 수가 바뀔 때마다 (좌표, 템플릿 ID)와 함께 호출될 리스너 설정 (load() 중에는 호출 안 함)"""
+        self._count_listener = listener
+
+    def load(self, monsters: Iterable[Monster]) -> None:
+        """전체 몬스터 목록으로 레지스트리를 재구성합니다."""
+        self._reset()
+        for monster in monsters:
+            self._put(monster, notify=False)
+        self._loaded = True
+        logger.info(f"몬스터 레지스트리 적재 완료: {len(self._by_id)}마리 (생존 {len(self._alive)})")
+
+    def clear(self) -> None:
+        """레지스트리를 비우고 미적재 상태로 되돌립니다."""
+        self._reset()
+        self._loaded = False
+
+    def _reset(self) -> None:
+        self._by_id.clear()
+        self._keys.clear()
+        self._by_coord.clear()
+        self._by_template.clear()
+        self._alive.clear()
+        self._dead.clear()
+        self._alive_by_template.clear()
+        self._alive_by_cell_template.clear()
+        self._aggressive_by_coord.clear()
+        self._respawn_heap.clear()
+        self._respawn_due.clear()
+
+    def put(self, monster: Monster) -> Monster:
+        """몬스터를 추가하거나 갱신합니다 (좌표/생존 상태 변경 반영).
+
+        같은 ID의 다른 객체가 이미 있으면 넘겨받은 객체로 교체합니다.
+
+        Returns:
+            Monster: 레지스트리에 보관된 객체
+        """
+        return self._put(monster, notify=True)
+
+    def _put(self, monster: Monster, notify: bool) -> Monster:
+        key = _index_key(monster)
+        previous_key = self._keys.get(monster.id)
+        self._by_id[monster.id] = monster
+        if previous_key != key:
+            if previous_key is not None:
+                self._unlink(monster.id, previous_key)
+            self._link(monster.id, key)
+            if notify and self._arrival_listener and _is_aggressive_arrival(previous_key, key):
+                self._arrival_listener(monster)
+            if notify:
+                self._notify_count(previous_key)
+                self._notify_count(key)
+        self._sync_respawn(monster, key[2])
+        return monster
+
+    def remove(self, monster_id: str) -> Optional[Monster]:
+        """몬스터를 레지스트리에서 제거합니다."""
+        monster = self._by_id.pop(monster_id, None)
+        key = self._keys.get(monster_id)
+        if key is not None:
+            self._unlink(monster_id, key)
+            self._notify_count(key)
+        self._respawn_due.pop(monster_id, None)
+        return monster
+
+    def _notify_count(self, key: Optional[_IndexKey]) -> None:
+        """키가 셀/템플릿 생존 수에 포함되는 경우 생존 수 리스너 호출"""
+        if key is None or not self._count_listener:
+            return
+        coord, template_id, alive, _ = key
+        if alive and coord is not None and template_id is not None:
+            self._count_listener(coord, template_id)
+
+    def _link(self, monster_id: str, key: _IndexKey) -> None:
+        coord, template_id, alive, aggressive = key
+        self._keys[monster_id] = key
+        if coord is not None:
+            self._by_coord.setdefault(coord, {})[monster_id] = None
+        if template_id is not None:
+            self._by_template.setdefault(template_id, {})[monster_id] = None
+        if alive:
+            self._alive[monster_id] = None
+            if template_id is not None:
+                self._alive_by_template[template_id] = self._alive_by_template.get(template_id, 0) + 1
+                if coord is not None:
+                    cell_key = (coord, template_id)
+                    self._alive_by_cell_template[cell_key] = self._alive_by_cell_template.get(cell_key, 0) + 1
+            if aggressive and coord is not None:
+                self._aggressive_by_coord.setdefault(coord, {})[monster_id] = None
+        else:
+            self._dead[monster_id] = None
+
+    def _unlink(self, monster_id: str, key: _IndexKey) -> None:
+        coord, template_id, alive, aggressive = key
+        self._keys.pop(monster_id, None)
+        if coord is not None:
+            _discard(self._by_coord, coord, monster_id)
+        if template_id is not None:
+            _discard(self._by_template, template_id, monster_id)
+        if alive:
+            self._alive.pop(monster_id, None)
+            if template_id is not None:
+                _decrement(self._alive_by_template, template_id)
+                if coord is not None:
+                    _decrement(self._alive_by_cell_template, (coord, template_id))
+            if aggressive and coord is not None:
+                _discard(self._aggressive_by_coord, coord, monster_id)
+        else:
+            self._dead.pop(monster_id, None)
+
+    # === 리스폰 예약 ===
+
+    def _sync_respawn(self, monster: Monster, alive: bool) -> None:
+        """생존 상태/사망 시각에 맞춰 리스폰 예약을 갱신합니다."""
+        due = None if alive else _respawn_due_time(monster)
+        if due is None:
+            self._respawn_due.pop(monster.id, None)
+            return
+        if self._respawn_due.get(monster.id) == due:
+            return
+        self.schedule_respawn(monster.id, due)
+
+    def schedule_respawn(self, monster_id: str, due: float) -> None:
+        """몬스터 리스폰을 예정 시각에 예약합니다 (기존 예약은 대체)."""
+        self._respawn_due[monster_id] = due
+        heapq.heappush(self._respawn_heap, (due, monster_id))
+        if self._respawn_listener:
+            self._respawn_listener(due)
+
+    def _drop_stale_respawns(self) -> None:
+        heap = self._respawn_heap
+        while heap and self._respawn_due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def next_respawn_time(self) -> Optional[float]:
+        """가장 이른 리스폰 예정 시각 (예약이 없으면 None)"""
+        self._drop_stale_respawns()
+        return self._respawn_heap[0][0] if self._respawn_heap else None
+
+    def pop_due_respawns(self, now: float) -> List[Monster]:
+        """예정 시각이 now 이전인 사망 몬스터를 예약에서 꺼내 반환합니다."""
+        due_monsters: List[Monster] = []
+        heap = self._respawn_heap
+        while True:
+            self._drop_stale_respawns()
+            if not heap or heap[0][0] > now:
+                break
+            _, monster_id = heapq.heappop(heap)
+            del self._respawn_due[monster_id]
+            if monster_id in self._dead:
+                due_monsters.append(self._by_id[monster_id])
+        return due_monsters
+
+    # === 조회 ===
+
+    def get(self, monster_id: str) -> Optional[Monster]:
+        """몬스터 ID로 조회"""
+        return self._by_id.get(monster_id)
+
+    def all_monsters(self) -> List[Monster]:
+        """모든 몬스터 목록"""
+        return list(self._by_id.values())
+
+    def alive_monsters(self) -> List[Monster]:
+        """살아있는 몬스터 목록"""
+        return [self._by_id[monster_id] for monster_id in self._alive]
+
+    def dead_monsters(self) -> List[Monster]:
+        """사망(리스폰 대기) 몬스터 목록"""
+        return [self._by_id[monster_id] for monster_id in self._dead]
+
+    def get_at(self, x: int, y: int, alive_only: bool = True) -> List[Monster]:
+        """좌표에 있는 몬스터 목록"""
+        monster_ids = self._by_coord.get((x, y))
+        if not monster_ids:
+            return []
+        return [
+            self._by_id[monster_id] for monster_id in monster_ids
+            if not alive_only or monster_id in self._alive
+        ]
+
+    def get_aggressive_at(self, x: int, y: int) -> List[Monster]:
+        """좌표에 있는 살아있는 선공형 몬스터 목록"""
+        monster_ids = self._aggressive_by_coord.get((x, y))
+        if not monster_ids:
+            return []
+        return [self._by_id[monster_id] for monster_id in monster_ids]
+
+    def get_by_template(self, template_id: str, alive_only: bool = True) -> List[Monster]:
+        """템플릿 ID별 몬스터 목록"""
+        monster_ids = self._by_template.get(template_id)
+        if not monster_ids:
+            return []
+        return [
+            self._by_id[monster_id] for monster_id in monster_ids
+            if not alive_only or monster_id in self._alive
+        ]
+
+    def count_alive(self, template_id: str) -> int:
+        """템플릿별 살아있는 몬스터 수"""
+        return self._alive_by_template.get(template_id, 0)
+
+    def count_alive_at(self, x: int, y: int, template_id: str) -> int:
+        """좌표(셀)의 템플릿별 살아있는 몬스터 수"""
+        return self._alive_by_cell_template.get(((x, y), template_id), 0)
+
+
+def _discard(index: Dict, key, monster_id: str) -> None:
+    members = index.get(key)
+    if members is not None:
+        members.pop(monster_id, None)
+        if not members:
+            del index[key]
+
+
+def _decrement(counter: Dict, key) -> None:
+    remaining = counter.get(key, 0) - 1
+    if remaining > 0:
+        counter[key] = remaining
+    else:
+        counter.pop(key, None)
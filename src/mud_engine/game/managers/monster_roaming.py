@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""몬스터 로밍 일괄 계산 모듈
+
+로밍 대상 몬스터의 좌표/로밍 확률/로밍 영역을 한 번에 목록으로 모은 뒤,
+방 공간 인덱스의 좌표 → 방 매핑(이동 가능 셀)과 대조해 이번 주기의 이동을 계산한다.
+계산 중에는 DB나 await가 없으며, 저장(update_many)/레지스트리 갱신/방별 메시지 묶음 전송은
+MonsterManager가 계산 결과로 한 번에 처리한다.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Any, List, Mapping, Optional, Tuple
+
+from ..monster import Monster
+from ...utils.coordinate_utils import DIRECTION_OFFSETS
+
+Coordinate = Tuple[int, int]
+
+# 로밍 영역 경계가 없을 때 쓰는 값 (좌표로 나올 수 없는 충분히 큰 값)
+_NO_MIN = -(1 << 62)
+_NO_MAX = 1 << 62
+_OFFSETS = tuple(DIRECTION_OFFSETS.values())
+
+
+@dataclass(frozen=True)
+class RoamMove:
+    """몬스터 한 마리의 이번 주기 이동"""
+    monster: Monster
+    old: Coordinate
+    new: Coordinate
+    roll: float
+
+
+class RoamingBatch:
+    """로밍 대상 몬스터의 좌표/확률/영역 (몬스터별 같은 위치의 값을 열마다 목록으로 보관)"""
+
+    def __init__(self) -> None:
+        self.monsters: List[Monster] = []
+        self.xs: List[int] = []
+        self.ys: List[int] = []
+        self.chances: List[float] = []
+        self.min_xs: List[int] = []
+        self.max_xs: List[int] = []
+        self.min_ys: List[int] = []
+        self.max_ys: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.monsters)
+
+    @classmethod
+    def from_monsters(cls, monsters) -> 'RoamingBatch':
+        """살아있는 몬스터 중 로밍 대상만 모읍니다 (템플릿/좌표 없음/로밍 설정 없음 제외)."""
+        batch = cls()
+        for monster in monsters:
+            if monster.x is None or monster.y is None:
+                continue
+            # TODO: 여기서 몹의 lua 에 있는 로밍 함수를 실행
+            if monster.get_property('is_template', False) or not monster.can_roam():
+                continue
+            roaming_config = monster.get_property('roaming_config')
+            if not roaming_config:
+                continue
+            area = roaming_config.get('roaming_area') or {}
+            batch.monsters.append(monster)
+            batch.xs.append(monster.x)
+            batch.ys.append(monster.y)
+            batch.chances.append(roaming_config.get('roam_chance', 0.5))  # 기본 50%
+            batch.min_xs.append(_bound(area.get('min_x'), _NO_MIN))
+            batch.max_xs.append(_bound(area.get('max_x'), _NO_MAX))
+            batch.min_ys.append(_bound(area.get('min_y'), _NO_MIN))
+            batch.max_ys.append(_bound(area.get('max_y'), _NO_MAX))
+        return batch
+
+    def plan(self, walkable: Mapping[Coordinate, Any], rng: Optional[random.Random] = None) -> List[RoamMove]:
+        """
+        이번 주기의 이동 계산
+
+        Args:
+            walkable: 이동 가능한 좌표 (방이 있는 좌표 → 방)
+            rng: 난수 생성기 (테스트용, 기본은 random 모듈)
+
+        Returns:
+            List[RoamMove]: 실제로 이동하는 몬스터 목록 (확률 실패/막힌 몬스터 제외)
+        """
+        rng = rng or random
+        rolls = [rng.random() for _ in self.monsters]
+        moves: List[RoamMove] = []
+        for monster, roll, chance, x, y, min_x, max_x, min_y, max_y in zip(
+            self.monsters, rolls, self.chances, self.xs, self.ys,
+            self.min_xs, self.max_xs, self.min_ys, self.max_ys,
+        ):
+            if roll > chance:
+                continue
+            candidates = [
+                (x + dx, y + dy) for dx, dy in _OFFSETS
+                if min_x <= x + dx <= max_x and min_y <= y + dy <= max_y and (x + dx, y + dy) in walkable
+            ]
+            if candidates:
+                moves.append(RoamMove(monster, (x, y), rng.choice(candidates), roll))
+        return moves
+
+
+def _bound(value: Optional[int], default: int) -> int:
+    return default if value is None else int(value)
@@ -29,46 +29,7 @@ class ObjectManager:
     async def create_game_object(self, object_data: Dict[str, Any]) -> GameObject:
         """새로운 게임 객체를 생성합니다."""
         try:
-            # name이 없고 name_en/name_ko가 있으면 name dict로 재조합
-            name = object_data.get('name', {})
-            if not name and (object_data.get('name_en') or object_data.get('name_ko')):
-                name = {}
-                if object_data.get('name_en'):
-                    name['en'] = object_data['name_en']
-                if object_data.get('name_ko'):
-                    name['ko'] = object_data['name_ko']
-
-            # description도 동일하게 처리
-            description = object_data.get('description', {})
-            if not description and (object_data.get('description_en') or object_data.get('description_ko')):
-                description = {}
-                if object_data.get('description_en'):
-                    description['en'] = object_data['description_en']
-                if object_data.get('description_ko'):
-                    description['ko'] = object_data['description_ko']
-
-            # properties가 JSON 문자열이면 dict로 파싱
-            properties = object_data.get('properties', {})
-            if isinstance(properties, str):
-                import json
-                try:
-                    properties = json.loads(properties)
-                except (json.JSONDecodeError, TypeError):
-                    properties = {}
-
-            game_object = GameObject(
-                id=object_data.get('id'),
-                name=name,
-                description=description,
-                location_type=object_data.get('location_type', 'room'),
-                location_id=object_data.get('location_id'),
-                properties=properties,
-                weight=object_data.get('weight', 1.0),
-                max_stack=object_data.get('max_stack', 1),
-                equipment_slot=object_data.get('equipment_slot'),
-                is_equipped=object_data.get('is_equipped', False),
-                created_at=datetime.now()
-            )
+            game_object = self._build_game_object(object_data)
             created_object = await self._object_repo.create(game_object.to_dict())
             logger.info(f"새 게임 객체 생성됨: {created_object.id}")
             return created_object
@@ -76,6 +37,69 @@ class ObjectManager:
             logger.error(f"게임 객체 생성 실패: {e}")
             raise
 
+    async def create_game_objects(self, objects_data: List[Dict[str, Any]]) -> List[GameObject]:
+        """여러 게임 객체를 한 트랜잭션으로 생성합니다."""
+        try:
+            game_objects = [self._build_game_object(object_data) for object_data in objects_data]
+            created_objects = await self._object_repo.create_many(game_objects)
+            logger.info(f"새 게임 객체 {len(created_objects)}개 생성됨")
+            return created_objects
+        except Exception as e:
+            logger.error(f"게임 객체 일괄 생성 실패: {e}")
+            raise
+
+    async def move_game_objects(self, object_ids: List[str], location_type: str, location_id: str,
+                                is_equipped: Optional[bool] = None) -> List[GameObject]:
+        """여러 게임 객체를 한 번에 같은 위치로 이동합니다."""
+        try:
+            return await self._object_repo.move_objects(object_ids, location_type, location_id, is_equipped)
+        except Exception as e:
+            logger.error(f"게임 객체 일괄 이동 실패 ({location_type}:{location_id}): {e}")
+            raise
+
+    def _build_game_object(self, object_data: Dict[str, Any]) -> GameObject:
+        """생성 요청 데이터를 GameObject로 정규화합니다."""
+        # name이 없고 name_en/name_ko가 있으면 name dict로 재조합
+        name = object_data.get('name', {})
+        if not name and (object_data.get('name_en') or object_data.get('name_ko')):
+            name = {}
+            if object_data.get('name_en'):
+                name['en'] = object_data['name_en']
+            if object_data.get('name_ko'):
+                name['ko'] = object_data['name_ko']
+
+        # description도 동일하게 처리
+        description = object_data.get('description', {})
+        if not description and (object_data.get('description_en') or object_data.get('description_ko')):
+            description = {}
+            if object_data.get('description_en'):
+                description['en'] = object_data['description_en']
+            if object_data.get('description_ko'):
+                description['ko'] = object_data['description_ko']
+
+        # properties가 JSON 문자열이면 dict로 파싱
+        properties = object_data.get('properties', {})
+        if isinstance(properties, str):
+            import json
+            try:
+                properties = json.loads(properties)
+            except (json.JSONDecodeError, TypeError):
+                properties = {}
+
+        return GameObject(
+            id=object_data.get('id'),
+            name=name,
+            description=description,
+            location_type=object_data.get('location_type', 'room'),
+            location_id=object_data.get('location_id'),
+            properties=properties,
+            weight=object_data.get('weight', 1.0),
+            max_stack=object_data.get('max_stack', 1),
+            equipment_slot=object_data.get('equipment_slot'),
+            is_equipped=object_data.get('is_equipped', False),
+            created_at=datetime.now()
+        )
+
     async def update_game_object(self, object_id: str, updates: Dict[str, Any]) -> Optional[GameObject]:
         """게임 객체 정보를 수정합니다."""
         try:
@@ -85,14 +85,13 @@ class PriceResolver:
         if not template_id:
             return 0
         try:
-            cursor = await self._db.execute(
+            row = await self._db.fetch_one(
                 f"SELECT {column} FROM item_prices WHERE template_id = ?",
                 (template_id,),
             )
-            row = await cursor.fetchone()
             if row is None:
                 return 0
-            return int(row[0]) if row[0] is not None else 0
+            return int(row[column]) if row[column] is not None else 0
         except Exception as e:
             logger.error(
                 "item_prices 조회 실패 [%s.%s]: %s",
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""방 공간 인덱스 모듈
+
+서버 시작 시 rooms 테이블을 한 번 읽어 방 ID 및 좌표(x, y) 기준으로 메모리에 유지한다.
+RoomManager가 방 생성/수정/삭제 시 write-through로 갱신하므로,
+이동/출구/미니맵 등 좌표 기반 조회는 DB 왕복 없이 딕셔너리 조회로 처리된다.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..models import Room
+
+logger = logging.getLogger(__name__)
+
+Coordinate = Tuple[int, int]
+
+
+class RoomSpatialIndex:
+    """방 ID / 좌표 기반 인메모리 인덱스"""
+
+    def __init__(self) -> None:
+        self._by_id: Dict[str, Room] = {}
+        self._by_coord: Dict[Coordinate, Room] = {}
+        self._loaded: bool = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """인덱스 적재 여부"""
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def load(self, rooms: Iterable[Room]) -> None:
+        """전체 방 목록으로 인덱스를 재구성합니다."""
+        self._by_id.clear()
+        self._by_coord.clear()
+        for room in rooms:
+            self._by_id[room.id] = room
+            if room.x is not None and room.y is not None:
+                # 같은 좌표에 방이 여러 개면 DB 조회와 동일하게 먼저 읽힌 방을 사용
+                self._by_coord.setdefault((room.x, room.y), room)
+        self._loaded = True
+        logger.info(f"방 공간 인덱스 적재 완료: {len(self._by_id)}개 방, {len(self._by_coord)}개 좌표")
+
+    def clear(self) -> None:
+        """인덱스를 비우고 미적재 상태로 되돌립니다."""
+        self._by_id.clear()
+        self._by_coord.clear()
+        self._loaded = False
+
+    def put(self, room: Room) -> None:
+        """방을 추가하거나 갱신합니다 (좌표 변경 반영)."""
+        previous = self._by_id.get(room.id)
+        if previous is not None:
+            self._unlink_coordinate(previous)
+        self._by_id[room.id] = room
+        if room.x is not None and room.y is not None:
+            self._by_coord[(room.x, room.y)] = room
+
+    def remove(self, room_id: str) -> Optional[Room]:
+        """방을 인덱스에서 제거합니다."""
+        room = self._by_id.pop(room_id, None)
+        if room is not None:
+            self._unlink_coordinate(room)
+        return room
+
+    def _unlink_coordinate(self, room: Room) -> None:
+        """좌표 매핑에서 방을 제거하고, 같은 좌표의 다른 방이 있으면 대신 연결합니다."""
+        if room.x is None or room.y is None:
+            return
+        coord = (room.x, room.y)
+        current = self._by_coord.get(coord)
+        if current is None or current.id != room.id:
+            return
+        del self._by_coord[coord]
+        for other in self._by_id.values():
+            if other.id != room.id and other.x == room.x and other.y == room.y:
+                self._by_coord[coord] = other
+                break
+
+    def get(self, room_id: str) -> Optional[Room]:
+        """방 ID로 조회"""
+        return self._by_id.get(room_id)
+
+    def get_at(self, x: int, y: int) -> Optional[Room]:
+        """좌표로 조회"""
+        return self._by_coord.get((x, y))
+
+    def all_rooms(self) -> List[Room]:
+        """모든 방 목록"""
+        return list(self._by_id.values())
+
+    def coordinates(self) -> Dict[Coordinate, Room]:
+        """좌표 → 방 매핑 (읽기 전용으로 사용할 것)"""
+        return self._by_coord
+
+    def get_in_bounds(self, min_x: int, max_x: int, min_y: int, max_y: int) -> List[Room]:
+        """좌표 범위(경계 포함) 내의 방 목록"""
+        if min_x > max_x or min_y > max_y:
+            return []
+
+        cell_count = (max_x - min_x + 1) * (max_y - min_y + 1)
+        if cell_count <= len(self._by_coord):
+            # 범위가 작으면 셀 단위로 조회
+            rooms = []
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    room = self._by_coord.get((x, y))
+                    if room is not None:
+                        rooms.append(room)
+            return rooms
+
+        return [
+            room for (x, y), room in self._by_coord.items()
+            if min_x <= x <= max_x and min_y <= y <= max_y
+        ]
+
+    def get_in_radius(self, center_x: int, center_y: int, radius: int) -> List[Room]:
+        """중심 좌표로부터 유클리드 거리 radius 이내의 방 목록"""
+        radius_sq = radius * radius
+        return [
+            room for room in self.get_in_bounds(center_x - radius, center_x + radius,
+                                                center_y - radius, center_y + radius)
+            if (room.x - center_x) ** 2 + (room.y - center_y) ** 2 <= radius_sq
+        ]
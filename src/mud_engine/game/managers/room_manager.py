@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 """방 관리자 모듈"""
+import copy
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from ..repositories import RoomRepository
 from ..models import Room
+from .room_index import RoomSpatialIndex
+from .exit_graph import ExitGraph
+from ...utils.coordinate_utils import DIRECTION_OFFSETS, ENTER_EXIT, compute_coordinate_exits
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +20,44 @@ class RoomManager:
     def __init__(self, room_repo: RoomRepository) -> None:
         """RoomManager를 초기화합니다."""
         self._room_repo: RoomRepository = room_repo
+        self._spatial_index: RoomSpatialIndex = RoomSpatialIndex()
+        self._exit_graph: ExitGraph = ExitGraph(self._spatial_index)
         logger.info("RoomManager 초기화 완료")
 
+    @property
+    def spatial_index(self) -> RoomSpatialIndex:
+        """방 공간 인덱스"""
+        return self._spatial_index
+
+    @property
+    def exit_graph(self) -> ExitGraph:
+        """출구 그래프"""
+        return self._exit_graph
+
+    async def load_spatial_index(self) -> int:
+        """rooms 테이블 전체를 읽어 공간 인덱스와 출구 그래프를 적재합니다.
+
+        적재 이후에는 방 조회가 인덱스에서 처리되며, 방 변경은 반드시
+        create_room/update_room/delete_room을 거쳐야 인덱스에 반영됩니다.
+
+        Returns:
+            int: 적재된 방 개수
+        """
+        try:
+            rooms = await self._room_repo.get_all()
+            self._spatial_index.load(rooms)
+            connections = await self._room_repo.get_enter_connections()
+            self._exit_graph.build(connections)
+            return len(rooms)
+        except Exception as e:
+            logger.error(f"방 공간 인덱스 적재 실패: {e}")
+            raise
+
     async def get_room(self, room_id: str) -> Optional[Room]:
         """방 ID로 방 정보를 조회합니다."""
         try:
+            if self._spatial_index.is_loaded:
+                return self._spatial_index.get(room_id)
             return await self._room_repo.get_by_id(room_id)
         except Exception as e:
             logger.error(f"방 조회 실패 ({room_id}): {e}")
@@ -38,6 +75,9 @@ class RoomManager:
                 updated_at=datetime.now()
             )
             created_room = await self._room_repo.create(room.to_dict())
+            if created_room and self._spatial_index.is_loaded:
+                self._spatial_index.put(created_room)
+                self._exit_graph.on_room_changed(None, created_room)
             logger.info(f"새 방 생성됨: {created_room.id}")
             return created_room
         except Exception as e:
@@ -52,6 +92,10 @@ class RoomManager:
                 logger.warning(f"수정하려는 방이 존재하지 않음: {room_id}")
                 return None
 
+            # 인덱스에 있는 객체를 직접 수정하지 않도록 복사본에 적용 (DB 반영 실패 시 인덱스 보존)
+            original_room = existing_room
+            existing_room = copy.copy(existing_room)
+
             for key, value in updates.items():
                 if hasattr(existing_room, key) and key != 'exits':  # exits는 더 이상 사용하지 않음
                     setattr(existing_room, key, value)
@@ -59,6 +103,9 @@ class RoomManager:
             existing_room.updated_at = datetime.now()
             updated_room = await self._room_repo.update(room_id, existing_room.to_dict())
             if updated_room:
+                if self._spatial_index.is_loaded:
+                    self._spatial_index.put(updated_room)
+                    self._exit_graph.on_room_changed(original_room, updated_room)
                 logger.info(f"방 정보 수정됨: {room_id}")
             return updated_room
         except Exception as e:
@@ -78,6 +125,9 @@ class RoomManager:
             await self._remove_exits_to_room(room_id)
             success = await self._room_repo.delete(room_id)
             if success:
+                removed_room = self._spatial_index.remove(room_id)
+                if removed_room:
+                    self._exit_graph.on_room_changed(removed_room, None)
                 logger.info(f"방 삭제됨: {room_id}")
             return success
         except Exception as e:
@@ -87,6 +137,8 @@ class RoomManager:
     async def get_all_rooms(self) -> List[Room]:
         """모든 방 목록을 조회합니다."""
         try:
+            if self._spatial_index.is_loaded:
+                return self._spatial_index.all_rooms()
             return await self._room_repo.get_all()
         except Exception as e:
             logger.error(f"전체 방 목록 조회 실패: {e}")
@@ -109,14 +161,57 @@ class RoomManager:
             raise
 
     async def add_room_exit(self, room_id: str, direction: str, target_room_id: str) -> bool:
-        """출구 추가 (좌표 기반 시스템에서는 사용하지 않음)."""
-        logger.warning("좌표 기반 시스템에서는 add_room_exit을 사용하지 않습니다.")
-        return False
+        """출구를 추가합니다.
+
+        동서남북은 좌표상 인접한 방이어야 하며 막힌 출구를 해제하고,
+        enter는 room_connections에 연결을 추가합니다.
+        """
+        try:
+            room = await self.get_room(room_id)
+            target_room = await self.get_room(target_room_id)
+            if not room or not target_room or room.x is None or target_room.x is None:
+                logger.warning(f"출구 추가 실패 - 방 또는 좌표 없음: {room_id} -> {target_room_id}")
+                return False
+
+            if direction == ENTER_EXIT:
+                await self._room_repo.add_enter_connection(room.x, room.y, target_room.x, target_room.y)
+                self._exit_graph.set_enter_connection((room.x, room.y), (target_room.x, target_room.y))
+                logger.info(f"enter 연결 추가됨: {room_id} -> {target_room_id}")
+                return True
+
+            offset = DIRECTION_OFFSETS.get(direction)
+            if offset is None or (room.x + offset[0], room.y + offset[1]) != (target_room.x, target_room.y):
+                logger.warning(f"출구 추가 실패 - {direction} 방향에 인접한 방이 아님: {room_id} -> {target_room_id}")
+                return False
+
+            blocked_exits = [d for d in (room.blocked_exits or []) if d != direction]
+            return await self.update_room(room_id, {'blocked_exits': blocked_exits}) is not None
+        except Exception as e:
+            logger.error(f"출구 추가 실패 ({room_id}, {direction}): {e}")
+            raise
 
     async def remove_room_exit(self, room_id: str, direction: str) -> bool:
-        """출구 제거 (좌표 기반 시스템에서는 사용하지 않음)."""
-        logger.warning("좌표 기반 시스템에서는 remove_room_exit을 사용하지 않습니다.")
-        return False
+        """출구를 제거합니다 (동서남북은 막힌 출구로 등록, enter는 연결 삭제)."""
+        try:
+            room = await self.get_room(room_id)
+            if not room or room.x is None or room.y is None:
+                return False
+
+            if direction == ENTER_EXIT:
+                removed = await self._room_repo.remove_enter_connection(room.x, room.y)
+                self._exit_graph.remove_enter_connection((room.x, room.y))
+                return removed
+
+            if direction not in DIRECTION_OFFSETS:
+                return False
+
+            blocked_exits = list(room.blocked_exits or [])
+            if direction not in blocked_exits:
+                blocked_exits.append(direction)
+            return await self.update_room(room_id, {'blocked_exits': blocked_exits}) is not None
+        except Exception as e:
+            logger.error(f"출구 제거 실패 ({room_id}, {direction}): {e}")
+            raise
 
     async def _remove_exits_to_room(self, target_room_id: str) -> None:
         """특정 방으로의 출구들을 제거합니다 (좌표 기반에서는 불필요)."""
@@ -127,7 +222,8 @@ class RoomManager:
     async def get_room_at_coordinates(self, x: int, y: int) -> Optional[Room]:
         """특정 좌표의 방을 조회합니다."""
         try:
-            # 직접 데이터베이스에서 좌표로 조회
+            if self._spatial_index.is_loaded:
+                return self._spatial_index.get_at(x, y)
             return await self._room_repo.get_room_by_coordinates(x, y)
         except Exception as e:
             logger.error(f"좌표 기반 방 조회 실패 ({x}, {y}): {e}")
@@ -136,6 +232,9 @@ class RoomManager:
     async def get_rooms_in_area(self, center_x: int, center_y: int, radius: int) -> List[Room]:
         """특정 좌표 주변의 방들을 조회합니다."""
         try:
+            if self._spatial_index.is_loaded:
+                return self._spatial_index.get_in_radius(center_x, center_y, radius)
+
             rooms = await self._room_repo.get_all()
             area_rooms = []
 
@@ -153,6 +252,9 @@ class RoomManager:
     async def find_rooms_by_coordinates(self, min_x: int, max_x: int, min_y: int, max_y: int) -> List[Room]:
         """좌표 범위 내의 방들을 조회합니다."""
         try:
+            if self._spatial_index.is_loaded:
+                return self._spatial_index.get_in_bounds(min_x, max_x, min_y, max_y)
+
             rooms = await self._room_repo.get_all()
             filtered_rooms = []
 
@@ -168,53 +270,50 @@ class RoomManager:
     async def get_coordinate_based_exits(self, room_id: str) -> Dict[str, str]:
         """좌표 기반으로 방의 출구를 계산합니다 (동서남북 + enter)."""
         try:
+            if self._exit_graph.is_built:
+                return self._exit_graph.get_exits(room_id)
+
             room = await self.get_room(room_id)
             if not room or room.x is None or room.y is None:
                 return {}
 
-            exits = {}
-            blocked = set(room.blocked_exits) if room.blocked_exits else set()
-
-            # 방향별 좌표 오프셋 (동서남북만)
-            direction_offsets = {
-                'north': (0, 1),
-                'south': (0, -1),
-                'east': (1, 0),
-                'west': (-1, 0)
-            }
-
-            # 좌표를 기반으로 인접한 방들을 찾아 출구 생성
-            for direction, (dx, dy) in direction_offsets.items():
-                if direction in blocked:
-                    continue  # 막힌 방향은 건너뜀
-
-                adj_x = room.x + dx
-                adj_y = room.y + dy
-
-                # 해당 좌표에 방이 있는지 직접 조회
-                adjacent_room = await self.get_room_at_coordinates(adj_x, adj_y)
-                if adjacent_room:
-                    exits[direction] = adjacent_room.id
-
-            # enter 연결 확인
-            db_manager = await self._room_repo.get_db_manager()
-            cursor = await db_manager.execute(
-                "SELECT to_x, to_y FROM room_connections WHERE from_x = ? AND from_y = ?",
-                (room.x, room.y)
-            )
-            connection = await cursor.fetchone()
+            # 그래프 구성 전에는 DB에서 직접 계산
+            neighbours: Dict[Any, Optional[str]] = {}
+            for dx, dy in DIRECTION_OFFSETS.values():
+                adjacent_room = await self.get_room_at_coordinates(room.x + dx, room.y + dy)
+                neighbours[(room.x + dx, room.y + dy)] = adjacent_room.id if adjacent_room else None
 
-            if connection:
-                # enter 연결이 있으면 enter 출구 추가
-                target_room = await self.get_room_at_coordinates(connection[0], connection[1])
-                if target_room:
-                    exits['enter'] = target_room.id
+            enter_target = await self.get_enter_connection(room.x, room.y)
+            if enter_target is not None:
+                target_room = await self.get_room_at_coordinates(enter_target[0], enter_target[1])
+                neighbours[enter_target] = target_room.id if target_room else None
 
-            return exits
+            return compute_coordinate_exits(
+                room.x, room.y, lambda x, y: neighbours.get((x, y)),
+                blocked_exits=room.blocked_exits, enter_target=enter_target
+            )
         except Exception as e:
             logger.error(f"좌표 기반 출구 계산 실패 ({room_id}): {e}")
             return {}
 
+    async def get_room_exit(self, room_id: str, direction: str) -> Optional[str]:
+        """방의 특정 방향 출구 목적지 방 ID를 조회합니다."""
+        if self._exit_graph.is_built:
+            return self._exit_graph.get_exit(room_id, direction)
+        exits = await self.get_coordinate_based_exits(room_id)
+        return exits.get(direction)
+
+    async def get_enter_connection(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """좌표의 enter 연결 목적지 좌표를 조회합니다."""
+        try:
+            if self._exit_graph.is_built:
+                return self._exit_graph.get_enter_target(x, y)
+            connections = await self._room_repo.get_enter_connections()
+            return connections.get((x, y))
+        except Exception as e:
+            logger.error(f"enter 연결 조회 실패 ({x}, {y}): {e}")
+            return None
+
     async def update_room_exits_by_coordinates(self, room_id: str) -> bool:
         """방의 출구를 좌표 기반으로 업데이트합니다 (좌표 기반에서는 불필요)."""
         logger.debug("좌표 기반 시스템에서는 출구 업데이트가 불필요합니다.")
@@ -228,6 +327,13 @@ class RoomManager:
     async def get_connected_rooms_by_coordinates(self, room_id: str) -> List[Room]:
         """좌표 기반으로 연결된 방들을 조회합니다."""
         try:
+            if self._exit_graph.is_built:
+                return [
+                    room for room in (self._spatial_index.get(rid)
+                                      for rid in self._exit_graph.get_adjacent_room_ids(room_id))
+                    if room is not None
+                ]
+
             room = await self.get_room(room_id)
             if not room or room.x is None or room.y is None:
                 return []
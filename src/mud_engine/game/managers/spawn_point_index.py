@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""스폰 포인트 인덱스 모듈
+
+spawn_points 테이블을 서버 시작 시 한 번 읽어 방/셀(x, y)/템플릿 기준으로 메모리에 유지한다.
+각 스폰 포인트의 현재 생존 수는 MonsterRegistry의 셀/템플릿 카운터를 그대로 사용하며,
+카운터가 바뀔 때마다 refresh()로 해당 셀/템플릿의 포인트만 다시 판정해
+정원 미달(생존 수 < max_count) 포인트 집합을 유지한다.
+스폰 주기는 이 집합만 훑으므로 정원이 찬 포인트는 방/몬스터 조회 없이 건너뛴다.
+DB 기록은 MonsterManager가 MonsterRepository를 통해 수행하고, 변경 후 put()/remove()로 갱신한다.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .room_index import Coordinate
+
+logger = logging.getLogger(__name__)
+
+# 스폰 포인트 키: (방 ID, 몬스터 템플릿 ID)
+SpawnPointKey = Tuple[str, str]
+# 좌표/템플릿별 생존 수 조회 함수 (x, y, 템플릿 ID) -> 생존 수
+LiveCounter = Callable[[int, int, str], int]
+_KeySet = Dict[SpawnPointKey, None]
+
+
+@dataclass
+class SpawnPoint:
+    """방 하나의 몬스터 템플릿 스폰 설정"""
+    room_id: str
+    x: int
+    y: int
+    monster_template_id: str
+    max_count: int = 1
+    spawn_chance: float = 1.0
+
+    @property
+    def key(self) -> SpawnPointKey:
+        return self.room_id, self.monster_template_id
+
+    @property
+    def cell(self) -> Coordinate:
+        return self.x, self.y
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SpawnPoint':
+        return cls(
+            room_id=data['room_id'],
+            x=data['x'],
+            y=data['y'],
+            monster_template_id=data['monster_template_id'],
+            max_count=data.get('max_count', 1),
+            spawn_chance=data.get('spawn_chance', 1.0),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'room_id': self.room_id,
+            'x': self.x,
+            'y': self.y,
+            'monster_template_id': self.monster_template_id,
+            'max_count': self.max_count,
+            'spawn_chance': self.spawn_chance,
+        }
+
+    def to_config(self) -> Dict[str, Any]:
+        """기존 스폰 설정 딕셔너리 형식 (get_spawn_points 등의 반환값)"""
+        return {
+            'monster_template_id': self.monster_template_id,
+            'max_count': self.max_count,
+            'spawn_chance': self.spawn_chance,
+        }
+
+
+class SpawnPointIndex:
+    """스폰 포인트 인메모리 인덱스 (방/셀/템플릿 및 정원 미달 집합)"""
+
+    def __init__(self) -> None:
+        self._by_key: Dict[SpawnPointKey, SpawnPoint] = {}
+        self._by_room: Dict[str, _KeySet] = {}
+        self._by_cell: Dict[Coordinate, _KeySet] = {}
+        self._by_template: Dict[str, _KeySet] = {}
+        self._under_populated: _KeySet = {}
+        self._live_counter: Optional[LiveCounter] = None
+        self._loaded: bool = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """인덱스 적재 여부"""
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def load(self, points: Iterable[SpawnPoint], live_counter: LiveCounter) -> None:
+        """전체 스폰 포인트로 인덱스를 재구성하고 정원 미달 여부를 판정합니다."""
+        self._by_key.clear()
+        self._by_room.clear()
+        self._by_cell.clear()
+        self._by_template.clear()
+        self._under_populated.clear()
+        self._live_counter = live_counter
+        for point in points:
+            self.put(point)
+        self._loaded = True
+        logger.info(f"스폰 포인트 인덱스 적재 완료: {len(self._by_key)}개 "
+                    f"(정원 미달 {len(self._under_populated)}개)")
+
+    def put(self, point: SpawnPoint) -> None:
+        """스폰 포인트를 추가하거나 같은 방/템플릿의 기존 설정을 대체합니다."""
+        self.remove(*point.key)
+        key = point.key
+        self._by_key[key] = point
+        self._by_room.setdefault(point.room_id, {})[key] = None
+        self._by_cell.setdefault(point.cell, {})[key] = None
+        self._by_template.setdefault(point.monster_template_id, {})[key] = None
+        self._judge(point)
+
+    def remove(self, room_id: str, monster_template_id: str) -> Optional[SpawnPoint]:
+        """스폰 포인트를 인덱스에서 제거합니다."""
+        key = (room_id, monster_template_id)
+        point = self._by_key.pop(key, None)
+        if point is None:
+            return None
+        _discard(self._by_room, point.room_id, key)
+        _discard(self._by_cell, point.cell, key)
+        _discard(self._by_template, point.monster_template_id, key)
+        self._under_populated.pop(key, None)
+        return point
+
+    # === 생존 수 ===
+
+    def refresh(self, cell: Coordinate, monster_template_id: str) -> None:
+        """셀/템플릿의 생존 수가 바뀌었을 때 해당 포인트들의 정원 미달 여부를 다시 판정합니다."""
+        keys = self._by_cell.get(cell)
+        if not keys:
+            return
+        for key in keys:
+            if key[1] == monster_template_id:
+                self._judge(self._by_key[key])
+
+    def refresh_all(self) -> None:
+        """모든 포인트의 정원 미달 여부를 다시 판정합니다 (몬스터 레지스트리 재적재 후)."""
+        for point in self._by_key.values():
+            self._judge(point)
+
+    def live_count(self, point: SpawnPoint) -> int:
+        """스폰 포인트 셀의 해당 템플릿 생존 수"""
+        if self._live_counter is None:
+            return 0
+        return self._live_counter(point.x, point.y, point.monster_template_id)
+
+    def _judge(self, point: SpawnPoint) -> None:
+        if self.live_count(point) < point.max_count:
+            self._under_populated[point.key] = None
+        else:
+            self._under_populated.pop(point.key, None)
+
+    # === 조회 ===
+
+    def get(self, room_id: str, monster_template_id: str) -> Optional[SpawnPoint]:
+        """방/템플릿으로 조회"""
+        return self._by_key.get((room_id, monster_template_id))
+
+    def all_points(self) -> List[SpawnPoint]:
+        """모든 스폰 포인트"""
+        return list(self._by_key.values())
+
+    def get_by_room(self, room_id: str) -> List[SpawnPoint]:
+        """방의 스폰 포인트 목록"""
+        return [self._by_key[key] for key in self._by_room.get(room_id, ())]
+
+    def get_at(self, x: int, y: int) -> List[SpawnPoint]:
+        """셀의 스폰 포인트 목록"""
+        return [self._by_key[key] for key in self._by_cell.get((x, y), ())]
+
+    def get_by_template(self, monster_template_id: str) -> List[SpawnPoint]:
+        """템플릿의 스폰 포인트 목록"""
+        return [self._by_key[key] for key in self._by_template.get(monster_template_id, ())]
+
+    def under_populated(self) -> List[SpawnPoint]:
+        """생존 수가 max_count보다 적은 스폰 포인트 목록"""
+        return [self._by_key[key] for key in self._under_populated]
+
+    def room_ids(self) -> List[str]:
+        """스폰 포인트가 있는 방 ID 목록"""
+        return list(self._by_room)
+
+
+def _discard(index: Dict, key, member: SpawnPointKey) -> None:
+    members = index.get(key)
+    if members is not None:
+        members.pop(member, None)
+        if not members:
+            del index[key]
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """세계 관리자 모듈 - 통합 인터페이스"""
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..repositories import RoomRepository, GameObjectRepository, MonsterRepository
 from ..models import Room, GameObject
@@ -10,6 +10,8 @@ from ..monster import Monster
 from .room_manager import RoomManager
 from .object_manager import ObjectManager
 from .monster_manager import MonsterManager
+from .spawn_point_index import SpawnPoint
+from .exit_graph import ExitGraph
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,24 @@ class WorldManager:
         self._monster_manager.set_game_engine(game_engine)
         logger.debug("WorldManager에 GameEngine 참조 설정됨")
 
+    async def initialize_room_index(self) -> int:
+        """방 공간 인덱스를 적재합니다."""
+        count = await self._room_manager.load_spatial_index()
+        logger.info(f"WorldManager 방 공간 인덱스 초기화 완료: {count}개 방")
+        return count
+
+    async def initialize_monster_registry(self) -> int:
+        """몬스터 레지스트리를 적재합니다."""
+        count = await self._monster_manager.load_registry()
+        logger.info(f"WorldManager 몬스터 레지스트리 초기화 완료: {count}마리")
+        return count
+
+    async def initialize_spawn_points(self) -> int:
+        """스폰 포인트 인덱스를 적재합니다."""
+        count = await self._monster_manager.load_spawn_points()
+        logger.info(f"WorldManager 스폰 포인트 인덱스 초기화 완료: {count}개")
+        return count
+
     async def initialize_templates(self) -> None:
         """템플릿을 초기화합니다."""
         await self._monster_manager.initialize_templates()
@@ -67,6 +87,21 @@ class WorldManager:
     async def remove_room_exit(self, room_id: str, direction: str) -> bool:
         return await self._room_manager.remove_room_exit(room_id, direction)
 
+    async def get_room_exit(self, room_id: str, direction: str) -> Optional[str]:
+        """미리 계산된 출구 그래프에서 특정 방향의 목적지 방 ID 조회"""
+        return await self._room_manager.get_room_exit(room_id, direction)
+
+    async def get_coordinate_based_exits(self, room_id: str) -> Dict[str, str]:
+        return await self._room_manager.get_coordinate_based_exits(room_id)
+
+    async def get_enter_connection(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        return await self._room_manager.get_enter_connection(x, y)
+
+    @property
+    def exit_graph(self) -> ExitGraph:
+        """출구 그래프"""
+        return self._room_manager.exit_graph
+
     # === 좌표 기반 방 관리 ===
 
     async def get_room_at_coordinates(self, x: int, y: int) -> Optional[Room]:
@@ -169,6 +204,9 @@ class WorldManager:
     async def stop_spawn_scheduler(self) -> None:
         return await self._monster_manager.stop_spawn_scheduler()
 
+    async def run_spawn_cycle(self) -> None:
+        return await self._monster_manager.run_spawn_cycle()
+
     async def add_spawn_point(self, room_id: str, monster_template_id: str, max_count: int = 1, spawn_chance: float = 1.0) -> None:
         return await self._monster_manager.add_spawn_point(room_id, monster_template_id, max_count, spawn_chance, self._room_manager)
 
@@ -181,6 +219,9 @@ class WorldManager:
     async def get_room_spawn_points(self, room_id: str) -> List[Dict[str, Any]]:
         return await self._monster_manager.get_room_spawn_points(room_id)
 
+    async def get_template_spawn_points(self, monster_template_id: str) -> List[SpawnPoint]:
+        return await self._monster_manager.get_template_spawn_points(monster_template_id)
+
     async def clear_spawn_points(self, room_id: Optional[str] = None) -> None:
         return await self._monster_manager.clear_spawn_points(room_id)
 
@@ -209,6 +250,14 @@ class WorldManager:
         """특정 좌표에 있는 몬스터들을 조회합니다."""
         return await self._monster_manager.get_monsters_at_coordinates(x, y)
 
+    async def get_aggressive_monsters_at_coordinates(self, x: int, y: int) -> List[Monster]:
+        """특정 좌표에 있는 살아있는 선공형 몬스터들을 조회합니다."""
+        return await self._monster_manager.get_aggressive_monsters_at_coordinates(x, y)
+
+    def set_monster_arrival_listener(self, listener: Optional[Callable[[Monster], None]]) -> None:
+        """선공형 몬스터가 셀에 새로 나타날 때 호출될 리스너를 설정합니다."""
+        self._monster_manager.set_arrival_listener(listener)
+
     # === 위치 추적 및 요약 ===
 
     async def track_object_location(self, object_id: str) -> Optional[Dict[str, Any]]:
@@ -2,7 +2,7 @@
 """몬스터 리포지토리"""
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from ..database.repository import BaseRepository
 from .models import GameObject
@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 class MonsterRepository(BaseRepository):
     """몬스터 리포지토리"""
 
+    cache_entities = True
+
     def get_table_name(self) -> str:
         return "monsters"
 
@@ -49,12 +51,10 @@ class MonsterRepository(BaseRepository):
             from datetime import datetime
             current_time = datetime.now().isoformat()
 
-            db_manager = await self.get_db_manager()
-            await db_manager.execute(
-                "UPDATE monsters SET is_alive = FALSE, last_death_time = ? WHERE id = ?",
-                (current_time, monster_id)
-            )
-            await db_manager.commit()
+            # 엔티티 캐시를 거쳐 기록 (write-behind)
+            updated = await self.update(monster_id, {'is_alive': False, 'last_death_time': current_time})
+            if updated is None:
+                return False
 
             logger.info(f"몬스터 {monster_id} 사망 처리 완료")
             return True
@@ -82,16 +82,11 @@ class MonsterRepository(BaseRepository):
             monster.stats.current_hp = monster.stats.max_hp
             stats_json = json.dumps(monster.stats.to_dict(), ensure_ascii=False)
 
-            db_manager = await self.get_db_manager()
-            await db_manager.execute("""
-                UPDATE monsters
-                SET is_alive = TRUE,
-                    last_death_time = NULL,
-                    stats = ?
-                WHERE id = ?
-            """, (stats_json, monster_id))
-
-            await db_manager.commit()
+            await self.update(monster_id, {
+                'is_alive': True,
+                'last_death_time': None,
+                'stats': stats_json
+            })
 
             logger.info(f"몬스터 {monster_id} 리스폰 완료")
             return True
@@ -112,3 +107,57 @@ class MonsterRepository(BaseRepository):
         except Exception as e:
             logger.error(f"객체 컨테이너 이동 실패 ({object_id} -> {container_id}): {e}")
             raise
+
+    # === 스폰 포인트 (spawn_points 테이블) ===
+
+    async def get_spawn_points(self) -> List[Dict[str, Any]]:
+        """스폰 포인트 전체 조회"""
+        try:
+            db_manager = await self.get_db_manager()
+            rows = await db_manager.fetch_all(
+                "SELECT room_id, x, y, monster_template_id, max_count, spawn_chance "
+                "FROM spawn_points ORDER BY rowid"
+            )
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"스폰 포인트 조회 실패: {e}")
+            raise
+
+    async def save_spawn_point(self, spawn_point: Dict[str, Any]) -> None:
+        """스폰 포인트 저장 (같은 방/템플릿의 기존 설정은 대체)"""
+        try:
+            db_manager = await self.get_db_manager()
+            await db_manager.execute(
+                "INSERT OR REPLACE INTO spawn_points "
+                "(room_id, x, y, monster_template_id, max_count, spawn_chance) VALUES (?, ?, ?, ?, ?, ?)",
+                (spawn_point['room_id'], spawn_point['x'], spawn_point['y'], spawn_point['monster_template_id'],
+                 spawn_point['max_count'], spawn_point['spawn_chance'])
+            )
+            await db_manager.commit()
+        except Exception as e:
+            logger.error(f"스폰 포인트 저장 실패 ({spawn_point.get('room_id')}): {e}")
+            raise
+
+    async def delete_spawn_points(self, room_id: Optional[str] = None,
+                                  monster_template_id: Optional[str] = None) -> int:
+        """스폰 포인트 삭제 (room_id/monster_template_id가 None이면 해당 조건 없이 삭제)"""
+        try:
+            conditions = []
+            params: List[Any] = []
+            if room_id is not None:
+                conditions.append("room_id = ?")
+                params.append(room_id)
+            if monster_template_id is not None:
+                conditions.append("monster_template_id = ?")
+                params.append(monster_template_id)
+            query = "DELETE FROM spawn_points"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+
+            db_manager = await self.get_db_manager()
+            cursor = await db_manager.execute(query, tuple(params))
+            await db_manager.commit()
+            return cursor.rowcount
+        except Exception as e:
+            logger.error(f"스폰 포인트 삭제 실패 ({room_id}, {monster_template_id}): {e}")
+            raise
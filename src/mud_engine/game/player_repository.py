@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class PlayerRepository(BaseRepository[Player]):
     """플레이어 리포지토리"""
 
+    cache_entities = True
+
     def get_table_name(self) -> str:
         return "players"
 
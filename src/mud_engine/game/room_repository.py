@@ -2,7 +2,8 @@
 """방 리포지토리"""
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
 
 from ..database.repository import BaseRepository
 from .models import Room
@@ -13,6 +14,8 @@ logger = logging.getLogger(__name__)
 class RoomRepository(BaseRepository[Room]):
     """방 리포지토리"""
 
+    cache_entities = True
+
     def get_table_name(self) -> str:
         return "rooms"
 
@@ -22,18 +25,9 @@ class RoomRepository(BaseRepository[Room]):
     async def get_room_by_coordinates(self, x: int, y: int) -> Optional[Room]:
         """좌표로 방 조회"""
         try:
-            db_manager = await self.get_db_manager()
-            cursor = await db_manager.execute(
-                "SELECT * FROM rooms WHERE x = ? AND y = ?",
-                (x, y)
-            )
-            row = await cursor.fetchone()
-            if row:
-                # SQLite row를 딕셔너리로 변환
-                columns = [description[0] for description in cursor.description]
-                row_dict = dict(zip(columns, row))
-                return Room.from_dict(row_dict)
-            return None
+            # find_by는 기록 대기 중인 변경을 먼저 기록하고 결과를 엔티티 캐시에 적재
+            rooms = await self.find_by(x=x, y=y)
+            return rooms[0] if rooms else None
         except Exception as e:
             logger.error(f"좌표 기반 방 조회 실패 ({x}, {y}): {e}")
             raise
@@ -53,14 +47,8 @@ class RoomRepository(BaseRepository[Room]):
                 target_x, target_y = calculate_new_coordinates(room.x, room.y, direction)
 
                 # 해당 좌표에 방이 있는지 확인
-                db_manager = await self.get_db_manager()
-                cursor = await db_manager.execute(
-                    "SELECT * FROM rooms WHERE x = ? AND y = ?",
-                    (target_x, target_y)
-                )
-                row = await cursor.fetchone()
-                if row:
-                    connected_room = Room.from_dict(dict(row))
+                connected_room = await self.get_room_by_coordinates(target_x, target_y)
+                if connected_room:
                     connected_rooms.append(connected_room)
 
             return connected_rooms
@@ -68,6 +56,53 @@ class RoomRepository(BaseRepository[Room]):
             logger.error(f"연결된 방 조회 실패 ({room_id}): {e}")
             raise
 
+    async def get_enter_connections(self) -> Dict[Tuple[int, int], Tuple[int, int]]:
+        """enter 연결 전체 조회 (출발 좌표 → 도착 좌표)"""
+        try:
+            db_manager = await self.get_db_manager()
+            rows = await db_manager.fetch_all(
+                "SELECT from_x, from_y, to_x, to_y FROM room_connections ORDER BY rowid"
+            )
+            connections: Dict[Tuple[int, int], Tuple[int, int]] = {}
+            for row in rows:
+                # 같은 출발지에 연결이 여러 개면 먼저 등록된 연결을 사용
+                connections.setdefault((row['from_x'], row['from_y']), (row['to_x'], row['to_y']))
+            return connections
+        except Exception as e:
+            logger.error(f"enter 연결 조회 실패: {e}")
+            raise
+
+    async def add_enter_connection(self, from_x: int, from_y: int, to_x: int, to_y: int) -> None:
+        """enter 연결 추가 (같은 출발지의 기존 연결은 대체)"""
+        try:
+            db_manager = await self.get_db_manager()
+            await db_manager.execute(
+                "DELETE FROM room_connections WHERE from_x = ? AND from_y = ?",
+                (from_x, from_y)
+            )
+            await db_manager.execute(
+                "INSERT INTO room_connections (id, from_x, from_y, to_x, to_y) VALUES (?, ?, ?, ?, ?)",
+                (str(uuid4()), from_x, from_y, to_x, to_y)
+            )
+            await db_manager.commit()
+        except Exception as e:
+            logger.error(f"enter 연결 추가 실패 ({from_x}, {from_y}) -> ({to_x}, {to_y}): {e}")
+            raise
+
+    async def remove_enter_connection(self, from_x: int, from_y: int) -> bool:
+        """enter 연결 제거"""
+        try:
+            db_manager = await self.get_db_manager()
+            cursor = await db_manager.execute(
+                "DELETE FROM room_connections WHERE from_x = ? AND from_y = ?",
+                (from_x, from_y)
+            )
+            await db_manager.commit()
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"enter 연결 제거 실패 ({from_x}, {from_y}): {e}")
+            raise
+
     async def find_rooms_by_name(self, name_pattern: str, locale: str = 'en') -> List[Room]:
         """이름 패턴으로 방 검색 (부분 일치)"""
         try:
@@ -101,14 +136,8 @@ class RoomRepository(BaseRepository[Room]):
                 source_x, source_y = calculate_new_coordinates(target_room.x, target_room.y, direction)
 
                 # 해당 좌표에 방이 있는지 확인
-                db_manager = await self.get_db_manager()
-                cursor = await db_manager.execute(
-                    "SELECT * FROM rooms WHERE x = ? AND y = ?",
-                    (source_x, source_y)
-                )
-                row = await cursor.fetchone()
-                if row:
-                    source_room = Room.from_dict(dict(row))
+                source_room = await self.get_room_by_coordinates(source_x, source_y)
+                if source_room:
                     rooms_with_exits.append(source_room)
 
             return rooms_with_exits
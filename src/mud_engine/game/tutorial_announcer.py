@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """튜토리얼 안내 시스템"""
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING, Dict, Optional
 from datetime import datetime, timedelta
@@ -15,6 +14,8 @@ logger = logging.getLogger(__name__)
 class TutorialAnnouncer:
     """튜토리얼 안내 시스템"""
 
+    CHECK_INTERVAL = 60  # 1분마다 체크
+
     def __init__(self, game_engine: 'GameEngine'):
         self.game_engine = game_engine
         self.last_announcement: Dict[str, datetime] = {}  # 플레이어별 마지막 안내 시간
@@ -29,34 +30,23 @@ class TutorialAnnouncer:
         self.running = True
         logger.info("튜토리얼 안내 시스템 시작")
 
-        # 백그라운드 태스크로 실행
-        asyncio.create_task(self._announcement_loop())
+        # 글로벌 Tick 시스템으로 등록
+        self.game_engine.global_tick_manager.register_system(
+            "tutorial_announce", self._check_and_announce, self.CHECK_INTERVAL, order=200
+        )
 
     async def stop(self):
         """안내 시스템 중지"""
+        if self.running:
+            self.game_engine.global_tick_manager.unregister_system("tutorial_announce")
         self.running = False
         logger.info("튜토리얼 안내 시스템 중지")
 
-    async def _announcement_loop(self):
-        """안내 루프"""
-        while self.running:
-            try:
-                await self._check_and_announce()
-                await asyncio.sleep(60)  # 1분마다 체크
-            except Exception as e:
-                logger.error(f"튜토리얼 안내 루프 오류: {e}")
-                await asyncio.sleep(60)
-
     async def _check_and_announce(self):
         """신입 플레이어 체크 및 안내"""
         try:
             # 마을 광장에 있는 플레이어들 확인
-            town_square_sessions = []
-
-            for session in self.game_engine.session_manager.get_authenticated_sessions():
-                if (session.player and
-                    getattr(session, 'current_room_id', None) == 'town_square'):
-                    town_square_sessions.append(session)
+            town_square_sessions = self.game_engine.session_manager.get_sessions_in_room('town_square')
 
             if not town_square_sessions:
                 return
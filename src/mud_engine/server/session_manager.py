@@ -2,7 +2,7 @@
 """Telnet 전용 세션 관리자"""
 
 import logging
-from typing import Dict, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
 from .telnet_session import TelnetSession
@@ -20,6 +20,10 @@ class SessionManager:
         """SessionManager 초기화"""
         self.sessions = {}
         self.player_sessions = {}  # player_id -> session_id 매핑
+        # room_id -> {session_id: session} (세션의 current_room_id 변경 시 자동 갱신)
+        self._room_occupants: Dict[str, Dict[str, TelnetSession]] = {}
+        # 세션이 방에 들어갈 때 호출될 리스너 (AggroManager의 선공 확인 등)
+        self._room_enter_listener: Optional[Callable[[TelnetSession, str], None]] = None
         logger.info("SessionManager 초기화 완료")
 
     def add_session(self, session: TelnetSession) -> None:
@@ -29,6 +33,8 @@ class SessionManager:
             session: 추가할 세션
         """
         self.sessions[session.session_id] = session
+        session.set_room_change_listener(self._on_session_room_changed)
+        self._index_room(session, session.current_room_id)
         logger.debug(f"세션 추가: {session.session_id}")
 
     def remove_session(self, session_id: str) -> bool:
@@ -52,9 +58,59 @@ class SessionManager:
 
         # 세션 제거
         del self.sessions[session_id]
+        session.set_room_change_listener(None)
+        self._unindex_room(session, session.current_room_id)
         logger.debug(f"세션 제거: {session_id}")
         return True
 
+    # === 방 점유 인덱스 ===
+
+    def set_room_enter_listener(self, listener: Optional[Callable[[TelnetSession, str], None]]) -> None:
+        """관리 중인 세션의 current_room_id가 새 방으로 바뀔 때 호출될 리스너 설정"""
+        self._room_enter_listener = listener
+
+    def _on_session_room_changed(self, session: TelnetSession,
+                                 old_room_id: Optional[str], new_room_id: Optional[str]) -> None:
+        """세션의 current_room_id가 바뀔 때 호출되어 인덱스를 갱신"""
+        self._unindex_room(session, old_room_id)
+        self._index_room(session, new_room_id)
+        if new_room_id and self._room_enter_listener:
+            self._room_enter_listener(session, new_room_id)
+
+    def _index_room(self, session: TelnetSession, room_id: Optional[str]) -> None:
+        if room_id:
+            self._room_occupants.setdefault(room_id, {})[session.session_id] = session
+
+    def _unindex_room(self, session: TelnetSession, room_id: Optional[str]) -> None:
+        if not room_id:
+            return
+        occupants = self._room_occupants.get(room_id)
+        if occupants is None:
+            return
+        occupants.pop(session.session_id, None)
+        if not occupants:
+            del self._room_occupants[room_id]
+
+    def get_sessions_in_room(self, room_id: Optional[str],
+                             authenticated_only: bool = True) -> List[TelnetSession]:
+        """방에 있는 세션 목록 조회 (전체 세션을 순회하지 않음)
+
+        Args:
+            room_id: 방 ID (전투/대화 인스턴스 ID 포함)
+            authenticated_only: 플레이어가 인증된 세션만 반환할지 여부
+
+        Returns:
+            list[TelnetSession]: 방에 있는 세션 목록
+        """
+        if not room_id:
+            return []
+        occupants = self._room_occupants.get(room_id)
+        if not occupants:
+            return []
+        if not authenticated_only:
+            return list(occupants.values())
+        return [s for s in occupants.values() if s.is_authenticated and s.player]
+
     async def authenticate_session(self, session_id: str, player: Player) -> None:
         """세션 인증
 
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Telnet 입력 프로토콜 파서
+
+소켓에서 청크 단위로 읽은 바이트를 받아 IAC 협상, 서브 협상(SB ... SE),
+백스페이스, CR/LF 처리를 작은 상태 머신으로 수행하고 완성된 줄만 돌려준다.
+바이트마다 await 하지 않으므로 연결 수가 많아도 이벤트 루프 부하가 적다.
+"""
+
+from typing import List
+
+# Telnet 명령 바이트
+IAC = 0xFF  # Interpret As Command
+DONT = 0xFE
+DO = 0xFD
+WONT = 0xFC
+WILL = 0xFB
+SB = 0xFA  # 서브 협상 시작
+SE = 0xF0  # 서브 협상 종료
+
+# 제어 문자
+NUL = 0x00
+BACKSPACE = 0x08  # ^H (Ctrl+H)
+LF = 0x0A  # Line Feed (\n)
+CR = 0x0D  # Carriage Return (\r)
+DELETE = 0x7F  # DEL
+
+# 파서 상태
+_DATA = 0  # 일반 데이터
+_COMMAND = 1  # IAC 다음 명령 바이트 대기
+_OPTION = 2  # WILL/WONT/DO/DONT 다음 옵션 바이트 대기
+_SUBNEG = 3  # 서브 협상 데이터 (IAC SE까지 무시)
+_SUBNEG_IAC = 4  # 서브 협상 중 IAC 다음 바이트 대기
+
+
+class TelnetLineParser:
+    """Telnet 바이트 스트림 → 입력 줄 변환기"""
+
+    # 한 줄 최대 길이 (초과분은 버림)
+    MAX_LINE_LENGTH = 4096
+
+    def __init__(self) -> None:
+        self._state: int = _DATA
+        self._buffer = bytearray()
+        self._after_cr: bool = False  # 직전 바이트가 CR이면 뒤따르는 LF/NUL을 무시
+
+    def feed(self, data: bytes) -> List[str]:
+        """
+        수신한 바이트를 처리하고 완성된 줄 목록을 반환합니다.
+
+        Args:
+            data: 소켓에서 읽은 바이트 (줄/명령 경계와 무관)
+
+        Returns:
+            List[str]: 완성된 줄 목록 (앞뒤 공백 제거, 빈 줄은 "")
+        """
+        lines: List[str] = []
+        buffer = self._buffer
+        state = self._state
+
+        for byte_val in data:
+            if state == _DATA:
+                if self._after_cr:
+                    self._after_cr = False
+                    if byte_val in (LF, NUL):
+                        continue
+
+                if byte_val == IAC:
+                    state = _COMMAND
+                elif byte_val in (CR, LF):
+                    lines.append(buffer.decode("utf-8", errors="ignore").strip())
+                    buffer.clear()
+                    self._after_cr = byte_val == CR
+                elif byte_val in (BACKSPACE, DELETE):
+                    if buffer:
+                        # UTF-8 멀티바이트 문자는 연속 바이트까지 한 글자로 지움
+                        while buffer and (buffer.pop() & 0xC0) == 0x80:
+                            pass
+                elif (32 <= byte_val <= 126 or byte_val >= 128) and len(buffer) < self.MAX_LINE_LENGTH:
+                    buffer.append(byte_val)
+
+            elif state == _COMMAND:
+                if byte_val in (WILL, WONT, DO, DONT):
+                    state = _OPTION
+                elif byte_val == SB:
+                    state = _SUBNEG
+                elif byte_val == IAC:
+                    # IAC IAC는 실제 0xFF 바이트 (UTF-8 텍스트에는 나오지 않으므로 무시)
+                    state = _DATA
+                else:
+                    # 2바이트 명령 (NOP, GA 등)
+                    state = _DATA
+
+            elif state == _OPTION:
+                state = _DATA
+
+            elif state == _SUBNEG:
+                if byte_val == IAC:
+                    state = _SUBNEG_IAC
+
+            elif state == _SUBNEG_IAC:
+                state = _DATA if byte_val == SE else _SUBNEG
+
+        self._state = state
+        return lines
+
+    def reset(self) -> None:
+        """파서 상태 초기화 (작성 중인 줄도 버림)"""
+        self._state = _DATA
+        self._buffer.clear()
+        self._after_cr = False
@@ -478,10 +478,13 @@ after suffering a crushing defeat in a war against an enigmatic sorcerer.
         await session.send_info(game_entered_msg)
         await session.send_text("")
 
+        # 프롬프트 표시
+        await session.send_prompt("> ")
+
         while session.is_active():
             try:
-                # 프롬프트 표시
-                await session.send_prompt("> ")
+                # 느린 클라이언트는 출력이 빠질 때까지 다음 입력을 받지 않음 (backpressure)
+                await session.drain_output()
 
                 # 명령어 입력 대기
                 command = await session.read_line(timeout=300.0)
@@ -491,12 +494,12 @@ after suffering a crushing defeat in a war against an enigmatic sorcerer.
                     logger.debug(f"Telnet 세션 {session.session_id}: read_line returned None")
                     break
 
-                # 빈 문자열인 경우 (Telnet 프로토콜 바이트만 있었던 경우) 무시하고 계속
-                if command == "":
-                    continue
-
-                # 명령어 처리
-                await self.handle_game_command(session, command)
+                # 명령어 처리 결과와 다음 프롬프트를 모아 한 번에 전송
+                # 빈 문자열인 경우 (Telnet 프로토콜 바이트만 있었던 경우) 프롬프트만 다시 표시
+                async with session.batch_output():
+                    if command != "":
+                        await self.handle_game_command(session, command)
+                    await session.send_prompt("> ")
 
             except asyncio.CancelledError:
                 logger.info(f"Telnet 세션 {session.session_id} 게임 루프 취소됨")
@@ -504,6 +507,7 @@ after suffering a crushing defeat in a war against an enigmatic sorcerer.
             except Exception as e:
                 logger.error(f"Telnet 세션 {session.session_id} 게임 루프 오류: {e}", exc_info=True)
                 await session.send_error("명령어 처리 중 오류가 발생했습니다.")
+                await session.send_prompt("> ")
 
     async def handle_game_command(self, session: TelnetSession, command: str) -> None:
         """게임 명령어 처리
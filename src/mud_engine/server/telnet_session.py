@@ -4,10 +4,13 @@
 import asyncio
 import logging
 import uuid
-from typing import Optional, Dict, Any
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional, Dict, Any, Deque
 from datetime import datetime
 
 from ..game.models import Player
+from .telnet_protocol import TelnetLineParser
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,17 @@ logger = logging.getLogger(__name__)
 class TelnetSession:
     """Telnet 클라이언트 세션을 관리하는 클래스"""
 
+    # 소켓에서 한 번에 읽을 최대 바이트 수
+    READ_CHUNK_SIZE = 4096
+
+    # 출력 흐름 제어
+    OUTPUT_HIGH_WATER = 64 * 1024  # 전송 대기량이 이보다 크면 세션 루프가 다음 입력 전에 drain
+    OUTPUT_MAX_PENDING = 1024 * 1024  # 전송 대기량이 이보다 크면 멈춘 클라이언트로 보고 연결 종료
+    DRAIN_TIMEOUT = 10.0  # drain 최대 대기 시간 (초)
+
+    # 전체 세션이 전송한 텍스트 메시지 누적 수 (Tick 프로파일러가 시스템별 메시지 수 계산에 사용)
+    messages_sent: int = 0
+
     def __init__(
         self,
         reader: asyncio.StreamReader,
@@ -40,7 +54,11 @@ class TelnetSession:
         self.metadata: Dict[str, Any] = {}
 
         # 게임 관련 속성
-        self.current_room_id: Optional[str] = None
+        # 방 변경 리스너 (SessionManager의 방 점유 인덱스 갱신용, current_room_id setter에서 호출)
+        self._room_change_listener: Optional[
+            Callable[["TelnetSession", Optional[str], Optional[str]], None]
+        ] = None
+        self._current_room_id: Optional[str] = None
         self.current_room_type: str = "unknown"  # 현재 방 유형
         self.locale: str = "en"  # 기본 언어 설정
         self.game_engine: Optional[Any] = None  # GameEngine 참조
@@ -64,6 +82,16 @@ class TelnetSession:
         self.terminal_width: int = 80  # 터미널 너비
         self.terminal_height: int = 24  # 터미널 높이
 
+        # 입력 파서 (청크 단위로 읽은 바이트 → 완성된 줄)
+        self._line_parser = TelnetLineParser()
+        self._pending_lines: Deque[str] = deque()
+        self._input_closed: bool = False  # 클라이언트가 입력 스트림을 닫았는지 여부
+
+        # 출력 버퍼 (같은 명령/이벤트 루프 반복 중에 만든 출력을 모아 한 번에 write)
+        self._output = bytearray()
+        self._output_batch_depth: int = 0
+        self._flush_scheduled: bool = False
+
         # IP 주소 추출
         peername = writer.get_extra_info("peername")
         if peername:
@@ -76,6 +104,24 @@ class TelnetSession:
         )
         logger.info(f"새 Telnet 세션 생성: {short_session_id} (IP: {self.ip_address})")
 
+    @property
+    def current_room_id(self) -> Optional[str]:
+        """현재 방 ID (전투/대화 인스턴스 ID 포함)"""
+        return self._current_room_id
+
+    @current_room_id.setter
+    def current_room_id(self, room_id: Optional[str]) -> None:
+        previous = self._current_room_id
+        self._current_room_id = room_id
+        if previous != room_id and self._room_change_listener is not None:
+            self._room_change_listener(self, previous, room_id)
+
+    def set_room_change_listener(
+        self, listener: Optional[Callable[["TelnetSession", Optional[str], Optional[str]], None]]
+    ) -> None:
+        """current_room_id 변경 시 호출할 리스너 설정 (None이면 해제)"""
+        self._room_change_listener = listener
+
     async def initialize_telnet(self) -> None:
         """
         Telnet 프로토콜 초기화 및 협상
@@ -97,10 +143,10 @@ class TelnetSession:
 
         try:
             # 서버 옵션 전송
-            self.writer.write(IAC + WILL + SUPPRESS_GO_AHEAD)
-            self.writer.write(IAC + WONT + ECHO)  # 기본적으로 클라이언트가 에코
-            self.writer.write(IAC + DONT + LINEMODE)
-            await self.writer.drain()
+            self._queue_output(IAC + WILL + SUPPRESS_GO_AHEAD)
+            self._queue_output(IAC + WONT + ECHO)  # 기본적으로 클라이언트가 에코
+            self._queue_output(IAC + DONT + LINEMODE)
+            await self.drain_output()
         except Exception as e:
             logger.debug(f"Telnet 프로토콜 협상 오류 (무시됨): {e}")
 
@@ -148,14 +194,14 @@ class TelnetSession:
             # 디버깅: 전송되는 메시지 타입 확인
             msg_type = message.get("type", "")
             # print(f"DEBUG: send_message called with type: {msg_type}")
-            logger.info(f"send_message called with type: {msg_type}")
+            logger.debug(f"send_message called with type: {msg_type}")
 
             if msg_type == "room_info":
                 # print(f"DEBUG: room_info message detected!")
-                logger.info(f"room_info message detected!")
+                logger.debug(f"room_info message detected!")
                 entity_map = message.get("entity_map", {})
                 # print(f"DEBUG: entity_map in room_info: {entity_map is not None}")
-                logger.info(f"entity_map in room_info: {entity_map is not None}")
+                logger.debug(f"entity_map in room_info: {entity_map is not None}")
 
             # 메시지 타입에 따라 적절한 포맷으로 변환
             text = self._format_message(message)
@@ -525,14 +571,14 @@ class TelnetSession:
                 logger.warning(f"Telnet 세션 {short_session_id}: 연결이 이미 닫혀있음")
                 return False
 
-            # 텍스트 인코딩 및 전송
+            # 텍스트 인코딩 후 출력 버퍼에 추가 (전송은 _flush_output에서 한 번에)
             text = text.replace("\r", "\n").replace("\n\n", "\n")  # 중간에 들어간 행변환 처리
             if newline:
                 text += "\n"
                 # text += "\r\n"
 
-            self.writer.write(text.encode("utf-8"))
-            await self.writer.drain()
+            self._queue_output(text.encode("utf-8"))
+            TelnetSession.messages_sent += 1
             self.update_activity()
             return True
 
@@ -635,8 +681,8 @@ class TelnetSession:
 
         try:
             # 서버가 에코를 처리하겠다고 알림 (클라이언트 에코 비활성화)
-            self.writer.write(IAC + WILL + ECHO)
-            await self.writer.drain()
+            self._queue_output(IAC + WILL + ECHO)
+            await self.drain_output()
         except Exception as e:
             logger.debug(f"에코 비활성화 오류 (무시됨): {e}")
 
@@ -650,11 +696,87 @@ class TelnetSession:
 
         try:
             # 서버가 에코를 처리하지 않겠다고 알림 (클라이언트 에코 활성화)
-            self.writer.write(IAC + WONT + ECHO)
-            await self.writer.drain()
+            self._queue_output(IAC + WONT + ECHO)
+            await self.drain_output()
         except Exception as e:
             logger.debug(f"에코 활성화 오류 (무시됨): {e}")
 
+    # === 출력 버퍼 ===
+
+    def _queue_output(self, data: bytes) -> None:
+        """출력 버퍼에 추가 (배치 중이 아니면 현재 이벤트 루프 반복이 끝난 뒤 한 번에 전송)"""
+        self._output += data
+        if self._output_batch_depth == 0 and not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_output)
+
+    def _flush_output(self) -> None:
+        """
+        출력 버퍼를 transport에 한 번에 기록
+
+        write는 블로킹하지 않으므로 브로드캐스트 루프에서 호출돼도 느린 클라이언트를 기다리지 않습니다.
+        전송 대기량이 OUTPUT_MAX_PENDING을 넘으면 멈춘 클라이언트로 보고 연결을 끊습니다.
+        """
+        self._flush_scheduled = False
+        if not self._output:
+            return
+
+        data = bytes(self._output)
+        self._output.clear()
+        if self.writer.is_closing():
+            return
+
+        try:
+            self.writer.write(data)
+            pending = self.writer.transport.get_write_buffer_size()
+        except Exception as e:
+            logger.error(f"Telnet 세션 {self.session_id} 출력 전송 실패: {e}")
+            return
+
+        if pending > self.OUTPUT_MAX_PENDING:
+            logger.warning(
+                f"Telnet 세션 {self.session_id}: 전송 대기량 초과 ({pending} bytes), 연결 종료"
+            )
+            self.writer.transport.abort()
+
+    @asynccontextmanager
+    async def batch_output(self) -> AsyncIterator[None]:
+        """
+        블록 안에서 만든 출력을 모아 블록 종료 시 한 번에 전송
+
+        사용 예:
+            async with session.batch_output():
+                await session.send_message(...)
+                await session.send_prompt()
+        """
+        self._output_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._output_batch_depth -= 1
+            if self._output_batch_depth == 0:
+                self._flush_output()
+
+    async def drain_output(self) -> None:
+        """
+        출력 버퍼를 전송하고, 전송 대기량이 OUTPUT_HIGH_WATER를 넘으면 줄어들 때까지 대기
+
+        브로드캐스트가 느린 클라이언트에 막히지 않도록 세션 자신의 루프에서만 호출합니다.
+        """
+        self._flush_output()
+        if self.writer.is_closing():
+            return
+
+        try:
+            if self.writer.transport.get_write_buffer_size() <= self.OUTPUT_HIGH_WATER:
+                return
+            async with asyncio.timeout(self.DRAIN_TIMEOUT):
+                await self.writer.drain()
+        except TimeoutError:
+            logger.warning(f"Telnet 세션 {self.session_id}: 출력 drain 타임아웃")
+        except Exception as e:
+            logger.debug(f"Telnet 세션 {self.session_id} 출력 drain 오류 (무시됨): {e}")
+
     def _filter_telnet_commands(self, data: bytes) -> bytes:
         """
         Telnet 프로토콜 명령어를 필터링
@@ -704,112 +826,48 @@ class TelnetSession:
         """
         클라이언트로부터 한 줄 읽기 (백스페이스 처리 포함)
 
+        소켓에서 청크 단위로 읽어 TelnetLineParser로 줄을 만들며,
+        한 번에 여러 줄이 도착하면 남은 줄은 다음 호출에서 바로 반환합니다.
+
         Args:
             timeout: 타임아웃 시간 (초)
 
         Returns:
             Optional[str]: 읽은 문자열 (타임아웃 또는 연결 종료 시 None, 빈 줄은 "")
         """
-        # 백스페이스 및 제어 문자
-        BACKSPACE = 0x08  # ^H (Ctrl+H)
-        DELETE = 0x7F  # DEL
-        CR = 0x0D  # Carriage Return (\r)
-        LF = 0x0A  # Line Feed (\n)
-        IAC = 0xFF  # Telnet IAC
-
-        buffer = bytearray()
-        start_time = asyncio.get_event_loop().time() if timeout else None
-
         try:
-            while True:
-                # 타임아웃 체크
-                if timeout and start_time:
-                    elapsed = asyncio.get_event_loop().time() - start_time
-                    if elapsed >= timeout:
-                        logger.debug(f"Telnet 세션 {self.session_id} 읽기 타임아웃")
-                        return None
-                    remaining = timeout - elapsed
-                else:
-                    remaining = None
-
-                # 1바이트씩 읽기
-                try:
-                    if remaining:
-                        byte_data = await asyncio.wait_for(
-                            self.reader.read(1), timeout=remaining
-                        )
-                    else:
-                        byte_data = await self.reader.read(1)
-                except asyncio.TimeoutError:
-                    logger.debug(f"Telnet 세션 {self.session_id} 읽기 타임아웃")
-                    return None
-
-                # 연결 종료 확인
-                if not byte_data:
-                    logger.debug(f"Telnet 세션 {self.session_id}: 연결 종료 감지")
+            if not self._pending_lines:
+                if self._input_closed:
                     return None
+                if timeout:
+                    async with asyncio.timeout(timeout):
+                        await self._fill_pending_lines()
+                else:
+                    await self._fill_pending_lines()
 
-                byte_val = byte_data[0]
+            if not self._pending_lines:
+                return None
 
-                # Telnet IAC 명령어 처리
-                if byte_val == IAC:
-                    # IAC 명령어 시퀀스 읽기 (최대 2바이트 더)
-                    try:
-                        cmd_byte = await asyncio.wait_for(
-                            self.reader.read(1), timeout=0.1
-                        )
-                        if cmd_byte:
-                            cmd = cmd_byte[0]
-                            # DO, DONT, WILL, WONT는 3바이트 명령어
-                            if cmd in (251, 252, 253, 254):  # WILL, WONT, DO, DONT
-                                await asyncio.wait_for(self.reader.read(1), timeout=0.1)
-                    except asyncio.TimeoutError:
-                        pass
-                    continue
-
-                # 백스페이스 처리
-                if byte_val in (BACKSPACE, DELETE):
-                    if len(buffer) > 0:
-                        buffer.pop()
-                        # 클라이언트에 백스페이스 에코 (선택사항)
-                        # await self.send_text("\b \b", newline=False)
-                    continue
-
-                # 줄바꿈 처리
-                if byte_val in (CR, LF):
-                    # CR+LF 또는 LF만 처리
-                    if byte_val == CR:
-                        # 다음 바이트가 LF인지 확인 (peek)
-                        try:
-                            next_byte = await asyncio.wait_for(
-                                self.reader.read(1), timeout=0.05
-                            )
-                            if next_byte and next_byte[0] != LF:
-                                # LF가 아니면 다시 버퍼에 넣어야 하지만 불가능하므로 무시
-                                pass
-                        except asyncio.TimeoutError:
-                            pass
-
-                    # 입력 완료
-                    break
-
-                # 일반 문자 추가
-                if 32 <= byte_val <= 126 or byte_val >= 128:  # 출력 가능한 문자
-                    buffer.append(byte_val)
-
-            # 디코딩
-            try:
-                decoded_line = buffer.decode("utf-8", errors="ignore").strip()
-                self.update_activity()
-                return decoded_line
-            except Exception as e:
-                logger.warning(f"Telnet 세션 {self.session_id} 디코딩 오류: {e}")
-                return ""
+            self.update_activity()
+            return self._pending_lines.popleft()
 
+        except TimeoutError:
+            logger.debug(f"Telnet 세션 {self.session_id} 읽기 타임아웃")
+            return None
         except Exception as e:
             logger.error(f"Telnet 세션 {self.session_id} 읽기 오류: {e}")
             return None
 
+    async def _fill_pending_lines(self) -> None:
+        """완성된 줄이 하나 이상 생기거나 연결이 끊길 때까지 읽기"""
+        while not self._pending_lines:
+            data = await self.reader.read(self.READ_CHUNK_SIZE)
+            if not data:
+                logger.debug(f"Telnet 세션 {self.session_id}: 연결 종료 감지")
+                self._input_closed = True
+                return
+            self._pending_lines.extend(self._line_parser.feed(data))
+
     async def close(self, message: str = "Connection closed") -> None:
         """
         Telnet 연결 종료
@@ -820,6 +878,7 @@ class TelnetSession:
         try:
             if not self.writer.is_closing():
                 await self.send_text(f"\r\n{message}\r\n")
+                self._flush_output()
                 self.writer.close()
                 await self.writer.wait_closed()
                 short_session_id = (
@@ -2,7 +2,7 @@
 """좌표 관련 유틸리티 함수들"""
 
 from enum import Enum
-from typing import Tuple, Optional
+from typing import Callable, Dict, Iterable, Tuple, Optional
 from dataclasses import dataclass
 
 class Direction(Enum):
@@ -13,6 +13,51 @@ class Direction(Enum):
     WEST = "west"
 
 
+# 방향별 좌표 변화량 (북쪽이 y+1)
+DIRECTION_OFFSETS: Dict[str, Tuple[int, int]] = {
+    Direction.NORTH.value: (0, 1),
+    Direction.SOUTH.value: (0, -1),
+    Direction.EAST.value: (1, 0),
+    Direction.WEST.value: (-1, 0),
+}
+
+ENTER_EXIT = "enter"
+
+
+def compute_coordinate_exits(x: int, y: int, room_id_at: Callable[[int, int], Optional[str]],
+                             blocked_exits: Optional[Iterable[str]] = None,
+                             enter_target: Optional[Tuple[int, int]] = None) -> Dict[str, str]:
+    """
+    좌표 기반 출구 계산 (enter 연결 포함)
+
+    Args:
+        x: 방 X 좌표
+        y: 방 Y 좌표
+        room_id_at: 좌표 → 방 ID 조회 함수 (방이 없으면 None)
+        blocked_exits: 막힌 방향 목록
+        enter_target: enter 연결 목적지 좌표
+
+    Returns:
+        방향 → 목적지 방 ID 딕셔너리
+    """
+    exits: Dict[str, str] = {}
+    blocked = set(blocked_exits) if blocked_exits else set()
+
+    for direction, (dx, dy) in DIRECTION_OFFSETS.items():
+        if direction in blocked:
+            continue
+        target_room_id = room_id_at(x + dx, y + dy)
+        if target_room_id:
+            exits[direction] = target_room_id
+
+    if enter_target is not None:
+        target_room_id = room_id_at(enter_target[0], enter_target[1])
+        if target_room_id:
+            exits[ENTER_EXIT] = target_room_id
+
+    return exits
+
+
 def get_direction_from_string(direction_str: str) -> Optional[Direction]:
     """
     문자열을 Direction 열거형으로 변환
@@ -8,7 +8,7 @@ from typing import Dict, List, Tuple, Optional, Any, cast
 from pathlib import Path
 
 from ..database.connection import DatabaseManager
-from .coordinate_utils import Direction, calculate_new_coordinates
+from .coordinate_utils import compute_coordinate_exits
 
 logger = logging.getLogger(__name__)
 
@@ -16,25 +16,25 @@ logger = logging.getLogger(__name__)
 class MapExporter:
     """월드 맵 HTML 생성기"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, exit_graph: Optional[Any] = None):
         """
         MapExporter 초기화
 
         Args:
             db_manager: 데이터베이스 매니저 인스턴스
+            exit_graph: 게임 서버의 출구 그래프 (있으면 출구를 다시 계산하지 않음)
         """
         self.db_manager = db_manager
+        self.exit_graph = exit_graph
 
     async def get_all_rooms(self) -> List[Tuple[Any, ...]]:
         """모든 방 정보 가져오기"""
-        cursor = await self.db_manager.execute("""
+        return await self.db_manager.fetch_rows("""
             SELECT id, description_ko, description_en, x, y, blocked_exits
             FROM rooms
             WHERE x IS NOT NULL AND y IS NOT NULL
             ORDER BY x, y
         """)
-        result = await cursor.fetchall()
-        return [tuple(row) for row in result]
 
     async def get_monsters_by_room(self) -> Dict[str, int]:
         """방별 몬스터 수 가져오기 (하위 호환성을 위한 메서드)"""
@@ -55,7 +55,7 @@ class MapExporter:
         entities_by_room: Dict[str, Dict[str, Dict[str, int]]] = {}
 
         # monsters 테이블에서 가져오기
-        cursor = await self.db_manager.execute("""
+        monsters_result = await self.db_manager.fetch_rows("""
             SELECT r.id, m.faction_id, COUNT(*) as count
             FROM rooms r
             INNER JOIN monsters m ON (r.x = m.x AND r.y = m.y)
@@ -63,7 +63,6 @@ class MapExporter:
             AND m.x IS NOT NULL AND m.y IS NOT NULL
             GROUP BY r.id, m.faction_id
         """)
-        monsters_result = await cursor.fetchall()
 
         for room_id, faction_id, count in monsters_result:
             if room_id not in entities_by_room:
@@ -87,7 +86,7 @@ class MapExporter:
         }
 
     async def get_factions_by_room(self) -> Dict[str, Dict[str, int]]:
-        cursor = await self.db_manager.execute("""
+        result = await self.db_manager.fetch_rows("""
             SELECT r.id, m.faction_id, COUNT(*) as count
             FROM rooms r
             INNER JOIN monsters m ON (r.x = m.x AND r.y = m.y)
@@ -95,7 +94,6 @@ class MapExporter:
             AND m.x IS NOT NULL AND m.y IS NOT NULL
             GROUP BY r.id, m.faction_id
         """)
-        result = await cursor.fetchall()
 
         # 방별 종족 카운트 딕셔너리 생성
         factions_by_room: Dict[str, Dict[str, int]] = {}
@@ -108,58 +106,52 @@ class MapExporter:
 
     async def get_players_by_room(self) -> Dict[str, int]:
         """방별 플레이어 수 가져오기 (좌표 기반)"""
-        cursor = await self.db_manager.execute("""
+        result = await self.db_manager.fetch_rows("""
             SELECT r.id, COUNT(*) as count
             FROM players p
             INNER JOIN rooms r ON (p.last_room_x = r.x AND p.last_room_y = r.y)
             GROUP BY r.id
         """)
-        result = await cursor.fetchall()
         return {row[0]: row[1] for row in result}
 
 
     async def get_faction_relations(self) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
         """종족 관계 정보 가져오기"""
         # 종족 정보
-        cursor = await self.db_manager.execute("""
+        factions_result = await self.db_manager.fetch_rows("""
             SELECT id, name_ko, name_en
             FROM factions
             ORDER BY id
         """)
-        factions_result = await cursor.fetchall()
 
         # 종족 관계
-        cursor = await self.db_manager.execute("""
+        relations_result = await self.db_manager.fetch_rows("""
             SELECT faction_a_id, faction_b_id, relation_value, relation_status
             FROM faction_relations
             WHERE faction_a_id = 'ash_knights'
             ORDER BY faction_b_id
         """)
-        relations_result = await cursor.fetchall()
 
-        return [tuple(row) for row in factions_result], [tuple(row) for row in relations_result]
+        return factions_result, relations_result
 
     async def get_all_players(self) -> List[Tuple[Any, ...]]:
         """모든 플레이어 정보 가져오기 (좌표 기반)"""
-        cursor = await self.db_manager.execute("""
+        return await self.db_manager.fetch_rows("""
             SELECT p.username, p.last_room_x, p.last_room_y, p.is_admin, p.created_at, p.last_login
             FROM players p
             ORDER BY p.username
         """)
-        result = await cursor.fetchall()
-        return [tuple(row) for row in result]
 
     async def get_room_details(self) -> Dict[str, Dict[str, Any]]:
         """모든 방의 상세 정보를 가져오기 (클릭 시 표시용)"""
         room_details = {}
 
         # 방 기본 정보
-        cursor = await self.db_manager.execute("""
+        rooms = await self.db_manager.fetch_rows("""
             SELECT id, description_ko, description_en, x, y
             FROM rooms
             WHERE x IS NOT NULL AND y IS NOT NULL
         """)
-        rooms = await cursor.fetchall()
 
         for room in rooms:
             room_id, desc_ko, desc_en, x, y = room
@@ -174,7 +166,7 @@ class MapExporter:
             }
 
         # 모든 생명체 정보 (몬스터/NPC 구분 없이 종족별로)
-        cursor = await self.db_manager.execute("""
+        creatures = await self.db_manager.fetch_rows("""
             SELECT r.id, m.name_ko, m.name_en,
                    COALESCE(
                        json_extract(m.stats, '$.current_hp'),
@@ -191,7 +183,6 @@ class MapExporter:
             WHERE m.is_alive = 1 AND r.x IS NOT NULL AND r.y IS NOT NULL
             ORDER BY r.id, m.faction_id, m.name_ko
         """)
-        creatures = await cursor.fetchall()
 
         for creature in creatures:
             room_id, name_ko, name_en, current_hp, max_hp, faction_id = creature
@@ -204,13 +195,12 @@ class MapExporter:
                 })
 
         # 플레이어 정보 (좌표 기반)
-        cursor = await self.db_manager.execute("""
+        players = await self.db_manager.fetch_rows("""
             SELECT r.id, p.username, p.is_admin
             FROM players p
             INNER JOIN rooms r ON (p.last_room_x = r.x AND p.last_room_y = r.y)
             ORDER BY p.username
         """)
-        players = await cursor.fetchall()
 
         for player in players:
             room_id, username, is_admin = player
@@ -221,7 +211,7 @@ class MapExporter:
                 })
 
         # 아이템 정보 (게임 오브젝트에서)
-        cursor = await self.db_manager.execute("""
+        items = await self.db_manager.fetch_rows("""
             SELECT r.id, go.name_ko, go.name_en
             FROM rooms r
             INNER JOIN game_objects go ON (r.id = go.location_id)
@@ -229,7 +219,6 @@ class MapExporter:
             AND r.x IS NOT NULL AND r.y IS NOT NULL
             ORDER BY r.id, go.name_ko
         """)
-        items = await cursor.fetchall()
 
         for item in items:
             room_id, name_ko, name_en = item
@@ -241,13 +230,12 @@ class MapExporter:
                 })
 
         # enter 연결 정보 추가
-        cursor = await self.db_manager.execute("""
+        enter_connections = await self.db_manager.fetch_rows("""
             SELECT r.id, rc.to_x, rc.to_y
             FROM rooms r
             INNER JOIN room_connections rc ON (r.x = rc.from_x AND r.y = rc.from_y)
             WHERE r.x IS NOT NULL AND r.y IS NOT NULL
         """)
-        enter_connections = await cursor.fetchall()
 
         for connection in enter_connections:
             room_id, to_x, to_y = connection
@@ -263,33 +251,13 @@ class MapExporter:
 
     def calculate_coordinate_based_exits(self, x: int, y: int, all_rooms_coords: Dict[Tuple[int, int], str], enter_connections: Dict[Tuple[int, int], Tuple[int, int]] = None, blocked_exits: List[str] = None) -> Dict[str, str]:
         """좌표 기반으로 출구를 계산합니다 (enter 연결 포함)."""
-        exits = {}
-        blocked = set(blocked_exits) if blocked_exits else set()
-
-        # 모든 방향에 대해 인접한 방이 있는지 확인
-        for direction in Direction:
-            try:
-                if direction.value in blocked:
-                    continue  # 막힌 방향은 건너뜀
-
-                adj_x, adj_y = calculate_new_coordinates(x, y, direction)
-
-                # 해당 좌표에 방이 있는지 확인
-                if (adj_x, adj_y) in all_rooms_coords:
-                    target_room_id = all_rooms_coords[(adj_x, adj_y)]
-                    exits[direction.value] = target_room_id
-            except Exception:
-                # UP, DOWN 등 좌표 변화가 없는 방향은 무시
-                continue
-
-        # enter 연결 확인 (미리 가져온 데이터 사용)
-        if enter_connections and (x, y) in enter_connections:
-            to_x, to_y = enter_connections[(x, y)]
-            if (to_x, to_y) in all_rooms_coords:
-                target_room_id = all_rooms_coords[(to_x, to_y)]
-                exits['enter'] = target_room_id
-
-        return exits
+        # 게임 서버의 출구 그래프와 동일한 계산 함수 사용
+        return compute_coordinate_exits(
+            x, y,
+            lambda cx, cy: all_rooms_coords.get((cx, cy)),
+            blocked_exits=blocked_exits,
+            enter_target=enter_connections.get((x, y)) if enter_connections else None,
+        )
 
     def generate_html_with_factions(self, rooms_data: List[Tuple[Any, ...]], entities_by_room: Dict[str, Dict[str, Dict[str, int]]],
                                    players_by_room: Dict[str, int], factions: List[Tuple[Any, ...]], relations: List[Tuple[Any, ...]],
@@ -333,8 +301,12 @@ class MapExporter:
             if x is not None and y is not None:
                 coord = (x, y)
 
-                # 좌표 기반 출구 계산
-                exits = self.calculate_coordinate_based_exits(coord[0], coord[1], all_rooms_coords, blocked_exits=room_blocked)
+                # 좌표 기반 출구 계산 (출구 그래프가 있으면 미리 계산된 값 사용)
+                if self.exit_graph is not None and self.exit_graph.is_built:
+                    exits = self.exit_graph.get_exits(room_id)
+                else:
+                    exits = self.calculate_coordinate_based_exits(coord[0], coord[1], all_rooms_coords,
+                                                                  enter_connections, blocked_exits=room_blocked)
 
                 # description에서 첫 줄을 이름으로 사용
                 name_ko = desc_ko.split('\n')[0] if desc_ko else room_id
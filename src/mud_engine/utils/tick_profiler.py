@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Tick 시스템 프로파일러
+
+Tick 시스템별 실행 시간, 실행 중 발생한 DB 쿼리 수/전송 메시지 수, tick 지연(drift)을
+고정 버킷 히스토그램으로 누적하고 JSON 또는 Prometheus 텍스트 형식으로 내보낸다.
+쿼리/메시지 수는 전역 카운터의 실행 전후 차이로 계산하므로, 같은 시간에 다른 태스크
+(플레이어 명령 처리 등)가 만든 쿼리/메시지도 함께 집계될 수 있다.
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram과 같은 le 버킷)"""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """값 하나를 기록"""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self._counts[index] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def cumulative(self) -> Dict[str, int]:
+        """le 버킷별 누적 개수 ("+Inf" 포함)"""
+        result: Dict[str, int] = {}
+        total = 0
+        for bound, count in zip(self.buckets, self._counts):
+            total += count
+            result[_format_bound(bound)] = total
+        result["+Inf"] = self.count
+        return result
+
+    def percentile(self, q: float) -> float:
+        """버킷 상한 기준 근사 백분위수 (q: 0~1)"""
+        if not self.count:
+            return 0.0
+        target = math.ceil(q * self.count)
+        total = 0
+        for bound, count in zip(self.buckets, self._counts):
+            total += count
+            if total >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": self.max,
+            "buckets": self.cumulative()
+        }
+
+
+def _format_bound(bound: float) -> str:
+    return str(int(bound)) if float(bound).is_integer() else repr(bound)
+
+
+class TickProfiler:
+    """Tick 시스템별 실행 시간/쿼리 수/메시지 수 및 tick 지연 히스토그램"""
+
+    DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+    COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+    def __init__(self, counters: Optional[Dict[str, Callable[[], int]]] = None) -> None:
+        """
+        TickProfiler 초기화
+
+        Args:
+            counters: 카운터 이름 -> 현재 누적값을 반환하는 함수 (예: DB 쿼리 수, 전송 메시지 수)
+        """
+        self._counters: Dict[str, Callable[[], int]] = dict(counters or {})
+        self._systems: Dict[str, Dict[str, Histogram]] = {}
+        self.tick_drift = Histogram(self.DURATION_BUCKETS)
+
+    def add_counter(self, name: str, getter: Callable[[], int]) -> None:
+        """시스템 실행 전후 차이를 기록할 카운터 추가"""
+        self._counters[name] = getter
+
+    def begin(self) -> Dict[str, int]:
+        """시스템 실행 직전 카운터 값 스냅샷"""
+        snapshot: Dict[str, int] = {}
+        for name, getter in self._counters.items():
+            try:
+                snapshot[name] = getter()
+            except Exception as e:
+                logger.debug(f"프로파일러 카운터 조회 실패 ({name}): {e}")
+        return snapshot
+
+    def record_system(self, name: str, duration: float, snapshot: Optional[Dict[str, int]] = None) -> None:
+        """
+        시스템 1회 실행 결과 기록
+
+        Args:
+            name: 시스템 이름
+            duration: 실행 시간 (초)
+            snapshot: begin()으로 얻은 실행 직전 카운터 값
+        """
+        histograms = self._systems.get(name)
+        if histograms is None:
+            histograms = {"duration_seconds": Histogram(self.DURATION_BUCKETS)}
+            self._systems[name] = histograms
+        histograms["duration_seconds"].observe(duration)
+
+        if not snapshot:
+            return
+        current = self.begin()
+        for counter, before in snapshot.items():
+            if counter not in current:
+                continue
+            histogram = histograms.get(counter)
+            if histogram is None:
+                histogram = histograms[counter] = Histogram(self.COUNT_BUCKETS)
+            histogram.observe(max(0, current[counter] - before))
+
+    def record_drift(self, drift: float) -> None:
+        """예정 시각 대비 tick 시작 지연 기록 (초)"""
+        self.tick_drift.observe(max(0.0, drift))
+
+    def reset(self) -> None:
+        """누적된 히스토그램 초기화"""
+        self._systems.clear()
+        self.tick_drift = Histogram(self.DURATION_BUCKETS)
+
+    # === 내보내기 ===
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 딕셔너리"""
+        return {
+            "tick_drift_seconds": self.tick_drift.to_dict(),
+            "systems": {
+                name: {metric: histogram.to_dict() for metric, histogram in histograms.items()}
+                for name, histograms in self._systems.items()
+            }
+        }
+
+    def to_prometheus(self, prefix: str = "mud_tick") -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines: List[str] = []
+        _append_histogram(lines, f"{prefix}_drift_seconds", "Tick start delay against schedule",
+                          [({}, self.tick_drift)])
+
+        metrics: Dict[str, list] = {}
+        for name, histograms in self._systems.items():
+            for metric, histogram in histograms.items():
+                metrics.setdefault(metric, []).append(({"system": name}, histogram))
+        for metric, series in metrics.items():
+            _append_histogram(lines, f"{prefix}_system_{metric}", f"Per tick system {metric}", series)
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str, fmt: Optional[str] = None) -> Path:
+        """
+        파일로 내보내기
+
+        Args:
+            path: 출력 파일 경로
+            fmt: "json" 또는 "prom" (None이면 확장자로 판단, .prom/.txt는 Prometheus 형식)
+
+        Returns:
+            Path: 기록한 파일 경로
+        """
+        output = Path(path)
+        if fmt is None:
+            fmt = "prom" if output.suffix in (".prom", ".txt") else "json"
+
+        if fmt == "prom":
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(content, encoding="utf-8")
+        return output
+
+
+def _append_histogram(lines: list, metric: str, help_text: str, series: list) -> None:
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} histogram")
+    for labels, histogram in series:
+        for bound, count in histogram.cumulative().items():
+            lines.append(f"{metric}_bucket{_labels(labels, le=bound)} {count}")
+        lines.append(f"{metric}_sum{_labels(labels)} {histogram.sum}")
+        lines.append(f"{metric}_count{_labels(labels)} {histogram.count}")
+
+
+def _labels(labels: Dict[str, str], **extra: str) -> str:
+    merged = dict(labels, **extra)
+    if not merged:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in merged.items()) + "}"
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""주기별 시스템 실행 Tick 스케줄러
+
+고정 간격(TICK_INTERVAL)으로 돌며, 등록된 시스템을 각자의 주기에 맞춰 정해진 순서대로 실행한다.
+시스템마다 실행 시간 예산(budget)을 두고 초과(overrun)를 기록하며,
+tick 자체가 밀리면 놓친 tick을 몰아서 실행하지 않고 건너뛴다.
+프로파일러(TickProfiler)를 설정하면 시스템별 실행 시간/쿼리 수/메시지 수와 tick 지연을 히스토그램으로 기록한다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .tick_profiler import TickProfiler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TickSystem:
+    """Tick 스케줄러에 등록된 시스템"""
+    name: str
+    callback: Callable[[], Awaitable[None]]
+    interval: float  # 실행 주기 (초)
+    order: int  # 같은 tick 안에서의 실행 순서 (작을수록 먼저)
+    budget: float  # 1회 실행 시간 예산 (초)
+    sequence: int  # 등록 순서 (order가 같을 때 순서 결정)
+    enabled: bool = True
+    next_run: Optional[float] = None  # 다음 실행 시각 (loop.time 기준)
+    run_count: int = 0
+    error_count: int = 0
+    overrun_count: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+
+
+class TickScheduler:
+    """주기/순서/예산을 가진 시스템들을 하나의 tick 루프에서 실행"""
+
+    TICK_INTERVAL = 1.0  # 기본 tick 간격 (초)
+    DEFAULT_BUDGET = 0.05  # 시스템 1회 실행 기본 예산 (초)
+
+    def __init__(self) -> None:
+        self._running: bool = False
+        self._loop_task: Optional[asyncio.Task] = None
+        self._systems: Dict[str, TickSystem] = {}
+        self._ordered: List[TickSystem] = []
+        self._sequence: int = 0
+        self._tick_count: int = 0
+        self._skipped_ticks: int = 0
+        self._tick_overruns: int = 0
+        self.profiler: Optional[TickProfiler] = None
+
+    def set_profiler(self, profiler: Optional[TickProfiler]) -> None:
+        """시스템 실행/tick 지연을 기록할 프로파일러 설정 (None이면 해제)"""
+        self.profiler = profiler
+
+    # === 시스템 등록 ===
+
+    def register_system(
+        self,
+        name: str,
+        callback: Callable[[], Awaitable[None]],
+        interval: float,
+        order: int = 100,
+        budget: Optional[float] = None
+    ) -> None:
+        """
+        Tick 시스템 등록
+
+        Args:
+            name: 시스템 이름 (고유 식별자)
+            callback: 실행할 비동기 함수
+            interval: 실행 주기 (초, TICK_INTERVAL 단위로 동작)
+            order: 같은 tick 안에서의 실행 순서 (작을수록 먼저)
+            budget: 1회 실행 시간 예산 (초, 초과 시 overrun으로 기록)
+        """
+        if name in self._systems:
+            logger.warning(f"Tick 시스템 '{name}'이 이미 등록되어 있습니다. 덮어씁니다.")
+
+        self._sequence += 1
+        self._systems[name] = TickSystem(
+            name=name,
+            callback=callback,
+            interval=max(self.TICK_INTERVAL, float(interval)),
+            order=order,
+            budget=budget if budget is not None else self.DEFAULT_BUDGET,
+            sequence=self._sequence
+        )
+        self._reorder()
+        logger.info(f"Tick 시스템 등록: {name} (주기: {interval}초, 순서: {order})")
+
+    def unregister_system(self, name: str) -> bool:
+        """Tick 시스템 등록 해제"""
+        if name in self._systems:
+            del self._systems[name]
+            self._reorder()
+            logger.info(f"Tick 시스템 등록 해제: {name}")
+            return True
+
+        logger.warning(f"등록되지 않은 Tick 시스템: {name}")
+        return False
+
+    def set_system_enabled(self, name: str, enabled: bool) -> bool:
+        """Tick 시스템 활성화/비활성화"""
+        system = self._systems.get(name)
+        if not system:
+            logger.warning(f"등록되지 않은 Tick 시스템: {name}")
+            return False
+
+        system.enabled = enabled
+        logger.info(f"Tick 시스템 {'활성화' if enabled else '비활성화'}: {name}")
+        return True
+
+    def _reorder(self) -> None:
+        self._ordered = sorted(self._systems.values(), key=lambda s: (s.order, s.sequence))
+
+    def get_system_info(self, name: str) -> Optional[Dict[str, Any]]:
+        """Tick 시스템 정보 조회"""
+        system = self._systems.get(name)
+        if not system:
+            return None
+
+        return {
+            "name": system.name,
+            "enabled": system.enabled,
+            "interval": system.interval,
+            "order": system.order,
+            "budget": system.budget,
+            "run_count": system.run_count,
+            "error_count": system.error_count,
+            "overrun_count": system.overrun_count,
+            "last_duration": system.last_duration,
+            "max_duration": system.max_duration,
+            "avg_duration": system.total_duration / system.run_count if system.run_count else 0.0
+        }
+
+    def list_systems(self) -> List[Dict[str, Any]]:
+        """등록된 Tick 시스템 목록 (실행 순서대로)"""
+        return [self.get_system_info(system.name) for system in self._ordered]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tick 스케줄러 통계"""
+        return {
+            "running": self._running,
+            "tick_interval": self.TICK_INTERVAL,
+            "tick_count": self._tick_count,
+            "skipped_ticks": self._skipped_ticks,
+            "tick_overruns": self._tick_overruns,
+            "systems": self.list_systems()
+        }
+
+    # === 실행 ===
+
+    async def start(self) -> None:
+        """Tick 루프 시작"""
+        if self._running:
+            logger.warning("Tick 스케줄러가 이미 실행 중입니다")
+            return
+
+        self._running = True
+        self._loop_task = asyncio.create_task(self._scheduler_loop())
+        logger.info(f"Tick 스케줄러 시작 (시스템 {len(self._systems)}개)")
+
+    async def stop(self) -> None:
+        """Tick 루프 중지"""
+        self._running = False
+        if self._loop_task and not self._loop_task.done():
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Tick 스케줄러 중지")
+
+    async def _scheduler_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        try:
+            while self._running:
+                now = loop.time()
+                if self.profiler:
+                    self.profiler.record_drift(now - next_tick)
+                await self._run_tick(now)
+                self._tick_count += 1
+
+                next_tick += self.TICK_INTERVAL
+                now = loop.time()
+                lag = now - next_tick
+                if lag >= self.TICK_INTERVAL:
+                    # 밀린 tick은 몰아서 실행하지 않고 건너뜀
+                    skipped = int(lag // self.TICK_INTERVAL)
+                    self._skipped_ticks += skipped
+                    next_tick += skipped * self.TICK_INTERVAL
+                    logger.warning(f"Tick 지연 {lag:.3f}초 - {skipped}개 tick 건너뜀")
+
+                await asyncio.sleep(max(0.0, next_tick - now))
+        except asyncio.CancelledError:
+            logger.info("Tick 루프 취소됨")
+            raise
+
+    async def _run_tick(self, now: float) -> None:
+        """이번 tick에 실행할 시스템들을 순서대로 실행"""
+        loop = asyncio.get_running_loop()
+        tick_start = loop.time()
+
+        for system in list(self._ordered):
+            if not system.enabled:
+                continue
+            if system.next_run is None:
+                system.next_run = now
+            if system.next_run - now > self.TICK_INTERVAL / 2:
+                # tick 타이밍 오차를 감안해 반 tick 이내로 남았으면 이번 tick에 실행
+                continue
+
+            # 다음 실행 시각 (밀렸으면 현재 기준으로 재설정)
+            system.next_run += system.interval
+            if system.next_run <= now:
+                system.next_run = now + system.interval
+
+            snapshot = self.profiler.begin() if self.profiler else None
+            started = loop.time()
+            try:
+                await system.callback()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                system.error_count += 1
+                logger.error(f"Tick 시스템 실행 오류 ({system.name}): {e}", exc_info=True)
+            finally:
+                duration = loop.time() - started
+                system.run_count += 1
+                system.last_duration = duration
+                system.total_duration += duration
+                system.max_duration = max(system.max_duration, duration)
+                if self.profiler:
+                    self.profiler.record_system(system.name, duration, snapshot)
+                if duration > system.budget:
+                    system.overrun_count += 1
+                    logger.warning(f"Tick 시스템 예산 초과: {system.name} "
+                                   f"({duration * 1000:.1f}ms > {system.budget * 1000:.1f}ms)")
+
+        tick_duration = loop.time() - tick_start
+        if tick_duration > self.TICK_INTERVAL:
+            self._tick_overruns += 1
+            logger.warning(f"Tick 실행 시간이 간격을 초과함: {tick_duration:.3f}초")
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""선공형 몬스터 선공 매니저 단위 테스트"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import src.mud_engine.server  # noqa: F401  # game.combat <-> core 순환 import를 피하기 위해 먼저 적재
+from src.mud_engine.core.managers.aggro_manager import AggroManager
+from src.mud_engine.game.combat import CombatantType
+from src.mud_engine.game.monster import Monster
+
+
+def _aggro_manager(sessions_by_room: dict, monsters_by_cell: dict):
+    """방 room_{x}_{y}가 좌표 (x, y)에 있는 가짜 게임 엔진 위의 AggroManager"""
+    started = []
+    sessions = {s.session_id: s for room in sessions_by_room.values() for s in room}
+
+    async def get_room(room_id):
+        _, x, y = room_id.split("_")
+        return SimpleNamespace(id=room_id, x=int(x), y=int(y))
+
+    async def get_room_at_coordinates(x, y):
+        return SimpleNamespace(id=f"room_{x}_{y}", x=x, y=y)
+
+    async def get_aggressive_monsters_at_coordinates(x, y):
+        return monsters_by_cell.get((x, y), [])
+
+    async def start_combat(player, monster, room_id, aggresive=False):
+        started.append((player, monster, room_id, aggresive))
+        return SimpleNamespace(
+            id="c1", lock=asyncio.Lock(), set_entity_map=lambda entity_map: None,
+            get_current_combatant=lambda: SimpleNamespace(combatant_type=CombatantType.PLAYER),
+        )
+
+    game_engine = SimpleNamespace(
+        session_manager=SimpleNamespace(sessions=sessions,
+                                        get_sessions_in_room=lambda room_id: sessions_by_room.get(room_id, [])),
+        world_manager=SimpleNamespace(get_room=get_room, get_room_at_coordinates=get_room_at_coordinates,
+                                      get_aggressive_monsters_at_coordinates=get_aggressive_monsters_at_coordinates),
+        combat_handler=SimpleNamespace(start_combat=start_combat),
+    )
+    return AggroManager(game_engine), started
+
+
+def _session(session_id: str, room_id: str):
+    return SimpleNamespace(session_id=session_id, is_authenticated=True, player=SimpleNamespace(id=session_id),
+                           in_combat=False, current_room_id=room_id)
+
+
+def _wolf(x: int, y: int) -> Monster:
+    return Monster(id="wolf", name={"en": "wolf"}, description={"en": "wolf"}, x=x, y=y)
+
+
+class TestAggroManager:
+    """방 입장/몬스터 도착 이벤트 기반 선공 확인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_room_enter_starts_combat_with_aggressive_monster(self):
+        """선공형 몬스터가 있는 방에 들어가면 전투가 시작되고 세션이 전투 인스턴스로 이동하는지 테스트"""
+        wolf = _wolf(1, 2)
+        session = _session("s1", "room_1_2")
+        manager, started = _aggro_manager({"room_1_2": [session]}, {(1, 2): [wolf]})
+
+        manager._on_room_entered(session, "room_1_2")
+        await manager._flush_task
+
+        assert started == [(session.player, wolf, "room_1_2", True)]
+        assert session.in_combat and session.combat_id == "c1"
+        assert session.original_room_id == "room_1_2" and session.current_room_id == "combat_c1"
+
+    @pytest.mark.asyncio
+    async def test_monster_arrival_queues_sessions_in_cell(self):
+        """선공형 몬스터가 도착한 셀의 세션만 선공 확인 대상이 되는지 테스트"""
+        here, elsewhere = _session("s1", "room_3_4"), _session("s2", "room_0_0")
+        manager, _ = _aggro_manager({"room_3_4": [here], "room_0_0": [elsewhere]}, {})
+        checked = []
+
+        async def check_session(s):
+            checked.append(s.session_id)
+
+        manager._check_session = check_session
+        manager._on_monster_arrived(_wolf(3, 4))
+        await manager._flush_task
+
+        assert checked == ["s1"]
+
+    @pytest.mark.asyncio
+    async def test_combat_room_enter_is_ignored(self):
+        """전투 인스턴스(combat_) 방 입장은 선공 확인을 예약하지 않는지 테스트"""
+        session = _session("s1", "combat_c1")
+        manager, started = _aggro_manager({}, {})
+
+        manager._on_room_entered(session, "combat_c1")
+
+        assert manager._pending_sessions == {}
+        assert manager._flush_task is None
+        assert started == []
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""전투 매니저 인덱스 단위 테스트"""
+
+import src.mud_engine.server  # noqa: F401  # game.combat <-> core 순환 import를 피하기 위해 먼저 적재
+from src.mud_engine.game.combat_manager import CombatManager
+from src.mud_engine.game.models import Player
+from src.mud_engine.game.monster import Monster, MonsterStats
+
+
+def _start_combat(manager: CombatManager, monster_dexterity: int):
+    player = Player(username="hero", password_hash="x")
+    monster = Monster(id="monster_1", name={"en": "rat"}, description={"en": "rat"},
+                      stats=MonsterStats(dexterity=monster_dexterity))
+    combat = manager.create_combat("room_1")
+    manager.add_player_to_combat(combat.id, player, player.id)
+    manager.add_monster_to_combat(combat.id, monster)
+    return combat, player
+
+
+class TestCombatManager:
+    """CombatManager 인덱스 테스트"""
+
+    def test_awaiting_monster_turn_follows_turn(self):
+        """현재 턴이 몬스터인 전투만 몹 턴 대기 목록에 있는지 테스트"""
+        manager = CombatManager()
+        combat, _ = _start_combat(manager, monster_dexterity=1)
+
+        assert not combat.is_monster_turn()
+        assert manager.get_combats_awaiting_monster_turn() == []
+
+        combat.advance_turn()
+        assert manager.get_combats_awaiting_monster_turn() == [combat]
+
+        combat.advance_turn()
+        assert manager.get_combats_awaiting_monster_turn() == []
+
+    def test_end_combat_clears_indexes(self):
+        """전투 종료 시 플레이어/몬스터 매핑과 몹 턴 대기 목록이 정리되는지 테스트"""
+        manager = CombatManager()
+        combat, player = _start_combat(manager, monster_dexterity=40)
+
+        assert manager.get_combats_awaiting_monster_turn() == [combat]
+        assert manager.get_combat_by_player(player.id) is combat
+        assert manager.is_monster_in_combat("monster_1")
+
+        combat.get_combatant("monster_1").current_hp = 0
+        assert not manager.is_monster_in_combat("monster_1")
+
+        manager.end_combat(combat.id)
+
+        assert manager.get_combats_awaiting_monster_turn() == []
+        assert manager.get_combat_by_player(player.id) is None
+        assert manager.get_combat_by_monster("monster_1") is None
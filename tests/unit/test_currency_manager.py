@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""실버 잔액 원장 단위 테스트"""
+
+import asyncio
+import os
+import random
+import tempfile
+
+import pytest
+
+from src.mud_engine.database import DatabaseManager
+from src.mud_engine.game.game_object_repository import GameObjectRepository
+from src.mud_engine.game.managers.currency_manager import MAX_STACK, CurrencyManager
+
+
+@pytest.fixture
+async def currency():
+    """임시 DB 위의 CurrencyManager 픽스처"""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp_file:
+        db_path = tmp_file.name
+
+    db_manager = DatabaseManager(f"sqlite:///{db_path}")
+    try:
+        await db_manager.initialize()
+        # 새 DB의 game_objects는 구 스키마이므로 문서(DATABASE_SCHEMA.md)의 실제 스키마로 교체
+        connection = await db_manager.get_connection()
+        await connection.executescript("""
+            DROP TABLE game_objects;
+            CREATE TABLE game_objects (
+                id TEXT PRIMARY KEY,
+                name_en TEXT NOT NULL,
+                name_ko TEXT NOT NULL,
+                description_en TEXT,
+                description_ko TEXT,
+                location_type TEXT NOT NULL,
+                location_id TEXT,
+                properties TEXT DEFAULT '{}',
+                weight REAL DEFAULT 1.0,
+                equipment_slot TEXT,
+                is_equipped BOOLEAN DEFAULT FALSE,
+                max_stack INTEGER DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                category TEXT DEFAULT 'misc'
+            );
+        """)
+        db_manager.invalidate_schema_cache()
+        yield CurrencyManager(GameObjectRepository(db_manager))
+    finally:
+        await db_manager.close()
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+
+async def _stack_total(currency: CurrencyManager, owner_id: str) -> int:
+    stacks = await currency._find_silver_stacks(owner_id)
+    return sum(s.properties["quantity"] for s in stacks)
+
+
+async def _journal(currency: CurrencyManager, owner_id: str) -> list:
+    db_manager = await currency._object_repo.get_db_manager()
+    rows = await db_manager.fetch_all(
+        "SELECT delta, balance, reason FROM currency_transactions WHERE owner_id = ? ORDER BY id",
+        (owner_id,),
+    )
+    return [(row["delta"], row["balance"], row["reason"]) for row in rows]
+
+
+class TestCurrencyManager:
+    """CurrencyManager 원장/스택 동기화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_earn_and_spend_keep_ledger_and_stacks_in_sync(self, currency):
+        """지급/차감이 원장, 저널, 표시용 스택에 함께 반영되는지 테스트"""
+        assert await currency.get_balance("p1") == 0
+
+        assert await currency.earn("p1", MAX_STACK + 1, reason="spawn")
+        assert await currency.spend("p1", 500, reason="buy:item")
+        assert not await currency.spend("p1", MAX_STACK)  # 잔액 부족
+
+        assert await currency.get_balance("p1") == MAX_STACK + 1 - 500
+        assert await _stack_total(currency, "p1") == MAX_STACK + 1 - 500
+        assert await _journal(currency, "p1") == [
+            (MAX_STACK + 1, MAX_STACK + 1, "spawn"),
+            (-500, MAX_STACK + 1 - 500, "buy:item"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_moved_stacks_resync_ledger(self, currency):
+        """다른 경로로 실버 스택이 이동하면 양쪽 소유자의 원장이 맞춰지는지 테스트"""
+        repo = currency._object_repo
+        await currency.earn("p1", 30)
+        stack = (await currency._find_silver_stacks("p1"))[0]
+
+        await repo.move_object_to_room(stack.id, "room-1")
+        assert await currency.get_balance("p1") == 0
+
+        await repo.move_object_to_inventory(stack.id, "p2")
+        assert await currency.get_balance("p2") == 30
+        assert await _journal(currency, "p2") == [(30, 30, "sync")]
+        assert await currency.spend("p2", 30)
+        assert await repo.get_by_id(stack.id) is None
+
+    @pytest.mark.asyncio
+    async def test_other_repository_instances_notify_ledger(self, currency):
+        """같은 DB를 쓰는 다른 리포지토리 인스턴스로 옮긴 스택도 원장에 반영되는지 테스트"""
+        await currency.earn("p1", 30)
+        stack = (await currency._find_silver_stacks("p1"))[0]
+        other_repo = GameObjectRepository(await currency._object_repo.get_db_manager())
+
+        await other_repo.move_object_to_inventory(stack.id, "p2")
+        assert await currency.get_balance("p1") == 0
+        assert await currency.get_balance("p2") == 30
+
+    @pytest.mark.asyncio
+    async def test_stack_lookup_failure_rolls_back(self, currency, monkeypatch):
+        """스택 조회가 실패하면 원장 변경도 롤백되는지 테스트"""
+        await currency.earn("p1", 100)
+
+        async def broken(owner_id, template_id):
+            raise RuntimeError("db error")
+
+        monkeypatch.setattr(currency._object_repo, "get_inventory_objects_by_template", broken)
+        assert not await currency.spend("p1", 40)
+        with pytest.raises(RuntimeError):
+            await currency.sync_balance("p1")
+
+        monkeypatch.undo()
+        assert await currency.get_balance("p1") == await _stack_total(currency, "p1") == 100
+
+    @pytest.mark.asyncio
+    async def test_sync_concurrent_with_earn_does_not_drift(self, currency):
+        """재동기화와 지급이 겹쳐도 잘못된 차액을 기록하지 않는지 테스트"""
+        await currency.earn("p1", 100)
+        rng = random.Random(0)
+
+        async def after(delay, coro):
+            await asyncio.sleep(delay)
+            return await coro
+
+        for _ in range(20):
+            await asyncio.gather(
+                after(rng.random() * 0.002, currency.sync_balance("p1")),
+                after(rng.random() * 0.002, currency.earn("p1", 50)),
+            )
+
+        assert await currency.get_balance("p1") == await _stack_total(currency, "p1") == 100 + 20 * 50
+        assert all(reason != "sync" for _, _, reason in await _journal(currency, "p1"))
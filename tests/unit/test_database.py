@@ -38,6 +38,12 @@ class TestRepository(BaseRepository[TestModel]):
         return TestModel
 
 
+class CachedTestRepository(TestRepository):
+    """엔티티 캐시를 사용하는 테스트용 리포지토리"""
+
+    cache_entities = True
+
+
 @pytest.fixture
 async def temp_db():
     """임시 데이터베이스 픽스처"""
@@ -206,6 +212,387 @@ class TestBaseRepository:
         assert not_exists is False
 
 
+class TestBulkOperations:
+    """일괄 생성/업데이트/삭제 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_create_many(self, temp_db):
+        """여러 레코드가 한 번에 생성되고 입력 순서대로 반환되는지 테스트"""
+        repo = TestRepository(temp_db)
+
+        created = await repo.create_many([{'name': 'A'}, {'name': 'B', 'data': {'k': 1}}])
+
+        assert [record.name for record in created] == ['A', 'B']
+        assert all(record.id for record in created)
+        assert await repo.count() == 2
+
+    @pytest.mark.asyncio
+    async def test_create_many_rolls_back_on_failure(self, temp_db):
+        """일부 행이 실패하면 전체가 롤백되는지 테스트"""
+        repo = TestRepository(temp_db)
+        existing = await repo.create({'name': 'Existing'})
+
+        with pytest.raises(Exception):
+            await repo.create_many([{'name': 'New'}, {'id': existing.id, 'name': 'Duplicate'}])
+
+        assert await repo.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_update_many(self, temp_db):
+        """여러 레코드가 한 번에 갱신되고 없는 ID는 건너뛰는지 테스트"""
+        repo = CachedTestRepository(temp_db)
+        first, second = await repo.create_many([{'name': 'A'}, {'name': 'B'}])
+
+        updated = await repo.update_many({
+            first.id: {'name': 'A2'},
+            second.id: {'name': 'B2'},
+            'missing': {'name': 'X'},
+        })
+
+        assert sorted(record.name for record in updated) == ['A2', 'B2']
+        assert (await repo.get_by_id(first.id)).name == 'A2'
+        assert [record.id for record in await repo.find_by(name='B2')] == [second.id]
+
+    @pytest.mark.asyncio
+    async def test_delete_many(self, temp_db):
+        """여러 레코드가 한 번에 삭제되고 캐시에서도 제거되는지 테스트"""
+        repo = CachedTestRepository(temp_db)
+        first, second, third = await repo.create_many([{'name': 'A'}, {'name': 'B'}, {'name': 'C'}])
+        await repo.get_by_id(first.id)
+
+        assert await repo.delete_many([first.id, second.id]) == 2
+        assert await repo.get_by_id(first.id) is None
+        assert [record.id for record in await repo.get_all()] == [third.id]
+
+
+class TestSchemaCache:
+    """테이블 컬럼/구문 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_table_columns_cached(self, temp_db, monkeypatch):
+        """PRAGMA table_info는 테이블당 한 번만 실행되는지 테스트"""
+        calls = []
+        original = temp_db.get_table_info
+
+        async def counting_get_table_info(table_name):
+            calls.append(table_name)
+            return await original(table_name)
+
+        monkeypatch.setattr(temp_db, 'get_table_info', counting_get_table_info)
+        repo = TestRepository(temp_db)
+        created = await repo.create({'name': 'Cached'})
+
+        await repo.update(created.id, {'name': 'Once'})
+        await repo.update(created.id, {'name': 'Twice'})
+
+        assert calls == ['test_table']
+
+        temp_db.invalidate_schema_cache('test_table')
+        await repo.update(created.id, {'name': 'Again'})
+        assert calls == ['test_table', 'test_table']
+
+    @pytest.mark.asyncio
+    async def test_statement_reused(self, temp_db):
+        """같은 컬럼 조합은 동일한 SQL 문자열을 재사용하는지 테스트"""
+        repo = TestRepository(temp_db)
+
+        first = repo._select_where_statement(temp_db, ('name',))
+        second = repo._select_where_statement(temp_db, ('name',))
+
+        assert first is second
+        assert first == "SELECT * FROM test_table WHERE name = ?"
+
+
+class TestEntityCache:
+    """엔티티 캐시 (write-behind) 테스트"""
+
+    async def _fetch_name(self, db_manager, record_id):
+        row = await db_manager.fetch_one("SELECT name FROM test_table WHERE id = ?", (record_id,))
+        return row['name'] if row else None
+
+    @pytest.mark.asyncio
+    async def test_update_is_deferred_until_flush(self, temp_db):
+        """update는 캐시에만 반영되고 flush 시 DB에 기록되는지 테스트"""
+        repo = CachedTestRepository(temp_db)
+        created = await repo.create({'name': 'Original'})
+
+        await repo.update(created.id, {'name': 'First'})
+        updated = await repo.update(created.id, {'name': 'Second'})
+
+        assert updated.name == 'Second'
+        assert (await repo.get_by_id(created.id)).name == 'Second'
+        assert await self._fetch_name(temp_db, created.id) == 'Original'
+
+        cache = temp_db.get_entity_cache('test_table')
+        assert cache.pending_count == 1  # 연속 변경은 하나로 합쳐짐
+
+        assert await temp_db.flush_entity_caches() == 1
+        assert await self._fetch_name(temp_db, created.id) == 'Second'
+        assert not cache.has_pending
+
+    @pytest.mark.asyncio
+    async def test_queries_see_pending_changes_without_flush(self, temp_db):
+        """조회/개수가 대기 중인 변경을 기록하지 않고 결과에 반영하는지 테스트"""
+        repo = CachedTestRepository(temp_db)
+        created = await repo.create({'name': 'Before'})
+        other = await repo.create({'name': 'Other'})
+        await repo.update(created.id, {'name': 'After'})
+
+        assert [record.id for record in await repo.find_by(name='After')] == [created.id]
+        assert await repo.find_by(name='Before') == []
+        assert [record.id for record in await repo.find_by(name='Other')] == [other.id]
+        assert await repo.count(name='After') == 1
+        assert await repo.count(name='Before') == 0
+        assert {record.name for record in await repo.get_all()} == {'After', 'Other'}
+
+        assert await self._fetch_name(temp_db, created.id) == 'Before'
+        assert temp_db.get_entity_cache('test_table').pending_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_only_clean_rows(self, temp_db):
+        """행 수 제한을 넘으면 오래된 깨끗한 행부터 내보내고 대기 중인 행은 유지하는지 테스트"""
+        repo = CachedTestRepository(temp_db)
+        cache = temp_db.get_entity_cache('test_table')
+        cache.max_rows = 2
+        records = [await repo.create({'name': f'Row {i}'}) for i in range(3)]
+        await repo.update(records[0].id, {'name': 'Dirty'})
+
+        for record in records[1:]:
+            await repo.get_by_id(record.id)
+
+        assert len(cache) == 2
+        assert cache.contains(records[0].id) and not cache.contains(records[1].id)
+        assert (await repo.get_by_id(records[0].id)).name == 'Dirty'
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_between_repositories(self, temp_db):
+        """같은 테이블의 리포지토리 인스턴스들이 캐시를 공유하는지 테스트"""
+        created = await CachedTestRepository(temp_db).create({'name': 'Shared'})
+        await CachedTestRepository(temp_db).update(created.id, {'name': 'Changed'})
+
+        record = await CachedTestRepository(temp_db).get_by_id(created.id)
+
+        assert record.name == 'Changed'
+
+    @pytest.mark.asyncio
+    async def test_unknown_column_rejected(self, temp_db):
+        """없는 컬럼 업데이트는 기록 대기 전에 거부되는지 테스트"""
+        repo = CachedTestRepository(temp_db)
+        created = await repo.create({'name': 'Valid'})
+
+        with pytest.raises(ValueError):
+            await repo.update(created.id, {'missing_column': 1})
+
+        assert not temp_db.get_entity_cache('test_table').has_pending
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_changes(self):
+        """연결 종료 시 대기 중인 변경이 기록되는지 테스트"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp_file:
+            db_path = tmp_file.name
+
+        try:
+            db_manager = DatabaseManager(f"sqlite:///{db_path}")
+            await db_manager.initialize()
+            await db_manager.execute(
+                "CREATE TABLE test_table (id TEXT PRIMARY KEY, name TEXT NOT NULL, "
+                "data TEXT DEFAULT '{}', created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+            )
+            repo = CachedTestRepository(db_manager)
+            created = await repo.create({'name': 'Before close'})
+            await repo.update(created.id, {'name': 'After close'})
+            await db_manager.close()
+
+            reopened = DatabaseManager(f"sqlite:///{db_path}")
+            await reopened.initialize()
+            assert await self._fetch_name(reopened, created.id) == 'After close'
+            await reopened.close()
+        finally:
+            if os.path.exists(db_path):
+                os.unlink(db_path)
+
+
+class TestTransaction:
+    """transaction() 작업 단위 테스트"""
+
+    async def _names(self, db_manager):
+        rows = await db_manager.fetch_all("SELECT name FROM test_table ORDER BY name")
+        return [row['name'] for row in rows]
+
+    @pytest.mark.asyncio
+    async def test_commit_on_success(self, temp_db):
+        """블록이 정상 종료되면 모든 변경이 커밋되는지 테스트"""
+        repo = TestRepository(temp_db)
+        async with temp_db.transaction():
+            await repo.create({'name': 'A'})
+            await repo.create({'name': 'B'})
+            assert temp_db.in_transaction()
+
+        assert not temp_db.in_transaction()
+        assert await self._names(temp_db) == ['A', 'B']
+
+    @pytest.mark.asyncio
+    async def test_rollback_on_exception(self, temp_db):
+        """블록에서 예외가 발생하면 모든 변경이 롤백되는지 테스트"""
+        repo = TestRepository(temp_db)
+        with pytest.raises(RuntimeError):
+            async with temp_db.transaction():
+                await repo.create({'name': 'A'})
+                raise RuntimeError("중단")
+
+        assert await self._names(temp_db) == []
+
+    @pytest.mark.asyncio
+    async def test_nested_block_uses_savepoint(self, temp_db):
+        """중첩 블록의 실패는 그 블록의 변경만 롤백하는지 테스트"""
+        repo = TestRepository(temp_db)
+        async with temp_db.transaction():
+            await repo.create({'name': 'Outer'})
+            with pytest.raises(RuntimeError):
+                async with temp_db.transaction():
+                    await repo.create({'name': 'Inner'})
+                    raise RuntimeError("중단")
+
+        assert await self._names(temp_db) == ['Outer']
+
+    @pytest.mark.asyncio
+    async def test_cache_restored_on_rollback(self, temp_db):
+        """롤백 시 엔티티 캐시도 트랜잭션 이전 상태로 돌아가는지 테스트"""
+        repo = CachedTestRepository(temp_db)
+        created = await repo.create({'name': 'Original'})
+
+        with pytest.raises(RuntimeError):
+            async with temp_db.transaction():
+                await repo.update(created.id, {'name': 'Changed'})
+                assert (await repo.get_by_id(created.id)).name == 'Changed'
+                raise RuntimeError("중단")
+
+        assert (await repo.get_by_id(created.id)).name == 'Original'
+        assert await self._names(temp_db) == ['Original']
+
+    @pytest.mark.asyncio
+    async def test_other_tasks_wait_for_transaction(self, temp_db):
+        """다른 태스크의 쿼리가 열린 트랜잭션에 섞이지 않는지 테스트"""
+        repo = TestRepository(temp_db)
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def rolled_back_writer():
+            with pytest.raises(RuntimeError):
+                async with temp_db.transaction():
+                    await repo.create({'name': 'RolledBack'})
+                    entered.set()
+                    await release.wait()
+                    raise RuntimeError("중단")
+
+        writer = asyncio.create_task(rolled_back_writer())
+        await entered.wait()
+        other = asyncio.create_task(repo.create({'name': 'Independent'}))
+        await asyncio.sleep(0.05)
+        assert not other.done()
+
+        release.set()
+        await writer
+        await other
+
+        assert await self._names(temp_db) == ['Independent']
+
+    @pytest.mark.asyncio
+    async def test_commit_outside_block_does_not_commit_other_transaction(self, temp_db):
+        """블록 밖의 execute + commit/rollback이 다른 태스크의 열린 트랜잭션을 커밋/롤백하지 않는지 테스트"""
+        repo = TestRepository(temp_db)
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def rolled_back_writer():
+            with pytest.raises(RuntimeError):
+                async with temp_db.transaction():
+                    await repo.create({'name': 'RolledBack'})
+                    entered.set()
+                    await release.wait()
+                    raise RuntimeError("중단")
+
+        await temp_db.execute("INSERT INTO test_table (id, name) VALUES ('a', 'Independent')")
+        writer = asyncio.create_task(rolled_back_writer())
+        await entered.wait()
+        committer = asyncio.create_task(temp_db.commit())
+        rollbacker = asyncio.create_task(temp_db.rollback())
+        await asyncio.sleep(0.05)
+        assert not committer.done() and not rollbacker.done()
+
+        release.set()
+        await writer
+        await committer
+        await rollbacker
+
+        assert await self._names(temp_db) == ['Independent']
+
+    @pytest.mark.asyncio
+    async def test_child_task_leaves_transaction_when_block_ends(self, temp_db):
+        """블록 안에서 만든 태스크는 블록이 끝난 뒤에는 트랜잭션 밖으로 취급되는지 테스트"""
+        release = asyncio.Event()
+
+        async def child():
+            await release.wait()
+            return temp_db.in_transaction()
+
+        async with temp_db.transaction():
+            task = asyncio.create_task(child())
+            await asyncio.sleep(0)
+
+        release.set()
+        assert await task is False
+
+
+class TestReaderPool:
+    """읽기 전용 연결 풀 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_open_transaction(self, temp_db):
+        """다른 작업의 트랜잭션이 열려 있어도 SELECT는 커밋된 데이터를 바로 읽는지 테스트"""
+        repo = TestRepository(temp_db)
+        await repo.create({'name': 'Committed'})
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def open_writer():
+            async with temp_db.transaction():
+                await repo.create({'name': 'Uncommitted'})
+                entered.set()
+                await release.wait()
+
+        writer = asyncio.create_task(open_writer())
+        await entered.wait()
+
+        rows = await asyncio.wait_for(temp_db.fetch_all("SELECT name FROM test_table"), timeout=1.0)
+        assert [row['name'] for row in rows] == ['Committed']
+
+        release.set()
+        await writer
+        assert await repo.count() == 2
+
+    @pytest.mark.asyncio
+    async def test_transaction_reads_own_writes(self, temp_db):
+        """트랜잭션 안의 조회는 아직 커밋되지 않은 변경을 읽는지 테스트"""
+        repo = TestRepository(temp_db)
+        async with temp_db.transaction():
+            await repo.create({'name': 'Pending'})
+            assert [record.name for record in await repo.find_by(name='Pending')] == ['Pending']
+
+    @pytest.mark.asyncio
+    async def test_pool_disabled(self, monkeypatch):
+        """풀 크기가 0이면 쓰기 연결로 조회하는지 테스트"""
+        monkeypatch.setenv("DB_READER_POOL_SIZE", "0")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_manager = DatabaseManager(f"sqlite:///{tmp_dir}/test.db")
+            await db_manager.initialize()
+            try:
+                assert db_manager._idle_readers is None
+                assert await db_manager.fetch_rows("SELECT 1") == [(1,)]
+            finally:
+                await db_manager.close()
+
+
 class TestSchema:
     """스키마 관련 테스트"""
 
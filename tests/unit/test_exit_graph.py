@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""출구 그래프 단위 테스트"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.mud_engine.game.managers.exit_graph import ExitGraph
+from src.mud_engine.game.managers.room_index import RoomSpatialIndex
+from src.mud_engine.game.managers.room_manager import RoomManager
+from src.mud_engine.game.models import Room
+from src.mud_engine.game.repositories import RoomRepository
+
+
+def _room(room_id: str, x: int, y: int, blocked=None) -> Room:
+    return Room(id=room_id, description={"en": room_id}, x=x, y=y, blocked_exits=blocked or [])
+
+
+def _graph(rooms, enter_connections=None) -> ExitGraph:
+    index = RoomSpatialIndex()
+    index.load(rooms)
+    graph = ExitGraph(index)
+    graph.build(enter_connections or {})
+    return graph
+
+
+class TestExitGraph:
+    """ExitGraph 테스트"""
+
+    def test_build_with_blocked_and_enter(self):
+        """막힌 출구와 enter 연결 반영 테스트"""
+        graph = _graph(
+            [_room("a", 0, 0, blocked=["east"]), _room("b", 0, 1), _room("c", 1, 0), _room("d", 10, 10)],
+            {(0, 0): (10, 10)},
+        )
+
+        assert graph.get_exits("a") == {"north": "b", "enter": "d"}
+        assert graph.get_exits("b") == {"south": "a"}
+        assert graph.get_exits("c") == {"west": "a"}
+        assert set(graph.get_adjacent_room_ids("a")) == {"b", "c"}
+
+    def test_room_added_updates_neighbours(self):
+        """방 추가 시 인접 셀 출구 갱신 테스트"""
+        index = RoomSpatialIndex()
+        index.load([_room("a", 0, 0)])
+        graph = ExitGraph(index)
+        graph.build({})
+
+        new_room = _room("b", -1, 0)
+        index.put(new_room)
+        graph.on_room_changed(None, new_room)
+
+        assert graph.get_exit("a", "west") == "b"
+        assert graph.get_exit("b", "east") == "a"
+
+    def test_room_removed_updates_enter_sources(self):
+        """enter 목적지 방 삭제 시 출발 방 출구 갱신 테스트"""
+        index = RoomSpatialIndex()
+        index.load([_room("a", 0, 0), _room("d", 10, 10)])
+        graph = ExitGraph(index)
+        graph.build({(0, 0): (10, 10)})
+
+        removed = index.remove("d")
+        graph.on_room_changed(removed, None)
+
+        assert graph.get_exits("a") == {}
+        assert graph.get_exits("d") == {}
+
+
+class TestRoomManagerExitGraph:
+    """RoomManager 출구 그래프 연동 테스트"""
+
+    @pytest.fixture
+    def mock_room_repo(self):
+        """RoomRepository 모의 객체"""
+        repo = AsyncMock(spec=RoomRepository)
+        repo.get_all.return_value = [_room("a", 0, 0), _room("b", 0, 1)]
+        repo.get_enter_connections.return_value = {}
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_blocking_exit_invalidates_graph(self, mock_room_repo):
+        """update_room으로 출구를 막으면 그래프에 반영되는지 테스트"""
+        manager = RoomManager(mock_room_repo)
+        await manager.load_spatial_index()
+        mock_room_repo.update.return_value = _room("a", 0, 0, blocked=["north"])
+
+        assert await manager.get_room_exit("a", "north") == "b"
+
+        await manager.remove_room_exit("a", "north")
+
+        assert await manager.get_room_exit("a", "north") is None
+        assert await manager.get_coordinate_based_exits("b") == {"south": "a"}
+
+    @pytest.mark.asyncio
+    async def test_add_enter_connection(self, mock_room_repo):
+        """enter 연결 추가 시 DB 기록 및 그래프 갱신 테스트"""
+        manager = RoomManager(mock_room_repo)
+        await manager.load_spatial_index()
+
+        assert await manager.add_room_exit("a", "enter", "b")
+
+        mock_room_repo.add_enter_connection.assert_awaited_once_with(0, 0, 0, 1)
+        assert await manager.get_room_exit("a", "enter") == "b"
+        assert await manager.get_enter_connection(0, 0) == (0, 1)
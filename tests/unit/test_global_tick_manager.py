@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""글로벌 Tick 매니저 몹 턴 처리 단위 테스트"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import src.mud_engine.server  # noqa: F401  # game.combat <-> core 순환 import를 피하기 위해 먼저 적재
+from src.mud_engine.core.managers.global_tick_manager import GlobalTickManager
+from src.mud_engine.game.combat_manager import CombatManager
+from src.mud_engine.game.models import Player
+from src.mud_engine.game.monster import Monster, MonsterStats
+
+
+def _tick_manager(process_monster_turn):
+    combat_manager = CombatManager()
+    sessions = {}
+    game_engine = SimpleNamespace(
+        session_manager=SimpleNamespace(get_player_session=sessions.get, get_all_sessions=lambda: []),
+        combat_handler=SimpleNamespace(combat_manager=combat_manager, process_monster_turn=process_monster_turn),
+        db_manager=SimpleNamespace(query_count=0),
+    )
+    return GlobalTickManager(game_engine), combat_manager, sessions
+
+
+def _monster_turn_combat(combat_manager: CombatManager, sessions: dict, name: str):
+    player = Player(username=f"hero_{name}", password_hash="x")
+    monster = Monster(id=f"{name}_rat", name={"en": "rat"}, description={"en": "rat"},
+                      stats=MonsterStats(dexterity=40))
+    combat = combat_manager.create_combat(f"room_{name}")
+    combat_manager.add_player_to_combat(combat.id, player, player.id)
+    combat_manager.add_monster_to_combat(combat.id, monster)
+    sessions[player.id] = SimpleNamespace(session_id=f"session_{name}", in_combat=True, combat_id=combat.id)
+    return combat
+
+
+class TestMonsterTurns:
+    """전투별 몹 턴 동시 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_combats_run_concurrently_and_errors_are_isolated(self):
+        """서로 다른 전투의 몹 턴이 동시에 처리되고 한 전투의 오류가 다른 전투를 막지 않는지 테스트"""
+        async def process_monster_turn(combat_id):
+            await asyncio.sleep(0.05)
+            combat = combat_manager.get_combat(combat_id)
+            if combat.room_id == "room_broken":
+                raise RuntimeError("boom")
+            combat.advance_turn()
+
+        manager, combat_manager, sessions = _tick_manager(process_monster_turn)
+        combats = [_monster_turn_combat(combat_manager, sessions, name) for name in ("a", "b", "broken")]
+
+        started = asyncio.get_running_loop().time()
+        await manager._process_monster_turns()
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert elapsed < 0.12
+        assert not combats[0].is_monster_turn()
+        assert not combats[1].is_monster_turn()
+        assert combat_manager.get_combats_awaiting_monster_turn() == [combats[2]]
+
+    @pytest.mark.asyncio
+    async def test_monster_turn_waits_for_combat_lock(self):
+        """플레이어 명령이 전투 락을 잡고 있으면 기다렸다가 바뀐 턴을 보고 건너뛰는지 테스트"""
+        calls = []
+
+        async def process_monster_turn(combat_id):
+            calls.append(combat_id)
+
+        manager, combat_manager, sessions = _tick_manager(process_monster_turn)
+        combat = _monster_turn_combat(combat_manager, sessions, "a")
+
+        async with combat.lock:
+            task = asyncio.create_task(manager._process_monster_turns())
+            await asyncio.sleep(0)
+            combat.advance_turn()  # 락을 잡은 플레이어 명령이 턴을 넘김
+        await task
+
+        assert calls == []
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""Lua 스크립트 로더 단위 테스트"""
+
+import asyncio
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("lupa")
+
+from src.mud_engine.game.lua_script_loader import LazyField, LuaScriptLoader  # noqa: E402
+
+SCRIPT_V1 = """
+function get_dialogue(ctx)
+    return {text = {{en = "hello " .. ctx.player.name}}, choices = {{en = "bye"}}}
+end
+function on_bye(ctx)
+    log("bye")
+end
+"""
+SCRIPT_V2 = """
+function get_dialogue(ctx)
+    return {text = {{en = "changed"}}, choices = {}}
+end
+"""
+SCRIPT_OTHER = """
+function get_dialogue(ctx)
+    return {text = {{en = "other"}}, choices = {}}
+end
+"""
+SCRIPT_SANDBOX = """
+function get_dialogue(ctx)
+    local escaped = tostring(io ~= nil or python ~= nil or load ~= nil or debug ~= nil)
+    local ok = pcall(function() string.format = nil end)
+    return {text = {{en = escaped .. " " .. tostring(ok)}}, choices = {}}
+end
+"""
+SCRIPT_EXCHANGE = """
+function probe(ctx)
+    local inv = exchange.get_npc_inventory(ctx.npc_id)
+    return {count = #inv, price = inv[1].buy_price, silver = exchange.get_npc_silver(ctx.npc_id)}
+end
+"""
+SCRIPT_LAZY = """
+function probe(ctx)
+    if ctx.trade then
+        return {silver = ctx.npc.silver + ctx.npc.silver, first = ctx.npc.inventory[1].name}
+    end
+    return {name = ctx.npc.name}
+end
+"""
+SCRIPT_LOOP = """
+function get_dialogue(ctx)
+    while true do end
+end
+"""
+SCRIPT_PCALL_LOOP = """
+function get_dialogue(ctx)
+    while true do pcall(function() while true do end end) end
+end
+"""
+SCRIPT_SLOW_EXCHANGE = """
+function probe(ctx)
+    exchange.get_npc_silver("first")
+    exchange.get_npc_silver("second")
+end
+"""
+
+
+@pytest.fixture
+def dialogue_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "configs" / "dialogues"
+    path.mkdir(parents=True)
+    return path
+
+
+class TestLuaScriptLoader:
+    """LuaScriptLoader 스크립트 환경/캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_env_reused_until_file_changes(self, dialogue_dir):
+        """파일이 그대로면 적재된 환경을 쓰고, mtime/크기가 바뀌면 다시 적재하는지 테스트"""
+        script = dialogue_dir / "npc.lua"
+        script.write_text(SCRIPT_V1, encoding="utf-8")
+        loader = LuaScriptLoader(pool_size=1)
+        worker = loader._workers[0]
+        file_path = os.path.join("configs", "dialogues", "npc.lua")
+
+        texts, choices = await loader.execute_get_dialogue("npc", {"player": {"name": "kim"}})
+        env = worker.envs[file_path][1]
+        assert texts == [{"en": "hello kim"}] and list(choices) == [1]
+        await loader.execute_get_dialogue("npc", {"player": {"name": "kim"}})
+        assert worker.envs[file_path][1] is env
+
+        script.write_text(SCRIPT_V2, encoding="utf-8")
+        stat = script.stat()
+        os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        texts, _ = await loader.execute_get_dialogue("npc", {"player": {"name": "kim"}})
+        assert texts == [{"en": "changed"}]
+        assert worker.envs[file_path][1] is not env
+
+    @pytest.mark.asyncio
+    async def test_scripts_isolated_and_sandboxed(self, dialogue_dir):
+        """스크립트끼리 함수가 덮어쓰이지 않고, 샌드박스 밖 API에 접근할 수 없는지 테스트"""
+        (dialogue_dir / "a.lua").write_text(SCRIPT_V1, encoding="utf-8")
+        (dialogue_dir / "b.lua").write_text(SCRIPT_OTHER, encoding="utf-8")
+        (dialogue_dir / "sandbox.lua").write_text(SCRIPT_SANDBOX, encoding="utf-8")
+        loader = LuaScriptLoader(pool_size=1)
+        ctx = {"player": {"name": "kim"}}
+
+        assert (await loader.execute_get_dialogue("b", ctx))[0] == [{"en": "other"}]
+        assert (await loader.execute_get_dialogue("a", ctx))[0] == [{"en": "hello kim"}]
+        assert (await loader.execute_get_dialogue("b", ctx))[0] == [{"en": "other"}]
+        # b에는 on_bye가 없으므로 a의 on_bye가 보이지 않아야 함
+        assert await loader.call_function(
+            os.path.join("configs", "dialogues", "b.lua"), "on_bye", ctx
+        ) is None
+
+        texts, _ = await loader.execute_get_dialogue("sandbox", ctx)
+        assert texts == [{"en": "false false"}]
+
+    @pytest.mark.asyncio
+    async def test_missing_broken_and_runaway_scripts(self, dialogue_dir):
+        """없는/문법 오류/끝나지 않는 스크립트는 None을 반환하는지 테스트"""
+        (dialogue_dir / "broken.lua").write_text("function (", encoding="utf-8")
+        (dialogue_dir / "loop.lua").write_text(SCRIPT_LOOP, encoding="utf-8")
+        loader = LuaScriptLoader(pool_size=1)
+        loader.MAX_INSTRUCTIONS = 100_000
+
+        assert await loader.execute_get_dialogue("missing", {}) is None
+        assert await loader.execute_get_dialogue("broken", {}) is None
+        assert await loader.execute_get_dialogue("loop", {}) is None
+        assert await loader.execute_get_dialogue("broken", {}) is None
+
+    @pytest.mark.asyncio
+    async def test_instruction_budget_not_catchable_by_pcall(self, dialogue_dir):
+        """pcall로 명령어 수 초과를 잡는 스크립트도 끝나고, 워커는 다음 호출에 재사용되는지 테스트"""
+        (dialogue_dir / "pcall_loop.lua").write_text(SCRIPT_PCALL_LOOP, encoding="utf-8")
+        (dialogue_dir / "v1.lua").write_text(SCRIPT_V1, encoding="utf-8")
+        loader = LuaScriptLoader(pool_size=1)
+        loader.MAX_INSTRUCTIONS = 100_000
+        loader.CALL_TIMEOUT = 3.0
+
+        assert await loader.execute_get_dialogue("pcall_loop", {}) is None
+        texts, _ = await loader.execute_get_dialogue("v1", {"player": {"name": "kim"}})
+        assert texts == [{"en": "hello kim"}]
+
+    @pytest.mark.asyncio
+    async def test_timed_out_call_cancels_exchange_calls(self, dialogue_dir):
+        """시간 초과로 버려진 호출의 Exchange API는 취소되고 이후 호출은 시작되지 않는지 테스트"""
+        (dialogue_dir / "slow.lua").write_text(SCRIPT_SLOW_EXCHANGE, encoding="utf-8")
+        started, cancelled = [], []
+
+        async def get_balance(owner_id):
+            started.append(owner_id)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(owner_id)
+                raise
+
+        loader = LuaScriptLoader(pool_size=1)
+        loader.CALL_TIMEOUT = 0.2
+        loader.register_exchange_api(SimpleNamespace(
+            _object_repo=SimpleNamespace(_db_manager=None), _currency=SimpleNamespace(get_balance=get_balance),
+        ))
+
+        assert await loader.call_function(os.path.join("configs", "dialogues", "slow.lua"), "probe") is None
+        for _ in range(100):  # 진행 중이던 코루틴 취소와 워커 반납까지 대기
+            await asyncio.sleep(0.01)
+            if cancelled and loader._idle.qsize() == 1:
+                break
+
+        assert started == ["first"]
+        assert cancelled == ["first"]
+
+    @pytest.mark.asyncio
+    async def test_exchange_calls_run_on_calling_loop(self, dialogue_dir):
+        """Exchange API 코루틴이 워커가 아니라 호출한 이벤트 루프 스레드에서 실행되는지 테스트"""
+        (dialogue_dir / "merchant.lua").write_text(SCRIPT_EXCHANGE, encoding="utf-8")
+        loop_thread = threading.get_ident()
+        threads, price_queries = set(), []
+
+        def item(item_id, template_id):
+            return SimpleNamespace(id=item_id, name={"en": item_id}, weight=1.0, is_equipped=False,
+                                   equipment_slot=None, properties={"template_id": template_id})
+
+        async def get_objects_in_inventory(owner_id):
+            threads.add(threading.get_ident())
+            return [item("a", "bread"), item("b", "bread"), item("coin", "silver_coin")]
+
+        async def fetch_one(query, params):
+            price_queries.append(params)
+            return {"buy_price": 7}
+
+        async def get_balance(owner_id):
+            threads.add(threading.get_ident())
+            return 42
+
+        exchange_manager = SimpleNamespace(
+            _object_repo=SimpleNamespace(get_objects_in_inventory=get_objects_in_inventory,
+                                         _db_manager=SimpleNamespace(fetch_one=fetch_one)),
+            _currency=SimpleNamespace(get_balance=get_balance),
+        )
+        loader = LuaScriptLoader(pool_size=1)
+        loader.register_exchange_api(exchange_manager)
+
+        result = await loader.call_function(
+            os.path.join("configs", "dialogues", "merchant.lua"), "probe", {"npc_id": "npc"},
+            convert=loader._lua_table_to_dict,
+        )
+
+        assert result == {"count": "2", "price": "7", "silver": "42"}
+        assert threads == {loop_thread}
+        assert price_queries == [("bread",)]  # 같은 템플릿 가격은 한 번만 조회
+
+    @pytest.mark.asyncio
+    async def test_lazy_fields_load_only_when_read(self, dialogue_dir):
+        """LazyField는 스크립트가 읽을 때 한 번만 호출한 루프에서 조회되는지 테스트"""
+        (dialogue_dir / "lazy.lua").write_text(SCRIPT_LAZY, encoding="utf-8")
+        loop_thread = threading.get_ident()
+        loads = []
+
+        def lazy(name, value):
+            async def load():
+                loads.append((name, threading.get_ident()))
+                return value
+            return LazyField(load)
+
+        def ctx(trade):
+            return {"trade": trade, "npc": {
+                "name": "bob",
+                "silver": lazy("silver", 5),
+                "inventory": lazy("inventory", [{"name": "bread", "obj": object()}]),
+            }}
+
+        loader = LuaScriptLoader(pool_size=1)
+        file_path = os.path.join("configs", "dialogues", "lazy.lua")
+
+        result = await loader.call_function(file_path, "probe", ctx(False), convert=loader._lua_table_to_dict)
+        assert result == {"name": "bob"} and loads == []
+
+        result = await loader.call_function(file_path, "probe", ctx(True), convert=loader._lua_table_to_dict)
+        assert result == {"silver": "10", "first": "bread"}
+        assert loads == [("silver", loop_thread), ("inventory", loop_thread)]
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""몬스터 레지스트리 단위 테스트"""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.mud_engine.game.managers.monster_manager import MonsterManager
+from src.mud_engine.game.managers.monster_registry import MonsterRegistry
+from src.mud_engine.game.monster import Monster, MonsterType
+
+
+def _monster(monster_id: str, x: int, y: int, template_id: str = "rat", is_alive: bool = True) -> Monster:
+    return Monster(id=monster_id, name={"en": monster_id}, description={"en": monster_id},
+                   x=x, y=y, is_alive=is_alive, properties={"template_id": template_id})
+
+
+class TestMonsterRegistry:
+    """MonsterRegistry 테스트"""
+
+    def test_load_and_counters(self):
+        """적재 후 좌표 조회와 템플릿/셀 생존 수 카운터 테스트"""
+        registry = MonsterRegistry()
+        registry.load([
+            _monster("a", 0, 0),
+            _monster("b", 0, 0),
+            _monster("c", 1, 0, is_alive=False),
+            _monster("d", 1, 0, template_id="wolf"),
+        ])
+
+        assert registry.is_loaded
+        assert [m.id for m in registry.get_at(0, 0)] == ["a", "b"]
+        assert [m.id for m in registry.get_at(1, 0)] == ["d"]
+        assert [m.id for m in registry.get_at(1, 0, alive_only=False)] == ["c", "d"]
+        assert registry.count_alive("rat") == 2
+        assert registry.count_alive_at(0, 0, "rat") == 2
+        assert registry.count_alive_at(1, 0, "rat") == 0
+        assert [m.id for m in registry.dead_monsters()] == ["c"]
+
+    def test_put_reindexes_move_and_death(self):
+        """이동/사망/리스폰 후 put() 호출 시 인덱스가 갱신되는지 테스트"""
+        registry = MonsterRegistry()
+        monster = _monster("a", 0, 0)
+        registry.load([monster])
+
+        monster.x = 2
+        registry.put(monster)
+        assert registry.get_at(0, 0) == []
+        assert registry.count_alive_at(2, 0, "rat") == 1
+
+        monster.die()
+        registry.put(monster)
+        assert registry.count_alive("rat") == 0
+        assert registry.get_at(2, 0) == []
+        assert [m.id for m in registry.dead_monsters()] == ["a"]
+
+        monster.respawn()
+        registry.put(monster)
+        assert registry.count_alive("rat") == 1
+        assert registry.dead_monsters() == []
+
+    def test_remove(self):
+        """제거 시 모든 인덱스와 카운터에서 빠지는지 테스트"""
+        registry = MonsterRegistry()
+        registry.load([_monster("a", 0, 0), _monster("b", 0, 0)])
+
+        assert registry.remove("a").id == "a"
+
+        assert registry.get("a") is None
+        assert [m.id for m in registry.get_by_template("rat")] == ["b"]
+        assert registry.count_alive_at(0, 0, "rat") == 1
+        assert registry.remove("missing") is None
+
+    def test_respawn_schedule(self):
+        """사망 시 리스폰이 예약되고 예정 시각이 지난 항목만 꺼내지는지 테스트"""
+        registry = MonsterRegistry()
+        early = _monster("early", 0, 0)
+        late = _monster("late", 0, 0)
+        early.respawn_time = 10
+        late.respawn_time = 60
+        registry.load([early, late])
+        scheduled = []
+        registry.set_respawn_listener(scheduled.append)
+
+        early.die()
+        late.die()
+        registry.put(early)
+        registry.put(late)
+        died_at = early.last_death_time.timestamp()
+
+        assert len(scheduled) == 2
+        assert registry.next_respawn_time() == died_at + 10
+        assert registry.pop_due_respawns(died_at + 5) == []
+        assert [m.id for m in registry.pop_due_respawns(died_at + 10)] == ["early"]
+
+        # 리스폰 전에 살아난(또는 제거된) 몬스터의 예약은 무시됨
+        late.respawn()
+        registry.put(late)
+        assert registry.next_respawn_time() is None
+        assert registry.pop_due_respawns(died_at + 100) == []
+
+    def test_aggressive_index_and_arrival(self):
+        """선공형 몬스터 셀 인덱스와 도착 리스너(스폰/이동/리스폰 시에만 호출) 테스트"""
+        registry = MonsterRegistry()
+        wolf = _monster("wolf", 0, 0)
+        wolf.monster_type = MonsterType.AGGRESSIVE
+        registry.load([wolf, _monster("rat", 0, 0)])
+        arrivals = []
+        registry.set_arrival_listener(arrivals.append)
+
+        assert [m.id for m in registry.get_aggressive_at(0, 0)] == ["wolf"]
+
+        registry.put(wolf)  # 위치/상태 변화 없음
+        registry.put(_monster("rat2", 1, 0))  # 비선공형 스폰
+        assert arrivals == []
+
+        wolf.x = 1
+        registry.put(wolf)
+        assert registry.get_aggressive_at(0, 0) == []
+        assert [m.id for m in registry.get_aggressive_at(1, 0)] == ["wolf"]
+
+        wolf.die()
+        registry.put(wolf)
+        assert registry.get_aggressive_at(1, 0) == []
+
+        wolf.respawn()
+        registry.put(wolf)
+        assert [m.id for m in arrivals] == ["wolf", "wolf"]
+
+
+class TestMonsterManagerWrites:
+    """MonsterManager 기록 실패 시 레지스트리 객체 복원 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_failed_write_restores_registry_monster(self):
+        """DB 기록이 실패하면 사망/이동 변경이 되돌려져 인덱스와 일치하는지 테스트"""
+        monster = _monster("a", 0, 0)
+        results = iter([None, RuntimeError("db down")])
+
+        async def get_all():
+            return [monster]
+
+        async def update(monster_id, data):
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        manager = MonsterManager(SimpleNamespace(get_all=get_all, update=update))
+        hp = monster.stats.current_hp
+
+        assert await manager.kill_monster("a") is False
+        assert monster.is_alive and monster.last_death_time is None and monster.stats.current_hp == hp
+        assert [m.id for m in manager._registry.get_at(0, 0)] == ["a"]
+
+        async def get_room(room_id):
+            return SimpleNamespace(id=room_id, x=3, y=4)
+
+        with pytest.raises(RuntimeError):
+            await manager.move_monster_to_room("a", "room", room_manager=SimpleNamespace(get_room=get_room))
+        assert (monster.x, monster.y) == (0, 0)
+        assert manager._registry.get_at(3, 4) == []
+
+    @pytest.mark.asyncio
+    async def test_spawn_commits_monster_and_silver_together(self):
+        """초기 실버 생성이 실패하면 스폰 트랜잭션이 롤백되고 레지스트리에 등록되지 않는지 테스트"""
+        outcomes, created = [], []
+
+        @asynccontextmanager
+        async def transaction():
+            try:
+                yield
+            except BaseException:
+                outcomes.append("rollback")
+                raise
+            outcomes.append("commit")
+
+        async def get_all():
+            return []
+
+        async def create(data):
+            created.append(data)
+            return Monster.from_dict(data)
+
+        async def get_db_manager():
+            return SimpleNamespace(transaction=transaction)
+
+        earned = iter([False, True])
+
+        async def earn(owner_id, amount, reason=""):
+            return next(earned)
+
+        manager = MonsterManager(SimpleNamespace(get_all=get_all, create=create, get_db_manager=get_db_manager))
+        manager._currency_manager = SimpleNamespace(earn=earn)
+        manager._template_loader = SimpleNamespace(
+            create_monster_from_template=lambda template_id, monster_id, room_id: _monster(monster_id, 0, 0),
+            get_spawn_config=lambda template_id: None,
+            get_monster_template=lambda template_id: {"exchange_config": {"initial_silver": 50}},
+        )
+
+        assert await manager._spawn_monster_from_template("room", "rat") is None
+        assert outcomes == ["rollback"]
+        assert manager._registry.all_monsters() == []
+
+        monster = await manager._spawn_monster_from_template("room", "rat")
+        assert outcomes == ["rollback", "commit"]
+        assert manager._registry.all_monsters() == [monster]
+        assert monster.properties["exchange_config"] == {"initial_silver": 50}
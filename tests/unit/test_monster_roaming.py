@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""몬스터 로밍 일괄 계산 단위 테스트"""
+
+import random
+
+from src.mud_engine.game.managers.monster_roaming import RoamingBatch
+from src.mud_engine.game.monster import Monster, MonsterBehavior
+
+
+def _monster(monster_id: str, x: int, y: int, roaming_config=None,
+             behavior: MonsterBehavior = MonsterBehavior.ROAMING) -> Monster:
+    properties = {"roaming_config": roaming_config} if roaming_config else {}
+    return Monster(id=monster_id, name={"en": monster_id}, description={"en": monster_id},
+                   x=x, y=y, behavior=behavior, properties=properties)
+
+
+class TestRoamingBatch:
+    """RoamingBatch 테스트"""
+
+    def test_collects_only_roaming_monsters(self):
+        """로밍 설정이 있는 로밍형 몬스터만 배열에 모이는지 테스트"""
+        batch = RoamingBatch.from_monsters([
+            _monster("rat", 0, 0, {"roam_chance": 0.3}),
+            _monster("guard", 0, 0, {"roam_chance": 1.0}, behavior=MonsterBehavior.STATIONARY),
+            _monster("no_config", 0, 0),
+        ])
+
+        assert [m.id for m in batch.monsters] == ["rat"]
+        assert list(batch.chances) == [0.3]
+
+    def test_plan_respects_walkable_cells_and_area(self):
+        """이동 가능한 셀과 로밍 영역 안으로만 이동하는지 테스트"""
+        area = {"min_x": 0, "max_x": 1, "min_y": 0, "max_y": 0}
+        batch = RoamingBatch.from_monsters([
+            _monster("boxed", 0, 0, {"roam_chance": 1.0, "roaming_area": area}),
+            _monster("stuck", 5, 5, {"roam_chance": 1.0}),
+            _monster("lazy", 0, 0, {"roam_chance": 0.0}),
+        ])
+        walkable = {(0, 0): "a", (1, 0): "b", (0, 1): "c", (-1, 0): "d"}
+
+        moves = batch.plan(walkable, random.Random(1))
+
+        assert [(m.monster.id, m.old, m.new) for m in moves] == [("boxed", (0, 0), (1, 0))]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""방 공간 인덱스 단위 테스트"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.mud_engine.game.managers.room_index import RoomSpatialIndex
+from src.mud_engine.game.managers.room_manager import RoomManager
+from src.mud_engine.game.models import Room
+from src.mud_engine.game.repositories import RoomRepository
+
+
+def _room(room_id: str, x: int, y: int) -> Room:
+    return Room(id=room_id, description={"en": room_id}, x=x, y=y)
+
+
+class TestRoomSpatialIndex:
+    """RoomSpatialIndex 테스트"""
+
+    def test_load_and_lookup(self):
+        """적재 후 ID/좌표 조회 테스트"""
+        index = RoomSpatialIndex()
+        index.load([_room("a", 0, 0), _room("b", 1, 0)])
+
+        assert index.is_loaded
+        assert index.get("a").id == "a"
+        assert index.get_at(1, 0).id == "b"
+        assert index.get_at(5, 5) is None
+
+    def test_put_moves_coordinate(self):
+        """좌표 변경 시 이전 좌표 매핑 제거 테스트"""
+        index = RoomSpatialIndex()
+        index.load([_room("a", 0, 0)])
+
+        index.put(_room("a", 3, 3))
+
+        assert index.get_at(0, 0) is None
+        assert index.get_at(3, 3).id == "a"
+
+    def test_remove(self):
+        """방 제거 테스트"""
+        index = RoomSpatialIndex()
+        index.load([_room("a", 0, 0)])
+
+        index.remove("a")
+
+        assert index.get("a") is None
+        assert index.get_at(0, 0) is None
+
+    def test_area_queries(self):
+        """범위/반경 조회 테스트"""
+        index = RoomSpatialIndex()
+        index.load([_room(f"r{x}_{y}", x, y) for x in range(-3, 4) for y in range(-3, 4)])
+
+        in_bounds = index.get_in_bounds(-1, 1, -1, 1)
+        assert len(in_bounds) == 9
+
+        in_radius = index.get_in_radius(0, 0, 1)
+        assert {room.id for room in in_radius} == {"r0_0", "r1_0", "r-1_0", "r0_1", "r0_-1"}
+
+
+class TestRoomManagerSpatialIndex:
+    """RoomManager 인덱스 연동 테스트"""
+
+    @pytest.fixture
+    def mock_room_repo(self):
+        """RoomRepository 모의 객체"""
+        repo = AsyncMock(spec=RoomRepository)
+        repo.get_all.return_value = [_room("a", 0, 0), _room("b", 0, 1)]
+        repo.get_enter_connections.return_value = {}
+        return repo
+
+    @pytest.mark.asyncio
+    async def test_lookups_served_from_index(self, mock_room_repo):
+        """인덱스 적재 후 DB 조회 없이 좌표 조회 테스트"""
+        manager = RoomManager(mock_room_repo)
+        await manager.load_spatial_index()
+
+        room = await manager.get_room_at_coordinates(0, 1)
+
+        assert room.id == "b"
+        mock_room_repo.get_room_by_coordinates.assert_not_called()
+        mock_room_repo.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_room_writes_through(self, mock_room_repo):
+        """방 생성 시 인덱스 갱신 테스트"""
+        manager = RoomManager(mock_room_repo)
+        await manager.load_spatial_index()
+        mock_room_repo.create.return_value = _room("c", 1, 0)
+
+        await manager.create_room({"id": "c", "x": 1, "y": 0})
+
+        assert (await manager.get_room_at_coordinates(1, 0)).id == "c"
+
+    @pytest.mark.asyncio
+    async def test_delete_room_writes_through(self, mock_room_repo):
+        """방 삭제 시 인덱스 갱신 테스트"""
+        manager = RoomManager(mock_room_repo)
+        await manager.load_spatial_index()
+        mock_room_repo.delete.return_value = True
+
+        await manager.delete_room("a")
+
+        assert await manager.get_room("a") is None
+        assert await manager.get_room_at_coordinates(0, 0) is None
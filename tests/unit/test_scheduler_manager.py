@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""글로벌 스케줄러 단위 테스트"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import src.mud_engine.server  # noqa: F401  # game.combat <-> core 순환 import를 피하기 위해 먼저 적재
+from src.mud_engine.core.managers.scheduler_manager import (
+    MissedRunPolicy, ScheduleInterval, SchedulerManager
+)
+from src.mud_engine.utils.tick_profiler import TickProfiler
+
+
+def _scheduler() -> SchedulerManager:
+    engine = SimpleNamespace(global_tick_manager=SimpleNamespace(profiler=TickProfiler()))
+    scheduler = SchedulerManager(engine)
+    scheduler._epoch = 1000.0  # 벽시계 0초 = loop.time() 1000
+    return scheduler
+
+
+class TestSchedulerManager:
+    """SchedulerManager 테스트"""
+
+    def test_next_due_with_interval_and_offsets(self):
+        """주기/시점으로 다음 예정 시각을 계산하는지 테스트"""
+        scheduler = _scheduler()
+        scheduler.register_event("map", None, interval=60, offset=15)
+        scheduler.register_event("legacy", None, [ScheduleInterval.SECOND_45, ScheduleInterval.SECOND_00])
+        scheduler.register_event("fast", None, interval=0.5)
+
+        map_event = scheduler._events["map"]
+        assert scheduler._next_due(map_event, 1000.0) == 1015.0
+        assert scheduler._next_due(map_event, 1015.0) == 1075.0
+
+        legacy = scheduler._events["legacy"]
+        assert legacy.interval == 60 and legacy.offsets == (0.0, 45.0)
+        assert scheduler._next_due(legacy, 1010.0) == 1045.0
+        assert scheduler._next_due(legacy, 1045.0) == 1060.0
+
+        assert scheduler._next_due(scheduler._events["fast"], 1000.2) == 1000.5
+
+    def test_register_requires_interval(self):
+        """주기 없이 등록하면 오류가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            _scheduler().register_event("none", None)
+
+    @pytest.mark.asyncio
+    async def test_missed_runs_skip_and_catch_up(self):
+        """밀린 실행을 SKIP은 한 번으로 합치고 CATCH_UP은 모두 실행하는지 테스트"""
+        scheduler = _scheduler()
+        calls = {"skip": 0, "catch": 0}
+
+        def counter(name):
+            async def callback():
+                calls[name] += 1
+            return callback
+
+        scheduler.register_event("skip", counter("skip"), interval=10)
+        scheduler.register_event("catch", counter("catch"), interval=10, missed_policy=MissedRunPolicy.CATCH_UP)
+        for event in scheduler._events.values():
+            event.next_run = 1010.0
+
+        # 1010, 1020, 1030 세 번의 예정 시각이 도래한 뒤에야 디스패치
+        for event in scheduler._events.values():
+            scheduler._dispatch(event, 1035.0)
+            await event.task
+
+        skip, catch = scheduler._events["skip"], scheduler._events["catch"]
+        assert calls == {"skip": 1, "catch": 3}
+        assert skip.skipped_count == 2 and catch.skipped_count == 0
+        assert skip.next_run == catch.next_run == 1040.0
+        assert catch.latency.count == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_overlap(self):
+        """제한 시간 초과가 기록되고, 실행 중인 이벤트는 겹쳐 실행하지 않는지 테스트"""
+        scheduler = _scheduler()
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        scheduler.register_event("slow", slow, interval=10, timeout=0.05)
+        event = scheduler._events["slow"]
+        event.next_run = 1010.0
+        scheduler._dispatch(event, 1010.0)
+        scheduler._dispatch(event, 1020.0)  # 첫 실행이 아직 진행 중
+        assert event.skipped_count == 1
+
+        await event.task
+        assert event.timeout_count == 1 and event.error_count == 1 and event.run_count == 0
+        profile = scheduler.game_engine.global_tick_manager.profiler.to_dict()
+        assert "scheduler:slow" in profile["systems"]
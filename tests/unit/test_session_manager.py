@@ -0,0 +1,55 @@
+"""
+SessionManager 방 점유 인덱스 단위 테스트
+"""
+
+from unittest.mock import MagicMock
+
+from src.mud_engine.server.session_manager import SessionManager
+from src.mud_engine.server.telnet_session import TelnetSession
+
+
+def _session(session_id: str, authenticated: bool = True) -> TelnetSession:
+    writer = MagicMock()
+    writer.get_extra_info.return_value = ("127.0.0.1", 12345)
+    session = TelnetSession(MagicMock(), writer, session_id=session_id)
+    if authenticated:
+        session.is_authenticated = True
+        session.player = MagicMock()
+    return session
+
+
+class TestRoomOccupancyIndex:
+    """방 점유 인덱스 테스트"""
+
+    def test_index_follows_room_changes(self):
+        """current_room_id 변경과 세션 제거가 인덱스에 반영되는지 테스트"""
+        manager = SessionManager()
+        alice = _session("alice")
+        bob = _session("bob")
+        manager.add_session(alice)
+        manager.add_session(bob)
+
+        alice.current_room_id = "town_square"
+        bob.current_room_id = "town_square"
+        assert set(s.session_id for s in manager.get_sessions_in_room("town_square")) == {"alice", "bob"}
+
+        bob.current_room_id = "forest"
+        assert [s.session_id for s in manager.get_sessions_in_room("town_square")] == ["alice"]
+        assert [s.session_id for s in manager.get_sessions_in_room("forest")] == ["bob"]
+
+        manager.remove_session("alice")
+        assert manager.get_sessions_in_room("town_square") == []
+
+        # 제거된 세션의 이동은 인덱스에 영향을 주지 않음
+        alice.current_room_id = "forest"
+        assert [s.session_id for s in manager.get_sessions_in_room("forest")] == ["bob"]
+
+    def test_unauthenticated_sessions_filtered(self):
+        """기본 조회에서 인증되지 않은 세션이 제외되는지 테스트"""
+        manager = SessionManager()
+        guest = _session("guest", authenticated=False)
+        manager.add_session(guest)
+        guest.current_room_id = "town_square"
+
+        assert manager.get_sessions_in_room("town_square") == []
+        assert manager.get_sessions_in_room("town_square", authenticated_only=False) == [guest]
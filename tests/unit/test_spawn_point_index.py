@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""스폰 포인트 인덱스 단위 테스트"""
+
+from src.mud_engine.game.managers.monster_registry import MonsterRegistry
+from src.mud_engine.game.managers.spawn_point_index import SpawnPoint, SpawnPointIndex
+from src.mud_engine.game.monster import Monster
+
+
+def _rat(monster_id: str, x: int, y: int) -> Monster:
+    return Monster(id=monster_id, name={"en": monster_id}, description={"en": monster_id},
+                   x=x, y=y, properties={"template_id": "rat"})
+
+
+class TestSpawnPointIndex:
+    """SpawnPointIndex 테스트"""
+
+    def test_indexes_by_room_cell_and_template(self):
+        """방/셀/템플릿별 조회와 같은 방/템플릿 설정 대체 테스트"""
+        index = SpawnPointIndex()
+        index.load([
+            SpawnPoint("room_a", 0, 0, "rat", max_count=2),
+            SpawnPoint("room_a", 0, 0, "wolf"),
+            SpawnPoint("room_b", 1, 0, "rat"),
+        ], lambda x, y, template_id: 0)
+
+        assert [p.monster_template_id for p in index.get_by_room("room_a")] == ["rat", "wolf"]
+        assert [p.room_id for p in index.get_by_template("rat")] == ["room_a", "room_b"]
+        assert [p.monster_template_id for p in index.get_at(1, 0)] == ["rat"]
+
+        index.put(SpawnPoint("room_a", 0, 0, "rat", max_count=5))
+        assert len(index) == 3
+        assert index.get("room_a", "rat").max_count == 5
+
+        index.remove("room_a", "wolf")
+        assert index.get_at(0, 0) == [index.get("room_a", "rat")]
+        assert index.get_by_template("wolf") == []
+
+    def test_under_populated_follows_registry_counts(self):
+        """레지스트리 생존 수 변화에 따라 정원 미달 포인트만 남는지 테스트"""
+        registry = MonsterRegistry()
+        registry.load([_rat("a", 0, 0)])
+        index = SpawnPointIndex()
+        registry.set_count_listener(index.refresh)
+        index.load([
+            SpawnPoint("room_a", 0, 0, "rat", max_count=1),
+            SpawnPoint("room_b", 1, 0, "rat", max_count=1),
+        ], registry.count_alive_at)
+
+        assert [p.room_id for p in index.under_populated()] == ["room_b"]
+
+        registry.put(_rat("b", 1, 0))
+        assert index.under_populated() == []
+
+        monster = registry.get("a")
+        monster.die()
+        registry.put(monster)
+        assert [p.room_id for p in index.under_populated()] == ["room_a"]
+
+        registry.remove("b")
+        assert [p.room_id for p in index.under_populated()] == ["room_a", "room_b"]
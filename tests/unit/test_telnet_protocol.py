@@ -0,0 +1,144 @@
+"""
+Telnet 입력 파서 단위 테스트
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.mud_engine.server.telnet_protocol import TelnetLineParser
+from src.mud_engine.server.telnet_session import TelnetSession
+
+
+class TestTelnetLineParser:
+    """TelnetLineParser 테스트"""
+
+    def test_lines_split_across_chunks(self):
+        """줄과 CR/LF가 여러 청크에 나뉘어 도착해도 한 줄로 처리되는지 테스트"""
+        parser = TelnetLineParser()
+
+        assert parser.feed(b"loo") == []
+        assert parser.feed(b"k\r") == ["look"]
+        assert parser.feed(b"\nnorth\n") == ["north"]
+
+    def test_multiple_lines_in_one_chunk(self):
+        """한 청크에 여러 줄과 빈 줄이 있는 경우 테스트"""
+        parser = TelnetLineParser()
+
+        assert parser.feed(b"say hi\r\n\r\nquit\r\0") == ["say hi", "", "quit"]
+
+    def test_iac_negotiation_removed(self):
+        """IAC 옵션 협상과 서브 협상이 입력에서 제거되는지 테스트"""
+        parser = TelnetLineParser()
+        data = (
+            b"\xff\xfb\x1f"            # IAC WILL NAWS
+            b"\xff\xfa\x1f\x00\x50\x00\x18\xff\xf0"  # IAC SB NAWS 80x24 IAC SE
+            b"lo\xff\xf1ok\n"          # 중간의 IAC NOP
+        )
+
+        assert parser.feed(data[:5]) == []
+        assert parser.feed(data[5:]) == ["look"]
+
+    def test_backspace_removes_whole_character(self):
+        """백스페이스가 UTF-8 멀티바이트 문자를 한 글자로 지우는지 테스트"""
+        parser = TelnetLineParser()
+
+        assert parser.feed("가나".encode("utf-8") + b"\x7f" + b"ab\x08c\n") == ["가ac"]
+
+
+class TestTelnetSessionReadLine:
+    """TelnetSession.read_line 테스트"""
+
+    def _session(self, reader: asyncio.StreamReader) -> TelnetSession:
+        writer = MagicMock()
+        writer.get_extra_info.return_value = ("127.0.0.1", 12345)
+        return TelnetSession(reader, writer, session_id="test-session")
+
+    @pytest.mark.asyncio
+    async def test_reads_buffered_lines(self):
+        """한 번에 도착한 여러 줄을 순서대로 반환하고 종료 시 None을 반환하는지 테스트"""
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"\xff\xfd\x01north\r\nsouth\r\n")
+        reader.feed_eof()
+        session = self._session(reader)
+
+        assert await session.read_line() == "north"
+        assert await session.read_line() == "south"
+        assert await session.read_line() is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_partial_input(self):
+        """타임아웃 시 None을 반환하고 입력 중이던 내용은 유지되는지 테스트"""
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"ea")
+        session = self._session(reader)
+
+        assert await session.read_line(timeout=0.05) is None
+
+        reader.feed_data(b"st\n")
+        assert await session.read_line(timeout=1.0) == "east"
+
+
+class _FakeTransport:
+    """전송 대기량을 조절할 수 있는 테스트용 transport"""
+
+    def __init__(self):
+        self.pending = 0
+        self.aborted = False
+
+    def get_write_buffer_size(self):
+        return self.pending
+
+    def abort(self):
+        self.aborted = True
+
+
+class TestTelnetSessionOutput:
+    """TelnetSession 출력 버퍼 테스트"""
+
+    def _session(self) -> TelnetSession:
+        writer = MagicMock()
+        writer.get_extra_info.return_value = ("127.0.0.1", 12345)
+        writer.is_closing.return_value = False
+        writer.transport = _FakeTransport()
+        return TelnetSession(asyncio.StreamReader(), writer, session_id="test-session")
+
+    @pytest.mark.asyncio
+    async def test_messages_coalesced_into_one_write(self):
+        """같은 이벤트 루프 반복에서 보낸 메시지가 한 번의 write로 합쳐지는지 테스트"""
+        session = self._session()
+
+        await session.send_text("first")
+        await session.send_text("second")
+        await session.send_prompt("> ")
+        session.writer.write.assert_not_called()
+
+        await asyncio.sleep(0)
+
+        session.writer.write.assert_called_once_with(b"first\nsecond\n> ")
+
+    @pytest.mark.asyncio
+    async def test_batch_flushes_on_exit(self):
+        """batch_output 블록 안의 출력은 블록 종료 시 한 번에 전송되는지 테스트"""
+        session = self._session()
+
+        async with session.batch_output():
+            await session.send_text("room")
+            await asyncio.sleep(0)
+            await session.send_prompt("> ")
+            session.writer.write.assert_not_called()
+
+        session.writer.write.assert_called_once_with(b"room\n> ")
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_disconnected(self):
+        """전송 대기량이 한도를 넘으면 기다리지 않고 연결을 끊는지 테스트"""
+        session = self._session()
+        session.writer.transport.pending = TelnetSession.OUTPUT_MAX_PENDING + 1
+
+        async with session.batch_output():
+            await session.send_text("broadcast")
+
+        assert session.writer.transport.aborted
+        session.writer.drain.assert_not_called()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Tick 스케줄러 단위 테스트"""
+
+import asyncio
+
+import pytest
+
+from src.mud_engine.utils.tick_profiler import Histogram, TickProfiler
+from src.mud_engine.utils.tick_scheduler import TickScheduler
+
+
+class TestTickScheduler:
+    """TickScheduler 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_systems_run_by_interval_and_order(self):
+        """시스템이 주기에 맞춰 order, 등록 순서대로 실행되는지 테스트"""
+        manager = TickScheduler()
+        calls = []
+
+        def system(name):
+            async def callback():
+                calls.append(name)
+            return callback
+
+        manager.register_system("slow", system("slow"), 3, order=20)
+        manager.register_system("fast_b", system("fast_b"), 1, order=10)
+        manager.register_system("fast_a", system("fast_a"), 1, order=5)
+
+        for second in range(4):
+            await manager._run_tick(float(second))
+
+        assert calls == [
+            "fast_a", "fast_b", "slow",
+            "fast_a", "fast_b",
+            "fast_a", "fast_b",
+            "fast_a", "fast_b", "slow",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_overrun_and_errors_recorded(self):
+        """예산 초과와 예외가 기록되고 다음 시스템은 계속 실행되는지 테스트"""
+        manager = TickScheduler()
+        ran = []
+
+        async def slow():
+            await asyncio.sleep(0.02)
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        async def after():
+            ran.append(True)
+
+        manager.register_system("slow", slow, 1, order=1, budget=0.001)
+        manager.register_system("broken", broken, 1, order=2)
+        manager.register_system("after", after, 1, order=3)
+
+        await manager._run_tick(0.0)
+
+        assert manager.get_system_info("slow")["overrun_count"] == 1
+        assert manager.get_system_info("broken")["error_count"] == 1
+        assert ran == [True]
+
+    @pytest.mark.asyncio
+    async def test_profiler_records_counter_deltas(self):
+        """프로파일러가 시스템 실행 전후 카운터 차이와 실행 시간을 기록하는지 테스트"""
+        queries = [0]
+
+        async def query_twice():
+            queries[0] += 2
+
+        manager = TickScheduler()
+        manager.set_profiler(TickProfiler({"db_queries": lambda: queries[0]}))
+        manager.register_system("queries", query_twice, 1)
+
+        await manager._run_tick(0.0)
+        await manager._run_tick(1.0)
+
+        systems = manager.profiler.to_dict()["systems"]
+        assert systems["queries"]["duration_seconds"]["count"] == 2
+        assert systems["queries"]["db_queries"]["sum"] == 4
+        assert systems["queries"]["db_queries"]["max"] == 2
+
+        prometheus = manager.profiler.to_prometheus()
+        assert 'mud_tick_system_db_queries_bucket{system="queries",le="2"} 2' in prometheus
+        assert 'mud_tick_system_db_queries_count{system="queries"} 2' in prometheus
+
+
+class TestHistogram:
+    """Histogram 테스트"""
+
+    def test_cumulative_buckets_and_percentile(self):
+        """누적 버킷과 버킷 상한 기준 백분위수 테스트"""
+        histogram = Histogram((1, 5, 10))
+        for value in (0, 1, 3, 7, 20):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == {"1": 2, "5": 3, "10": 4, "+Inf": 5}
+        assert histogram.percentile(0.5) == 5
+        assert histogram.percentile(1.0) == 20
+        assert histogram.sum == 31